@@ -29,6 +29,16 @@ get_models()  # This registers all models with SQLModel.metadata
 
 target_metadata = SQLModel.metadata
 
+# Derived tables managed at runtime, not by migrations (FTS5 dictionary index
+# and its shadow tables, see utils/dictionary_search.py)
+RUNTIME_TABLE_PREFIXES = ("word_search",)
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and name.startswith(RUNTIME_TABLE_PREFIXES):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -52,6 +62,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -79,7 +90,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
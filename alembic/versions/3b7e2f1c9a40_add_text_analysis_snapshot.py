@@ -0,0 +1,37 @@
+"""Add text analysis snapshot
+
+Revision ID: 3b7e2f1c9a40
+Revises: df09a0cd82c5
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e2f1c9a40'
+down_revision: Union[str, Sequence[str], None] = 'df09a0cd82c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    import sqlmodel
+    op.create_table(
+        'textanalysissnapshot',
+        sa.Column('text_id', sa.Integer(), nullable=False),
+        sa.Column('content_version', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('payload', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['text_id'], ['text.id'], ),
+        sa.PrimaryKeyConstraint('text_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('textanalysissnapshot')
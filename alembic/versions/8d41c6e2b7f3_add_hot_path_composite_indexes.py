@@ -0,0 +1,48 @@
+"""Add composite indexes for hot progress and content queries
+
+Revision ID: 8d41c6e2b7f3
+Revises: 3b7e2f1c9a40
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41c6e2b7f3'
+down_revision: Union[str, Sequence[str], None] = '3b7e2f1c9a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (nombre, tabla, columnas) — deben coincidir con __table_args__ de los modelos
+INDEXES = [
+    ('ix_textwordlink_text_id_sentence_position', 'textwordlink',
+     ['text_id', 'sentence_number', 'position_in_sentence']),
+    ('ix_textwordlink_word_id', 'textwordlink', ['word_id']),
+    ('ix_reviewlog_word_id_review_date', 'reviewlog', ['word_id', 'review_date']),
+    ('ix_exercise_attempt_user_id_lesson_number', 'exercise_attempt', ['user_id', 'lesson_number']),
+    ('ix_user_vocabulary_progress_user_id_word_id', 'user_vocabulary_progress', ['user_id', 'word_id']),
+    ('ix_user_vocabulary_progress_user_id_next_review_date', 'user_vocabulary_progress',
+     ['user_id', 'next_review_date']),
+    ('ix_lesson_vocabulary_lesson_number_word_id', 'lesson_vocabulary', ['lesson_number', 'word_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all() ya crea estos índices en bases nuevas
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    # Refrescar estadísticas para que el planificador use los índices nuevos
+    if op.get_bind().dialect.name in ("sqlite", "postgresql"):
+        op.execute(sa.text("ANALYZE"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,42 @@
+"""Add incremental accumulators to user progress summary
+
+Revision ID: c52a9e07d1b8
+Revises: 8d41c6e2b7f3
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52a9e07d1b8'
+down_revision: Union[str, Sequence[str], None] = '8d41c6e2b7f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # reconciled_at queda a NULL: el primer evento de cada usuario reconcilia
+    # el resumen con agregados SQL y rellena los acumuladores
+    with op.batch_alter_table('user_progress_summary', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('vocab_words_total', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('vocab_mastery_sum', sa.Float(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('exercises_correct_total', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('comprehension_sum', sa.Float(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('comprehension_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('reconciled_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('user_progress_summary', schema=None) as batch_op:
+        batch_op.drop_column('reconciled_at')
+        batch_op.drop_column('comprehension_count')
+        batch_op.drop_column('comprehension_sum')
+        batch_op.drop_column('exercises_correct_total')
+        batch_op.drop_column('vocab_mastery_sum')
+        batch_op.drop_column('vocab_words_total')
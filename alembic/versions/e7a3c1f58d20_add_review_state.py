@@ -0,0 +1,83 @@
+"""Add per-word SRS review state
+
+Revision ID: e7a3c1f58d20
+Revises: c52a9e07d1b8
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3c1f58d20'
+down_revision: Union[str, Sequence[str], None] = 'c52a9e07d1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'reviewstate',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('word_id', sa.Integer(), nullable=False),
+        sa.Column('due_at', sa.DateTime(), nullable=False),
+        sa.Column('ease_factor', sa.Float(), nullable=False),
+        sa.Column('interval', sa.Integer(), nullable=False),
+        sa.Column('repetitions', sa.Integer(), nullable=False),
+        sa.Column('last_quality', sa.Integer(), nullable=False),
+        sa.Column('last_review_date', sa.DateTime(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['word_id'], ['word.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_reviewstate_user_id_word_id', 'reviewstate', ['user_id', 'word_id'], unique=True)
+    op.create_index('ix_reviewstate_user_id_due_at', 'reviewstate', ['user_id', 'due_at'], unique=False)
+
+    # Estado inicial desde la última revisión de cada palabra (usuario 1)
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT r.word_id, r.review_date, r.quality, r.ease_factor, r.interval, r.repetitions, c.n "
+        "FROM reviewlog r "
+        "JOIN (SELECT word_id, MAX(review_date) AS last_date, COUNT(*) AS n "
+        "      FROM reviewlog GROUP BY word_id) c "
+        "ON c.word_id = r.word_id AND c.last_date = r.review_date"
+    )).fetchall()
+
+    states = {}
+    for word_id, review_date, quality, ease_factor, interval, repetitions, count in rows:
+        if isinstance(review_date, str):
+            review_date = datetime.fromisoformat(review_date)
+        states[word_id] = {
+            'user_id': 1,
+            'word_id': word_id,
+            'due_at': review_date + timedelta(days=interval or 0),
+            'ease_factor': ease_factor,
+            'interval': interval or 0,
+            'repetitions': repetitions or 0,
+            'last_quality': quality,
+            'last_review_date': review_date,
+            'review_count': count,
+        }
+
+    if states:
+        table = sa.table(
+            'reviewstate',
+            *(sa.column(name) for name in (
+                'user_id', 'word_id', 'due_at', 'ease_factor', 'interval', 'repetitions',
+                'last_quality', 'last_review_date', 'review_count'
+            ))
+        )
+        op.bulk_insert(table, list(states.values()))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reviewstate_user_id_due_at', table_name='reviewstate')
+    op.drop_index('ix_reviewstate_user_id_word_id', table_name='reviewstate')
+    op.drop_table('reviewstate')
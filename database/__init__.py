@@ -38,9 +38,11 @@ else:
 Word = models.Word
 Author = models.Author
 ReviewLog = models.ReviewLog
+ReviewState = models.ReviewState
 UserProfile = models.UserProfile
 Text = models.Text
 TextWordLink = models.TextWordLink
+TextAnalysisSnapshot = models.TextAnalysisSnapshot
 WordFrequency = models.WordFrequency
 SyntaxPattern = models.SyntaxPattern
 InflectedForm = models.InflectedForm
@@ -73,10 +75,14 @@ SentenceStructure = syntax_models.SentenceStructure
 # Connection utilities
 from database.connection import (
     get_session,
+    get_read_session,
     init_db,
     engine
 )
 
+# Invalidación de snapshots de análisis de textos al cambiar sus enlaces
+from database import text_snapshots
+
 # Helper functions
 from database.utils import (
     get_json_list,
@@ -89,9 +95,11 @@ __all__ = [
     'Word',
     'Author',
     'ReviewLog',
+    'ReviewState',
     'UserProfile',
     'Text',
     'TextWordLink',
+    'TextAnalysisSnapshot',
     'WordFrequency',
     'SyntaxPattern',
     'InflectedForm',
@@ -123,6 +131,7 @@ __all__ = [
     
     # Connection utilities
     'get_session',
+    'get_read_session',
     'init_db',
     'engine',
     
@@ -0,0 +1,192 @@
+"""
+Importación masiva en streaming de vocabulario (Word)
+
+Procesa las filas por bloques: valida cada bloque, descarta las palabras que
+ya existen (conjunto en memoria de claves latin + categoría cargado una sola
+vez) y las repetidas dentro del propio fichero, e inserta con un INSERT
+executemany por bloque en su propia transacción. La memoria queda acotada
+por el tamaño del bloque más el conjunto de claves.
+
+Usado por database.connection.import_seed_data y
+utils.csv_handler.import_vocabulary_from_csv.
+"""
+
+import csv
+import io
+import logging
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from database.models import Word
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Clave de deduplicación de una palabra
+WordKey = Tuple[str, str]
+
+
+def word_key(latin: Optional[str], part_of_speech: Optional[str]) -> WordKey:
+    """Clave de deduplicación: lema y categoría, sin espacios ni mayúsculas"""
+    return ((latin or "").strip().lower(), (part_of_speech or "").strip().lower())
+
+
+def load_existing_word_keys(session: Session, batch_size: int = 10000) -> Set[WordKey]:
+    """Claves de todas las palabras existentes (solo dos columnas, en streaming)"""
+    keys: Set[WordKey] = set()
+    result = session.execute(
+        select(Word.latin, Word.part_of_speech).execution_options(yield_per=batch_size)
+    )
+    for latin, part_of_speech in result:
+        keys.add(word_key(latin, part_of_speech))
+    return keys
+
+
+def _word_column_defaults() -> Dict[str, Any]:
+    """Valores por defecto escalares de las columnas de Word (sin id)"""
+    defaults = {}
+    for column in Word.__table__.columns:
+        if column.primary_key:
+            continue
+        default = column.default.arg if column.default is not None and column.default.is_scalar else None
+        defaults[column.name] = default
+    return defaults
+
+
+def iter_csv_rows(source: Union[str, bytes, io.TextIOBase], encoding: str = "utf-8") -> Iterator[Dict[str, str]]:
+    """Filas de un CSV (ruta, bytes o fichero abierto) sin cargarlo entero"""
+    if isinstance(source, bytes):
+        stream = io.TextIOWrapper(io.BytesIO(source), encoding=encoding, newline="")
+        yield from csv.DictReader(stream)
+    elif isinstance(source, str):
+        with open(source, mode="r", encoding=encoding, newline="") as f:
+            yield from csv.DictReader(f)
+    else:
+        yield from csv.DictReader(source)
+
+
+def iter_chunks(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Agrupa un iterable en listas de como máximo `size` elementos"""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+@dataclass
+class ImportReport:
+    """Progreso y resultado de una importación"""
+    rows_read: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    batches: int = 0
+    errors: List[str] = field(default_factory=list)
+    started_at: float = field(default_factory=time.time)
+
+    @property
+    def elapsed(self) -> float:
+        return time.time() - self.started_at
+
+    def add_error(self, message: str, max_messages: int = 100):
+        self.invalid += 1
+        if len(self.errors) < max_messages:
+            self.errors.append(message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rows_read": self.rows_read,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "invalid": self.invalid,
+            "batches": self.batches,
+            "elapsed_s": round(self.elapsed, 2),
+        }
+
+
+class TooManyImportErrors(Exception):
+    """Se superó max_errors filas inválidas"""
+
+
+def bulk_import_words(
+    session: Session,
+    rows: Iterable[Any],
+    parse_row: Callable[[Any], Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    deduplicate: bool = True,
+    existing_keys: Optional[Set[WordKey]] = None,
+    progress_callback: Optional[Callable[[ImportReport], None]] = None,
+    max_errors: Optional[int] = None,
+    first_row_number: int = 2,
+    report: Optional[ImportReport] = None,
+) -> ImportReport:
+    """
+    Inserta palabras en bloques con executemany y un commit por bloque.
+
+    Args:
+        session: Sesión de BD
+        rows: Filas de origen (dicts de CSV, registros de DataFrame...)
+        parse_row: Convierte una fila en dict de columnas de Word; lanza
+            ValueError/KeyError si la fila no es válida
+        chunk_size: Filas por bloque/transacción
+        deduplicate: Omitir palabras ya existentes o repetidas en el fichero
+        existing_keys: Claves ya cargadas (por defecto se leen de la BD)
+        progress_callback: Se llama con el ImportReport tras cada bloque
+        max_errors: Máximo de filas inválidas antes de abortar (None = sin límite)
+        first_row_number: Número de la primera fila en los mensajes (2 = tras cabecera)
+        report: ImportReport a rellenar (por defecto uno nuevo); si la
+            importación falla, conserva lo ya confirmado en bloques anteriores
+
+    Returns:
+        ImportReport con contadores y mensajes de error
+    """
+    if report is None:
+        report = ImportReport()
+    defaults = _word_column_defaults()
+    if deduplicate and existing_keys is None:
+        existing_keys = load_existing_word_keys(session)
+    statement = insert(Word)
+
+    row_number = first_row_number
+    for chunk in iter_chunks(rows, chunk_size):
+        values = []
+        for row in chunk:
+            report.rows_read += 1
+            try:
+                record = parse_row(row)
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                report.add_error(f"Fila {row_number}: {e}")
+                if max_errors is not None and report.invalid > max_errors:
+                    raise TooManyImportErrors(f"Too many import errors (>{max_errors})")
+                row_number += 1
+                continue
+            row_number += 1
+
+            if deduplicate:
+                key = word_key(record.get("latin"), record.get("part_of_speech"))
+                if key in existing_keys:
+                    report.duplicates += 1
+                    continue
+                existing_keys.add(key)
+
+            values.append({**defaults, **record})
+
+        if values:
+            session.execute(statement, values)
+        session.commit()
+        report.inserted += len(values)
+        report.batches += 1
+
+        logger.debug(f"Bulk import batch {report.batches}: {report.to_dict()}")
+        if progress_callback:
+            progress_callback(report)
+
+    return report
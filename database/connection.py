@@ -6,7 +6,8 @@ with comprehensive improvements for performance and robustness.
 
 KEY IMPROVEMENTS:
 - Optimized connection pooling based on database type
-- SQLite StaticPool for single-file databases
+- SQLite production profile: WAL, small connection pool, tuned pragmas
+  and a separate read-only engine for content queries
 - PostgreSQL/MySQL with proper pool configuration
 - Automatic health checks and validation
 - Enhanced error handling and recovery
@@ -14,13 +15,15 @@ KEY IMPROVEMENTS:
 - Proper timeout and retry settings
 """
 
-import csv
+import bisect
 import logging
 import os
+import re
+import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import create_engine, event, inspect, select, text
 from sqlalchemy.engine import Engine
@@ -57,14 +60,124 @@ POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", "3600"))
 # Debug mode
 DATABASE_ECHO = os.getenv("DATABASE_ECHO", "False").lower() == "true"
 
+# SQLite production profile (file databases only; in-memory keeps StaticPool)
+SQLITE_WAL_MODE = os.getenv("SQLITE_WAL_MODE", "True").lower() == "true"
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "5"))
+SQLITE_MAX_OVERFLOW = int(os.getenv("SQLITE_MAX_OVERFLOW", "5"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "20000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+
+# Record distinct SELECT statements to this JSONL file for
+# scripts/tools/query_plan_audit.py --replay (empty = disabled)
+QUERY_CAPTURE_FILE = os.getenv("QUERY_CAPTURE_FILE", "")
+
+# Per-statement metrics (fingerprinted SQL, latency histograms, rows returned)
+QUERY_METRICS_ENABLED = os.getenv("QUERY_METRICS_ENABLED", "True").lower() == "true"
+QUERY_METRICS_MAX_FINGERPRINTS = int(os.getenv("QUERY_METRICS_MAX_FINGERPRINTS", "500"))
+QUERY_METRICS_TOP_N = int(os.getenv("QUERY_METRICS_TOP_N", "10"))
+SLOW_QUERY_MS = int(os.getenv("SLOW_QUERY_MS", "100"))
+
 # ============================================================================
 # CONNECTION METRICS
 # ============================================================================
 
 
+# Latency histogram buckets: upper bounds in ms, geometric from 10µs to ~100s
+LATENCY_BUCKETS_MS: List[float] = [0.01 * (1.25 ** i) for i in range(73)]
+
+_FINGERPRINT_RULES = [
+    (re.compile(r"--[^\n]*"), " "),                             # line comments
+    (re.compile(r"/\*.*?\*/", re.S), " "),                       # block comments
+    (re.compile(r"'(?:[^']|'')*'"), "?"),                        # string literals
+    (re.compile(r"%\(\w+\)s|:\w+|\$\d+|%s"), "?"),                # named/positional params (before numbers: $1)
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),                      # numeric literals
+    (re.compile(r"\s+"), " "),                                   # whitespace
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?+)"),              # IN (?, ?, ...) / VALUES rows
+    (re.compile(r"\(\?\+\)(?:\s*,\s*\(\?\+\))+"), "(?+)"),             # multi-row VALUES
+]
+
+# Raw statement -> fingerprint (SQLAlchemy reuses the same strings)
+_fingerprint_cache: Dict[str, str] = {}
+_FINGERPRINT_CACHE_SIZE = 2048
+
+
+def fingerprint_statement(statement: str) -> str:
+    """
+    Normalize SQL to its shape: literals and parameters become ``?``,
+    IN lists and multi-row VALUES collapse, whitespace and comments go away.
+    """
+    cached = _fingerprint_cache.get(statement)
+    if cached is not None:
+        return cached
+
+    fingerprint = statement
+    for pattern, replacement in _FINGERPRINT_RULES:
+        fingerprint = pattern.sub(replacement, fingerprint)
+    fingerprint = fingerprint.strip()
+
+    if len(_fingerprint_cache) >= _FINGERPRINT_CACHE_SIZE:
+        _fingerprint_cache.clear()
+    _fingerprint_cache[statement] = fingerprint
+    return fingerprint
+
+
+class QueryStats:
+    """Execution count, latency histogram and rows for one statement fingerprint"""
+
+    __slots__ = ("fingerprint", "count", "total_ms", "max_ms", "rows", "buckets")
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, duration_ms: float):
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Latency (ms) under which a fraction q of executions fell (bucket upper bound)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.buckets):
+            cumulative += bucket_count
+            if cumulative >= target:
+                if index >= len(LATENCY_BUCKETS_MS):
+                    return self.max_ms
+                return min(LATENCY_BUCKETS_MS[index], self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.50), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "max_ms": round(self.max_ms, 3),
+            "rows": self.rows,
+            "avg_rows": round(self.rows / self.count, 1) if self.count else 0.0,
+        }
+
+
 class ConnectionMetrics:
     """Track connection pool metrics"""
 
+    # Bucket for fingerprints beyond QUERY_METRICS_MAX_FINGERPRINTS
+    OTHER_FINGERPRINT = "<other>"
+
     def __init__(self):
         self.total_connections = 0
         self.failed_connections = 0
@@ -73,6 +186,13 @@ class ConnectionMetrics:
         self.last_health_check = None
         self.total_query_time_ms = 0.0
 
+        # Per-statement metrics, keyed by fingerprint
+        self.statements: Dict[str, QueryStats] = {}
+        self.statements_executed = 0
+        self.slow_statements = 0
+        self.total_statement_time_ms = 0.0
+        self._lock = threading.Lock()
+
     def record_query(self, duration_ms: float, slow_threshold: int = 100):
         """Record query execution"""
         self.queries_executed += 1
@@ -80,6 +200,57 @@ class ConnectionMetrics:
         if duration_ms > slow_threshold:
             self.slow_queries += 1
 
+    def statement_stats(self, statement: str) -> QueryStats:
+        """QueryStats for a raw SQL statement (created on first use)"""
+        fingerprint = fingerprint_statement(statement)
+        stats = self.statements.get(fingerprint)
+        if stats is None:
+            with self._lock:
+                stats = self.statements.get(fingerprint)
+                if stats is None:
+                    if len(self.statements) >= QUERY_METRICS_MAX_FINGERPRINTS:
+                        fingerprint = self.OTHER_FINGERPRINT
+                        stats = self.statements.get(fingerprint)
+                    if stats is None:
+                        stats = self.statements[fingerprint] = QueryStats(fingerprint)
+        return stats
+
+    def record_statement(self, statement: str, duration_ms: float, rows: int = 0,
+                         stats: Optional[QueryStats] = None) -> QueryStats:
+        """Record one cursor execution of a statement"""
+        stats = stats or self.statement_stats(statement)
+        with self._lock:
+            stats.record(duration_ms)
+            stats.rows += max(rows, 0)
+            self.statements_executed += 1
+            self.total_statement_time_ms += duration_ms
+            if duration_ms > SLOW_QUERY_MS:
+                self.slow_statements += 1
+        return stats
+
+    def add_rows(self, stats: QueryStats, rows: int):
+        """Add rows fetched after execution (SELECT results)"""
+        with self._lock:
+            stats.rows += rows
+
+    def get_top_statements(self, n: int = QUERY_METRICS_TOP_N, sort_by: str = "total_ms") -> List[Dict[str, Any]]:
+        """Top-n statement fingerprints by total_ms, count, p95_ms, p99_ms or rows"""
+        with self._lock:
+            rows = [stats.to_dict() for stats in self.statements.values()]
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+        total = self.total_statement_time_ms or 1.0
+        for row in rows[:n]:
+            row["pct_time"] = round(100 * row["total_ms"] / total, 1)
+        return rows[:n]
+
+    def reset_statements(self):
+        """Forget per-statement metrics (e.g. after a warm-up)"""
+        with self._lock:
+            self.statements.clear()
+            self.statements_executed = 0
+            self.slow_statements = 0
+            self.total_statement_time_ms = 0.0
+
     def get_stats(self) -> Dict[str, Any]:
         """Get metrics summary"""
         avg_query_time = (
@@ -94,6 +265,10 @@ class ConnectionMetrics:
             "slow_queries": self.slow_queries,
             "avg_query_time_ms": round(avg_query_time, 2),
             "last_health_check": self.last_health_check,
+            "statements_executed": self.statements_executed,
+            "slow_statements": self.slow_statements,
+            "statement_fingerprints": len(self.statements),
+            "total_statement_time_ms": round(self.total_statement_time_ms, 2),
         }
 
 
@@ -122,17 +297,38 @@ def create_optimized_engine(database_url: str) -> Engine:
 
         # SQLite-specific configuration
         if database_url.startswith("sqlite://"):
-            engine = create_engine(
-                database_url,
-                echo=DATABASE_ECHO,
-                # Use StaticPool for SQLite - maintains single connection
-                poolclass=StaticPool,
-                connect_args={
-                    "check_same_thread": False,
-                    "timeout": POOL_TIMEOUT,  # 30 second timeout
-                },
-            )
-            logger.info("✓ SQLite engine configured with StaticPool")
+            if SQLITE_WAL_MODE and not _is_sqlite_memory(database_url):
+                engine = create_engine(
+                    database_url,
+                    echo=DATABASE_ECHO,
+                    # Each thread checks out its own connection; WAL lets
+                    # readers proceed while a writer holds the lock
+                    poolclass=QueuePool,
+                    pool_size=SQLITE_POOL_SIZE,
+                    max_overflow=SQLITE_MAX_OVERFLOW,
+                    pool_timeout=POOL_TIMEOUT,
+                    connect_args={
+                        "check_same_thread": False,
+                        "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+                    },
+                )
+                _register_sqlite_pragmas(engine, journal_wal=True)
+                logger.info(
+                    f"✓ SQLite engine configured with WAL and "
+                    f"QueuePool(size={SQLITE_POOL_SIZE}, overflow={SQLITE_MAX_OVERFLOW})"
+                )
+            else:
+                engine = create_engine(
+                    database_url,
+                    echo=DATABASE_ECHO,
+                    # Use StaticPool for SQLite - maintains single connection
+                    poolclass=StaticPool,
+                    connect_args={
+                        "check_same_thread": False,
+                        "timeout": POOL_TIMEOUT,  # 30 second timeout
+                    },
+                )
+                logger.info("✓ SQLite engine configured with StaticPool")
 
         # PostgreSQL/MySQL configuration
         else:
@@ -168,6 +364,71 @@ def create_optimized_engine(database_url: str) -> Engine:
         raise DatabaseError(f"Engine creation failed: {e}")
 
 
+def _is_sqlite_memory(database_url: str) -> bool:
+    """True for in-memory SQLite URLs (each connection would get its own DB)"""
+    path = database_url.split("?")[0][len("sqlite://"):].lstrip("/")
+    return path in ("", ":memory:") or "mode=memory" in database_url
+
+
+def _register_sqlite_pragmas(engine: Engine, journal_wal: bool = True, read_only: bool = False):
+    """Apply the SQLite production pragmas on every new connection"""
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        try:
+            if journal_wal and not read_only:
+                cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+            cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+            cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            if read_only:
+                cursor.execute("PRAGMA query_only=ON")
+        except Exception as e:
+            logger.warning(f"Could not apply SQLite pragmas: {e}")
+        finally:
+            cursor.close()
+
+
+def create_read_only_engine(database_url: str) -> Optional[Engine]:
+    """
+    Create a read-only engine for content queries on a SQLite file.
+
+    Connections open the file with ``mode=ro`` and ``query_only``, so content
+    pages (dictionary, readings, syntax) can read concurrently without
+    competing for the writer's connections.
+
+    Returns:
+        Engine, or None when the database is not a SQLite file
+    """
+    if not database_url.startswith("sqlite://") or _is_sqlite_memory(database_url):
+        return None
+
+    path = os.path.abspath(database_url.split("?")[0][len("sqlite:///"):])
+    if not os.path.exists(path):
+        return None
+
+    read_engine = create_engine(
+        f"sqlite:///file:{path}?mode=ro&uri=true",
+        echo=DATABASE_ECHO,
+        poolclass=QueuePool,
+        pool_size=SQLITE_POOL_SIZE,
+        max_overflow=SQLITE_MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        connect_args={
+            "check_same_thread": False,
+            "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+        },
+    )
+    _register_sqlite_pragmas(read_engine, journal_wal=False, read_only=True)
+    if QUERY_METRICS_ENABLED:
+        _register_query_metrics(read_engine)
+    logger.info("✓ SQLite read-only engine configured for content queries")
+    return read_engine
+
+
 def _register_event_listeners(engine: Engine):
     """Register SQLAlchemy event listeners for monitoring and debugging"""
 
@@ -185,6 +446,12 @@ def _register_event_listeners(engine: Engine):
         except Exception as e:
             logger.debug(f"Could not set PRAGMA: {e}")
 
+    if QUERY_CAPTURE_FILE:
+        _register_query_capture(engine, QUERY_CAPTURE_FILE)
+
+    if QUERY_METRICS_ENABLED:
+        _register_query_metrics(engine)
+
     @event.listens_for(engine, "close")
     def receive_close(dbapi_conn, connection_record):
         """Monitor connection close"""
@@ -196,6 +463,119 @@ def _register_event_listeners(engine: Engine):
         logger.debug("Database connection detached from pool")
 
 
+class _RowCountingCursor:
+    """DBAPI cursor proxy that adds fetched rows to a statement's QueryStats"""
+
+    __slots__ = ("_cursor", "_stats")
+
+    def __init__(self, cursor, stats: QueryStats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            metrics.add_rows(self._stats, 1)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        metrics.add_rows(self._stats, len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        metrics.add_rows(self._stats, len(rows))
+        return rows
+
+    def __iter__(self):
+        for row in self._cursor:
+            metrics.add_rows(self._stats, 1)
+            yield row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def _dml_rowcount(cursor, parameters, context) -> Optional[int]:
+    """
+    Rows affected by an INSERT/UPDATE/DELETE, or None when they have to be
+    counted as they are fetched (queries, UPDATE/DELETE ... RETURNING).
+
+    sqlite3 only reports rowcount for RETURNING statements once their rows
+    are read, and SQLAlchemy reads the RETURNING rows of "insertmanyvalues"
+    batches (ORM flushes, executemany inserts) from the raw cursor, past the
+    counting proxy. Those batches are counted from their parameters instead.
+    """
+    if cursor.description is None:
+        return cursor.rowcount
+    if context is None or not (context.isinsert or context.isupdate or context.isdelete):
+        return None
+    if cursor.rowcount > 0:
+        # Drivers that report the affected rows before they are fetched
+        return cursor.rowcount
+    if context.isinsert and context.executemany and context.parameters and parameters:
+        # One batch: its parameters are the rows' parameters concatenated
+        per_row = len(context.parameters[0])
+        if per_row:
+            return len(parameters) // per_row
+    return None
+
+
+def _register_query_metrics(engine: Engine):
+    """Time every cursor execution and count its rows, per statement fingerprint"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start_time")
+        if not starts:
+            return
+        duration_ms = (time.perf_counter() - starts.pop()) * 1000
+
+        rowcount = _dml_rowcount(cursor, parameters, context)
+        if rowcount is not None:
+            metrics.record_statement(statement, duration_ms, rowcount)
+            return
+
+        # SELECT (or RETURNING that is fetched through the result): rows are
+        # counted as the result is fetched
+        stats = metrics.record_statement(statement, duration_ms)
+        if context is not None and context.cursor is cursor:
+            context.cursor = _RowCountingCursor(cursor, stats)
+
+    @event.listens_for(engine, "handle_error")
+    def discard_timer(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start_time"):
+            connection.info["query_start_time"].pop()
+
+
+def _register_query_capture(engine: Engine, capture_file: str):
+    """Append each distinct SELECT (with its first parameters) to a JSONL file"""
+    import json
+
+    seen = set()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture_query(conn, cursor, statement, parameters, context, executemany):
+        if executemany or statement in seen:
+            return
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return
+        seen.add(statement)
+        try:
+            with open(capture_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"sql": statement, "params": parameters}, default=str) + "\n")
+        except OSError as e:
+            logger.debug(f"Could not capture query: {e}")
+
+    logger.info(f"✓ Capturing SELECT statements to {capture_file}")
+
+
 # Create the engine
 try:
     engine = create_optimized_engine(DATABASE_URL)
@@ -204,6 +584,30 @@ except DatabaseError as e:
     raise
 
 
+# Read-only engine for content queries (created on first use)
+_read_engine: Optional[Engine] = None
+_read_engine_checked = False
+
+
+def get_read_engine() -> Engine:
+    """
+    Engine for read-only content queries.
+
+    Falls back to the main engine for non-SQLite databases, in-memory
+    SQLite, or when the SQLite profile is disabled.
+    """
+    global _read_engine, _read_engine_checked
+    if not _read_engine_checked:
+        _read_engine_checked = True
+        if SQLITE_WAL_MODE:
+            try:
+                _read_engine = create_read_only_engine(DATABASE_URL)
+            except Exception as e:
+                logger.warning(f"Read-only engine unavailable, using main engine: {e}")
+                _read_engine = None
+    return _read_engine or engine
+
+
 # Session factory function
 def get_session_factory():
     """Create a new session"""
@@ -306,6 +710,29 @@ def get_session_explicit():
         session.close()
 
 
+@contextmanager
+def get_read_session():
+    """
+    Context manager for read-only content queries.
+
+    Uses the read-only engine (see get_read_engine). Never commits; any
+    attempted write fails on SQLite with "attempt to write a readonly database".
+
+    Usage:
+        with get_read_session() as session:
+            words = session.exec(select(Word)).all()
+
+    Yields:
+        Session: SQLModel database session
+    """
+    session = Session(get_read_engine())
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
 def get_session_no_context():
     """
     Get a database session without context manager.
@@ -478,7 +905,10 @@ def get_connection_status() -> Dict[str, Any]:
             "database_url": DATABASE_URL.split("?")[0],  # Hide credentials
             "pool_size": POOL_SIZE,
             "max_overflow": MAX_OVERFLOW,
+            "pool": engine.pool.status(),
+            "read_only_engine": _read_engine is not None,
             "metrics": metrics.get_stats(),
+            "top_queries": metrics.get_top_statements(QUERY_METRICS_TOP_N),
             "timestamp": datetime.utcnow().isoformat(),
         }
     except Exception as e:
@@ -494,16 +924,42 @@ def get_connection_status() -> Dict[str, Any]:
 # ============================================================================
 
 
-def import_seed_data(csv_path: str, session: Optional[Session] = None) -> int:
+def _parse_seed_row(row: Dict[str, str]) -> Dict[str, Any]:
+    """Map a seed CSV row to Word columns (raises on missing/invalid fields)"""
+    return {
+        "latin": row["latin"].strip(),
+        "translation": row["translation"].strip(),
+        "part_of_speech": row["part_of_speech"].strip(),
+        "level": int(row["level"]),
+        "genitive": (row.get("genitive") or "").strip() or None,
+        "gender": (row.get("gender") or "").strip() or None,
+        "declension": (row.get("declension") or "").strip() or None,
+        "principal_parts": (row.get("principal_parts") or "").strip() or None,
+        "conjugation": (row.get("conjugation") or "").strip() or None,
+    }
+
+
+def import_seed_data(
+    csv_path: str,
+    session: Optional[Session] = None,
+    chunk_size: int = 5000,
+    progress_callback=None,
+) -> int:
     """
     Import vocabulary data from CSV file.
 
     CSV format:
         latin,translation,part_of_speech,level,[genitive],[gender],[declension],[principal_parts],[conjugation]
 
+    The file is streamed in chunks (see database/bulk_import.py): each chunk
+    is validated, words that already exist (same latin + part_of_speech) are
+    skipped, and the rest are inserted with one executemany per transaction.
+
     Args:
         csv_path: Path to CSV file
         session: Database session (creates new if not provided)
+        chunk_size: Rows per batch/transaction
+        progress_callback: Called with the ImportReport after each batch
 
     Returns:
         Number of words imported
@@ -511,7 +967,7 @@ def import_seed_data(csv_path: str, session: Optional[Session] = None) -> int:
     Raises:
         DatabaseError: If import fails
     """
-    from database import Word
+    from database.bulk_import import TooManyImportErrors, bulk_import_words, iter_csv_rows
 
     if not os.path.exists(csv_path):
         logger.warning(f"CSV file not found: {csv_path}")
@@ -521,43 +977,38 @@ def import_seed_data(csv_path: str, session: Optional[Session] = None) -> int:
     if own_session:
         session = Session(engine)
 
+    def log_progress(report):
+        logger.info(
+            f"Imported {report.inserted} words "
+            f"({report.rows_read} rows read, {report.duplicates} duplicates, "
+            f"{report.invalid} errors, {report.elapsed:.1f}s)"
+        )
+        if progress_callback:
+            progress_callback(report)
+
     try:
         logger.info(f"Importing seed data from {csv_path}...")
-        imported_count = 0
-        error_count = 0
-
-        with open(csv_path, mode="r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (skip header)
-                try:
-                    word = Word(
-                        latin=row["latin"].strip(),
-                        translation=row["translation"].strip(),
-                        part_of_speech=row["part_of_speech"].strip(),
-                        level=int(row["level"]),
-                        genitive=row.get("genitive", "").strip() or None,
-                        gender=row.get("gender", "").strip() or None,
-                        declension=row.get("declension", "").strip() or None,
-                        principal_parts=row.get("principal_parts", "").strip() or None,
-                        conjugation=row.get("conjugation", "").strip() or None,
-                    )
-                    session.add(word)
-                    imported_count += 1
-
-                    # Batch commit every 1000 rows
-                    if imported_count % 1000 == 0:
-                        session.commit()
-                        logger.debug(f"Imported {imported_count} words...")
-
-                except Exception as e:
-                    error_count += 1
-                    logger.warning(f"Error on row {row_num}: {e}")
-                    if error_count > 100:  # Stop after 100 errors
-                        raise DatabaseError(f"Too many import errors (>100)")
+        report = bulk_import_words(
+            session,
+            iter_csv_rows(csv_path),
+            _parse_seed_row,
+            chunk_size=chunk_size,
+            progress_callback=log_progress,
+            max_errors=100,  # Stop after 100 errors
+        )
+        for message in report.errors[:10]:
+            logger.warning(message)
 
-        session.commit()
-        logger.info(f"✓ Imported {imported_count} words (errors: {error_count})")
-        return imported_count
+        logger.info(
+            f"✓ Imported {report.inserted} words "
+            f"(duplicates skipped: {report.duplicates}, errors: {report.invalid})"
+        )
+        return report.inserted
+
+    except TooManyImportErrors as e:
+        session.rollback()
+        logger.error(f"✗ Failed to import seed data: {e}")
+        raise DatabaseError(str(e))
 
     except Exception as e:
         session.rollback()
@@ -582,12 +1033,34 @@ def dispose_engine():
     """
     try:
         engine.dispose()
+        if _read_engine is not None:
+            _read_engine.dispose()
         logger.info("✓ Database engine disposed successfully")
     except Exception as e:
         logger.error(f"Error disposing engine: {e}")
 
 
-def print_connection_stats():
-    """Print connection pool statistics"""
+def print_connection_stats(top_n: int = QUERY_METRICS_TOP_N, sort_by: str = "total_ms"):
+    """Print connection pool statistics and the top statement fingerprints"""
     stats = get_connection_status()
+    top_queries = stats.pop("top_queries", None) or []
     logger.info(f"Connection Stats: {stats}")
+
+    if top_n != QUERY_METRICS_TOP_N or sort_by != "total_ms":
+        top_queries = metrics.get_top_statements(top_n, sort_by)
+    if not top_queries:
+        return
+
+    logger.info(f"Top {len(top_queries)} statements by {sort_by}:")
+    logger.info(
+        f"{'count':>8} {'total_ms':>10} {'%time':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'rows/exec':>9}  statement"
+    )
+    for row in top_queries:
+        fingerprint = row["fingerprint"]
+        if len(fingerprint) > 120:
+            fingerprint = fingerprint[:117] + "..."
+        logger.info(
+            f"{row['count']:>8} {row['total_ms']:>10.1f} {row['pct_time']:>6.1f} "
+            f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+            f"{row['avg_rows']:>9.1f}  {fingerprint}"
+        )
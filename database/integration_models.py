@@ -8,6 +8,7 @@ Este módulo complementa database/models.py con nuevos modelos para:
 """
 
 from typing import Optional, List
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship, JSON, Column
 from datetime import datetime
 import json
@@ -52,7 +53,11 @@ class LessonProgress(SQLModel, table=True):
 class LessonVocabulary(SQLModel, table=True):
     """Relación entre lecciones y vocabulario esencial"""
     __tablename__ = "lesson_vocabulary"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Vocabulario de una lección (y su unión con el progreso del usuario)
+        Index("ix_lesson_vocabulary_lesson_number_word_id", "lesson_number", "word_id"),
+        {'extend_existing': True},
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     lesson_number: int = Field(index=True)
@@ -73,7 +78,13 @@ class LessonVocabulary(SQLModel, table=True):
 class UserVocabularyProgress(SQLModel, table=True):
     """Progreso del usuario con cada palabra individual"""
     __tablename__ = "user_vocabulary_progress"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Progreso de un usuario con una palabra concreta
+        Index("ix_user_vocabulary_progress_user_id_word_id", "user_id", "word_id"),
+        # Palabras vencidas de un usuario
+        Index("ix_user_vocabulary_progress_user_id_next_review_date", "user_id", "next_review_date"),
+        {'extend_existing': True},
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(default=1, index=True)
@@ -104,7 +115,11 @@ class UserVocabularyProgress(SQLModel, table=True):
 class ExerciseAttempt(SQLModel, table=True):
     """Registro de intentos de ejercicios"""
     __tablename__ = "exercise_attempt"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Intentos de un usuario en una lección
+        Index("ix_exercise_attempt_user_id_lesson_number", "user_id", "lesson_number"),
+        {'extend_existing': True},
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(default=1, index=True)
@@ -231,6 +246,14 @@ class UserProgressSummary(SQLModel, table=True):
     level: int = Field(default=1)
     badges: str = Field(default="[]")  # JSON array: ["first_steps", "vocab_50"]
     
+    # Acumuladores para el mantenimiento incremental (ver utils/progress_tracker.py)
+    vocab_words_total: int = Field(default=0)  # Palabras con progreso registrado
+    vocab_mastery_sum: float = Field(default=0.0)
+    exercises_correct_total: int = Field(default=0)
+    comprehension_sum: float = Field(default=0.0)  # Lecturas completadas con score > 0
+    comprehension_count: int = Field(default=0)
+    reconciled_at: Optional[datetime] = None  # Última reconciliación con agregados SQL
+    
     # Timestamps
     last_updated: datetime = Field(default_factory=datetime.utcnow)
     last_activity: datetime = Field(default_factory=datetime.utcnow)
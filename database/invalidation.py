@@ -0,0 +1,139 @@
+"""
+Invalidación de las cachés del proceso al escribir en la BD
+
+Un único juego de listeners de sesión (after_flush, do_orm_execute,
+after_commit, after_rollback) reparte los cambios entre las cachés
+registradas con register_invalidation(), cada una con sus modelos:
+
+- on_flush(session, objects, pending): objetos nuevos, modificados o
+  borrados de esos modelos en el flush (los borrados están en session.deleted)
+- on_bulk(orm_execute_state, model, pending): INSERT/UPDATE/DELETE masivo
+  sobre uno de esos modelos
+- on_commit(pending): tras el commit, con lo anotado durante la transacción
+
+`pending` es el estado de cada caché para la transacción en curso (lo crea
+make_pending y se guarda en session.info). Se descarta en el rollback y
+on_commit solo se llama si no está vacío.
+
+Uso (ver utils/reading_mastery.py):
+    def collect(session, objects, users):
+        users.update(obj.user_id for obj in objects)
+
+    register_invalidation("reading_mastery", (ReviewState,),
+                          on_flush=collect, on_commit=invalidate_reading_mastery)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as OrmSession
+
+logger = logging.getLogger(__name__)
+
+# Clave en session.info: nombre de la caché -> estado pendiente de commit
+_PENDING_KEY = "_pending_invalidations"
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    name: str
+    models: Tuple[type, ...]
+    on_flush: Optional[Callable[[Any, List[Any], Any], None]]
+    on_bulk: Optional[Callable[[Any, type, Any], None]]
+    on_commit: Optional[Callable[[Any], None]]
+    make_pending: Callable[[], Any]
+
+
+# Cachés registradas, por nombre (registrar de nuevo el mismo nombre la sustituye)
+_subscriptions: Dict[str, _Subscription] = {}
+
+
+def register_invalidation(
+    name: str,
+    models: Iterable[type],
+    on_flush: Optional[Callable[[Any, List[Any], Any], None]] = None,
+    on_bulk: Optional[Callable[[Any, type, Any], None]] = None,
+    on_commit: Optional[Callable[[Any], None]] = None,
+    make_pending: Callable[[], Any] = set,
+) -> None:
+    """
+    Registra una caché que se invalida con las escrituras de `models`
+
+    Args:
+        name: Nombre único de la caché (clave de su estado pendiente)
+        models: Modelos cuyas escrituras le afectan (incluye subclases)
+        on_flush: Cambios ORM del flush; puede anotar en pending o invalidar ya
+        on_bulk: Escritura masiva sobre uno de los modelos
+        on_commit: Aplica lo pendiente tras el commit
+        make_pending: Crea el estado pendiente vacío (por defecto un set)
+    """
+    _subscriptions[name] = _Subscription(
+        name=name,
+        models=tuple(models),
+        on_flush=on_flush,
+        on_bulk=on_bulk,
+        on_commit=on_commit,
+        make_pending=make_pending,
+    )
+
+
+def _pending(session, subscription: _Subscription) -> Any:
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    if subscription.name not in pending:
+        pending[subscription.name] = subscription.make_pending()
+    return pending[subscription.name]
+
+
+def has_pending_changes(session, name: str) -> bool:
+    """True si la transacción de `session` tiene cambios sin confirmar para la caché `name`"""
+    return bool(session.info.get(_PENDING_KEY, {}).get(name))
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _dispatch_flush(session, flush_context):
+    changed = list(session.new) + list(session.dirty) + list(session.deleted)
+    if not changed:
+        return
+    for subscription in list(_subscriptions.values()):
+        if subscription.on_flush is None:
+            continue
+        objects = [obj for obj in changed if isinstance(obj, subscription.models)]
+        if objects:
+            subscription.on_flush(session, objects, _pending(session, subscription))
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _dispatch_bulk_write(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    for subscription in list(_subscriptions.values()):
+        if subscription.on_bulk is not None and issubclass(mapper.class_, subscription.models):
+            subscription.on_bulk(
+                orm_execute_state, mapper.class_, _pending(orm_execute_state.session, subscription)
+            )
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _dispatch_commit(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    for name, state in pending.items():
+        subscription = _subscriptions.get(name)
+        if subscription is None or subscription.on_commit is None or not state:
+            continue
+        # Un fallo en una caché no impide invalidar las demás
+        try:
+            subscription.on_commit(state)
+        except Exception as e:
+            logger.warning(f"No se pudo invalidar la caché {name}: {e}", exc_info=True)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
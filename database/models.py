@@ -1,4 +1,5 @@
 from typing import Optional, List
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 from datetime import datetime
 import logging
@@ -82,7 +83,11 @@ class Word(SQLModel, table=True):
     frequencies: List["WordFrequency"] = Relationship(back_populates="word")
 
 class ReviewLog(SQLModel, table=True):
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Historial de una palabra ordenado por fecha
+        Index("ix_reviewlog_word_id_review_date", "word_id", "review_date"),
+        {'extend_existing': True},
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     word_id: int = Field(foreign_key="word.id")
@@ -94,6 +99,26 @@ class ReviewLog(SQLModel, table=True):
     
     word: Optional["Word"] = Relationship(back_populates="reviews")
 
+class ReviewState(SQLModel, table=True):
+    """Estado SRS actual de cada palabra por usuario (último resultado de ReviewLog)"""
+    __table_args__ = (
+        Index("ix_reviewstate_user_id_word_id", "user_id", "word_id", unique=True),
+        # Cola de repaso: tarjetas vencidas de un usuario por fecha
+        Index("ix_reviewstate_user_id_due_at", "user_id", "due_at"),
+        {'extend_existing': True},
+    )
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(default=1)
+    word_id: int = Field(foreign_key="word.id")
+    due_at: datetime  # Próximo repaso: last_review_date + interval días
+    ease_factor: float = Field(default=2.5)
+    interval: int = Field(default=0)
+    repetitions: int = Field(default=0)
+    last_quality: int = Field(default=0)
+    last_review_date: datetime = Field(default_factory=datetime.utcnow)
+    review_count: int = Field(default=0)
+
 class UserProfile(SQLModel, table=True):
     __table_args__ = {'extend_existing': True}
     
@@ -137,7 +162,12 @@ class Text(SQLModel, table=True):
 
 class TextWordLink(SQLModel, table=True):
     """Vincula palabras con textos (con anotaciones morfológicas y sintácticas)"""
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Enlaces de un texto en orden de lectura
+        Index("ix_textwordlink_text_id_sentence_position", "text_id", "sentence_number", "position_in_sentence"),
+        Index("ix_textwordlink_word_id", "word_id"),
+        {'extend_existing': True},
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     text_id: int = Field(foreign_key="text.id")
@@ -154,6 +184,16 @@ class TextWordLink(SQLModel, table=True):
     word: Optional["Word"] = Relationship(back_populates="text_links")
 
 
+class TextAnalysisSnapshot(SQLModel, table=True):
+    """Análisis serializado de un texto (TextWordLink + Word) listo para renderizar"""
+    __table_args__ = {'extend_existing': True}
+
+    text_id: int = Field(foreign_key="text.id", primary_key=True)
+    content_version: str  # Versión del contenido del texto y del formato del snapshot
+    payload: str  # JSON: lista de análisis por token
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class WordFrequency(SQLModel, table=True):
     """Frecuencia de palabras en el corpus"""
     __table_args__ = {'extend_existing': True}
@@ -0,0 +1,128 @@
+"""
+Invalidación de TextAnalysisSnapshot y versiones de enlaces por texto
+
+Un snapshot guarda el análisis serializado de un texto (ver
+utils/text_cache.py). Se borra (database/invalidation.py), dentro de la misma
+transacción, cuando cambian los TextWordLink del texto o los datos de una
+Word enlazada (lema, traducción, categoría).
+
+Además se mantiene en memoria una "versión de enlaces" por texto, que las
+cachés del proceso (p. ej. el HTML de ReadingService) usan como clave. La
+versión cambia también con los campos de Word que solo usan esas cachés
+(TOOLTIP_WORD_FIELDS), sin borrar el snapshot.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm.attributes import get_history
+
+from database.invalidation import register_invalidation
+from database.models import TextAnalysisSnapshot, TextWordLink, Word
+
+logger = logging.getLogger(__name__)
+
+# Versión de enlaces por texto y versión global (escrituras masivas)
+_link_versions: Dict[int, int] = {}
+_global_link_version = 0
+_versions_lock = threading.Lock()
+
+# Nombre de la caché en database/invalidation.py
+SNAPSHOT_INVALIDATION_NAME = "text_snapshots"
+
+# Campos de Word que aparecen en el snapshot
+SNAPSHOT_WORD_FIELDS = ("latin", "translation", "part_of_speech")
+
+# Campos de Word que lee el HTML con tooltips (utils/reading_service.py);
+# su cambio incrementa la versión de enlaces pero conserva el snapshot
+TOOLTIP_WORD_FIELDS = SNAPSHOT_WORD_FIELDS + ("definition_es",)
+
+
+def _link_text_ids(link):
+    """text_id actual y anterior (si se movió) de un enlace"""
+    history = get_history(link, "text_id")
+    ids = set(history.added or ()) | set(history.unchanged or ()) | set(history.deleted or ())
+    if link.text_id is not None:
+        ids.add(link.text_id)
+    return {text_id for text_id in ids if text_id is not None}
+
+
+def get_link_version(text_id: int) -> Tuple[int, int]:
+    """Versión actual de los enlaces de un texto (cambia al modificarse)"""
+    return (_global_link_version, _link_versions.get(text_id, 0))
+
+
+def bump_link_versions(text_ids: Optional[Iterable[int]] = None) -> None:
+    """Incrementa la versión de los textos indicados (o de todos si es None)"""
+    global _global_link_version
+    with _versions_lock:
+        if text_ids is None:
+            _global_link_version += 1
+            return
+        for text_id in text_ids:
+            _link_versions[text_id] = _link_versions.get(text_id, 0) + 1
+
+
+def _invalidate_snapshots_on_flush(session, objects, pending_text_ids: set):
+    """Borra los snapshots de los textos cuyos enlaces o palabras cambiaron"""
+    text_ids = set()
+    word_ids = set()
+    tooltip_word_ids = set()
+
+    for obj in objects:
+        if isinstance(obj, TextWordLink):
+            text_ids |= _link_text_ids(obj)
+        elif isinstance(obj, Word) and obj.id is not None:
+            if obj in session.deleted or any(
+                get_history(obj, name).has_changes() for name in SNAPSHOT_WORD_FIELDS
+            ):
+                word_ids.add(obj.id)
+            elif any(get_history(obj, name).has_changes() for name in TOOLTIP_WORD_FIELDS):
+                tooltip_word_ids.add(obj.id)
+
+    if not text_ids and not word_ids and not tooltip_word_ids:
+        return
+
+    table = TextAnalysisSnapshot.__table__
+    tooltip_text_ids = set()
+    try:
+        connection = session.connection()
+        link_table = TextWordLink.__table__
+        if word_ids:
+            text_ids |= set(connection.execute(
+                select(link_table.c.text_id).where(link_table.c.word_id.in_(word_ids)).distinct()
+            ).scalars())
+        if text_ids:
+            connection.execute(delete(table).where(table.c.text_id.in_(text_ids)))
+        if tooltip_word_ids:
+            tooltip_text_ids = set(connection.execute(
+                select(link_table.c.text_id).where(link_table.c.word_id.in_(tooltip_word_ids)).distinct()
+            ).scalars())
+    except Exception as e:
+        logger.warning(f"No se pudieron invalidar snapshots de textos: {e}")
+
+    # Se invalida ya y de nuevo al hacer commit, para que nadie cachee
+    # el estado intermedio con la versión nueva
+    text_ids |= tooltip_text_ids
+    bump_link_versions(text_ids)
+    pending_text_ids.update(text_ids)
+
+
+def _invalidate_snapshots_on_bulk_write(orm_execute_state, model, pending_text_ids: set):
+    """Ante UPDATE/DELETE/INSERT masivos sobre enlaces o palabras, borra todos los snapshots"""
+    try:
+        orm_execute_state.session.connection().execute(delete(TextAnalysisSnapshot.__table__))
+    except Exception as e:
+        logger.warning(f"No se pudieron invalidar snapshots de textos: {e}")
+    bump_link_versions()
+
+
+register_invalidation(
+    SNAPSHOT_INVALIDATION_NAME,
+    (TextWordLink, Word),
+    on_flush=_invalidate_snapshots_on_flush,
+    on_bulk=_invalidate_snapshots_on_bulk_write,
+    on_commit=bump_link_versions,
+)
@@ -18,9 +18,11 @@ from database import (
     SentenceAnalysis, TokenAnnotation, SentenceStructure,
     LessonRequirement, UserLessonProgress,
     LessonProgress, UserVocabularyProgress, ExerciseAttempt,
-    ReadingProgress, UserProgressSummary, Author, UserChallengeProgress
+    ReadingProgress, UserProgressSummary, Author, UserChallengeProgress, ReviewState
 )
 from utils.csv_handler import import_vocabulary_from_csv, export_vocabulary_to_excel
+from utils.progress_tracker import update_user_summary
+from utils.content_catalog import get_content_catalog, invalidate_content_catalog, WORDS
 from database.seed import seed_user
 
 from utils.i18n import get_text
@@ -893,48 +895,35 @@ if section == "Vocabulario":
         col1, col2 = st.columns([4, 1])
         with col2:
             if st.button("🔄 Refrescar", key="refresh_vocab"):
-                if 'vocab_list_cache' in st.session_state:
-                    del st.session_state.vocab_list_cache
+                invalidate_content_catalog([WORDS])
                 st.rerun()
         
-        # Cache words in session state (as dicts to avoid DetachedInstanceError)
-        if 'vocab_list_cache' not in st.session_state:
-            st.session_state.vocab_list_cache = []
-        
-        if not st.session_state.vocab_list_cache:  # Si está vacío, intentar cargar
-            with st.spinner("⏳ Cargando vocabulario..."):
-                try:
-                    with get_session() as session:
-                        words = session.exec(select(Word)).all()
-                        # Convert to dicts WHILE session is still open
-                        st.session_state.vocab_list_cache = [
-                            {
-                                "ID": w.id,
-                                "Latín": w.latin,
-                                "Traducción": w.translation,
-                                "Tipo": w.part_of_speech,
-                                "Nivel": w.level
-                            }
-                            for w in words
-                        ]
-                    update_cache_status('vocabulary', True)
-                except Exception as e:
-                    st.error(f"Error cargando vocabulario: {e}")
-                    update_cache_status('vocabulary', False)
-        
-        cached_data = st.session_state.vocab_list_cache
-        
-        # Ensure cached_data is list of dicts (defensive check)
-        if cached_data and not isinstance(cached_data[0], dict):
-            st.session_state.vocab_list_cache = None
-            st.rerun()
+        # Words from the shared content catalog (one copy per process,
+        # reloaded automatically after vocabulary writes)
+        cached_data = ()
+        with st.spinner("⏳ Cargando vocabulario..."):
+            try:
+                cached_data = get_content_catalog().words()
+                update_cache_status('vocabulary', True)
+            except Exception as e:
+                st.error(f"Error cargando vocabulario: {e}")
+                update_cache_status('vocabulary', False)
         
         if cached_data:
             # Filter
             filter_text = st.text_input("🔍 Buscar palabra", "")
-            filtered_words = [w for w in cached_data if filter_text.lower() in w["Latín"].lower() or filter_text.lower() in w["Traducción"].lower()] if filter_text else cached_data
-            
-            data = filtered_words
+            filtered_words = [w for w in cached_data if filter_text.lower() in w.latin.lower() or filter_text.lower() in w.translation.lower()] if filter_text else cached_data
+            
+            data = [
+                {
+                    "ID": w.id,
+                    "Latín": w.latin,
+                    "Traducción": w.translation,
+                    "Tipo": w.part_of_speech,
+                    "Nivel": w.level
+                }
+                for w in filtered_words
+            ]
             st.dataframe(
                 data, 
                 column_config={
@@ -1226,42 +1215,21 @@ elif section == "Textos":
     with text_tabs[1]:
         st.markdown("### Textos Existentes")
         
-        # Cache texts in session state - Asegurar inicialización
-        if 'texts_list_cache' not in st.session_state:
-            st.session_state.texts_list_cache = []
-        
-        if not st.session_state.texts_list_cache:  # Si está vacío, intentar cargar
-            with st.spinner("⏳ Cargando textos..."):
-                try:
-                    with get_session() as session:
-                        texts_objs = session.exec(select(Text)).all()
-                        # Convert to dicts WHILE session is still open
-                        st.session_state.texts_list_cache = [
-                            {
-                                "title": t.title,
-                                "content": t.content,
-                                "difficulty": t.difficulty,
-                                "author": t.author
-                            }
-                            for t in texts_objs
-                        ]
-                    update_cache_status('texts', True)
-                except Exception as e:
-                    st.error(f"Error cargando textos: {e}")
-                    update_cache_status('texts', False)
-        
-        texts = st.session_state.texts_list_cache
-        
-        # Ensure texts is a list of dicts (defensive check)
-        if texts and not isinstance(texts[0], dict):
-            st.session_state.texts_list_cache = []
-            st.rerun()
+        # Texts from the shared content catalog
+        texts = ()
+        with st.spinner("⏳ Cargando textos..."):
+            try:
+                texts = get_content_catalog().texts()
+                update_cache_status('texts', True)
+            except Exception as e:
+                st.error(f"Error cargando textos: {e}")
+                update_cache_status('texts', False)
         
         if texts:
             for t in texts:
-                with st.expander(f"{t['title']} (Nivel {t['difficulty']})"):
-                    st.write(t['content'][:200] + "...")
-                    st.caption(f"Autor: {t['author'] if t['author'] else 'Desconocido'}")
+                with st.expander(f"{t.title} (Nivel {t.difficulty})"):
+                    st.write(t.content[:200] + "...")
+                    st.caption(f"Autor: {t.author_name if t.author_name else 'Desconocido'}")
         else:
             st.info("📭 No hay textos cargados aún")
 
@@ -1520,38 +1488,15 @@ elif section == "Lecciones":
     with lesson_tabs[1]:
         st.markdown("### Lecciones Existentes")
         
-        # Cache lessons in session state
-        if 'lessons_list_cache' not in st.session_state:
-            st.session_state.lessons_list_cache = []
-        
-        if not st.session_state.lessons_list_cache:  # Si está vacío, intentar cargar
-            with st.spinner("⏳ Cargando lecciones..."):
-                try:
-                    with get_session() as session:
-                        lessons_objs = session.exec(
-                            select(Lesson).order_by(Lesson.lesson_number)
-                        ).all()
-                        # Convert to dicts WHILE session is still open
-                        st.session_state.lessons_list_cache = [
-                            {
-                                "lesson_number": l.lesson_number,
-                                "title": l.title,
-                                "description": l.description,
-                                "created_at": l.created_at.isoformat() if l.created_at else None
-                            }
-                            for l in lessons_objs
-                        ]
-                    update_cache_status('lessons', True)
-                except Exception as e:
-                    st.error(f"Error cargando lecciones: {e}")
-                    update_cache_status('lessons', False)
-        
-        lessons = st.session_state.lessons_list_cache
-        
-        # Ensure lessons is list of dicts (defensive check)
-        if lessons and not isinstance(lessons[0], dict):
-            st.session_state.lessons_list_cache = None
-            st.rerun()
+        # Lessons from the shared content catalog (immutable records, ordered by number)
+        lessons = ()
+        with st.spinner("⏳ Cargando lecciones..."):
+            try:
+                lessons = get_content_catalog().lessons()
+                update_cache_status('lessons', True)
+            except Exception as e:
+                st.error(f"Error cargando lecciones: {e}")
+                update_cache_status('lessons', False)
         
         if not lessons:
             st.info("📭 No hay lecciones en la base de datos aún. Crea la primera usando la pestaña anterior.")
@@ -1562,10 +1507,10 @@ elif section == "Lecciones":
             lesson_data = []
             for lesson in lessons:
                 lesson_data.append({
-                    "Nº": lesson['lesson_number'],
-                    "Título": lesson['title'],
-                    "Descripción": lesson['description'],
-                    "Creada": lesson['created_at'] if lesson['created_at'] else "N/A"
+                    "Nº": lesson.lesson_number,
+                    "Título": lesson.title,
+                    "Nivel": lesson.level,
+                    "Creada": lesson.created_at.isoformat() if lesson.created_at else "N/A"
                 })
             
             df = pd.DataFrame(lesson_data)
@@ -2005,7 +1950,8 @@ elif section == "Usuario":
                             with get_session() as session:
                                 # Delete all progress records
                                 for model in [LessonProgress, UserVocabularyProgress, 
-                                            ExerciseAttempt, ReadingProgress, ReviewLog]:
+                                            ExerciseAttempt, ReadingProgress, ReviewLog,
+                                            ReviewState]:
                                     records = session.exec(select(model)).all()
                                     for record in records:
                                         session.delete(record)
@@ -2020,6 +1966,9 @@ elif section == "Usuario":
                                     summary.exercises_accuracy_avg = 0.0
                                     summary.comprehension_avg = 0.0
                                     session.add(summary)
+                                    
+                                    # Recompute the incremental accumulators from the (now empty) tables
+                                    update_user_summary(session, summary.user_id)
                                 
                                 session.commit()
                                 st.success("✅ Progreso de aprendizaje reseteado")
@@ -2080,7 +2029,7 @@ elif section == "Usuario":
                                 # Delete all progress records
                                 for model in [LessonProgress, UserVocabularyProgress,
                                             ExerciseAttempt, ReadingProgress, ReviewLog,
-                                            UserChallengeProgress]:
+                                            ReviewState, UserChallengeProgress]:
                                     records = session.exec(select(model)).all()
                                     for record in records:
                                         session.delete(record)
@@ -2101,6 +2050,9 @@ elif section == "Usuario":
                                     summary.level = 1
                                     summary.badges = "[]"
                                     session.add(summary)
+                                    
+                                    # Recompute the incremental accumulators from the (now empty) tables
+                                    update_user_summary(session, summary.user_id)
                                 
                                 session.commit()
                                 st.success("✅ TODO el progreso ha sido reseteado")
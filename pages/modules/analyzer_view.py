@@ -5,9 +5,7 @@ import random
 
 
 
-from database.connection import get_session
-from database import Word
-from sqlmodel import select
+from utils.content_catalog import get_content_catalog
 from utils.latin_logic import LatinMorphology, get_declension_forms, get_conjugation_forms
 from utils.i18n import get_text
 from utils.ui_helpers import load_css
@@ -71,109 +69,108 @@ def render_content():
     
     # Get a random word
     try:
-        with get_session() as session:
-            # Apply Context Filters if active
-            if practice_context and practice_context.get("active"):
-                filters = practice_context.get("filters", {})
-                query = select(Word)
-                
-                if "pos" in filters:
-                    query = query.where(Word.part_of_speech.in_(filters["pos"]))
-                if "declension" in filters:
-                    query = query.where(Word.declension.in_(filters["declension"]))
-                if "gender" in filters:
-                    query = query.where(Word.gender.in_(filters["gender"]))
-                # Add more filters as needed
-                
-                all_words = session.exec(query).all()
-                
-                if not all_words:
-                    st.warning(f"No hay palabras disponibles para el contexto: {practice_context.get('description')}")
-                    # Fallback
-                    all_words = session.exec(select(Word)).all()
-            else:
-                all_words = session.exec(select(Word)).all()
-            
-            if not all_words:
-                st.warning("No hay palabras en la base de datos.")
-                st.stop()
-            
-            # If no word selected or need new word, pick random
-            if st.session_state.current_word_analysis is None:
-                word_obj = random.choice(all_words)
-                # Convert to dict to avoid DetachedInstanceError
-                st.session_state.current_word_analysis = {
-                    'id': word_obj.id,
-                    'latin': word_obj.latin,
-                    'translation': word_obj.definition_es if word_obj.definition_es else word_obj.translation,
-                    'part_of_speech': word_obj.part_of_speech,
-                    'gender': word_obj.gender,
-                    'declension': word_obj.declension,
-                    'conjugation': word_obj.conjugation,
-                    'genitive': word_obj.genitive,
-                    'principal_parts': word_obj.principal_parts,
-                    'is_invariable': word_obj.is_invariable,
-                    'category': word_obj.category,
-                    'parisyllabic': word_obj.parisyllabic,
-                    'is_plurale_tantum': word_obj.is_plurale_tantum,
-                    'is_singulare_tantum': word_obj.is_singulare_tantum
-                }
+        # Word pool from the shared content catalog (no per-render select(Word))
+        all_words = get_content_catalog().words()
+        
+        # Apply Context Filters if active
+        if practice_context and practice_context.get("active"):
+            filters = practice_context.get("filters", {})
+            context_words = all_words
             
-            word = st.session_state.current_word_analysis
+            if "pos" in filters:
+                context_words = [w for w in context_words if w.part_of_speech in filters["pos"]]
+            if "declension" in filters:
+                context_words = [w for w in context_words if w.declension in filters["declension"]]
+            if "gender" in filters:
+                context_words = [w for w in context_words if w.gender in filters["gender"]]
+            # Add more filters as needed
             
-            # Display word
-            st.markdown(
-                f"""
-                <div class="vocab-card">
-                    <div class="vocab-latin">{word['latin']}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
+            if context_words:
+                all_words = context_words
+            else:
+                st.warning(f"No hay palabras disponibles para el contexto: {practice_context.get('description')}")
+                # Fallback: all words
+        
+        if not all_words:
+            st.warning("No hay palabras en la base de datos.")
+            st.stop()
+        
+        # If no word selected or need new word, pick random
+        if st.session_state.current_word_analysis is None:
+            word_obj = random.choice(all_words)
+            # Convert to dict to avoid DetachedInstanceError
+            st.session_state.current_word_analysis = {
+                'id': word_obj.id,
+                'latin': word_obj.latin,
+                'translation': word_obj.definition_es if word_obj.definition_es else word_obj.translation,
+                'part_of_speech': word_obj.part_of_speech,
+                'gender': word_obj.gender,
+                'declension': word_obj.declension,
+                'conjugation': word_obj.conjugation,
+                'genitive': word_obj.genitive,
+                'principal_parts': word_obj.principal_parts,
+                'is_invariable': word_obj.is_invariable,
+                'category': word_obj.category,
+                'parisyllabic': word_obj.parisyllabic,
+                'is_plurale_tantum': word_obj.is_plurale_tantum,
+                'is_singulare_tantum': word_obj.is_singulare_tantum
+            }
+        
+        word = st.session_state.current_word_analysis
+        
+        # Display word
+        st.markdown(
+            f"""
+            <div class="vocab-card">
+                <div class="vocab-latin">{word['latin']}</div>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+        
+        
+        
+        # Check if word is invariable
+        if word['is_invariable']:
+            st.markdown("### 📋 Palabra Invariable")
+            st.info(
+                f"**Tipo:** {translate_pos(word['part_of_speech'])}  \n"
+                f"**Significado:** {word['translation']}  \n"
+                f"**Categoría:** {word['category'] if word['category'] else 'N/A'}  \n\n"
+                f"Esta palabra es **invariable**, es decir, no se declina ni se conjuga. Siempre se usa en la misma forma: **{word['latin']}**"
             )
             
-            
-            
-            # Check if word is invariable
-            if word['is_invariable']:
-                st.markdown("### 📋 Palabra Invariable")
-                st.info(
-                    f"**Tipo:** {translate_pos(word['part_of_speech'])}  \n"
-                    f"**Significado:** {word['translation']}  \n"
-                    f"**Categoría:** {word['category'] if word['category'] else 'N/A'}  \n\n"
-                    f"Esta palabra es **invariable**, es decir, no se declina ni se conjuga. Siempre se usa en la misma forma: **{word['latin']}**"
+            st.markdown("---")
+            if st.button("🎲 Nueva Palabra", width='stretch'):
+                st.session_state.current_word_analysis = None
+                st.session_state.current_form_analysis = None
+                st.session_state.show_analysis_result = False
+                st.rerun()
+            st.stop()
+        
+        # Generate all forms for the word
+        forms = {}
+        if word['part_of_speech'] == "noun":
+            if word['declension'] and word['gender']:
+                genitive = word['genitive'] if word['genitive'] else word['latin']
+                forms = morphology.decline_noun(
+                    word['latin'], 
+                    word['declension'], 
+                    word['gender'], 
+                    genitive, 
+                    None, 
+                    word['parisyllabic'], 
+                    word['is_plurale_tantum'], 
+                    word['is_singulare_tantum']
                 )
-                
-                st.markdown("---")
-                if st.button("🎲 Nueva Palabra", width='stretch'):
-                    st.session_state.current_word_analysis = None
-                    st.session_state.current_form_analysis = None
-                    st.session_state.show_analysis_result = False
-                    st.rerun()
-                st.stop()
-            
-            # Generate all forms for the word
-            forms = {}
-            if word['part_of_speech'] == "noun":
-                if word['declension'] and word['gender']:
-                    genitive = word['genitive'] if word['genitive'] else word['latin']
-                    forms = morphology.decline_noun(
-                        word['latin'], 
-                        word['declension'], 
-                        word['gender'], 
-                        genitive, 
-                        None, 
-                        word['parisyllabic'], 
-                        word['is_plurale_tantum'], 
-                        word['is_singulare_tantum']
-                    )
         
-            elif word['part_of_speech'] == "verb":
-                if word['conjugation'] and word['principal_parts']:
-                    forms = morphology.conjugate_verb(
-                        word['latin'], 
-                        word['conjugation'], 
-                        word['principal_parts']
-                    )
+        elif word['part_of_speech'] == "verb":
+            if word['conjugation'] and word['principal_parts']:
+                forms = morphology.conjugate_verb(
+                    word['latin'], 
+                    word['conjugation'], 
+                    word['principal_parts']
+                )
     except Exception as e:
         st.error(f"Error al cargar Analizador Morfológico: {e}")
         import traceback
@@ -17,8 +17,8 @@ from utils.ui_components import render_flashcard
 from utils.text_utils import normalize_latin
 from utils.constants import TENSES_INDICATIVE, TENSE_LABELS_INDICATIVE, MOODS, MOOD_LABELS
 import json
-from datetime import datetime
-from database import Lesson, LessonVocabulary, ExerciseAttempt, UserVocabularyProgress
+from database import Lesson, LessonVocabulary
+from utils.progress_tracker import record_exercise_attempt, record_vocabulary_practice
 
 
 def render_content():
@@ -422,58 +422,29 @@ def render_content():
                                 st.session_state.xp_feedback_conjugation = f"🎉 +{xp_gained} XP ({correct_count}/{total_count} correctas)"
                     
                     # --- TRACKING INTEGRATION ---
+                    # Through progress_tracker so the progress summary stays in sync
                     if total_count > 0:
                         with get_session() as session:
-                            # 1. Register Exercise Attempt
-                            attempt = ExerciseAttempt(
+                            is_correct = correct_count == total_count
+                            record_exercise_attempt(
+                                session,
                                 user_id=1, # Default user
                                 lesson_number=st.session_state.conjugation_lesson_filter or 0,
                                 exercise_type="conjugation",
-                                exercise_config=json.dumps({
+                                exercise_config={
                                     "word": verb.latin,
                                     "conjugation": verb.conjugation,
                                     "tense": tense_selection,
                                     "voice": voice_selection,
                                     "mode": mode_selection
-                                }),
+                                },
                                 user_answer=json.dumps(st.session_state.user_conjugation_answers),
                                 correct_answer="[JSON DATA HIDDEN]",
-                                is_correct=(correct_count == total_count),
+                                is_correct=is_correct,
                                 time_spent_seconds=0,
                                 hint_used=st.session_state.show_conjugation_answers
                             )
-                            session.add(attempt)
-                            
-                            # 2. Update Vocabulary Progress
-                            vocab_progress = session.exec(
-                                select(UserVocabularyProgress).where(
-                                    UserVocabularyProgress.word_id == verb.id,
-                                    UserVocabularyProgress.user_id == 1
-                                )
-                            ).first()
-                            
-                            if not vocab_progress:
-                                vocab_progress = UserVocabularyProgress(
-                                    user_id=1, 
-                                    word_id=verb.id,
-                                    first_seen=datetime.utcnow()
-                                )
-                                session.add(vocab_progress)
-                            
-                            vocab_progress.times_seen += 1
-                            if correct_count == total_count:
-                                vocab_progress.times_correct += 1
-                            else:
-                                vocab_progress.times_incorrect += 1
-                                
-                            vocab_progress.last_reviewed = datetime.utcnow()
-                            
-                            # Simple mastery calculation
-                            total_attempts = vocab_progress.times_correct + vocab_progress.times_incorrect
-                            if total_attempts > 0:
-                                vocab_progress.mastery_level = vocab_progress.times_correct / total_attempts
-                            
-                            session.commit()
+                            record_vocabulary_practice(session, 1, verb.id, is_correct)
 
                     st.session_state.show_conjugation_answers = True
                     st.rerun()
@@ -2,7 +2,6 @@ import os
 import random
 import sys
 import json
-from datetime import datetime
 
 import streamlit as st
 from sqlmodel import or_, select
@@ -11,9 +10,7 @@ from database import (
     UserProfile, 
     Word, 
     Lesson,
-    LessonVocabulary,
-    ExerciseAttempt, 
-    UserVocabularyProgress
+    LessonVocabulary
 )
 from database.connection import get_session
 from utils.constants import CASE_LABELS, CASES, NUMBER_LABELS, NUMBERS
@@ -25,6 +22,7 @@ from utils.latin_logic import (
     get_demonstrative_genders,
     get_pronoun_forms,
 )
+from utils.progress_tracker import record_exercise_attempt, record_vocabulary_practice
 from utils.text_utils import normalize_latin
 from utils.ui_helpers import load_css
 from utils.ui_components import render_flashcard
@@ -733,57 +731,27 @@ def render_content():
                                 st.session_state.xp_feedback = f"🎉 +{xp_gained} XP ({correct_count}/{total_count} correctas)"
 
                     # --- TRACKING INTEGRATION ---
+                    # Through progress_tracker so the progress summary stays in sync
                     if total_count > 0:
                         with get_session() as session:
-                            # 1. Register Exercise Attempt
-                            attempt = ExerciseAttempt(
+                            is_correct = correct_count == total_count
+                            record_exercise_attempt(
+                                session,
                                 user_id=1, # Default user
-                                lesson_number=st.session_state.declension_lesson_filter or 0, # 0 if free mode
+                                lesson_number=st.session_state.declension_lesson_filter or 0,
                                 exercise_type="declension",
-                                exercise_config=json.dumps({
+                                exercise_config={
                                     "word": noun.latin,
                                     "declension": noun.declension,
                                     "mode": "guided" if not is_demonstrative else "demonstrative"
-                                }),
+                                },
                                 user_answer=json.dumps(st.session_state.user_declension_answers),
-                                correct_answer="[JSON DATA HIDDEN]", # Optional for privacy
-                                is_correct=(correct_count == total_count),
-                                time_spent_seconds=0, 
+                                correct_answer="[JSON DATA HIDDEN]",
+                                is_correct=is_correct,
+                                time_spent_seconds=0,
                                 hint_used=st.session_state.show_declension_answers
                             )
-                            session.add(attempt)
-                            
-                            # 2. Update Vocabulary Progress
-                            # Find or create progress record
-                            vocab_progress = session.exec(
-                                select(UserVocabularyProgress).where(
-                                    UserVocabularyProgress.word_id == noun.id,
-                                    UserVocabularyProgress.user_id == 1
-                                )
-                            ).first()
-                            
-                            if not vocab_progress:
-                                vocab_progress = UserVocabularyProgress(
-                                    user_id=1, 
-                                    word_id=noun.id,
-                                    first_seen=datetime.utcnow()
-                                )
-                                session.add(vocab_progress)
-                            
-                            vocab_progress.times_seen += 1
-                            if correct_count == total_count:
-                                vocab_progress.times_correct += 1
-                            else:
-                                vocab_progress.times_incorrect += 1
-                                
-                            vocab_progress.last_reviewed = datetime.utcnow()
-                            
-                            # Simple mastery calculation
-                            total_attempts = vocab_progress.times_correct + vocab_progress.times_incorrect
-                            if total_attempts > 0:
-                                vocab_progress.mastery_level = vocab_progress.times_correct / total_attempts
-                            
-                            session.commit()
+                            record_vocabulary_practice(session, 1, noun.id, is_correct)
 
                     st.session_state.show_declension_answers = True
                     st.rerun()
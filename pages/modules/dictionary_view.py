@@ -1,11 +1,10 @@
 import streamlit as st
-from database.connection import get_session, engine
-from database import Word, InflectedForm
-from sqlmodel import select, func
+from database.connection import get_read_session
 from utils.latin_logic import LatinMorphology
 from utils.i18n import get_text
 from utils.ui_helpers import load_css
-from utils.text_utils import normalize_latin
+from utils.content_catalog import get_content_catalog
+from utils.dictionary_search import search_words
 
 
 def render_content():
@@ -31,24 +30,20 @@ def render_content():
     with col2:
         search_mode = st.selectbox(
             "Modo",
-            ["Exacto", "Contiene"],
-            label_visibility="collapsed"
+            ["Exacto", "Prefijo"],
+            label_visibility="collapsed",
+            help="Exacto: lema o forma flexionada. Prefijo: comienzo del lema, formas, traducción o definición."
         )
     
     if search_term:
-        # Normalize search term
-        search_normalized = normalize_latin(search_term.strip().lower())
-        
-        with get_session() as session:
-            # Search in database
-            if search_mode == "Exacto":
-                results = session.exec(
-                    select(Word).where(Word.latin == search_normalized)
-                ).all()
-            else:
-                results = session.exec(
-                    select(Word).where(Word.latin.contains(search_normalized)).limit(50)
-                ).all()
+        with get_read_session() as session:
+            # Full-text index (macron-insensitive), ranked by frequency
+            results = search_words(
+                session,
+                search_term,
+                mode="exact" if search_mode == "Exacto" else "prefix",
+                limit=50
+            )
             
             # Display results
             if results:
@@ -136,45 +131,40 @@ def render_content():
     st.markdown("---")
     st.markdown("### Explorar por categoría")
     
-    with get_session() as session:
-        # Get counts by part of speech
-        all_words = session.exec(select(Word)).all()
-        pos_counts = {}
-        for word in all_words:
-            pos = word.part_of_speech or 'unknown'
-            pos_counts[pos] = pos_counts.get(pos, 0) + 1
-        
-        # Display categories
-        pos_spanish = {
-            'noun': 'Sustantivos',
-            'verb': 'Verbos',
-            'adjective': 'Adjetivos',
-            'adverb': 'Adverbios',
-            'preposition': 'Preposiciones',
-            'conjunction': 'Conjunciones',
-            'pronoun': 'Pronombres',
-            'interjection': 'Interjecciones'
-        }
-        
-        # Create rows of 4
-        items = list(pos_spanish.items())
-        for i in range(0, len(items), 4):
-            cols = st.columns(4)
-            for j in range(4):
-                if i + j < len(items):
-                    pos, label = items[i + j]
-                    count = pos_counts.get(pos, 0)
-                    
-                    with cols[j]:
-                        st.markdown(
-                            f"""
-                            <div class="stat-box">
-                                <div class="stat-value">{count}</div>
-                                <div class="stat-label">{label}</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
+    # Counts by part of speech (shared content catalog, no per-render full scan)
+    pos_counts = get_content_catalog().pos_counts()
+    
+    # Display categories
+    pos_spanish = {
+        'noun': 'Sustantivos',
+        'verb': 'Verbos',
+        'adjective': 'Adjetivos',
+        'adverb': 'Adverbios',
+        'preposition': 'Preposiciones',
+        'conjunction': 'Conjunciones',
+        'pronoun': 'Pronombres',
+        'interjection': 'Interjecciones'
+    }
+    
+    # Create rows of 4
+    items = list(pos_spanish.items())
+    for i in range(0, len(items), 4):
+        cols = st.columns(4)
+        for j in range(4):
+            if i + j < len(items):
+                pos, label = items[i + j]
+                count = pos_counts.get(pos, 0)
+                
+                with cols[j]:
+                    st.markdown(
+                        f"""
+                        <div class="stat-box">
+                            <div class="stat-value">{count}</div>
+                            <div class="stat-label">{label}</div>
+                        </div>
+                        """,
+                        unsafe_allow_html=True
+                    )
     
     # Footer with attribution
     st.markdown("---")
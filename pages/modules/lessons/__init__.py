@@ -0,0 +1,66 @@
+"""
+Registro de lecciones del curso (carga perezosa).
+
+Cada lección vive en su propio módulo (intro.py, lesson_01.py ... lesson_40.py)
+y solo se importa cuando se muestra: abrir la lección 3 carga lesson_03.py y
+nada más. El contenido estático de la lección (markdown, tablas) son constantes
+del módulo compilado; Python guarda el bytecode en __pycache__ y el módulo
+importado queda en sys.modules, así que se compila una vez y los reruns de
+Streamlit lo reutilizan.
+
+Uso:
+    renderer = get_lesson_renderer("l3")
+    if renderer:
+        renderer()
+"""
+
+import importlib
+from typing import Callable, Dict, List, Optional
+
+# lesson_id -> (módulo, función de render)
+LESSON_REGISTRY: Dict[str, tuple] = {"intro": ("intro", "render_intro")}
+LESSON_REGISTRY.update({
+    f"l{number}": (f"lesson_{number:02d}", f"render_lesson_{number}")
+    for number in range(1, 41)
+})
+
+# Renderers ya resueltos (lesson_id -> función)
+_renderers: Dict[str, Callable[[], None]] = {}
+
+
+def get_lesson_renderer(lesson_id: str) -> Optional[Callable[[], None]]:
+    """
+    Función de render de una lección, importando su módulo la primera vez.
+
+    Args:
+        lesson_id: "intro" o "l<número>" (p. ej. "l3")
+
+    Returns:
+        La función de render, o None si la lección no existe
+    """
+    renderer = _renderers.get(lesson_id)
+    if renderer is not None:
+        return renderer
+
+    entry = LESSON_REGISTRY.get(lesson_id)
+    if entry is None:
+        return None
+
+    module_name, function_name = entry
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    renderer = getattr(module, function_name)
+    _renderers[lesson_id] = renderer
+    return renderer
+
+
+def get_lesson_renderer_by_name(function_name: str) -> Optional[Callable[[], None]]:
+    """Resuelve por nombre de función (render_intro, render_lesson_N)"""
+    for lesson_id, (_, name) in LESSON_REGISTRY.items():
+        if name == function_name:
+            return get_lesson_renderer(lesson_id)
+    return None
+
+
+def available_lessons() -> List[str]:
+    """Ids de lección registrados, en orden"""
+    return list(LESSON_REGISTRY)
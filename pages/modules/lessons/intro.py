@@ -0,0 +1,123 @@
+"""Introducción al curso"""
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_intro():
+    st.image("static/images/intro_course_summary.png", caption="Los Cuatro Pilares del Aprendizaje: Leccion, Memorizacion, Practica y Analisis", width="stretch")
+
+    st.markdown("""
+    ## Aprende Latin: Un Enfoque Progresivo
+    
+    Bienvenido al curso de gramatica latina. Este curso esta disenado para guiarte paso a paso 
+    desde los conceptos mas basicos hasta las estructuras complejas, siguiendo el enfoque pedagogico 
+    del profesor **Fernando Nieto Mesa**.
+    
+    ### \u00bfPor que estudiar Latin?
+    
+    *   **Origen**: Es la madre del espanol y de las lenguas romances (frances, italiano, portugues, etc.).
+    *   **Cultura**: Nos conecta con el origen de nuestra civilizacion, leyes y costumbres.
+    *   **Etimologia**: Mas del 60% del vocabulario espanol proviene del latin.
+    
+    ### Estructura del Curso
+    
+    El curso consta de **40 lecciones progresivas** organizadas en tres niveles:
+    
+    ---
+    
+    ## 📗 NIVEL BASICO (Lecciones 1-13)
+    **Objetivo**: Fundamentos de morfologia nominal y verbal
+    
+    """)
+    
+    render_styled_table(
+        ["Leccion", "Titulo", "Contenido Principal", "Objetivo"],
+        [
+            ["**1**", "Primeros Pasos", "Alfabeto, pronunciacion, primeras palabras", "Familiarizarse con el latin"],
+            ["**2**", "El Sujeto", "Nominativo, verbo SUM (presente)", "Estructura de oracion basica"],
+            ["**3**", "Primera Declinacion", "Sustantivos femeninos -a, -ae", "Declinar sustantivos 1a"],
+            ["**4**", "Segunda Declinacion", "Masculinos -us, neutros -um", "Declinar sustantivos 2a"],
+            ["**5**", "El Neutro", "Reglas especiales neutros", "Dominar genero neutro"],
+            ["**6**", "Consolidacion", "Adjetivos 1a clase", "Concordancia adj-sustantivo"],
+            ["**7**", "Tercera Declinacion", "Temas consonanticos, Dativo", "Declinar sustantivos 3a"],
+            ["**8**", "Cuarta Declinacion", "Temas en -u, Preterito Perfecto", "Declinar 4a y tiempo pasado"],
+            ["**9**", "Quinta Declinacion", "Temas en -e, Futuro", "Completar 5 declinaciones"],
+            ["**10**", "Adjetivos 2a Clase", "Adjetivos 3a declinacion", "Adjetivos de tres tipos"],
+            ["**11**", "Comparacion", "Comparativo, superlativo, numerales", "Grados del adjetivo"],
+            ["**12**", "Pronombres", "Personales, demostrativos, relativos", "Sistema pronominal completo"],
+            ["**13**", "Voz Pasiva y Ablativo", "Pasiva, complementos de lugar", "Voz pasiva e introduccion ablativo"]
+        ]
+    )
+    
+    st.markdown("""
+    
+    ---
+    
+    ## 📘 NIVEL AVANZADO (Lecciones 14-30)
+    **Objetivo**: Sistema verbal completo y sintaxis compleja
+    
+    """)
+    
+    render_styled_table(
+        ["Leccion", "Titulo", "Contenido Principal", "Objetivo"],
+        [
+            ["**14**", "Pluscuamperf. y Fut. Perf.", "Tiempos compuestos de indicativo", "Completar indicativo"],
+            ["**15**", "Voz Pasiva - Infectum", "Pasiva presente, imperfecto, futuro", "Dominar pasiva infectum"],
+            ["**16**", "Voz Pasiva - Perfectum", "Pasiva perfecta con sum + participio", "Dominar pasiva perfectum"],
+            ["**17**", "Verbos Deponentes", "Forma pasiva, significado activo", "Identificar deponentes"],
+            ["**18**", "Subjuntivo I", "Presente y perfecto subjuntivo", "Formar subjuntivo"],
+            ["**19**", "Subjuntivo II", "Imperfecto y plusc. subj., consecutio", "Concordancia de tiempos"],
+            ["**20**", "Infinitivos y AcI", "Infinitivos, acusativo con infinitivo", "Oraciones infinitivas"],
+            ["**21**", "Participios", "Presente, perfecto, futuro", "Sistema de participios"],
+            ["**22**", "Ablativo Absoluto", "Construccion absoluta", "Usar ablativo absoluto"],
+            ["**23**", "Gerundio y Gerundivo", "Formas verbales -nd-", "Distinguir gerundio/gerundivo"],
+            ["**24**", "Perifrasticas", "Activa (-urus sum) y pasiva (-ndus sum)", "Intencion y obligacion"],
+            ["**25**", "Sintaxis I", "Coordinacion, causales, temporales", "Oraciones coordinadas y subordinadas basicas"],
+            ["**26**", "Sintaxis II", "Completivas, finales, consecutivas", "Subordinadas con ut/ne"],
+            ["**27**", "Condicionales", "Real, posible, irreal", "Tipos de condicion"],
+            ["**28**", "Relativas", "Oraciones de relativo, qui quae quod", "Subordinadas adjetivas"],
+            ["**29**", "Estilo Indirecto", "Oratio obliqua", "Discurso indirecto Latino"],
+            ["**30**", "Metrica y Poesia", "Hexametro, distica elegiaco", "Leer poesia latina"]
+        ]
+    )
+    
+    st.markdown("""
+    
+    ---
+    
+    ## 📕 NIVEL EXPERTO (Lecciones 31-40)
+    **Objetivo**: Autores, estilistica y evolucion del latin
+    
+    """)
+    
+    render_styled_table(
+        ["Leccion", "Titulo", "Contenido Principal", "Objetivo"],
+        [
+            ["**31**", "Cesar y Prosa Militar", "De Bello Gallico, estilo militar", "Leer prosa narrativa"],
+            ["**32**", "Ciceron y Retorica", "Catilinarias, estilo oratorio", "Leer discursos"],
+            ["**33**", "Salustio e Historiografia", "Conjuracion de Catilina", "Leer historia"],
+            ["**34**", "Catulo y Lirica", "Carmina, poesia amorosa", "Leer lirica"],
+            ["**35**", "Virgilio y Epica", "Eneida, hexametro epico", "Leer epica"],
+            ["**36**", "Horacio y Odas", "Odas, metros variados", "Leer poesia lirica"],
+            ["**37**", "Ovidio y Metamorfosis", "Transformaciones, hexametro", "Leer poesia narrativa"],
+            ["**38**", "Latin Medieval", "Textos medievales", "Reconocer caracteristicas medievales"],
+            ["**39**", "Latin Eclesiastico", "Vulgata, liturgia", "Leer textos religiosos"],
+            ["**40**", "Latin Renacentista", "Humanismo, neolatin", "Latin moderno y cientifico"]
+        ]
+    )
+    
+    st.markdown("""
+    
+    ---
+    
+    ### Como usar este curso
+    
+    1.  **Sigue el orden**: Las lecciones estan cuidadosamente secuenciadas
+    2.  **Practica activamente**: Usa las secciones de Memorizacion y Practica
+    3.  **Analiza textos**: Usa la herramienta de Analisis para consolidar
+    4.  **Estudia con los infogramas**: Recursos visuales para memorizar estructuras clave
+    
+    \u00a1Comencemos! Selecciona la **Leccion 1** en el menu lateral.
+    """)
@@ -0,0 +1,226 @@
+"""Lección 1: Primeros Pasos"""
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+from database.connection import get_session
+from utils.exercise_generator import ExerciseGenerator
+from utils.reading_service import ReadingService
+
+
+def render_lesson_1():
+    # Unlocks (L1 is always unlocked for now)
+    vocab_unlocked = True
+    exercises_unlocked = True
+    reading_unlocked = True
+
+    # Create Tabs
+    tab_theory, tab_vocab, tab_practice, tab_reading = st.tabs(["📖 Teoría", "🧠 Vocabulario", "⚔️ Práctica", "📜 Lectura"])
+
+    # --- TAB 1: THEORY ---
+    with tab_theory:
+        st.image("static/images/curso_gramatica/leccion1_mapa_imperio.png", 
+                 caption="El Imperio Romano en su máxima extensión, con el Lacio (Latium) y Roma destacados",
+                 width="stretch")
+        
+        st.markdown("""
+        ## Lección 1: Primeros Pasos
+        
+        ### 1. El Alfabeto Latino
+        
+        El alfabeto latino constaba originalmente de 23 letras. Persiste en el español, pero sin la **ñ**. 
+        Algunas letras tenían pronunciación distinta a la nuestra.
+        
+        > **Importante**: En latín clásico no existían los acentos escritos ni signos de cantidad. 
+        > Los gramáticos modernos los añaden para facilitar el aprendizaje.
+        
+        ### 2. Reglas de Pronunciación Clásica
+        
+        Vamos a aprender la **pronunciación restituta** (restituida), que intenta reconstruir cómo 
+        hablaban los romanos cultos en el siglo I a.C.
+        """)
+        
+        st.image("static/images/curso_gramatica/leccion1_alfabeto.png",
+                 caption="Guía de pronunciación del alfabeto latino clásico",
+                 width="stretch")
+        
+        st.markdown("""
+        
+        **Consonantes especiales:**
+        """)
+        
+        render_styled_table(
+            ["Letra(s)", "Pronunciación", "Ejemplo", "Se dice"],
+            [
+                ["**c**", "Siempre /k/ (como 'casa')", "*Cicero*", "/Kíkero/"],
+                ["**ch**", "/k/ (no /ch/)", "*chorus*", "/kórus/"],
+                ["**g**", "Siempre /g/ suave (como 'gato')", "*genus*", "/guénus/"],
+                ["**ge, gi**", "/gue/, /gui/", "*genui*, *gigno*", "/guénui/, /guígno/"],
+                ["**j**", "Como /i/ consonántica (inglés 'y')", "*janua*", "/iánua/"],
+                ["**ph**", "Como /f/", "*philosophia*", "/filosofía/"],
+                ["**que, qui**", "/kue/, /kui/", "*atque*, *quidem*", "/átkue/, /kúidem/"],
+                ["**v**", "Como /u/ semiconsonántica (inglés 'w')", "*vivere*", "/wíwere/"]
+            ]
+        )
+
+        st.markdown("""
+        
+        **Diptongos:**
+        *   **ae** = /ai/: *rosae* se dice /rósai/
+        *   **oe** = /oi/: *poena* se dice /póina/
+        *   **au** = /au/ (como en español): *aurum* se dice /áurum/
+        
+        > **Nota sobre la doble L**: En latín no existía el sonido /ll/ español. 
+        > Se pronuncian las dos eles separadas: *ille* = /il-le/, *puella* = /puel-la/, *ancilla* = /an-kil-la/.
+        
+        ### 3. Acentuación
+        
+        En latín **no hay palabras agudas**, solo llanas (graves) o esdrújulas.
+        
+        **Reglas:**
+        1.  Todas las palabras de **dos sílabas** son llanas: *ro-sa*, *do-mus*, *pa-ter*.
+        2.  Las palabras de **tres o más sílabas**:
+            *   Si la penúltima sílaba es **larga**: acento en la penúltima -> *musá-rum*, *candó-ris*.
+            *   Si la penúltima sílaba es **breve**: acento en la antepenúltima -> *cón-sules*, *fí-li-o-lus*.
+        
+        **¿Cómo saber si una sílaba es larga o breve?**
+        *   Es **larga** si forma diptongo, o si la vocal va seguida de **x, z, o dos consonantes**.
+        *   Es **breve** si la vocal va seguida de otra vocal.
+        
+        ### 4. Conceptos Fundamentales: Flexión
+        
+        El latín es una lengua **flexiva**. Esto significa que las palabras cambian su terminación (desinencia) 
+        para indicar su función en la oración, no el orden de las palabras.
+        
+        **Comparación con el español:**
+        """)
+        
+        render_styled_table(
+            ["Español", "Latín"],
+            [
+                ["El agricultor llama a la criada.", "*Agricola ancillam vocat.*"],
+                ["La criada llama al agricultor.", "*Agricolam ancilla vocat.*"]
+            ]
+        )
+
+        st.markdown("""
+        
+        > Observa que *agricola* y *ancilla* cambian de forma (*-a* / *-am*) para indicar quién es el sujeto 
+        > y quién el objeto, sin importar el orden.
+        
+        **Características de la flexión:**
+        *   **Declinación**: Cambios que experimentan sustantivos, adjetivos y pronombres.
+        *   **Conjugación**: Cambios que experimentan los verbos.
+        
+        ### 5. Categorías Gramaticales
+        
+        Las palabras latinas tienen:
+        *   **Género**: Masculino, Femenino, **Neutro** (ni uno ni otro).
+        *   **Número**: Singular, Plural.
+        *   **Caso**: Indica la función sintáctica (Sujeto, Objeto, Posesión, etc.).
+        
+        > **Sobre los artículos**: El latín **no tiene artículos** (el, la, un, una). 
+        > Al traducir, debemos añadirlos según el contexto. *Puella* puede ser "la niña", "una niña" o simplemente "niña".
+        
+        ### 6. Partes de la Oración
+        
+        En latín hay ocho clases de palabras:
+        """)
+        
+        render_styled_table(
+            ["Palabra", "Ejemplo", "Traducción"],
+            [
+                ["Nombre (sustantivo)", "*ancilla*", "criada"],
+                ["Adjetivo", "*sedula*", "activa"],
+                ["Pronombre", "*ego*", "yo"],
+                ["Verbo", "*voco*", "llamo"],
+                ["Adverbio", "*bene*", "bien"],
+                ["Preposición", "*cum*", "con"],
+                ["Conjunción", "*et*", "y"],
+                ["Interjección", "*o!*", "¡oh!"]
+            ]
+        )
+
+        st.markdown("""
+        
+        ### Ejercicio de Pronunciación
+        
+        Intenta leer en voz alta estas palabras aplicando las reglas:
+        *   *Cicero philosophus* (Cicerón el filósofo) -> /Kíkero filósofus/
+        *   *Julius Caesar* (Julio César) -> /Iúlius Káisar/
+        *   *Via longa* (El camino largo) -> /Wía lónga/
+        *   *Aqua vitae* (Agua de vida) -> /Ákua wítai/
+        """)
+        
+
+
+    # --- TAB 2: VOCABULARY ---
+    with tab_vocab:
+        from utils.learning_hub_widgets import render_vocabulary_widget
+        render_vocabulary_widget(lesson_number=1)
+
+    # --- TAB 3: PRACTICE ---
+    with tab_practice:
+        st.markdown("### ⚔️ Taller de Traducción")
+        from utils.learning_hub_widgets import render_translation_workshop
+        render_translation_workshop(lesson_number=1)
+        
+        st.divider()
+        st.markdown("### 🎲 Ejercicios Generados")
+        
+        # Importar funciones de UI
+        from utils.learning_hub_widgets import (
+            render_vocabulary_match_exercise,
+            render_multiple_choice_exercise,
+            render_sentence_completion_exercise
+        )
+        
+        with get_session() as session:
+            generator = ExerciseGenerator(session)
+            ex_type = st.selectbox(
+                "Tipo de Ejercicio:",
+                ["Emparejar Vocabulario", "Opción Múltiple (Morfología)", "Completar Oraciones"],
+                key="ex_type_l1"
+            )
+            
+            if st.button("Generar Nuevos Ejercicios", key="gen_ex_l1"):
+                if ex_type == "Emparejar Vocabulario":
+                    exercises = generator.generate_vocabulary_match(1)
+                    st.session_state["exercises_l1"] = ("vocab", exercises)
+                elif ex_type == "Opción Múltiple (Morfología)":
+                    exercises = generator.generate_declension_choice(1)
+                    st.session_state["exercises_l1"] = ("mc", exercises)
+                elif ex_type == "Completar Oraciones":
+                    exercises = generator.generate_sentence_completion(1)
+                    st.session_state["exercises_l1"] = ("fill", exercises)
+            
+            # Renderizar ejercicios almacenados
+            if "exercises_l1" in st.session_state:
+                ex_type_stored, exercises = st.session_state["exercises_l1"]
+                if ex_type_stored == "vocab":
+                    render_vocabulary_match_exercise(exercises, 1, key_suffix="dyn")
+                elif ex_type_stored == "mc":
+                    render_multiple_choice_exercise(exercises, 1)
+                elif ex_type_stored == "fill":
+                    render_sentence_completion_exercise(exercises, 1)
+
+    # --- TAB 4: READING ---
+    with tab_reading:
+        with get_session() as session:
+            reader = ReadingService(session)
+            text = reader.get_reading_for_lesson(1)
+            
+            if text:
+                st.markdown(f"### {text.title}")
+                enriched_html = reader.enrich_reading_with_tooltips(text.id)
+                st.markdown(enriched_html, unsafe_allow_html=True)
+                
+                if st.button("Marcar como Leída", key="read_l1"):
+                    reader.mark_reading_as_completed(1, text.id)
+                    st.success("¡Lectura completada!")
+            else:
+                st.info("No hay lectura asignada para esta lección aún.")
+
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary
+    render_lesson_progress_summary(lesson_number=1)
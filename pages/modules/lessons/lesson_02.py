@@ -0,0 +1,93 @@
+"""Lección 2: El Sujeto (Nominativo)"""
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_2():
+    st.image("static/images/curso_gramatica/leccion2_foro_romano.png",
+             caption="El Foro Romano, centro de la vida pública en la antigua Roma",
+             width="stretch")
+    
+    st.markdown("""
+    ## Lección 2: Los Casos y el Nominativo
+    
+    ### ¿Qué son los Casos?
+    
+    En español, usamos el **orden de las palabras** y las **preposiciones** para indicar la función de cada palabra:
+    *   "El padre ama **al hijo**" (hijo = objeto directo, marcado con "a")
+    *   "El regalo **del padre**" (padre = posesión, marcado con "de")
+    *   "Hablo **al maestro**" (maestro = objeto indirecto, marcado con "a")
+    
+    En latín, usamos los **casos**: terminaciones especiales que cambian según la función sintáctica.
+    
+    ### Los Seis Casos del Latín
+    """)
+    
+    render_styled_table(
+        ["Caso", "Función Principal", "Pregunta Clave"],
+        [
+            ["**Nominativo**", "Sujeto / Atributo", "¿Quién?"],
+            ["**Vocativo**", "Invocación/Llamada", "¡...!"],
+            ["**Acusativo**", "Objeto Directo", "¿A quién/qué?"],
+            ["**Genitivo**", "Posesión/Pertenencia", "¿De quién?"],
+            ["**Dativo**", "Objeto Indirecto", "¿A/Para quién?"],
+            ["**Ablativo**", "Circunstancia (Lugar, Modo, Instrumento)", "¿Con/Por/Desde qué?"]
+        ]
+    )
+
+    st.markdown("""
+    """)
+    
+    st.image("static/images/curso_gramatica/casos_latinos_diagram.png",
+             caption="Rueda de los 6 Casos Latinos y sus funciones",
+             width="stretch")
+             
+    st.markdown("""
+    
+    > **Clave de aprendizaje**: Aprenderemos los casos progresivamente. 
+    > Empezaremos con el Nominativo (Sujeto) y el Acusativo (Objeto Directo).
+    
+    ### El Caso Nominativo: El Sujeto
+    
+    El **Nominativo** es el caso fundamental. Responde a la pregunta **¿Quién?** realiza la acción.
+    
+    **Usos:**
+    1.  **Sujeto de un verbo**: *Puella cantat* (La niña canta)
+    2.  **Atributo** (con verbos copulativos como *sum*): *Puella est pulchra* (La niña es hermosa)
+    
+    ### La Oración Simple en Latín
+    
+    **Orden flexible:**
+    El latín permite gran libertad en el orden de las palabras porque los casos marcan la función.
+    Sin embargo, el orden más elegante y común es:
+    
+    **SUJETO + COMPLEMENTOS + VERBO**
+    
+    *   *Puella rosam amat.* (La niña ama la rosa)
+    *   *Rosam puella amat.* (La niña ama la rosa) ← Mismo significado, énfasis distinto
+    *   *Amat puella rosam.* (La niña ama la rosa) ← Menos elegante pero correcto
+    
+    > **Nota crucial**: En latín **NO hay artículos** (el, la, un, una). Al traducir, los añadimos según el contexto.
+    
+    ### Ejemplos de Análisis
+    """)
+    
+    render_styled_table(
+        ["Oración Latina", "Análisis", "Traducción"],
+        [
+            ["*Deus est bonus.*", "Deus (Nom, Suj) + est (verbo) + bonus (Nom, Atributo)", "Dios es bueno."],
+            ["*Puella cantat.*", "Puella (Nom, Suj) + cantat (verbo)", "La niña canta."],
+            ["*Roma magna est.*", "Roma (Nom, Suj) + magna (Nom, Atributo) + est (verbo)", "Roma es grande."]
+        ]
+    )
+
+    st.markdown("""
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop
+    render_vocabulary_widget(lesson_number=2)
+    render_translation_workshop(lesson_number=2)
+    render_lesson_progress_summary(lesson_number=2)
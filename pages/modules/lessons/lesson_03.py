@@ -0,0 +1,129 @@
+"""Lección 3: Primera Declinación y Sum"""
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_3():
+    st.markdown("""
+    ## Lección 3: Primera Declinación y Verbos Fundamentales
+    
+    ### 1. Primera Declinación (Temas en -a): Sustantivos Femeninos
+    
+    La Primera Declinación agrupa sustantivos mayoritariamente **femeninos** que terminan en **-a** en Nominativo Singular.
+    
+    **Enunciado**: Los sustantivos se enuncian con el Nominativo y el Genitivo Singular:
+    *   *Rosa, rosae* (la rosa, de la rosa) -> indica que es 1a Declinación
+    """)
+    
+    st.image("static/images/curso_gramatica/leccion3_primera_declinacion.png",
+             caption="Primera Declinación completa con ejemplos situacionales de uso de cada caso",
+             width="stretch")
+
+    st.markdown("""
+    
+    > **Nota sobre el Ablativo Sg**: La terminación **-ā** es larga (aunque se escribe igual que el Nominativo).
+    
+    **Otros ejemplos de 1a Declinación:**
+    *   *Puella, puellae* (niña)
+    *   *Femina, feminae* (mujer)
+    *   *Via, viae* (camino)
+    *   *Aqua, aquae* (agua)
+    *   *Terra, terrae* (tierra)
+    *   *Patria, patriae* (patria)
+    *   *Agricola, agricolae* (agricultor) ← **¡Masculino!** (excepción por su profesión)
+    
+    ### 2. El Verbo SUM (Ser/Estar) - Presente de Indicativo
+    
+    El verbo **sum** (ser/estar) es **irregular** pero absolutamente fundamental. 
+    Se usa para formar el atributo y aparece en innumerables expresiones.
+    
+    **Conjugación completa:**
+    """)
+    
+    render_styled_table(
+        ["Persona", "Forma", "Traducción 1", "Traducción 2"],
+        [
+            ["1a Sg", "**sum**", "yo soy", "yo estoy"],
+            ["2a Sg", "**es**", "tú eres", "tú estás"],
+            ["3a Sg", "**est**", "él/ella es", "él/ella está"],
+            ["1a Pl", "**sumus**", "nosotros somos", "nosotros estamos"],
+            ["2a Pl", "**estis**", "vosotros sois", "vosotros estáis"],
+            ["3a Pl", "**sunt**", "ellos/ellas son", "ellos/ellas están"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplos de uso:**
+    *   *Sum Romanus.* (Soy romano)
+    *   *Puella est pulchra.* (La niña es hermosa)
+    *   *Rosae sunt pulchrae.* (Las rosas son hermosas)
+    *   *Ubi es?* (¿Dónde estás?)
+    
+    ### 3. Primera Conjugación (verbos en -ARE): AMARE (Amar)
+    
+    Los verbos cuyo infinitivo termina en **-are** pertenecen a la 1a Conjugación.
+    Son los más regulares y numerosos.
+    
+    **Presente de Indicativo - Voz Activa:**
+    """)
+    
+    render_styled_table(
+        ["Persona", "Raíz", "Desinencia", "Forma completa", "Español"],
+        [
+            ["1a Sg", "am-", "**-o**", "am-**o**", "yo amo"],
+            ["2a Sg", "am-", "**-as**", "am-**as**", "tú amas"],
+            ["3a Sg", "am-", "**-at**", "am-**at**", "él/ella ama"],
+            ["1a Pl", "am-", "**-amus**", "am-**amus**", "nosotros amamos"],
+            ["2a Pl", "am-", "**-atis**", "am-**atis**", "vosotros amáis"],
+            ["3a Pl", "am-", "**-ant**", "am-**ant**", "ellos/ellas aman"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Otros verbos de 1a Conjugación:**
+    *   *Laudo, laudare* (alabar)
+    *   *Voco, vocare* (llamar)
+    *   *Narro, narrare* (narrar, contar)
+    *   *Oro, orare* (rogar, rezar)
+    *   *Ambulo, ambulare* (caminar)
+    *   *Habito, habitare* (habitar)
+    
+    ### Ejemplos de Frases Completas
+    """)
+    
+    render_styled_table(
+        ["Latín", "Análisis", "Traducción"],
+        [
+            ["*Puella rosam amat.*", "Puella (Nom, Suj) + rosam (Ac, OD) + amat (verbo)", "La niña ama la rosa."],
+            ["*Feminae aquam portant.*", "Feminae (Nom Pl, Suj) + aquam (Ac, OD) + portant (verbo)", "Las mujeres llevan agua."],
+            ["*Puella est bona.*", "Puella (Nom, Suj) + est (verbo) + bona (Nom, Atrib)", "La niña es buena."],
+            ["*Agricola patriam laudat.*", "Agricola (Nom, Suj) + patriam (Ac, OD) + laudat (verbo)", "El agricultor alaba la patria."],
+            ["*Puellae cantant.*", "Puellae (Nom Pl, Suj) + cantant (verbo)", "Las niñas cantan."]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### Vocabulario Esencial
+    
+    Aprende estas palabras fundamentales:
+    *   **Puella, -ae** (f): niña
+    *   **Rosa, -ae** (f): rosa
+    *   **Femina, -ae** (f): mujer
+    *   **Aqua, -ae** (f): agua
+    *   **Terra, -ae** (f): tierra
+    *   **Vita, -ae** (f): vida
+    *   **Amo, amare**: amar
+    *   **Laudo, laudare**: alabar
+    *   **Voco, vocare**: llamar
+    """) # Closing parenthesis for st.markdown
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop
+    render_vocabulary_widget(lesson_number=3)
+    render_translation_workshop(lesson_number=3)
+    render_lesson_progress_summary(lesson_number=3)
@@ -0,0 +1,140 @@
+"""Lección 4: Segunda Declinación y Objeto"""
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_4():
+    st.image("static/images/curso_gramatica/leccion4_vida_cotidiana.png",
+             caption="La vida cotidiana en una domus romana",
+             width="stretch")
+    
+    st.markdown("""
+    ## Lección 4: Segunda Declinación (Masculinos) y el Acusativo
+    
+    ### 1. Segunda Declinación: Sustantivos Masculinos en -US
+    
+    La Segunda Declinación agrupa sustantivos mayoritariamente **masculinos** que terminan en **-us** en Nominativo.
+    El Genitivo Singular termina en **-i**.
+    
+    **Enunciado estándar**: *Dominus, domini* (el señor, del señor)
+    
+    **Paradigma completo: Dominus, -i (El señor)**
+    """)
+
+    st.markdown("### 🧠 Mnemotecnia: Segunda Declinación")
+    st.image("static/images/curso_gramatica/leccion4_segunda_declinacion_completa.png",
+             caption="Resumen Visual de la Segunda Declinación (Masculinos y Neutros)",
+             width="stretch")
+    
+    render_styled_table(
+        ["Caso", "Singular", "Terminación", "Plural", "Terminación", "Función"],
+        [
+            ["**Nominativo**", "domin-**us**", "**-us**", "domin-**i**", "**-i**", "Sujeto"],
+            ["**Vocativo**", "domin-**e**", "**-e**", "domin-**i**", "**-i**", "¡Oh señor!"],
+            ["**Acusativo**", "domin-**um**", "**-um**", "domin-**os**", "**-os**", "Objeto Directo"],
+            ["**Genitivo**", "domin-**i**", "**-i**", "domin-**orum**", "**-orum**", "Del señor"],
+            ["**Dativo**", "domin-**o**", "**-o**", "domin-**is**", "**-is**", "Al señor"],
+            ["**Ablativo**", "domin-**o**", "**-o**", "domin-**is**", "**-is**", "Con/Por el señor"]
+        ]
+    )
+
+    st.markdown("""
+    
+    > **¡Atención al Vocativo!** El Vocativo Singular de los sustantivos en **-us** es **-e**. 
+    > Es la única diferencia con el Nominativo. *Domine!* = ¡Señor!
+    
+    **Sustantivos en -ER (menos frecuentes):**
+    Algunos masculinos de 2a Declinación terminan en **-er** en Nominativo:
+    *   *Puer, pueri* (niño) - Mantiene la **e**
+    *   *Ager, agri* (campo) - Pierde la **e** en los demás casos
+    
+    **Otros ejemplos de 2a Declinación Masculina:**
+    *   *Servus, -i*: esclavo, siervo
+    *   *Amicus, -i*: amigo
+    *   *Filius, -i*: hijo (Vocativo: *fili*, no *filie*)
+    *   *Deus, -i*: dios (Vocativo: *Deus*, irregular)
+    *   *Populus, -i*: pueblo
+    *   *Animus, -i*: ánimo, alma
+    *   *Liber, libri*: libro
+    *   *Magister, magistri*: maestro
+    
+    ### 2. El Caso Acusativo: El Objeto Directo
+    
+    El **Acusativo** es el caso del **Objeto Directo**. Responde a la pregunta **¿A quién?** o **¿Qué?** recibe la acción.
+    
+    **Equivale en español a**: "a" + sustantivo (cuando es persona), o simplemente el sustantivo (cuando es cosa).
+    
+    **Ejemplos:**
+    *   *Dominus servum vocat.* (El señor llama al siervo)
+        - *Dominus*: Nominativo (Sujeto) = ¿Quién llama?
+        - *servum*: Acusativo (Objeto Directo) = ¿A quién llama?
+    *   *Puella rosam amat.* (La niña ama la rosa)
+        - *Puella*: Nominativo (Sujeto)
+        - *rosam*: Acusativo (Objeto Directo)
+    
+    ### 3. Pretérito Imperfecto de Indicativo
+    
+    El **Pretérito Imperfecto** expresa una acción pasada que:
+    - Era continua o habitual: "amaba", "solía amar"
+    - No tiene un final definido en el tiempo
+    
+    **Formación**: Se añade el sufijo temporal **-ba-** (1a/2a conj.) a la raíz del presente.
+    
+    **Verbo SUM (Irregular):**
+    """)
+    
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "**eram**", "yo era / estaba"],
+            ["2a Sg", "**eras**", "tú eras / estabas"],
+            ["3a Sg", "**erat**", "él/ella era / estaba"],
+            ["1a Pl", "**eramus**", "nosotros éramos / estábamos"],
+            ["2a Pl", "**eratis**", "vosotros erais / estabais"],
+            ["3a Pl", "**erant**", "ellos eran / estaban"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Primera Conjugación (AMARE):**
+    """)
+    
+    render_styled_table(
+        ["Persona", "Raíz + Sufijo", "Forma", "Traducción"],
+        [
+            ["1a Sg", "ama + ba + m", "**amabam**", "yo amaba"],
+            ["2a Sg", "ama + ba + s", "**amabas**", "tú amabas"],
+            ["3a Sg", "ama + ba + t", "**amabat**", "él/ella amaba"],
+            ["1a Pl", "ama + ba + mus", "**amabamus**", "nosotros amábamos"],
+            ["2a Pl", "ama + ba + tis", "**amabatis**", "vosotros amabais"],
+            ["3a Pl", "ama + ba + nt", "**amabant**", "ellos/ellas amaban"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplos de uso:**
+    *   *Dominus servos vocabat.* (El señor llamaba a los siervos)
+    *   *Puella rosam amabat.* (La niña amaba la rosa)
+    *   *Eram puer.* (Yo era un niño)
+    *   *Magistri discipulos laudabant.* (Los maestros alababan a los discípulos)
+    
+    ### Vocabulario Esencial
+    *   **Dominus, -i** (m): señor, amo
+    *   **Servus, -i** (m): esclavo, siervo
+    *   **Amicus, -i** (m): amigo
+    *   **Puer, pueri** (m): niño
+    *   **Magister, magistri** (m): maestro
+    *   **Deus, -i** (m): dios
+    *   **Voco, vocare**: llamar
+    *   **Porto, portare**: llevar
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop
+    render_vocabulary_widget(lesson_number=4)
+    render_translation_workshop(lesson_number=4)
+    render_lesson_progress_summary(lesson_number=4)
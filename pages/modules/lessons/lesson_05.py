@@ -0,0 +1,141 @@
+"""Lección 5: El Neutro"""
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_5():
+    st.markdown("""
+    ## Lección 5: El Neutro y Segunda Conjugación
+    """)
+    
+    st.image("static/images/curso_gramatica/leccion5_neutro_diagram.png",
+             caption="Diagrama del Género Neutro y sus reglas fundamentales",
+             width="stretch")
+             
+    st.markdown("""
+    
+    ### 1. Segunda Declinación: Sustantivos Neutros en -UM
+    
+    El género **Neutro** (neuter = ni uno ni otro) se usa principalmente para cosas inanimadas, 
+    aunque no todas las cosas son neutras.
+    
+    **Las Reglas de Oro del Neutro** (válidas para TODAS las declinaciones):
+    1.  El **Nominativo, Vocativo y Acusativo** son **siempre iguales** entre sí.
+    2.  En el **Plural**, estos tres casos terminan siempre en **-a**.
+    
+    **Paradigma completo: Templum, -i (El templo)**
+    """)
+    
+    render_styled_table(
+        ["Caso", "Singular", "Terminación", "Plural", "Terminación", "Función"],
+        [
+            ["**Nom/Voc/Ac**", "templ-**um**", "**-um**", "templ-**a**", "**-a**", "Suj/OD"],
+            ["**Genitivo**", "templ-**i**", "**-i**", "templ-**orum**", "**-orum**", "Del templo"],
+            ["**Dativo**", "templ-**o**", "**-o**", "templ-**is**", "**-is**", "Al templo"],
+            ["**Ablativo**", "templ-**o**", "**-o**", "templ-**is**", "**-is**", "Con el templo"]
+        ]
+    )
+
+    st.markdown("""
+    
+    > **Observación**: Los casos Genitivo, Dativo y Ablativo son idénticos a los masculinos de 2a Declinación.
+    > La única diferencia está en Nom/Voc/Ac.
+    
+    **Otros ejemplos de Neutros en -UM:**
+    *   *Bellum, -i*: guerra
+    *   *Donum, -i*: regalo, don
+    *   *Verbum, -i*: palabra
+    *   *Caelum, -i*: cielo
+    *   *Oppidum, -i*: ciudad, plaza fuerte
+    *   *Auxilium, -i*: ayuda, auxilio
+    *   *Forum, -i*: foro, plaza pública
+    
+    **¡Nota sobre concordancia!**
+    En latín, cuando el sujeto es neutro plural (*templa*, *bella*), el verbo va en **plural**, igual que con los masculinos y femeninos.
+    
+    *   *Templa **sunt** pulchra.* ✓ (Correcto) - Los templos son hermosos.
+    *   *Templa est pulchra.* ❌ (Incorrecto en latín) - El verbo debe concordar en número.
+    
+    ### 2. Segunda Conjugación: Verbos en -ĒRE
+    
+    Los verbos cuyo infinitivo termina en **-ēre** (con **e larga**) pertenecen a la 2a Conjugación.
+    
+    **Modelo: Monere (Aconsejar, Advertir)**
+    
+    **Presente de Indicativo:**
+    """)
+    
+    render_styled_table(
+        ["Persona", "Raíz", "Desinencia", "Forma", "Español"],
+        [
+            ["1a Sg", "mone-", "**-o**", "**moneo**", "yo aconsejo"],
+            ["2a Sg", "mone-", "**-s**", "**mones**", "tú aconsejas"],
+            ["3a Sg", "mone-", "**-t**", "**monet**", "él/ella aconseja"],
+            ["1a Pl", "mone-", "**-mus**", "**monemus**", "nosotros aconsejamos"],
+            ["2a Pl", "mone-", "**-tis**", "**monetis**", "vosotros aconsejáis"],
+            ["3a Pl", "mone-", "**-nt**", "**monent**", "ellos/ellas aconsejan"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Pretérito Imperfecto:**
+    Sufijo temporal: **-eba-** (no -ba- como en la 1a)
+    """)
+    
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "**monebam**", "yo aconsejaba"],
+            ["2a Sg", "**monebas**", "tú aconsejabas"],
+            ["3a Sg", "**monebat**", "él/ella aconsejaba"],
+            ["1a Pl", "**monebamus**", "nosotros aconsejábamos"],
+            ["2a Pl", "**monebatis**", "vosotros aconsejabais"],
+            ["3a Pl", "**monebant**", "ellos/ellas aconsejaban"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Otros verbos de 2a Conjugación:**
+    *   *Habeo, habere*: tener, poseer
+    *   *Video, videre*: ver
+    *   *Timeo, timere*: temer
+    *   *Debeo, debere*: deber
+    *   *Teneo, tenere*: tener, sostener
+    *   *Doceo, docere*: enseñar
+    
+    ### Ejemplos de Frases
+    """)
+
+    render_styled_table(
+        ["Latín", "Análisis", "Traducción"],
+        [
+            ["*Puer templum videt.*", "Puer (Nom, Suj) + templum (Ac, OD) + videt (verbo)", "El niño ve el templo."],
+            ["*Templum pulchrum est.*", "Templum (Nom, Suj) + pulchrum (Nom, Atrib) + est", "El templo es hermoso."],
+            ["*Templa pulchra sunt.*", "Templa (Nom Pl Neut, Suj) + pulchra (Nom Pl Neut, Atrib) + sunt", "Los templos son hermosos."],
+            ["*Magister pueros monet.*", "Magister (Nom, Suj) + pueros (Ac, OD) + monet (verbo)", "El maestro aconseja a los niños."],
+            ["*Bellum timebamus.*", "Bellum (Ac, OD) + timebamus (verbo 1a Pl)", "Temíamos la guerra."]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### Vocabulario Esencial
+    *   **Templum, -i** (n): templo
+    *   **Bellum, -i** (n): guerra
+    *   **Donum, -i** (n): regalo
+    *   **Verbum, -i** (n): palabra
+    *   **Moneo, monere**: aconsejar
+    *   **Habeo, habere**: tener
+    *   **Video, videre**: ver
+    *   **Timeo, timere**: temer
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop
+    render_vocabulary_widget(lesson_number=5)
+    render_translation_workshop(lesson_number=5)
+    render_lesson_progress_summary(lesson_number=5)
@@ -0,0 +1,175 @@
+"""Lección 6: Consolidación y Adjetivos"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_6():
+    st.image("static/images/curso_gramatica/leccion6_arquitectura.png",
+             caption="Arquitectura romana icónica: Coliseo, Panteón, acueductos y columnas",
+             width="stretch")
+    
+    st.markdown("""
+    ## Lección 6: Consolidación, 3a/4a Conjugación y Adjetivos
+    """)
+    
+    st.image("static/images/curso_gramatica/conjugaciones_overview.png",
+             caption="Resumen visual de las 4 conjugaciones latinas",
+             width="stretch")
+             
+    st.markdown("""
+    
+    ### Revisión: Lo que hemos aprendido hasta ahora
+    
+    **Declinaciones:**
+    *   1a Declinación: Femeninos en **-a** (*rosa, puella*)
+    *   2a Declinación: Masculinos en **-us/-er** (*dominus, puer*) y Neutros en **-um** (*templum*)
+    
+    **Casos dominados:**
+    *   **Nominativo**: Sujeto
+    *   **Acusativo**: Objeto Directo
+    
+    **Verbos:**
+    *   *Sum* (irregular): Presente e Imperfecto
+    *   1a Conjugación (*amare*): Presente e Imperfecto
+    *   2a Conjugación (*monere*): Presente e Imperfecto
+    
+    ### 1. Tercera Conjugación: Verbos en -ERE (e breve)
+    
+    Los verbos cuyo infinitivo termina en **-ere** (con **e breve**, no larga) pertenecen a la 3a Conjugación.
+    Son más irregulares que la 1a y 2a.
+    
+    **Modelo: Legere (Leer)**
+    
+    **Presente de Indicativo:**
+    """)
+
+    render_styled_table(
+        ["Persona", "Forma", "Español"],
+        [
+            ["1a Sg", "**lego**", "yo leo"],
+            ["2a Sg", "**legis**", "tú lees"],
+            ["3a Sg", "**legit**", "él/ella lee"],
+            ["1a Pl", "**legimus**", "nosotros leemos"],
+            ["2a Pl", "**legitis**", "vosotros leéis"],
+            ["3a Pl", "**legunt**", "ellos/ellas leen"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Pretérito Imperfecto:**
+    Sufijo: **-eba-** (igual que la 2a)
+    *   *legebam, legebas, legebat, legebamus, legebatis, legebant*
+    
+    **Otros verbos de 3a Conjugación:**
+    *   *Dico, dicere*: decir
+    *   *Duco, ducere*: conducir, guiar
+    *   *Scribo, scribere*: escribir
+    *   *Mitto, mittere*: enviar
+    *   *Vivo, vivere*: vivir
+    
+    ### 2. Cuarta Conjugación: Verbos en -IRE
+    
+    Los verbos cuyo infinitivo termina en **-ire** pertenecen a la 4a Conjugación.
+    
+    **Modelo: Audire (Oír, Escuchar)**
+    
+    **Presente de Indicativo:**
+    """)
+
+    render_styled_table(
+        ["Persona", "Forma", "Español"],
+        [
+            ["1a Sg", "**audio**", "yo oigo"],
+            ["2a Sg", "**audis**", "tú oyes"],
+            ["3a Sg", "**audit**", "él/ella oye"],
+            ["1a Pl", "**audimus**", "nosotros oímos"],
+            ["2a Pl", "**auditis**", "vosotros oís"],
+            ["3a Pl", "**audiunt**", "ellos/ellas oyen"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Pretérito Imperfecto:**
+    Sufijo: **-ieba-**
+    *   *audiebam, audiebas, audiebat, audiebamus, audiebatis, audiebant*
+    
+    **Otros verbos de 4a Conjugación:**
+    *   *Venio, venire*: venir
+    *   *Dormio, dormire*: dormir
+    *   *Sentio, sentire*: sentir
+    """)
+    
+    st.markdown("### 🧠 Mnemotecnia: Primera Declinación")
+    
+    st.image("static/images/curso_gramatica/leccion3_rosa_diagram.png",
+             caption="Diagrama Clásico de ROSA (Estructura)",
+             width="stretch")
+
+    st.image("static/images/curso_gramatica/leccion3_rosa_paradigma_mnemotecnia.png",
+             caption="Mnemotecnia: Paradigma y Trucos de Memoria",
+             width="stretch")
+
+    st.image("static/images/curso_gramatica/leccion3_verbo_sum_mnemotecnia.png",
+             caption="Conjugación del Verbo SUM y Regla Mnemotécnica",
+             width="stretch")
+
+    if os.path.exists("static/images/curso_gramatica/leccion6_sum_possum_tree.png"):
+        st.image("static/images/curso_gramatica/leccion6_sum_possum_tree.png",
+                 caption="El Árbol de SUM y POSSUM: Raíces y Ramas",
+                 width="stretch")
+    
+    st.markdown("""
+    ### 3. Adjetivos de Primera Clase (Sistema 2-1-2)
+    
+    Los adjetivos de 1a Clase se declinan como los sustantivos de **1a y 2a Declinación**.
+    
+    **Modelo: Bonus, -a, -um (Bueno)**
+    
+    *   **Masculino**: *bonus* (se declina como *dominus*)
+    *   **Femenino**: *bona* (se declina como *rosa*)
+    *   **Neutro**: *bonum* (se declina como *templum*)
+    
+    **Principio de CONCORDANCIA**:
+    El adjetivo debe concordar con el sustantivo en **Género, Número y Caso**.
+    
+    **Ejemplos:**
+    *   *Puer bonus* (Niño bueno) - Masculino, Singular, Nominativo
+    *   *Puella bona* (Niña buena) - Femenino, Singular, Nominativo
+    *   *Templum bonum* (Templo bueno) - Neutro, Singular, Nominativo
+    *   *Puellam bonam* (A la niña buena) - Femenino, Singular, Acusativo
+    *   *Templa bona* (Los templos buenos) - Neutro, Plural, Nom/Ac
+    
+    **Otros adjetivos de 1a Clase:**
+    *   *Magnus, -a, -um*: grande
+    *   *Parvus, -a, -um*: pequeño
+    *   *Pulcher, pulchra, pulchrum*: hermoso
+    *   *Liber, libera, liberum*: libre
+    *   *Malus, -a, -um*: malo
+    
+    ### 4. El Caso Vocativo: La Invocación
+    
+    El **Vocativo** se usa para **invocar, llamar o dirigirse** a alguien.
+    
+    **Reglas:**
+    *   En 1a Declinación: **igual al Nominativo**
+    *   En 2a Declinación (-us): termina en **-e**
+    *   En 2a Declinación (-um): **igual al Nominativo**
+    
+    **Ejemplos:**
+    *   *Domine!* (¡Señor!)
+    *   *Puella!* (¡Niña!)
+    *   *Fili!* (¡Hijo!) - Excepción: *filius* hace *fili*, no *filie*
+    *   *Mi amice!* (¡Amigo mío!)
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop
+    render_vocabulary_widget(lesson_number=6)
+    render_translation_workshop(lesson_number=6)
+    render_lesson_progress_summary(lesson_number=6)
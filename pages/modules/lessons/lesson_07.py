@@ -0,0 +1,138 @@
+"""Lección 7: Tercera Declinación y Dativo"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_7():
+    st.markdown("""
+    ## Lección 7: Tercera Declinación y el Dativo
+    """)
+    
+    st.image("static/images/curso_gramatica/leccion7_third_declension.png",
+             caption="Esquema de la Tercera Declinación: Imparísílabos y Parisísílabos",
+             width="stretch")
+             
+    st.markdown("""
+    
+    ### 1. Tercera Declinación: La Más Compleja
+    
+    La 3a Declinación es la más amplia y compleja. Agrupa sustantivos de **los tres géneros**.
+    
+    **Característica identificadora**: Genitivo Singular en **-is**.
+    
+    **Dos grandes grupos:**
+    
+    #### A. Imparísílabos (Temas en consonante)
+    
+    Tienen **diferente número de sílabas** en Nominativo y Genitivo.
+    
+    **Modelo: Rex, regis (El rey) - Masculino**
+    
+    """
+    )
+
+    render_styled_table(
+        ["Caso", "Singular", "Plural"],
+        [
+            ["**Nominativo**", "rex", "reg-**es**"],
+            ["**Vocativo**", "rex", "reg-**es**"],
+            ["**Acusativo**", "reg-**em**", "reg-**es**"],
+            ["**Genitivo**", "reg-**is**", "reg-**um**"],
+            ["**Dativo**", "reg-**i**", "reg-**ibus**"],
+            ["**Ablativo**", "reg-**e**", "reg-**ibus**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Otros ejemplos de Imparísílabos:**
+    *   *Homo, hominis* (m): hombre
+    *   *Mulier, mulieris* (f): mujer
+    *   *Pater, patris* (m): padre
+    *   *Mater, matris* (f): madre
+    *   *Frater, fratris* (m): hermano
+    *   *Consul, consulis* (m): cónsul
+    *   *Virtus, virtutis* (f): virtud
+    *   *Amor, amoris* (m): amor
+    
+    #### B. Parisísílabos (Temas en -i)
+    
+    Tienen **igual número de sílabas** en Nom. y Gen. (o terminan en dos consonantes en Nom.).
+    
+    **Modelo: Civis, civis (El ciudadano) - Masculino/Femenino**
+    
+    """
+    )
+
+    render_styled_table(
+        ["Caso", "Singular", "Plural"],
+        [
+            ["**Nominativo**", "civis", "civ-**es**"],
+            ["**Acusativo**", "civ-**em**", "civ-**es**"],
+            ["**Genitivo**", "civ-**is**", "civ-**ium**"],
+            ["**Dativo**", "civ-**i**", "civ-**ibus**"],
+            ["**Ablativo**", "civ-**e/i**", "civ-**ibus**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    > **Diferencia clave**: Los parisísílabos tienen Genitivo Plural en **-ium** (no -um).
+    
+    **Ejemplos de Parisísílabos:**
+    *   *Urbs, urbis* (f): ciudad
+    *   *Mons, montis* (m): monte
+    *   *Fons, fontis* (m): fuente
+    *   *Navis, navis* (f): nave
+    
+    **Neutros de 3a Declinación:**
+    Siguen la **regla de oro del neutro** (Nom/Voc/Ac iguales, plural en -a).
+    
+    *   *Corpus, corporis* (n): cuerpo
+    *   *Opus, operis* (n): obra
+    *   *Nomen, nominis* (n): nombre
+    
+    ### 3. Excepciones de la Tercera Declinación (Refuerzo)
+    """)
+
+    if os.path.exists("static/images/curso_gramatica/leccion7_rarezas_3a.png"):
+        st.image("static/images/curso_gramatica/leccion7_rarezas_3a.png",
+                 caption="Museo de Rarezas: Vis, Bos, Sus, Iuppiter",
+                 width="stretch")
+
+    if os.path.exists("static/images/curso_gramatica/leccion7_torre_i.png"):
+        st.image("static/images/curso_gramatica/leccion7_torre_i.png",
+                 caption="La Torre de la -i: Turris, Puppis, Securis, Mare, Animal",
+                 width="stretch")
+
+    st.markdown("""
+    ### 4. El Caso Dativo: Objeto Indirecto
+    
+    El **Dativo** marca el **Objeto Indirecto** o el **Destinatario** de la acción.
+    Responde a **¿A quién?** o **¿Para quién?**
+    
+    **En español se traduce con**: "a" o "para" + persona.
+    
+    **Ejemplos:**
+    *   *Puer puellae rosam dat.* (El niño da una rosa a la niña)
+        - *Puer*: Nominativo (Sujeto)
+        - *puellae*: **Dativo** (Objeto Indirecto) = a quién da
+        - *rosam*: Acusativo (Objeto Directo) = qué da
+    *   *Magister discipulis libros dat.* (El maestro da libros a los discípulos)
+    *   *Do tibi donum.* (Te doy un regalo)
+    
+    **Terminaciones de Dativo:**
+    *   1a Declinación: Sg **-ae**, Pl **-is**
+    *   2a Declinación: Sg **-o**, Pl **-is**
+    *   3a Declinación: Sg **-i**, Pl **-ibus**
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop
+    render_vocabulary_widget(lesson_number=7)
+    render_translation_workshop(lesson_number=7)
+    render_lesson_progress_summary(lesson_number=7)
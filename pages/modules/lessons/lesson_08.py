@@ -0,0 +1,141 @@
+"""Lección 8: Cuarta Declinación y Pasado"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_8():
+    st.markdown("""
+    ## Lección 8: Cuarta Declinación, Pretérito Perfecto y Genitivo
+    """)
+    
+    st.image("static/images/curso_gramatica/leccion8_perfect_tense.png",
+             caption="El Pretérito Perfecto: Formación y Uso",
+             width="stretch")
+             
+    st.markdown("""
+    
+    ### 1. Cuarta Declinación: Temas en -U
+    
+    Sustantivos mayoritariamente **masculinos** (aunque hay algunos femeninos y neutros).
+    Terminan en **-us** en Nominativo y **-us** en Genitivo (no confundir con la 2a).
+    
+    **Modelo: Manus, -us (La mano) - FEMENINO (Excepción)**
+    
+    """
+    )
+
+    render_styled_table(
+        ["Caso", "Singular", "Plural"],
+        [
+            ["**Nominativo**", "man-**us**", "man-**us**"],
+            ["**Vocativo**", "man-**us**", "man-**us**"],
+            ["**Acusativo**", "man-**um**", "man-**us**"],
+            ["**Genitivo**", "man-**us**", "man-**uum**"],
+            ["**Dativo**", "man-**ui**", "man-**ibus**"],
+            ["**Ablativo**", "man-**u**", "man-**ibus**"]
+        ]
+    )
+    
+    # Infografía de la 4ª Declinación
+    if os.path.exists("static/images/curso_gramatica/leccion8_cuarta_declinacion.png"):
+        st.image("static/images/curso_gramatica/leccion8_cuarta_declinacion.png",
+                 caption="Cuarta Declinación: Paradigma y Características",
+                 width="stretch")
+
+    st.markdown("""
+    
+    **Otros ejemplos de 4a Declinación:**
+    *   *Exercitus, -us* (m): ejército
+    *   *Fructus, -us* (m): fruto
+    *   *Senatus, -us* (m): senado
+    *   *Portus, -us* (m): puerto
+    *   *Domus, -us* (f): casa (irregular, mezcla 2a y 4a)
+    
+    **Neutros de 4a Declinación** (muy raros):
+    *   *Cornu, -us* (n): cuerno
+    *   *Genu, -us* (n): rodilla
+    
+    
+    ### 2. Pretérito Perfecto (Perfectum): El Pasado Acabado
+    
+    El **Pretérito Perfecto** expresa una acción **completada en el pasado**.
+    Equivale a "amé", "he amado" en español.
+    
+    **Formación**: Se construye sobre el **tema de perfecto** (3a forma del enunciado del verbo).
+    
+    **Enunciado completo de un verbo**: Siempre se dan 4 formas:
+    1.  Presente 1a Sg: *amo*
+    2.  Infinitivo: *amare*
+    3.  **Perfecto 1a Sg**: *amavi*
+    4.  Supino: *amatum*
+    
+    **Terminaciones del Perfecto** (IGUALES para todas las conjugaciones):
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Desinencia", "Ejemplo (AMARE)", "Traducción"],
+        [
+            ["1a Sg", "**-i**", "amav-**i**", "yo amé / he amado"],
+            ["2a Sg", "**-isti**", "amav-**isti**", "tú amaste"],
+            ["3a Sg", "**-it**", "amav-**it**", "él/ella amó"],
+            ["1a Pl", "**-imus**", "amav-**imus**", "nosotros amamos"],
+            ["2a Pl", "**-istis**", "amav-**istis**", "vosotros amasteis"],
+            ["3a Pl", "**-erunt/-ere**", "amav-**erunt**", "ellos/ellas amaron"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplos de otros verbos:**
+    *   *Habeo, habere, **habui**, habitum* (tener) -> *habui* (tuve)
+    *   *Dico, dicere, **dixi**, dictum* (decir) -> *dixi* (dije)
+    *   *Lego, legere, **legi**, lectum* (leer) -> *legi* (leí)
+    *   *Video, videre, **vidi**, visum* (ver) -> *vidi* (vi)
+    
+    ### 3. El Caso Genitivo: Posesión y Pertenencia
+    
+    El **Genitivo** expresa **posesión**, **pertenencia** o **especificación**.
+    Responde a **¿De quién?** o **¿De qué?**
+    
+    **En español se traduce con**: "de" + sustantivo.
+    
+    **Ejemplos:**
+    *   *Domus patris* (La casa del padre)
+        - *Domus*: Nominativo
+        - *patris*: **Genitivo** (de quién es la casa)
+    *   *Liber pueri* (El libro del niño)
+    *   *Amor patriae* (El amor a la patria / de la patria)
+    *   *Corona rosarum* (Una corona de rosas)
+    
+    **Terminaciones de Genitivo:**
+    *   1a Declinación: Sg **-ae**, Pl **-arum**
+    *   2a Declinación: Sg **-i**, Pl **-orum**
+    *   3a Declinación: Sg **-is**, Pl **-um/-ium**
+    *   4a Declinación: Sg **-us**, Pl **-uum**
+
+    ### 4. El Genitivo Partitivo (El Todo y la Parte)
+    
+    Un uso muy común del genitivo es expresar **el todo del cual se toma una parte**.
+    
+    *   *Pars militum* (Una parte **de los soldados**)
+    *   *Nihil boni* (Nada **de bueno**)
+    *   *Plus pecuniae* (Más **de dinero** -> Más dinero)
+    
+    """)
+    
+    if os.path.exists("static/images/curso_gramatica/genitivo_partitivo.png"):
+        st.image("static/images/curso_gramatica/genitivo_partitivo.png",
+                 caption="Genitivo Partitivo: La Parte del Todo (Pars militum, Nihil boni, Plus pecuniae)",
+                 width="stretch")
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop
+    render_vocabulary_widget(lesson_number=8)
+    render_translation_workshop(lesson_number=8)
+    render_lesson_progress_summary(lesson_number=8)
@@ -0,0 +1,146 @@
+"""Lección 9: Quinta Declinación y Futuro"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_9():
+    st.markdown("""
+    ## Lección 9: Quinta Declinación y Futuro
+    """)
+    
+    st.image("static/images/curso_gramatica/leccion9_fifth_declension.png",
+             caption="La Quinta Declinación: Temas en -E",
+             width="stretch")
+             
+    st.markdown("""
+    
+    ### 1. Quinta Declinación: Temas en -E (La más pequeña)
+    
+    Sustantivos **femeninos** que terminan en **-es** en Nominativo y **-ei** en Genitivo.
+    Es la declinación más pequeña (solo unas 50 palabras).
+    
+    **Modelo: Dies, diei (El día) - Masc/Fem**
+    
+    """
+    )
+
+    render_styled_table(
+        ["Caso", "Singular", "Plural"],
+        [
+            ["**Nominativo**", "di-**es**", "di-**es**"],
+            ["**Vocativo**", "di-**es**", "di-**es**"],
+            ["**Acusativo**", "di-**em**", "di-**es**"],
+            ["**Genitivo**", "di-**ei**", "di-**erum**"],
+            ["**Dativo**", "di-**ei**", "di-**ebus**"],
+            ["**Ablativo**", "di-**e**", "di-**ebus**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Palabra más importante de 5a Declinación:**
+    *   **Res, rei** (f): cosa, asunto, hecho
+        - *Res publica* = La cosa pública = La república
+    
+    **Otras palabras de 5a Declinación:**
+    *   *Spes, spei* (f): esperanza
+    *   *Fides, fidei* (f): fe, confianza
+    *   *Species, speciei* (f): aspecto, especie
+    
+    ### 2. Futuro Imperfecto: El Tiempo Venidero
+    
+    El **Futuro Imperfecto** expresa una acción que **ocurrirá en el futuro**.
+    
+    **¡Atención!** La formación es **diferente** en 1a/2a conj. y 3a/4a conj.
+    
+    #### A. Primera y Segunda Conjugación: Sufijo -BO-
+    
+    **Modelo: AMARE**
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "ama-**bo**", "yo amaré"],
+            ["2a Sg", "ama-**bis**", "tú amarás"],
+            ["3a Sg", "ama-**bit**", "él/ella amará"],
+            ["1a Pl", "ama-**bimus**", "nosotros amaremos"],
+            ["2a Pl", "ama-**bitis**", "vosotros amaréis"],
+            ["3a Pl", "ama-**bunt**", "ellos/ellas amarán"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Modelo: MONERE**
+    *   *Monebo, monebis, monebit...* (Aconsejaré, aconsejarás...)
+    
+    #### B. Tercera y Cuarta Conjugación: Vocal -A- / -E-
+    
+    **Modelo: LEGERE**
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "leg-**am**", "yo leeré"],
+            ["2a Sg", "leg-**es**", "tú leerás"],
+            ["3a Sg", "leg-**et**", "él/ella leerá"],
+            ["1a Pl", "leg-**emus**", "nosotros leeremos"],
+            ["2a Pl", "leg-**etis**", "vosotros leeréis"],
+            ["3a Pl", "leg-**ent**", "ellos/ellas leerán"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Modelo: AUDIRE**
+    *   *Audiam, audies, audiet...* (Oiré, oirás...)
+    
+    **Futuro de SUM (Irregular):**
+    *   *Ero, eris, erit, erimus, eritis, erunt* (Seré, serás...)
+    
+    ### Resumen de Tiempos Verbales Aprendidos
+    
+    """
+    )
+
+    render_styled_table(
+        ["Tiempo", "Significado", "1a/2a Conj", "3a/4a Conj"],
+        [
+            ["**Presente**", "amo", "-o, -as, -at", "-o, -is, -it"],
+            ["**Imperfecto**", "amaba", "-**ba**m, -**ba**s", "-**eba**m, -**eba**s"],
+            ["**Perfecto**", "amé", "-**vi**, -v**isti**", "Varía según verbo"],
+            ["**Futuro**", "amaré", "-**bo**, -**bis**", "-**am**, -**es**"]
+        ]
+    )
+
+    st.markdown("""
+    """)
+
+    st.markdown("### 🧠 Mnemotecnia: Las 5 Declinaciones")
+    st.image("static/images/curso_gramatica/leccion9_5declinaciones_completas.png",
+             caption="Resumen Visual de las 5 Declinaciones Latinas",
+             width="stretch")
+    
+    # Cultural content: Roman Seasons
+    st.markdown("### 🏛️ Cultura Romana: Las Cuatro Estaciones")
+    st.info("La palabra **dies** (día) nos conecta con el calendario romano. Veamos cómo los romanos nombraban las estaciones:")
+    if os.path.exists("static/images/curso_gramatica/cultura_estaciones.png"):
+        st.image("static/images/curso_gramatica/cultura_estaciones.png",
+                 caption="Las Cuatro Estaciones en Roma: Ver, Aestas, Autumnus, Hiems",
+                 width="stretch")
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop
+    render_vocabulary_widget(lesson_number=9)
+    render_translation_workshop(lesson_number=9)
+    render_lesson_progress_summary(lesson_number=9)
@@ -0,0 +1,108 @@
+"""Lección 10: Adjetivos de 2a Clase"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_10():
+    st.markdown("""
+    ## Lección 10: Adjetivos de Segunda Clase y Sintaxis
+    """)
+    
+    if os.path.exists("static/images/curso_gramatica/leccion10_adjetivos_2clase.png"):
+        st.image("static/images/curso_gramatica/leccion10_adjetivos_2clase.png",
+                 caption="Clasificación de Adjetivos de 3a Declinación (2a Clase)",
+                 width="stretch")
+                 
+    st.markdown("""
+    
+    ### Revisión: Las Cinco Declinaciones y los Casos
+    
+    Ya hemos cubierto **todas las declinaciones del latín**:
+    *   1a: Femeninos en -a (*rosa, puella*)
+    *   2a: Masculinos en -us/er (*dominus, puer*) y Neutros en -um (*templum*)
+    *   3a: Los tres géneros (*rex, urbs, corpus*)
+    *   4a: Masculinos/Femeninos en -us (*manus, senatus*)
+    *   5a: Femeninos en -es (*res, dies*)
+    
+    Y **todos los seis casos**: Nominativo, Vocativo, Acusativo, Genitivo, Dativo, Ablativo.
+    
+    ### 1. Adjetivos de Segunda Clase (3a Declinación)
+    
+    Los adjetivos de 2a Clase se declinan como sustantivos de **3a Declinación** (temas en -i).
+    
+    **Tres tipos según el número de terminaciones:**
+    
+    #### A. Tres Terminaciones (M / F / N)
+    
+    **Modelo: Acer, acris, acre (Agudo, penetrante)**
+    *   Masc: *acer* (como *puer* pero con casos de 3a)
+    *   Fem: *acris*
+    *   Neut: *acre*
+    
+    **Otro ejemplo:**
+    *   *Celer, celeris, celere* (rápido)
+    
+    #### B. Dos Terminaciones (M/F | N)
+    
+    **Modelo: Omnis, omne (Todo, cada)**
+    *   Masc/Fem: *omnis*
+    *   Neut: *omne*
+    
+    **Otros ejemplos:**
+    *   *Brevis, breve* (breve, corto)
+    *   *Fortis, forte* (fuerte, valiente)
+    *   *Tristis, triste* (triste)
+    *   *Dulcis, dulce* (dulce)
+    
+    #### C. Una Terminación (M/F/N)
+    
+    **Modelo: Felix, felicis (Feliz, afortunado)**
+    Solo hay una forma para los tres géneros en Nominativo.
+    El género se determina por concordancia con el sustantivo.
+    
+    **Otros ejemplos:**
+    *   *Sapiens, sapientis* (sabio)
+    *   *Prudens, prudentis* (prudente)
+    *   *Audax, audacis* (audaz)
+    *   *Velox, velocis* (veloz)
+    
+    **Paradigma de Felix**:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Caso", "Singular", "Plural"],
+        [
+            ["Nom (m/f/n)", "felix", "felic-**es** / felic-**ia** (n)"],
+            ["Ac (m/f)", "felic-**em**", "felic-**es**"],
+            ["Ac (n)", "felix", "felic-**ia**"],
+            ["Gen", "felic-**is**", "felic-**ium**"],
+            ["Dat/Abl", "felic-**i/-e**", "felic-**ibus**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 2. La Aposición: Complemento Nominal
+    
+    La **aposición** es un sustantivo que explica o determina a otro sustantivo.
+    Ambos deben estar en el **mismo caso**.
+    
+    **Ejemplos:**
+    *   *Cicero, consul, dicit.* (Cicerón, el cónsul, dice)
+        - *Cicero*: Nominativo
+        - *consul*: Nominativo (en aposición)
+    *   *Roma, urbs magna, est.* (Roma, la gran ciudad, existe)
+    *   *Homerus, poeta Graecus, carmina scripsit.* (Homero, el poeta griego, escribió poemas)
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop
+    render_vocabulary_widget(lesson_number=10)
+    render_translation_workshop(lesson_number=10)
+    render_lesson_progress_summary(lesson_number=10)
@@ -0,0 +1,130 @@
+"""Lección 11: Comparación"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_11():
+    st.markdown("""
+    ## Lección 11: Comparación de Adjetivos y Numerales
+    """)
+    
+    if os.path.exists("static/images/curso_gramatica/leccion11_comparison_degrees.png"):
+        st.image("static/images/curso_gramatica/leccion11_comparison_degrees.png",
+                 caption="Los Grados del Adjetivo: Positivo, Comparativo y Superlativo",
+                 width="stretch")
+                 
+    st.markdown("""
+    
+    ### 1. Grados del Adjetivo
+    
+    Los adjetivos latinos tienen **tres grados**:
+    
+    #### A. Positivo (Grado Normal)
+    Es la forma básica: *altus* (alto)
+    
+    #### B. Comparativo (Más que...)
+    
+    **Formación**: Raíz + **-ior** (m/f) / **-ius** (n)
+    
+    **Modelo: Altior, altius (Más alto)**
+    Se declina como 3a Declinación.
+    
+    """
+    )
+
+    render_styled_table(
+        ["Caso", "Masc/Fem Sg", "Neutro Sg"],
+        [
+            ["**Nom**", "alt-**ior**", "alt-**ius**"],
+            ["**Ac**", "alt-**iorem**", "alt-**ius**"],
+            ["**Gen**", "alt-**ioris**", "alt-**ioris**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplos:**
+    *   *fortis* -> *fortior, fortius* (más fuerte)
+    *   *celer* -> *celerior, celerius* (más rápido)
+    *   *felix* -> *felicior, felicius* (más feliz)
+    
+    #### C. Superlativo (El más... / Muy...)
+    
+    **Formación regular**: Raíz + **-issimus, -a, -um**
+    
+    **Modelo: Altissimus, -a, -um**
+    Se declina como adjetivo de 1a Clase (2-1-2).
+    
+    *   *altissimus* = el más alto / altísimo / muy alto
+    *   *fortissimus* = el más fuerte / fortísimo
+    *   *felicissimus* = el más feliz / felicísimo
+    
+    **Superlativos irregulares importantes:**
+    
+    """
+    )
+
+    render_styled_table(
+        ["Positivo", "Comparativo", "Superlativo"],
+        [
+            ["*bonus* (bueno)", "*melior* (mejor)", "*optimus* (el mejor / óptimo)"],
+            ["*malus* (malo)", "*peior* (peor)", "*pessimus* (el peor / pésimo)"],
+            ["*magnus* (grande)", "*maior* (mayor)", "*maximus* (el mayor / máximo)"],
+            ["*parvus* (pequeño)", "*minor* (menor)", "*minimus* (el menor / mínimo)"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Construcción del comparativo:**
+    - El segundo término va en **Ablativo** (sin preposición): *Petrus altior Paulo est* (Pedro es más alto que Pablo)
+    - O con *quam* + mismo caso: *Petrus altior quam Paulus est*
+    
+    ### 2. Numerales Cardinales y Ordinales
+    
+    **Cardinales** (cuántos): uno, dos, tres...
+    **Ordinales** (en qué orden): primero, segundo, tercero...
+    
+    """
+    )
+
+    render_styled_table(
+        ["Número", "Cardinal", "Ordinal"],
+        [
+            ["1", "*unus, -a, -um*", "*primus, -a, -um*"],
+            ["2", "*duo, duae, duo*", "*secundus / alter*"],
+            ["3", "*tres, tria*", "*tertius*"],
+            ["4", "*quattuor*", "*quartus*"],
+            ["5", "*quinque*", "*quintus*"],
+            ["6", "*sex*", "*sextus*"],
+            ["7", "*septem*", "*septimus*"],
+            ["8", "*octo*", "*octavus*"],
+            ["9", "*novem*", "*nonus*"],
+            ["10", "*decem*", "*decimus*"],
+            ["100", "*centum*", "*centesimus*"],
+            ["1000", "*mille*", "*millesimus*"]
+        ]
+    )
+
+    st.markdown("""
+    
+    > **Nota**: Los cardinales del 4 al 100 son **indeclinables**.
+    > *Unus, duo, tres* sí se declinan.
+    """)
+    
+    # Infografía Cultural: Numerales Romanos en la Vida Cotidiana
+    if os.path.exists("static/images/curso_gramatica/leccion11_numerales_monumentos.png"):
+        st.image("static/images/curso_gramatica/leccion11_numerales_monumentos.png",
+                 caption="Numerales Romanos en Monumentos y la Vida Cotidiana",
+                 width="stretch")
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop, render_sentence_analysis_widget
+    render_vocabulary_widget(lesson_number=11)
+    render_translation_workshop(lesson_number=11)
+    render_sentence_analysis_widget(lesson_number=11)
+    render_lesson_progress_summary(lesson_number=11)
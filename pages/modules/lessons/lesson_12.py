@@ -0,0 +1,164 @@
+"""Lección 12: Pronombres"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_12():
+    st.markdown("""
+    ## Lección 12: Los Pronombres
+    """)
+    
+    if os.path.exists("static/images/curso_gramatica/leccion12_pronouns_demonstratives.png"):
+        st.image("static/images/curso_gramatica/leccion12_pronouns_demonstratives.png",
+                 caption="Pronombres Demostrativos: Hic, Ille, Is",
+                 width="stretch")
+                 
+    st.markdown("""
+    
+    ### 1. Pronombres Personales
+    
+    Los pronombres personales se usan para referirse a personas sin nombrarlas.
+    
+    **Primera y Segunda Persona:**
+    
+    """
+    )
+
+    render_styled_table(
+        ["Caso", "1a Sg (Yo)", "2a Sg (Tú)", "1a Pl (Nosotros)", "2a Pl (Vosotros)"],
+        [
+            ["**Nom**", "ego", "tu", "nos", "vos"],
+            ["**Ac**", "me", "te", "nos", "vos"],
+            ["**Gen**", "mei", "tui", "nostrum/nostri", "vestrum/vestri"],
+            ["**Dat**", "mihi", "tibi", "nobis", "vobis"],
+            ["**Abl**", "me", "te", "nobis", "vobis"]
+        ]
+    )
+
+    st.markdown("""
+    
+    > **Nota**: Los pronombres personales en Nominativo **raramente se usan** excepto para énfasis,
+    > porque el verbo ya indica la persona.
+    
+    **Tercera Persona**: Se usa el pronombre demostrativo *is, ea, id* (ver más abajo).
+    
+    ### 2. Pronombre Reflexivo (SE)
+    
+    El pronombre reflexivo **se refiere al sujeto de la oración**.
+    Solo existe para 3a persona (no hay formas de 1a y 2a, se usan *me, te*).
+    
+    """
+    )
+
+    render_styled_table(
+        ["Caso", "Forma", "Significado"],
+        [
+            ["**Ac**", "**se**", "a sí mismo/a"],
+            ["**Gen**", "**sui**", "de sí mismo"],
+            ["**Dat**", "**sibi**", "a/para sí mismo"],
+            ["**Abl**", "**se**", "consigo mismo"]
+        ]
+    )
+
+    st.markdown("""
+    
+    *   *Se amat.* (Él se ama a sí mismo)
+    *   *Sibi dicit.* (Se dice a sí mismo)
+    
+    ### 3. Pronombres-Adjetivos Posesivos
+    
+    Indican posesión. Se declinan como adjetivos de 1a Clase.
+    
+    """
+    )
+
+    render_styled_table(
+        ["Poseedor", "Singular (cosa poseída)", "Plural (cosas poseídas)"],
+        [
+            ["Mi(s)", "*meus, -a, -um*", "*mei, -ae, -a*"],
+            ["Tu(s)", "*tuus, -a, -um*", "*tui, -ae, -a*"],
+            ["Su(s) (de él/ella)", "*suus, -a, -um*", "*sui, -ae, -a*"],
+            ["Nuestro(s)", "*noster, nostra, nostrum*", "*nostri, -ae, -a*"],
+            ["Vuestro(s)", "*vester, vestra, vestrum*", "*vestri, -ae, -a*"]
+        ]
+    )
+
+    st.markdown("""
+    
+    *   *Meus pater* (Mi padre)
+    *   *Tua mater* (Tu madre)
+    *   *Nostrum oppidum* (Nuestra ciudad)
+    
+    ### 4. Pronombres-Adjetivos Demostrativos
+    
+    Señalan personas o cosas en el espacio o en el discurso.
+    
+    """
+    )
+    
+    if os.path.exists("static/images/curso_gramatica/leccion12_pronombres_heatmap.png"):
+        st.image("static/images/curso_gramatica/leccion12_pronombres_heatmap.png",
+                 caption="Mapa de Calor de Pronombres: Distancias Relativas (Hic, Iste, Ille)",
+                 width="stretch")
+                 
+    st.markdown("""
+    
+    #### A. Hic, haec, hoc (Este, esta, esto)
+    Indica **cercanía** al hablante.
+    
+    *   *Hic puer* (Este niño)
+    *   *Haec puella* (Esta niña)
+    *   *Hoc templum* (Este templo)
+    
+    #### B. Ille, illa, illud (Aquel, aquella, aquello)
+    Indica **lejanía** del hablante.
+    
+    *   *Ille rex* (Aquel rey)
+    *   *Illa regina* (Aquella reina)
+    
+    #### C. Is, ea, id (Él, ella, ello / Ese, esa, eso)
+    Es el demostrativo **neutro** y también se usa como pronombre personal de 3a persona.
+    
+    *   *Is vir* (Este/Ese hombre / Él, el hombre)
+    *   *Ea femina* (Ésa mujer / Ella, la mujer)
+    
+    ### 5. Pronombres Interrogativos
+    
+    Se usan para hacer preguntas.
+    
+    *   **Quis? Quid?** (¿Quién? ¿Qué?) - Para personas/cosas
+    *   **Qui, quae, quod?** (¿Qué? ¿Cuál?) - Como adjetivo
+    *   **Ubi?** (¿Dónde?)
+    *   **Quando?** (¿Cuándo?)
+    *   **Cur?** (¿Por qué?)
+    
+    ### 6. Pronombres Relativos
+    
+    Introducen **oraciones subordinadas adjetivas** (que modifican un sustantivo).
+    
+    **Qui, quae, quod** (Que, el cual, la cual, lo cual)
+    
+    *   *Puella quae cantat* (La niña que canta)
+    *   *Liber quem lego* (El libro que leo)
+    *   *Vir cuius filium video* (El hombre cuyo hijo veo)
+    
+    **Concordancia**: El relativo concuerda en **género y número** con su antecedente,
+    pero su **caso** depende de su función en la oración subordinada.
+    """)
+    
+    # Infografía Cultural: Estructura de la Familia Romana
+    if os.path.exists("static/images/curso_gramatica/leccion12_familia_romana.png"):
+        st.image("static/images/curso_gramatica/leccion12_familia_romana.png",
+                 caption="La Familia Romana: Estructura Social y Jerarquía",
+                 width="stretch")
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop, render_sentence_analysis_widget
+    render_vocabulary_widget(lesson_number=12)
+    render_translation_workshop(lesson_number=12)
+    render_sentence_analysis_widget(lesson_number=12)
+    render_lesson_progress_summary(lesson_number=12)
@@ -0,0 +1,468 @@
+"""Lección 13: Voz Pasiva y Ablativo"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_13():
+    st.markdown("""
+    ## Lección 13: Voz Pasiva y el Ablativo
+    """)
+    
+    st.image("static/images/curso_gramatica/passive_voice_diagram.png",
+             caption="La Voz Pasiva: Estructura y Formación",
+             width="stretch")
+             
+    st.markdown("""
+    
+    ### 1. Voz Pasiva: El Sujeto Recibe la Acción
+    
+    En la **voz activa**, el sujeto **realiza** la acción: *Puer puellam amat* (El niño ama a la niña).
+    En la **voz pasiva**, el sujeto **recibe** la acción: *Puella a puero amatur* (La niña es amada por el niño).
+    
+    **Formación**: Se cambian las **desinencias personales**.
+    
+    #### Desinencias Personales Pasivas (Sistema de Infectum)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Activa", "Pasiva"],
+        [
+            ["1a Sg", "-o/-m", "**-r**"],
+            ["2a Sg", "-s", "**-ris**"],
+            ["3a Sg", "-t", "**-tur**"],
+            ["1a Pl", "-mus", "**-mur**"],
+            ["2a Pl", "-tis", "**-mini**"],
+            ["3a Pl", "-nt", "**-ntur**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Presente Pasivo - Ejemplo: AMARE
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Activa", "Pasiva", "Traducción"],
+        [
+            ["1a Sg", "amo", "amo**r**", "yo soy amado"],
+            ["2a Sg", "amas", "ama**ris** / ama**re**", "tú eres amado"],
+            ["3a Sg", "amat", "ama**tur**", "él/ella es amado/a"],
+            ["1a Pl", "amamus", "ama**mur**", "nosotros somos amados"],
+            ["2a Sg", "amatis", "ama**mini**", "vosotros sois amados"],
+            ["3a Pl", "amant", "ama**ntur**", "ellos/ellas son amados/as"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Imperfecto Pasivo
+    *   *Amabar, amabaris, amabatur...* (Yo era amado, tú eras amado...)
+    
+    #### Futuro Pasívo (1a/2a Conj)
+    *   *Amabor, amaberis, amabitur...* (Yo seré amado...)
+    
+    ### 2. Verbos Deponentes: Pasivos en Forma, Activos en Significado
+    
+    Los **verbos deponentes** tienen forma pasiva pero significado activo.
+    (¡Se conjugan como pasivos pero se traducen como activos!)
+    
+    **Ejemplos importantes:**
+    *   **Sequor, sequi, secutus sum** (seguir)
+        - *Sequor te* = Te sigo (no "soy seguido por ti")
+    *   **Loquor, loqui, locutus sum** (hablar)
+    *   **Patior, pati, passus sum** (sufrir, padecer)
+    *   **Morior, mori, mortuus sum** (morir)
+    *   **Nascor, nasci, natus sum** (nacer)
+    
+    ### 3. El Caso Ablativo: El Más Versátil
+    
+    El **Ablativo** es el caso de las **circunstancias**. Es el caso más versátil del latín, 
+    con una enorme variedad de usos. Vamos a explorar los complementos circunstanciales en detalle.
+    
+    ---
+    
+    ## COMPLEMENTOS CIRCUNSTANCIALES DE LUGAR
+    
+    Los complementos de lugar expresan dónde ocurre la acción. El latín distingue cuatro tipos fundamentales:
+    
+    """)
+    
+    st.image("static/images/curso_gramatica/leccion13_complementos_lugar.png",
+             caption="Esquema de los Complementos de Lugar en Latín",
+             width="stretch")
+    
+    st.markdown("""
+    
+    ### 3.1 ¿A DÓNDE? - Movimiento hacia un lugar (Acusativo)
+    
+    Para expresar **movimiento hacia** un lugar se usa **Acusativo** con preposiciones:
+    
+    **AD + Acusativo**: "hacia, a" (dirección general)
+    *   *Miles ad urbem it.* (El soldado va hacia la ciudad)
+    *   *Venit ad Caesarem.* (Viene hacia César)
+    *   *Ad forum ambulamus.* (Caminamos hacia el foro)
+    
+    **IN + Acusativo**: "hacia dentro de, a" (entrada a un espacio cerrado)
+    *   *Puer in silvam currit.* (El niño corre hacia el bosque)
+    *   *In scholam venio.* (Vengo a la escuela)
+    *   *Equus in aquam descendit.* (El caballo desciende al agua)
+    
+    """)
+    
+    render_styled_table(
+        ["Preposición", "Caso", "Significado", "Ejemplo Latino", "Traducción"],
+        [
+            ["**AD**", "Acusativo", "hacia, a", "*ad urbem*", "hacia la ciudad"],
+            ["**IN**", "Acusativo", "hacia dentro de", "*in silvam*", "hacia el bosque"],
+            ["**PER**", "Acusativo", "a través de", "*per viam*", "por el camino"]
+        ]
+    )
+    
+    st.markdown("""
+    
+    ### 3.2 ¿DE DÓNDE? - Procedencia u origen (Ablativo)
+    
+    Para expresar **procedencia** se usa **Ablativo** con preposiciones:
+    
+    **A/AB + Ablativo**: "desde, de" (punto de partida, alejamiento)
+    *   *Ab urbe venio.* (Vengo desde la ciudad)
+    *   *A porta discedunt.* (Se alejan de la puerta)
+    *   *A Roma proficiscitur.* (Parte desde Roma)
+    
+    **DE + Ablativo**: "de, desde" (bajada, descenso)
+    *   *De monte descendit.* (Desciende del monte)
+    *   *De caelo cadit.* (Cae del cielo)
+    *   *De nave exit.* (Sale de la nave)
+    
+    **EX/E + Ablativo**: "de, fuera de, desde" (salida del interior)
+    *   *Ex oppido exeunt.* (Salen de la ciudad)
+    *   *E silva veniunt.* (Vienen del bosque)
+    *   *Ex urbe fugit.* (Huye de la ciudad)
+    
+    **Matices importantes**:
+    *   *AB*: Énfasis en el alejamiento o punto de partida
+    *   *DE*: Énfasis en bajada o descenso
+    *   *EX*: Énfasis en salida del interior
+    
+    """)
+    
+    render_styled_table(
+        ["Preposición", "Caso", "Matiz", "Ejemplo Latino", "Traducción"],
+        [
+            ["**A/AB**", "Ablativo", "alejamiento", "*ab urbe*", "desde la ciudad"],
+            ["**DE**", "Ablativo", "descenso", "*de monte*", "desde el monte"],
+            ["**EX/E**", "Ablativo", "salida interior", "*ex oppido*", "fuera de la ciudad"]
+        ]
+    )
+    
+    st.markdown("""
+    
+    ### 3.3 ¿DÓNDE? - Ubicación estática (Ablativo)
+    
+    Para expresar **ubicación en un lugar** se usa **Ablativo** con preposiciones:
+    
+    **IN + Ablativo**: "en, dentro de"
+    *   *In urbe habito.* (Habito en la ciudad)
+    *   *In silva sunt.* (Están en el bosque)
+    *   *In templo orat.* (Ora en el templo)
+    
+    **SUB + Ablativo**: "bajo, debajo de"
+    *   *Sub arbore sedet.* (Se sienta bajo el árbol)
+    *   *Sub terra latent.* (Se esconden bajo tierra)
+    
+    **SUPER + Ablativo**: "sobre, encima de"
+    *   *Super montem stat.* (Está sobre el monte)
+    
+    > **¡ATENCIÓN!** La preposición **IN** cambia de significado según el caso:
+    > *   **IN + Acusativo** = hacia dentro de (movimiento)
+    > *   **IN + Ablativo** = en, dentro de (ubicación estática)
+    
+    ### 3.4 ¿POR DÓNDE? - Tránsito o paso (Acusativo)
+    
+    **PER + Acusativo**: "por, a través de"
+    *   *Per viam ambulat.* (Camina por el camino)
+    *   *Per silvam iter faciunt.* (Hacen el viaje a través del bosque)
+    *   *Per forum transit.* (Pasa por el foro)
+    
+    """)
+    
+    st.markdown("### 🧠 Mnemotecnia: Preposiciones")
+    st.image("static/images/curso_gramatica/leccion13_preposiciones_completas.png",
+             caption="Guía Visual de Preposiciones (Acusativo vs Ablativo)",
+             width="stretch")
+
+    st.image("static/images/curso_gramatica/leccion13_preposiciones_casos.png",
+             caption="Preposiciones de Lugar con sus Casos Gramaticales",
+             width="stretch")
+    
+    st.image("static/images/curso_gramatica/leccion13_decision_preposiciones.png",
+             caption="Diagrama de Decisión: ¿Qué Preposición Usar?",
+             width="stretch")
+    
+    st.markdown("""
+    
+    ### 3.5 EL LOCATIVO: Caso Especial para Ciudades
+    
+    El **Locativo** es un caso arcaico que sobrevive SOLO para:
+    *   Nombres de **ciudades** y **pueblos**
+    *   Nombres de **islas pequeñas**
+    *   Las palabras **domus** (casa) y **rus** (campo)
+    
+    """)
+    
+    st.image("static/images/curso_gramatica/leccion13_locativo.png",
+             caption="El Locativo: Nombres de Ciudades e Islas Pequeñas",
+             width="stretch")
+    
+    st.markdown("""
+    
+    **Terminaciones del Locativo:**
+    
+    """)
+    
+    render_styled_table(
+        ["Declinación", "Singular", "Plural", "Ejemplos"],
+        [
+            ["**1a Decl**", "-ae", "-is", "*Romae* (en Roma), *Athenis* (en Atenas)"],
+            ["**2a Decl**", "-i", "-is", "*Corinthi* (en Corinto), *Delphi* (en Delfos)"],
+            ["**3a Decl**", "-i / -e", "-ibus", "*Carthagine* (en Cartago)"]
+        ]
+    )
+    
+    st.markdown("""
+    
+    **Ejemplos con ciudades:**
+    *   **Ubicación**: *Romae vivit.* (Vive en Roma) - Locativo
+    *   **Dirección**: *Romam it.* (Va a Roma) - Acusativo sin preposición
+    *   **Procedencia**: *Roma venit.* (Viene de Roma) - Ablativo sin preposición
+    
+    **Palabras especiales:**
+    *   *Domi* (en casa): *Domi maneo.* (Me quedo en casa)
+    *   *Domum* (a casa): *Domum eo.* (Voy a casa)
+    *   *Domo* (de casa): *Domo venio.* (Vengo de casa)
+    
+    > **Nota**: Las ciudades grandes a veces usan *in + Ablativo* en lugar del locativo.
+    
+    """)
+    
+    if os.path.exists("static/images/curso_gramatica/leccion13_geografia_militar.png"):
+        st.image("static/images/curso_gramatica/leccion13_geografia_militar.png",
+                 caption="Geografía Militar: Términos Estratégicos y Movimiento",
+                 width="stretch")
+    
+    st.markdown("""
+    ---
+    
+    ## COMPLEMENTOS CIRCUNSTANCIALES DE TIEMPO
+    """)
+    
+    st.image("static/images/curso_gramatica/leccion13_complementos_tiempo.png",
+             caption="Esquema de los Complementos de Tiempo en Latín",
+             width="stretch")
+    
+    st.markdown("""
+    
+    ### 4.1 ¿CUÁNDO? - Momento determinado (Ablativo sin preposición)
+    
+    Para expresar **en qué momento** ocurre algo, se usa **Ablativo SIN preposición**:
+    
+    *   *Prima hora venio.* (Vengo en la primera hora)
+    *   *Aestate* (En verano)
+    *   *Hieme* (En invierno)
+    *   *Nocte* (De noche)
+    *   *Die* (De día)
+    *   *Hora sexta* (A la hora sexta)
+    *   *Tertio die* (Al tercer día)
+    
+    **Ejemplos en contexto:**
+    *   *Nocte stellae lucent.* (De noche brillan las estrellas)
+    *   *Prima luce proficiscuntur.* (Parten al amanecer)
+    *   *Aestate in agris laborant.* (En verano trabajan en los campos)
+    
+    ### 4.2 ¿DESDE CUÁNDO? - Punto de partida temporal (Ablativo con preposición)
+    
+    **A/AB + Ablativo**: "desde"
+    *   *A prima luce laborat.* (Trabaja desde el amanecer)
+    *   *Ab illo tempore* (Desde aquel tiempo)
+    *   *A pueritia* (Desde la infancia)
+    
+    **EX + Ablativo**: "desde, a partir de"
+    *   *Ex eo tempore* (Desde ese tiempo)
+    *   *Ex hoc die* (A partir de este día)
+    
+    ### 4.3 ¿HASTA CUÁNDO? - Límite temporal (Acusativo)
+    
+    **AD + Acusativo**: "hasta"
+    *   *Ad vesperum manet.* (Permanece hasta la tarde)
+    *   *Ad noctem pugnaverunt.* (Lucharon hasta la noche)
+    
+    **USQUE AD + Acusativo**: "hasta" (con énfasis)
+    *   *Usque ad mortem fidelis.* (Fiel hasta la muerte)
+    *   *Usque ad noctem* (Hasta la noche)
+    
+    ### 4.4 ¿CUÁNTO TIEMPO? - Duración (Acusativo sin preposición)
+    
+    Para expresar **duración** se usa **Acusativo SIN preposición**:
+    
+    *   *Tres dies maneo.* (Permanezco tres días)
+    *   *Multos annos vixit.* (Vivió muchos años)
+    *   *Totam noctem vigilat.* (Vigila toda la noche)
+    *   *Decem annos regnavit.* (Reinó diez años)
+    
+    **PER + Acusativo**: Duración con énfasis en la continuidad
+    *   *Per decem annos* (Durante diez años [continuamente])
+    *   *Per totam vitam* (Durante toda la vida)
+    
+    """)
+    
+    render_styled_table(
+        ["Pregunta", "Construcción", "Ejemplo Latino", "Traducción"],
+        [
+            ["**¿Cuándo?**", "Ablativo solo", "*nocte*", "de noche"],
+            ["**¿Desde cuándo?**", "A/AB + Abl", "*a prima luce*", "desde el amanecer"],
+            ["**¿Hasta cuándo?**", "AD + Acus", "*ad vesperum*", "hasta la tarde"],
+            ["**¿Cuánto tiempo?**", "Acusativo solo", "*tres dies*", "tres días"]
+        ]
+    )
+    
+    st.markdown("""
+    
+    ---
+    
+    ## OTROS COMPLEMENTOS CIRCUNSTANCIALES
+    """)
+    
+    st.image("static/images/curso_gramatica/leccion13_otros_complementos.png",
+             caption="Otros Complementos Circunstanciales: Modo, Causa, Instrumento, etc.",
+             width="stretch")
+    
+    st.markdown("""
+    
+    ### 5.1 Modo (¿Cómo?)
+    
+    **CUM + Ablativo**: Con + cualidad
+    *   *Cum gaudio venit.* (Viene con alegría)
+    *   *Cum studio laborat.* (Trabaja con empeño)
+    *   *Magna cum laude* (Con gran alabanza)
+    
+    **Ablativo de cualidad solo** (sin preposición):
+    *   *Magna voce clamat.* (Grita en voz alta)
+    *   *Summa celeritate* (Con suma rapidez)
+    
+    ### 5.2 Causa (¿Por qué?)
+    
+    **OB/PROPTER + Acusativo**: "a causa de, por"
+    *   *Propter bellum fugiunt.* (Huyen a causa de la guerra)
+    *   *Ob metum tacet.* (Calla por miedo)
+    
+    **Ablativo de causa** (sin preposición):
+    *   *Metu fugiunt.* (Huyen por miedo)
+    *   *Amore patriae pugnat.* (Lucha por amor a la patria)
+    
+    ### 5.3 Medio o Instrumento (¿Con qué?)
+    
+    **Ablativo SIN preposición** (cosas):
+    *   *Gladio pugnat.* (Lucha con la espada)
+    *   *Oculis videt.* (Ve con los ojos)
+    *   *Navibus veniunt.* (Vienen en barcos)
+    
+    **PER + Acusativo** (medio, intermediario):
+    *   *Per nuntium dicit.* (Dice mediante un mensajero)
+    *   *Per epistulam scribit.* (Escribe por carta)
+    
+    ### 5.4 Compañía (¿Con quién?)
+    
+    **CUM + Ablativo**:
+    *   *Cum amicis ambulo.* (Camino con los amigos)
+    *   *Cum patre venit.* (Viene con el padre)
+    *   *Cum militibus pugnat.* (Lucha con los soldados)
+    
+    ### 5.5 Complemento Agente (con Pasiva)
+    
+    **A/AB + Ablativo** (persona que realiza la acción en voz pasiva):
+    *   *Urbs a Romanis capitur.* (La ciudad es tomada por los romanos)
+    *   *Puella a patre amatur.* (La niña es amada por el padre)
+    *   *Liber a Marco legitur.* (El libro es leído por Marco)
+    
+    ### 5.6 Materia (¿De qué está hecho?)
+    
+    **EX/DE + Ablativo**:
+    *   *Statua ex auro est.* (La estatua es de oro)
+    *   *Domus de ligno* (Casa de madera)
+    
+    ---
+    
+    ## RESUMEN DE USOS DEL ABLATIVO
+    
+    El Ablativo es el caso más versátil. Resumen de sus principales funciones:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Uso", "Construcción", "Ejemplo", "Traducción"],
+        [
+            ["**Agente**", "a/ab + Abl", "*a patre*", "por el padre"],
+            ["**Instrumento**", "Abl solo", "*gladio*", "con la espada"],
+            ["**Compañía**", "cum + Abl", "*cum amicis*", "con los amigos"],
+            ["**Modo**", "cum + Abl / Abl solo", "*magna voce*", "en voz alta"],
+            ["**Causa**", "Abl solo / propter + Ac", "*metu*", "por miedo"],
+            ["**Lugar ¿dónde?**", "in + Abl", "*in urbe*", "en la ciudad"],
+            ["**Lugar ¿de dónde?**", "ab/ex/de + Abl", "*ab urbe*", "desde la ciudad"],
+            ["**Tiempo ¿cuándo?**", "Abl solo", "*nocte*", "de noche"],
+            ["**Materia**", "ex/de + Abl", "*ex auro*", "de oro"]
+        ]
+    )
+    
+    st.markdown("""
+    
+    ### Vocabulario Esencial de Lugar y Tiempo
+    
+    **Lugares:**
+    *   *urbs, urbis* (f): ciudad
+    *   *oppidum, -i* (n): ciudad, plaza fuerte
+    *   *silva, -ae* (f): bosque
+    *   *mons, montis* (m): monte
+    *   *via, -ae* (f): camino
+    *   *forum, -i* (n): foro
+    *   *templum, -i* (n): templo
+    *   *porta, -ae* (f): puerta
+    
+    **Tiempo:**
+    *   *hora, -ae* (f): hora
+    *   *dies, diei* (m/f): día
+    *   *nox, noctis* (f): noche
+    *   *annus, -i* (m): año
+    *   *aestas, aestatis* (f): verano
+    *   *hiems, hiemis* (f): invierno
+    *   *tempus, temporis* (n): tiempo
+    *   *lux, lucis* (f): luz (prima luce = al amanecer)
+    
+    ### Resumen Final: ¡Has Completado el Curso!
+    
+    ¡Felicidades! Ahora conoces:
+    *   ✓ Las **5 declinaciones** del latín
+    *   ✓ Los **6 casos** y sus funciones
+    *   ✓ Las **4 conjugaciones** verbales
+    *   ✓ Los **4 tiempos principales**: Presente, Imperfecto, Perfecto, Futuro
+    *   ✓ La **voz pasiva** y los verbos deponentes
+    *   ✓ Los **pronombres** personales, demostrativos y relativos
+    *   ✓ Los **grados del adjetivo**: positivo, comparativo, superlativo
+    
+    ¡Ahora estás listo para leer textos latinos originales!
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop, render_sentence_analysis_widget
+    render_vocabulary_widget(lesson_number=13)
+    render_translation_workshop(lesson_number=13)
+    render_sentence_analysis_widget(lesson_number=13)
+    render_lesson_progress_summary(lesson_number=13)
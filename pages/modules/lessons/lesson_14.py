@@ -0,0 +1,185 @@
+"""Lección 14: Pluscuamperf. y Fut. Perfecto"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_14():
+    st.markdown("""
+    ## Lección 14: Pluscuamperfecto y Futuro Perfecto
+    """)
+    
+    if os.path.exists("static/images/curso_gramatica/leccion14_pluperfect_futureperfect.png"):
+        st.image("static/images/curso_gramatica/leccion14_pluperfect_futureperfect.png",
+                 caption="Línea de tiempo del Sistema de Perfectum",
+                 width="stretch")
+                 
+    st.markdown("""
+    
+    ### Nivel Avanzado: Completando el Sistema de Perfectum
+    
+    Ya conoces el **Pretérito Perfecto** (amavi = amé / he amado). Ahora aprenderemos los dos tiempos 
+    restantes del **Sistema de Perfectum** que se forman sobre el mismo tema.
+    
+    ### 1. Pretérito Pluscuamperfecto: El Pasado Anterior
+    
+    El **Pretérito Pluscuamperfecto** expresa una acción pasada **anterior a otra acción pasada**.
+    Equivale a "había amado" en español.
+    
+    **Formación**: Tema de Perfecto + **-eram, -eras, -erat, -eramus, -eratis, -erant**
+    
+    > Observa que las terminaciones son **idénticas al Imperfecto de SUM** (eram, eras, erat...)
+    
+    #### Paradigma: AMARE (Tema de perfecto: amav-)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "amav-**eram**", "yo había amado"],
+            ["2a Sg", "amav-**eras**", "tú habías amado"],
+            ["3a Sg", "amav-**erat**", "él/ella había amado"],
+            ["1a Pl", "amav-**eramus**", "nosotros habíamos amado"],
+            ["2a Pl", "amav-**eratis**", "vosotros habíais amado"],
+            ["3a Pl", "amav-**erant**", "ellos/ellas habían amado"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Otros ejemplos con verbos irregulares:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Perfecto (3a Sg)", "Pluscuamperfecto (3a Sg)", "Traducción"],
+        [
+            ["*Habeo*", "*habuit*", "*habu**erat***", "había tenido"],
+            ["*Dico*", "*dixit*", "*dix**erat***", "había dicho"],
+            ["*Lego*", "*legit*", "*leg**erat***", "había leído"],
+            ["*Sum*", "*fuit*", "*fu**erat***", "había sido/estado"],
+            ["*Venio*", "*venit*", "*ven**erat***", "había venido"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplos en contexto**:
+    *   *Caesar, antequam Romani venerunt, ad Galliam pervener**at**.* 
+        (César **había llegado** a la Galia antes de que los romanos vinieran)
+    *   *Puella rosam, quam puer dederat, amabat.*
+        (La niña amaba la rosa que el niño **le había dado**)
+    *   *Milites, qui diu pugav**erant**, fessi erant.*
+        (Los soldados, que **habían luchado** mucho tiempo, estaban cansados)
+    
+    ### 2. Futuro Perfecto: El Pasado en el Futuro
+    
+    El **Futuro Perfecto** expresa una acción que **estará completada en el futuro**.
+    Equivale a "habré amado" en español.
+    
+    **Formación**: Tema de Perfecto + **-ero, -eris, -erit, -erimus, -eritis, -erint**
+    
+    > ¡Atención! Las terminaciones son casi idénticas al **Futuro de SUM** (ero, eris, erit...)
+    > excepto en la 3a persona plural: -erint (no -erunt)
+    
+    #### Paradigma: AMARE
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "amav-**ero**", "yo habré amado"],
+            ["2a Sg", "amav-**eris**", "tú habrás amado"],
+            ["3a Sg", "amav-**erit**", "él/ella habrá amado"],
+            ["1a Pl", "amav-**erimus**", "nosotros habremos amado"],
+            ["2a Pl", "amav-**eritis**", "vosotros habréis amado"],
+            ["3a Pl", "amav-**erint**", "ellos/ellas habrán amado"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Uso típico**: En oraciones temporales con *cum, ubi, postquam, simul atque*
+    
+    *   *Cum hoc fec**eris**, felix eris.*
+        (Cuando **hayas hecho** esto, serás feliz)
+    *   *Simul atque ven**eris**, tibi dicam.*
+        (Tan pronto como **hayas venido**, te diré)
+    *   *Si hoc leg**erit**, intelleget.*
+        (Si **hubiere leído** esto, lo entenderá)
+    
+    ### 3. Resumen: Sistema Completo de Perfectum (Activo)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Tiempo", "Terminaciones", "Ejemplo (AMARE)", "Significado"],
+        [
+            ["**Perfecto**", "-i, -isti, -it, -imus, -istis, -erunt", "amav**i**", "amé / he amado"],
+            ["**Pluscuamperfecto**", "-eram, -eras, -erat, -eramus, -eratis, -erant", "amav**eram**", "había amado"],
+            ["**Futuro Perfecto**", "-ero, -eris, -erit, -erimus, -eritis, -erint", "amav**ero**", "habré amado"]
+        ]
+    )
+
+    st.markdown("""
+    
+    > **Clave**: Los tres tiempos se forman sobre el **mismo tema de perfecto**, 
+    > solo cambian las terminaciones.
+    
+    ### 4. Ejercicio de Conjugación
+    
+    Conjuga en los tres tiempos los siguientes verbos (3a persona singular):
+    
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Perfecto", "Pluscuamperfecto", "Futuro Perfecto"],
+        [
+            ["*Porto, portare, portavi, portatum*", "*portavit*", "*portav**erat***", "*portav**erit***"],
+            ["*Moneo, monere, monui, monitum*", "*monuit*", "*monu**erat***", "*monu**erit***"],
+            ["*Mitto, mittere, misi, missum*", "*misit*", "*mis**erat***", "*mis**erit***"],
+            ["*Audio, audire, audivi, auditum*", "*audivit*", "*audiv**erat***", "*audiv**erit***"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### Vocabulario Esencial
+    *   **antequam**: antes de que
+    *   **postquam**: después de que
+    *   **ubi**: cuando (tan pronto como)
+    *   **simul atque / simul ac**: tan pronto como
+    *   **priusquam**: antes de que
+    *   **cum primum**: apenas, en cuanto
+    """)
+    
+    # Infografía Cultural: El Calendario Romano
+    if os.path.exists("static/images/curso_gramatica/leccion14_calendario_romano.png"):
+        st.image("static/images/curso_gramatica/leccion14_calendario_romano.png",
+                 caption="El Calendario Romano: Nombres de los Meses y Días",
+                 width="stretch")
+    
+    # Infografía Cultural: Fiestas Religiosas Romanas
+    st.markdown("### 🏛️ Cultura Romana: Las Grandes Fiestas Religiosas")
+    st.info("El calendario romano estaba marcado por numerosas **fiestas religiosas** (*feriae*) en honor a los dioses.")
+    if os.path.exists("static/images/curso_gramatica/cultura_fiestas_religiosas.png"):
+        st.image("static/images/curso_gramatica/cultura_fiestas_religiosas.png",
+                 caption="Las Principales Fiestas Religiosas Romanas: Saturnalia, Lupercalia, Floralia...",
+                 width="stretch")
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop, render_sentence_analysis_widget
+    render_vocabulary_widget(lesson_number=14)
+    render_translation_workshop(lesson_number=14)
+    render_sentence_analysis_widget(lesson_number=14)
+    render_lesson_progress_summary(lesson_number=14)
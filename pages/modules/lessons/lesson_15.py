@@ -0,0 +1,221 @@
+"""Lección 15: Voz Pasiva - Infectum"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_15():
+    st.markdown("""
+    ## Lección 15: Voz Pasiva - Sistema de Infectum
+    """)
+    
+    if os.path.exists("static/images/curso_gramatica/leccion15_passive_conjugation_chart.png"):
+        st.image("static/images/curso_gramatica/leccion15_passive_conjugation_chart.png",
+                 caption="Tabla completa de la Voz Pasiva (Infectum)",
+                 width="stretch")
+                 
+    st.markdown("""
+    
+    ### Completando la Voz Pasiva
+    
+    En la Lección 13 viste una introducción a la voz pasiva. Ahora vamos a dominarla completamente 
+    para el **Sistema de Infectum** (Presente, Imperfecto, Futuro).
+    
+    ### 1. Recordatorio: ¿Qué es la Voz Pasiva?
+    
+    **Voz Activa**: El sujeto **realiza** la acción
+    *   *Puer puellam amat.* (El niño ama a la niña)
+    
+    **Voz Pasiva**: El sujeto **recibe** la acción
+    *   *Puella a puero amatur.* (La niña es amada por el niño)
+    
+    ### 2. Desinencias Personales Pasivas
+    
+    Las desinencias activas se reemplazan por desinencias pasivas:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Activa", "Pasiva"],
+        [
+            ["1a Sg", "-o / -m", "**-r** / **-or**"],
+            ["2a Sg", "-s", "**-ris** / **-re**"],
+            ["3a Sg", "-t", "**-tur**"],
+            ["1a Pl", "-mus", "**-mur**"],
+            ["2a Pl", "-tis", "**-mini**"],
+            ["3a Pl", "-nt", "**-ntur**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 3. Presente Pasivo - Las Cuatro Conjugaciones
+    
+    #### Primera Conjugación: AMARE
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Activa", "Pasiva", "Traducción"],
+        [
+            ["1a Sg", "amo", "am**or**", "yo soy amado/a"],
+            ["2a Sg", "amas", "ama**ris** / ama**re**", "tú eres amado/a"],
+            ["3a Sg", "amat", "ama**tur**", "él/ella es amado/a"],
+            ["1a Pl", "amamus", "ama**mur**", "nosotros somos amados/as"],
+            ["2a Sg", "amatis", "ama**mini**", "vosotros sois amados/as"],
+            ["3a Pl", "amant", "ama**ntur**", "ellos/ellas son amados/as"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Segunda Conjugación: MONERE
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Pasiva", "Traducción"],
+        [
+            ["1a Sg", "mone**or**", "yo soy aconsejado/a"],
+            ["2a Sg", "mone**ris**", "tú eres aconsejado/a"],
+            ["3a Sg", "mone**tur**", "él/ella es aconsejado/a"],
+            ["1a Pl", "mone**mur**", "nosotros somos aconsejados/as"],
+            ["2a Sg", "mone**mini**", "vosotros sois aconsejados/as"],
+            ["3a Pl", "mone**ntur**", "ellos/ellas son aconsejados/as"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Tercera Conjugación: LEGERE
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Pasiva", "Traducción"],
+        [
+            ["1a Sg", "leg**or**", "yo soy leído/a"],
+            ["2a Sg", "lege**ris**", "tú eres leído/a"],
+            ["3a Sg", "legi**tur**", "él/ella es leído/a"],
+            ["1a Pl", "legi**mur**", "nosotros somos leídos/as"],
+            ["2a Sg", "legi**mini**", "vosotros sois leídos/as"],
+            ["3a Pl", "leg**untur**", "ellos/ellas son leídos/as"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Cuarta Conjugación: AUDIRE
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Pasiva", "Traducción"],
+        [
+            ["1a Sg", "audi**or**", "yo soy oído/a"],
+            ["2a Sg", "audi**ris**", "tú eres oído/a"],
+            ["3a Sg", "audi**tur**", "él/ella es oído/a"],
+            ["1a Pl", "audi**mur**", "nosotros somos oídos/as"],
+            ["2a Sg", "audi**mini**", "vosotros sois oídos/as"],
+            ["3a Pl", "audi**untur**", "ellos/ellas son oídos/as"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 4. Imperfecto Pasivo
+    
+    **Formación**: Raíz + **vocal temática + -ba- + desinencias pasivas**
+    
+    #### Las Cuatro Conjugaciones:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Conjugación", "1a Sg", "2a Sg", "3a Sg", "Ejemplo"],
+        [
+            ["**1a**", "ama**bar**", "ama**baris**", "ama**batur**", "yo era amado"],
+            ["**2a**", "mone**bar**", "mone**baris**", "mone**batur**", "yo era aconsejado"],
+            ["**3a**", "lege**bar**", "lege**baris**", "lege**batur**", "yo era leído"],
+            ["**4a**", "audie**bar**", "audie**baris**", "audie**batur**", "yo era oído"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplos**:
+    *   *Liber a discipulis legebatur.* (El libro era leído por los discípulos)
+    *   *Urbs ab hostibus oppugnabatur.* (La ciudad era atacada por los enemigos)
+    
+    ### 5. Futuro Pasivo
+    
+    #### Primera y Segunda Conjugación: Sufijo -B-
+    
+    """
+    )
+
+    render_styled_table(
+        ["Conjugación", "1a Sg", "2a Sg", "3a Sg"],
+        [
+            ["**1a**", "ama**bor**", "ama**beris**", "ama**bitur**"],
+            ["**2a**", "mone**bor**", "mone**beris**", "mone**bitur**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Tercera y Cuarta Conjugación: Vocal -E-/-I- 
+    
+    """
+    )
+
+    render_styled_table(
+        ["Conjugación", "1a Sg", "2a Sg", "3a Sg"],
+        [
+            ["**3a**", "leg**ar**", "leg**eris**", "leg**etur**"],
+            ["**4a**", "audi**ar**", "audi**eris**", "audi**etur**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplos**:
+    *   *Cras laudabor.* (Mañana seré alabado)
+    *   *Epistula cras legetur.* (La carta será leída mañana)
+    
+    ### 6. Complemento Agente vs. Instrumento
+    
+    **Complemento Agente** (persona que realiza la acción):
+    *   Preposición **a/ab** + Ablativo
+    *   *Urbs a Romanis capitur.* (La ciudad es tomada **por los romanos**)
+    
+    **Complemento Instrumento** (medio por el cual se realiza):
+    *   Ablativo **sin preposición**
+    *   *Milites gladiis pugnant.* (Los soldados luchan **con espadas**)
+    *   *Urbs armis capitur.* (La ciudad es tomada **con armas**)
+    
+    ### Vocabulario Esencial
+    Verbos transitivos frecuentes en pasiva:
+    *   **Laudo, laudare**: alabar
+    *   **Pugno, pugnare**: luchar
+    *   **Capio, capere, cepi, captum**: tomar, capturar
+    *   **Vincio, vincire, vinxi, vinctum**: atar, encadenar
+    *   **Oppugno, oppugnare**: atacar
+    *   **Deligo, deligere, delegi, delectum**: elegir
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop, render_sentence_analysis_widget
+    render_vocabulary_widget(lesson_number=15)
+    render_translation_workshop(lesson_number=15)
+    render_sentence_analysis_widget(lesson_number=15)
+    render_lesson_progress_summary(lesson_number=15)
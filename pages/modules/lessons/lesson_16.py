@@ -0,0 +1,225 @@
+"""Lección 16: Voz Pasiva - Perfectum"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_16():
+    st.markdown("""
+    ## Lección 16: Voz Pasiva - Sistema de Perfectum
+    """)
+    
+    if os.path.exists("static/images/curso_gramatica/leccion16_passive_perfect_system.png"):
+        st.image("static/images/curso_gramatica/leccion16_passive_perfect_system.png",
+                 caption="Formación del Sistema de Perfectum Pasivo",
+                 width="stretch")
+                 
+    st.markdown("""
+    
+    ### El Participio Perfecto Pasivo
+    
+    La voz pasiva del Sistema de Perfectum se forma de manera **completamente diferente** 
+    al Sistema de Infectum. No usa desinencias especiales, sino una **construcción perifrástica** 
+    con el Participio Perfecto Pasivo.
+    
+    ### 1. El Participio Perfecto Pasivo (PPP)
+    
+    El **Participio Perfecto Pasivo** es un **adjetivo verbal** que se declina como 
+    los adjetivos de 1a clase (*bonus, -a, -um*).
+    
+    **Formación**: Se forma sobre el **tema de supino** (4a forma del enunciado del verbo).
+    
+    #### Ejemplos:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Supino", "PPP (m/f/n)", "Traducción"],
+        [
+            ["*Amo, amare, amavi, **amatum***", "amat-", "amat**us, -a, -um**", "amado/a"],
+            ["*Moneo, monere, monui, **monitum***", "monit-", "monit**us, -a, -um**", "aconsejado/a"],
+            ["*Lego, legere, legi, **lectum***", "lect-", "lect**us, -a, -um**", "leído/a"],
+            ["*Audio, audire, audivi, **auditum***", "audit-", "audit**us, -a, -um**", "oído/a"],
+            ["*Capio, capere, cepi, **captum***", "capt-", "capt**us, -a, -um**", "capturado/a"],
+            ["*Vinco, vincere, vici, **victum***", "vict-", "vict**us, -a, -um**", "vencido/a"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Concordancia**: El PPP concuerda en **género, número y caso** con el sujeto.
+    
+    ### 2. Pretérito Perfecto Pasivo
+    
+    **Fórmula**: **Participio Perfecto Pasivo + Presente de SUM**
+    
+    #### Paradigma: AMARE (Masculino)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "amat**us sum**", "yo fui amado / he sido amado"],
+            ["2a Sg", "amat**us es**", "tú fuiste amado"],
+            ["3a Sg", "amat**us est**", "él fue amado"],
+            ["1a Pl", "amat**i sumus**", "nosotros fuimos amados"],
+            ["2a Sg", "amat**i estis**", "vosotros fuisteis amados"],
+            ["3a Pl", "amat**i sunt**", "ellos fueron amados"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Femenino y Neutro:
+    *   Femenino Sg: *amata sum, amata es, amata est*
+    *   Neutro Sg: *amatum est* (solo 3a persona, cosas)
+    *   Femenino Pl: *amatae sumus, amatae estis, amatae sunt*
+    *   Neutro Pl: *amata sunt*
+    
+    **Ejemplos**:
+    *   *Urbs a Romanis capt**a est**.* (La ciudad fue capturada por los romanos)
+    *   *Epistola lect**a est**.* (La carta fue leída)
+    *   *Milites vinct**i sunt**.* (Los soldados fueron encadenados)
+    
+    ### 3. Pretérito Pluscuamperfecto Pasivo
+    
+    **Fórmula**: **Participio Perfecto Pasivo + Imperfecto de SUM** (eram, eras, erat...)
+    
+    #### Paradigma: AMARE (Masculino)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "amat**us eram**", "yo había sido amado"],
+            ["2a Sg", "amat**us eras**", "tú habías sido amado"],
+            ["3a Sg", "amat**us erat**", "él había sido amado"],
+            ["1a Pl", "amat**i eramus**", "nosotros habíamos sido amados"],
+            ["2a Sg", "amat**i eratis**", "vosotros habíais sido amados"],
+            ["3a Pl", "amat**i erant**", "ellos habían sido amados"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplos**:
+    *   *Urbs iam capt**a erat** cum Caesar advenit.*
+        (La ciudad **ya había sido capturada** cuando César llegó)
+    *   *Liber antea lect**us erat**.*
+        (El libro **había sido leído** antes)
+    
+    ### 4. Futuro Perfecto Pasivo
+    
+    **Fórmula**: **Participio Perfecto Pasivo + Futuro de SUM** (ero, eris, erit...)
+    
+    #### Paradigma: AMARE (Masculino)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "amat**us ero**", "yo habré sido amado"],
+            ["2a Sg", "amat**us eris**", "tú habrás sido amado"],
+            ["3a Sg", "amat**us erit**", "él habrá sido amado"],
+            ["1a Pl", "amat**i erimus**", "nosotros habremos sido amados"],
+            ["2a Sg", "amat**i eritis**", "vosotros habréis sido amados"],
+            ["3a Pl", "amat**i erunt**", "ellos habrán sido amados"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplos**:
+    *   *Cum hoc factum **erit**, gaudebo.*
+        (Cuando esto **haya sido hecho**, me alegraré)
+    
+    ### 5. Participios Perfectos Pasivos Irregulares Importantes
+    
+    Muchos verbos tienen PPP irregular. Memoriza estos frecuentes:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "PPP", "Traducción"],
+        [
+            ["*Dico, dicere, dixi, **dictum***", "dict**us**", "dicho"],
+            ["*Scribo, scribere, scripsi, **scriptum***", "script**us**", "escrito"],
+            ["*Facio, facere, feci, **factum***", "fact**us**", "hecho"],
+            ["*Video, videre, vidi, **visum***", "vis**us**", "visto"],
+            ["*Mitto, mittere, misi, **missum***", "miss**us**", "enviado"],
+            ["*Pono, ponere, posui, **positum***", "posit**us**", "puesto"],
+            ["*Rego, regere, rexi, **rectum***", "rect**us**", "regido"],
+            ["*Duco, ducere, duxi, **ductum***", "duct**us**", "conducido"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 6. Resumen: Sistema Completo de Voz Pasiva
+    
+    """
+    )
+
+    render_styled_table(
+        ["Tiempo", "Sistema Infectum", "Sistema Perfectum"],
+        [
+            ["**Presente**", "am**or**", "—"],
+            ["**Imperfecto**", "ama**bar**", "—"],
+            ["**Futuro**", "ama**bor** / leg**ar**", "—"],
+            ["**Perfecto**", "—", "amat**us sum**"],
+            ["**Pluscuamperfecto**", "—", "amat**us eram**"],
+            ["**Futuro Perfecto**", "—", "amat**us ero**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 7. Usos del Participio Perfecto Pasivo
+    
+    El PPP no solo se usa en tiempos verbales, sino también como:
+    
+    1. **Adjetivo atributivo**:
+       *   *Liber **lectus*** (El libro leído)
+       *   *Urbs **capta*** (La ciudad capturada)
+    
+    2. **Ablativo Absoluto** (veremos en Lección 25):
+       *   ***His rebus cognitis***, Caesar consilium cepit.
+           (Conocidas estas cosas, César tomó una decisión)
+    
+    ### Vocabulario Esencial
+    Verbos con PPP irregular frecuente:
+    *   **Facio, facere, feci, factum**: hacer
+    *   **Dico, dicere, dixi, dictum**: decir
+    *   **Scribo, scribere, scripsi, scriptum**: escribir
+    *   **Mitto, mittere, misi, missum**: enviar
+    *   **Capio, capere, cepi, captum**: tomar
+    """
+    )
+    
+    # Infografía Cultural: Organización de las Legiones Romanas
+    if os.path.exists("static/images/curso_gramatica/leccion16_legion_estructura.png"):
+        st.image("static/images/curso_gramatica/leccion16_legion_estructura.png",
+                 caption="La Legión Romana: Organización Militar del Imperio",
+                 width="stretch")
+    
+    st.markdown("""
+    *   **Video, videre, vidi, visum**: ver
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop, render_sentence_analysis_widget
+    render_vocabulary_widget(lesson_number=16)
+    render_translation_workshop(lesson_number=16)
+    render_sentence_analysis_widget(lesson_number=16)
+    render_lesson_progress_summary(lesson_number=16)
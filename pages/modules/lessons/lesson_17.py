@@ -0,0 +1,290 @@
+"""Lección 17: Verbos Deponentes"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_17():
+    st.markdown("""
+    ## Lección 17: Verbos Deponentes y Semideponentes
+    """)
+    
+    if os.path.exists("static/images/curso_gramatica/leccion17_deponent_verbs.png"):
+        st.image("static/images/curso_gramatica/leccion17_deponent_verbs.png",
+                 caption="Verbos Deponentes: Forma Pasiva, Significado Activo",
+                 width="stretch")
+                 
+    st.markdown("""
+    
+    ### Una Particularidad del Latín
+    
+    Los **verbos deponentes** son una característica única del latín que a menudo confunde a los estudiantes,
+    pero una vez comprendidos, se vuelven fascinantes.
+    
+    ### 1. ¿Qué son los Verbos Deponentes?
+    
+    **Deponente** viene de *deponere* (deponer, dejar de lado). Estos verbos "depusieron" su forma activa
+    y solo se conjugan en **voz pasiva**, pero conservan **significado activo**.
+    
+    **Regla de oro**:
+    > Forma pasiva + Significado activo = Verbo Deponente
+    
+    **Ejemplos**:
+    *   *Sequor* (sigo) - Forma: sequor (soy seguido) - Significado: "yo sigo" (activo)
+    *   *Loquor* (hablo) - Forma: loquor (soy hablado) - Significado: "yo hablo" (activo)
+    
+    ### 2. Las Cuatro Conjugaciones de Deponentes
+    
+    Los deponentes se conjugan como verbos pasivos de su conjugación correspondiente.
+    
+    #### Primera Conjugación: HORTOR, HORTARI, HORTATUS SUM (exhortar, animar)
+    
+    **Enunciado**: *Hortor, hortari, hortatus sum*
+    - 1a forma: Presente Indicativo (1a persona singular)
+    - 2a forma: Infinitivo Presente
+    - 3a forma: Perfecto (PPP + sum)
+    
+    **Presente Indicativo**:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "hort**or**", "yo exhorto"],
+            ["2a Sg", "hort**āris** / hort**āre**", "tú exhortas"],
+            ["3a Sg", "hort**ātur**", "él/ella exhorta"],
+            ["1a Pl", "hort**āmur**", "nosotros exhortamos"],
+            ["2a Sg", "hort**āmini**", "vosotros exhortáis"],
+            ["3a Pl", "hort**antur**", "ellos/ellas exhortan"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Segunda Conjugación: VEREOR, VERERI, VERITUS SUM (temer, respetar)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Presente", "Imperfecto", "Futuro"],
+        [
+            ["1a Sg", "vere**or**", "verē**bar**", "verē**bor**"],
+            ["2a Sg", "verē**ris**", "verē**bāris**", "verē**beris**"],
+            ["3a Sg", "verē**tur**", "verē**bātur**", "verē**bitur**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Tercera Conjugación: SEQUOR, SEQUI, SECUTUS SUM (seguir)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Presente", "Imperfecto", "Futuro"],
+        [
+            ["1a Sg", "sequ**or**", "sequē**bar**", "sequ**ar**"],
+            ["2a Sg", "seque**ris**", "sequē**bāris**", "sequē**ris**"],
+            ["3a Sg", "sequi**tur**", "sequē**bātur**", "sequē**tur**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Cuarta Conjugación: LARGIOR, LARGIRI, LARGITUS SUM (regalar, conceder)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Presente", "Imperfecto", "Futuro"],
+        [
+            ["1a Sg", "largi**or**", "largiē**bar**", "largi**ar**"],
+            ["2a Sg", "largī**ris**", "largiē**bāris**", "largiē**ris**"],
+            ["3a Sg", "largī**tur**", "largiē**bātur**", "largiē**tur**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 3. Formación de Tiempos en Deponentes
+    
+    #### Sistema de Infectum (igual que pasiva regular):
+    - **Presente**: Terminaciones pasivas
+    - **Imperfecto**: -bar (pasivo)
+    - **Futuro**: -bor (1a/2a conj) o -ar (3a/4a conj)
+    
+    #### Sistema de Perfectum (PPP + sum, como pasiva):
+    - **Perfecto**: PPP + sum -> *secutus sum* (he seguido)
+    - **Pluscuamperfecto**: PPP + eram -> *secutus eram* (había seguido)
+    - **Futuro Perfecto**: PPP + ero -> *secutus ero* (habré seguido)
+    
+    ### 4. Deponentes Frecuentes e Importantes
+    
+    #### 1a Conjugación (-or, -ari, -atus sum):
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Significado"],
+        [
+            ["*hortor, hortari, hortatus sum*", "exhortar, animar"],
+            ["*moror, morari, moratus sum*", "demorar, tardar"],
+            ["*opinor, opinari, opinatus sum*", "opinar, creer"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### 2a Conjugación (-eor, -eri, -itus sum):
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Significado"],
+        [
+            ["*vereor, vereri, veritus sum*", "temer, respetar"],
+            ["*confiteor, confiteri, confessus sum*", "confesar"],
+            ["*misereor, misereri, miseritus sum*", "compadecerse"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### 3a Conjugación (-or, -i, -us sum):
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Significado"],
+        [
+            ["***sequor, sequi, secutus sum***", "seguir"],
+            ["***loquor, loqui, locutus sum***", "hablar"],
+            ["***patior, pati, passus sum***", "sufrir, permitir"],
+            ["***morior, mori, mortuus sum***", "morir"],
+            ["***nascor, nasci, natus sum***", "nacer"],
+            ["*utor, uti, usus sum*", "usar (+ ablativo)"],
+            ["*fruor, frui, fructus sum*", "disfrutar (+ ablativo)"],
+            ["*fungor, fungi, functus sum*", "desempeñar (+ ablativo)"],
+            ["*potior, potiri, potitus sum*", "apoderarse (+ ablativo/genitivo)"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### 4a Conjugación (-ior, -iri, -itus sum):
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Significado"],
+        [
+            ["*largior, largiri, largitus sum*", "regalar, conceder"],
+            ["*partior, partiri, partitus sum*", "partir, dividir"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 5. Formas Nominales de los Deponentes
+    
+    Los deponentes tienen formas especiales que son **activas en significado** pero **pasivas en forma**:
+    
+    #### Participios:
+    1. **Participio Presente**: Activo en forma y significado
+       - *sequens, -entis* (que sigue, siguiendo)
+       - *loquens, -entis* (que habla, hablando)
+    
+    2. **Participio Futuro**: Activo en significado
+       - *secuturus, -a, -um* (que va a seguir)
+    
+    3. **Participio Perfecto Pasivo**: ¡ACTIVO en significado!
+       - *secutus, -a, -um* (habiendo seguido) - NO "habiendo sido seguido"
+       - *locutus, -a, -um* (habiendo hablado)
+    
+    #### Gerundio y Gerundivo:
+    - **Gerundio**: *sequendi* (de seguir)
+    - **Gerundivo**: *sequendus* (que debe ser seguido) - Pasivo en significado
+    
+    ### 6. Verbos Semideponentes
+    
+    Los **semideponentes** tienen forma activa en el Sistema de Infectum, pero **pasiva en el Perfectum**.
+    
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Infectum (Activo)", "Perfectum (Deponente)", "Significado"],
+        [
+            ["*audeo, audere*", "aude**o**, audē**s**, aude**t**", "**ausus sum**", "atreverse"],
+            ["*gaudeo, gaudere*", "gaude**o**, audē**s**, gaude**t**", "**gavisus sum**", "alegrarse"],
+            ["*soleo, solere*", "sole**o**, solē**s**, sole**t**", "**solitus sum**", "soler, acostumbrar"],
+            ["*fido, fidere*", "fid**o**, fidī**s**, fidi**t**", "**físus sum**", "confiar"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Ejemplo**:
+    *   Presente: *Audeo dicere* (Me atrevo a decir)
+    *   Perfecto: *Ausus sum dicere* (Me atreví a decir) - Forma pasiva, significado activo
+    
+    ### 7. Construcciones Especiales con Deponentes
+    
+    Algunos deponentes rigen **ablativo** (y NO acusativo):
+    
+    *   ***Utor* armis** (Uso las armas) - NO *uto armas*
+    *   ***Fruor* vita** (Disfruto de la vida)
+    *   ***Fungor* officio** (Desempeño el deber)
+    *   ***Potior* urbe** (Me apodero de la ciudad)
+    
+    ### 8. Ejercicio de Traducción
+    
+    Traduce al español (fíjate en la forma pasiva pero significado activo):
+    
+    1. *Milites ducem **sequuntur**.* 
+       -> Los soldados **siguen** al jefe.
+    
+    2. *Cives de pace **loquebantur**.*
+       -> Los ciudadanos **hablaban** sobre la paz.
+    
+    3. *Multi in bello **passi sunt**.*
+       -> Muchos **sufrieron** en la guerra.
+    
+    4. *Philosophus sapienter **loquitur**.*
+       -> El filósofo **habla** sabiamente.
+    
+    5. *Populus libertate **utitur**.*
+       -> El pueblo **usa** la libertad.
+    
+    ### Vocabulario Esencial de Deponentes
+    *   **sequor, sequi, secutus sum**: seguir
+    *   **loquor, loqui, locutus sum**: hablar
+    *   **patior, pati, passus sum**: sufrir
+    *   **nascor, nasci, natus sum**: nacer
+    *   **proficiscor, proficisci, profectus sum**: partir
+    *   **utor, uti, usus sum**: usar (+ ablativo)
+    *   **audeo, audere, ausus sum**: atreverse
+    *   **gaudeo, gaudere, gavisus sum**: alegrarse
+    """
+    )
+    
+    # Infografía Cultural: Cursus Honorum - Magistraturas Romanas
+    if os.path.exists("static/images/curso_gramatica/leccion17_cursus_honorum.png"):
+        st.image("static/images/curso_gramatica/leccion17_cursus_honorum.png",
+                 caption="El Cursus Honorum: La Carrera Política en la República Romana",
+                 width="stretch")
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop, render_sentence_analysis_widget
+    render_vocabulary_widget(lesson_number=17)
+    render_translation_workshop(lesson_number=17)
+    render_sentence_analysis_widget(lesson_number=17)
+    render_lesson_progress_summary(lesson_number=17)
@@ -0,0 +1,312 @@
+"""Lección 18: Subjuntivo I"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_18():
+    st.image("static/images/lesson_18_subjunctive.png", caption="El Orador: Expresando deseos y posibilidades con el Subjuntivo", width="stretch")
+
+    st.markdown("""
+    ## Lección 18: Modo Subjuntivo - Presente e Imperfecto
+    
+    ### Introducción al Subjuntivo
+    
+    El **Modo Subjuntivo** expresa acciones **no reales, posibles, deseadas o dependientes**.
+    A diferencia del Indicativo (que expresa hechos), el Subjuntivo expresa:
+    - **Posibilidad**: "Tal vez venga"
+    - **Deseo**: "Ojalá vengas"
+    - **Irrealidad**: "Si vinieras..."
+    - **Dependencia**: "Quiero que vengas"
+    
+    """)
+
+    st.image("static/images/lesson_18_vowels.png", caption="Cambios Vocálicos en el Subjuntivo", width="stretch")
+
+    st.markdown("""
+    ### 1. Formación del Subjuntivo Presente
+
+    **Regla general**: Cambiar la vocal temática
+    
+    #### 1a Conjugación: A -> E
+    - Indicativo: am**a**-o, am**a**-s
+    - Subjuntivo: am**e**-m, am**e**-s
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Indicativo", "Subjuntivo", "Traducción"],
+        [
+            ["1a Sg", "am**o**", "am**em**", "(que) yo ame"],
+            ["2a Sg", "am**as**", "am**es**", "(que) tú ames"],
+            ["3a Sg", "am**at**", "am**et**", "(que) él/ella ame"],
+            ["1a Pl", "am**amus**", "am**emus**", "(que) nosotros amemos"],
+            ["2a Sg", "am**atis**", "am**etis**", "(que) vosotros améis"],
+            ["3a Pl", "am**ant**", "am**ent**", "(que) ellos/ellas amen"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### 2a Conjugación: E -> EA
+    - Indicativo: mon**e**-o, mon**e**-s
+    - Subjuntivo: mon**ea**-m, mon**ea**-s
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Indicativo", "Subjuntivo"],
+        [
+            ["1a Sg", "mone**o**", "mone**am**"],
+            ["2a Sg", "mone**s**", "mone**as**"],
+            ["3a Sg", "mone**t**", "mone**at**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### 3a Conjugación: Consonante/E -> A
+    - Indicativo: leg-**o**, leg-i**s**
+    - Subjuntivo: leg-**a**-m, leg-**a**-s
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Indicativo", "Subjuntivo"],
+        [
+            ["1a Sg", "leg**o**", "leg**am**"],
+            ["2a Sg", "leg**is**", "leg**as**"],
+            ["3a Sg", "leg**it**", "leg**at**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### 4a Conjugación: I -> IA
+    - Indicativo: aud**i**-o, aud**i**-s
+    - Subjuntivo: aud**ia**-m, aud**ia**-s
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Indicativo", "Subjuntivo"],
+        [
+            ["1a Sg", "audi**o**", "audi**am**"],
+            ["2a Sg", "audi**s**", "audi**as**"],
+            ["3a Sg", "audi**t**", "audi**at**"]
+        ]
+    )
+
+    st.markdown("### 🧠 Mnemotecnia: Vocales del Subjuntivo")
+    st.image("static/images/curso_gramatica/leccion18_subjuntivo_vocales_regla.png",
+             caption="Regla de Cambio Vocálico en el Subjuntivo",
+             width="stretch")
+
+    st.markdown("""
+    
+    ### 2. Sub juntivo de SUM
+    
+    **SUM** (ser/estar) tiene subjuntivo irregular:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Indicativo", "Subjuntivo Presente"],
+        [
+            ["1a Sg", "sum", "**sim**"],
+            ["2a Sg", "es", "**sis**"],
+            ["3a Sg", "est", "**sit**"],
+            ["1a Pl", "sumus", "**simus**"],
+            ["2a Sg", "estis", "**sitis**"],
+            ["3a Pl", "sunt", "**sint**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 3. Formación del Subjuntivo Imperfecto
+    
+    **Regla universal**: Infinitivo presente + terminaciones personales activas (-m, -s, -t, -mus, -tis, -nt)
+    
+    #### Las Cuatro Conjugaciones:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Conjugación", "Infinitivo", "1a Sg", "2a Sg", "3a Sg"],
+        [
+            ["**1a**", "am**āre**", "amāre**m**", "amāre**s**", "amāre**t**"],
+            ["**2a**", "mon**ēre**", "monēre**m**", "monēre**s**", "monēre**t**"],
+            ["**3a**", "leg**ĕre**", "legĕre**m**", "legĕre**s**", "legĕre**t**"],
+            ["**4a**", "aud**īre**", "audīre**m**", "audīre**s**", "audīre**t**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    **Paradigma completo de AMARE**:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Subjuntivo Imperfecto", "Traducción"],
+        [
+            ["1a Sg", "amāre**m**", "(si) yo amara/amase"],
+            ["2a Sg", "amāre**s**", "(si) tú amaras"],
+            ["3a Sg", "amāre**t**", "(si) él amara"],
+            ["1a Pl", "amārē**mus**", "(si) nosotros amáramos"],
+            ["2a Sg", "amārē**tis**", "(si) vosotros amarais"],
+            ["3a Pl", "amāre**nt**", "(si) ellos amaran"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 4. Subjuntivo Imperfecto de SUM
+    
+    Infinitivo *esse* + terminaciones:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Forma", "Traducción"],
+        [
+            ["1a Sg", "**essem**", "(si) yo fuera/fuese"],
+            ["2a Sg", "**esses**", "(si) tú fueras"],
+            ["3a Sg", "**esset**", "(si) él fuera"],
+            ["1a Pl", "**essemus**", "(si) nosotros fuéramos"],
+            ["2a Sg", "**essetis**", "(si) vosotros fuerais"],
+            ["3a Pl", "**essent**", "(si) ellos fueran"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 5. Usos del Subjuntivo Independiente
+    
+    El subjuntivo puede aparecer en **oraciones principales** (no subordinadas) con varios usos:
+    
+    #### A. Subjuntivo Optativo (Deseo)
+    Expresa un deseo. Normalmente con ***utinam*** (ojalá).
+    
+    *   ***Utinam venias!*** (¡Ojalá vengas!)
+    *   ***Utinam ne hoc faceret!*** (¡Ojalá no hiciera esto!)
+    *   ***Di te servent!*** (¡Que los dioses te guarden!)
+    
+    **Negación**: *ne*
+    """)
+
+    if os.path.exists("static/images/curso_gramatica/leccion18_subjuntivo_augur.png"):
+        st.image("static/images/curso_gramatica/leccion18_subjuntivo_augur.png",
+                 caption="El Augur: Interpretando la voluntad de los dioses (Subjuntivo Optativo)",
+                 width="stretch")
+
+    st.markdown("""
+    #### B. Subjuntivo Yusivo / Exhortativo
+    Expresa una **orden o exhortación** en 1a o 3a persona.
+    
+    *   ***Gaudeamus igitur!*** (¡Alegrémonos, pues!)
+    *   ***Veniat!*** (¡Que venga!)
+    *   ***Ne timeas!*** (¡No temas!)
+    
+    **Negación**: *ne*
+    
+    #### C. Subjuntivo Dubitativo (Deliberativo)
+    Expresa **duda** en forma interrogativa.
+    
+    *   ***Quid faciam?*** (¿Qué debo hacer? / ¿Qué haga?)
+    *   ***Quo eam?*** (¿A dónde voy? / ¿A dónde vaya?)
+    
+    """)
+
+    st.image("static/images/lesson_18_potential.png", caption="El Subjuntivo Potencial: Imaginando posibilidades", width="stretch")
+
+    st.markdown("""
+    #### D. Subjuntivo Potencial
+    Expresa **posibilidad** (normalmente con Presente de Subjuntivo).
+    
+    *   ***Hoc dicas.*** (Podrías decir esto / Dirías esto)
+    *   ***Credas te in caelo esse.*** (Creerías que estás en el cielo)
+    
+    ### 6. Tabla Comparativa de Usos
+    
+    """
+    )
+
+    render_styled_table(
+        ["Uso", "Tiempo", "Ejemplo", "Traducción"],
+        [
+            ["**Optativo**", "Presente", "*Utinam veniat*", "Ojalá venga"],
+            ["**Optativo**", "Imperfecto", "*Utinam venīret*", "Ojalá viniera"],
+            ["**Yusivo**", "Presente", "*Veniat!*", "¡Que venga!"],
+            ["**Exhortativo**", "Presente", "*Eamus!*", "¡Vayamos!"],
+            ["**Dubitativo**", "Presente/Imp", "*Quid faciam?*", "¿Qué debo hacer?"],
+            ["**Potencial**", "Presente", "*Dicas*", "Podrías decir"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 7. Ejercicios de Conjugación
+    
+    Conjuga en Subjuntivo Presente y luego en Imperfecto:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Presente (3a Sg)", "Imperfecto (3a Sg)"],
+        [
+            ["*amo*", "am**et**", "amāre**t**"],
+            ["*moneo*", "mone**at**", "monēre**t**"],
+            ["*lego*", "leg**at**", "legĕre**t**"],
+            ["*audio*", "audi**at**", "audīre**t**"],
+            ["*sum*", "**sit**", "**esset**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 8. Traducción de Expresiones
+    
+    1. *Utinam viveres!*
+       -> ¡Ojalá vivieras!
+    
+    2. *Gaudeamus omnes!*
+       -> ¡Alegrémonos todos!
+    
+    3. *Veniat Caesar.*
+       -> Que venga César.
+    
+    4. *Quid agam?*
+       -> ¿Qué debo hacer?
+    
+    5. *Ne timeas.*
+       -> No temas.
+    
+    ### Vocabulario Esencial
+    *   **utinam**: ojalá
+    *   **ne**: no (en subjuntivo)
+    *   **quid**: qué
+    *   **quo**: a dónde
+    *   **cur**: por qué
+    *   **ut**: que (afirmativo)
+    """)
+    
+    # Learning Hub Integration
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop, render_sentence_analysis_widget
+    render_vocabulary_widget(lesson_number=18)
+    render_translation_workshop(lesson_number=18)
+    render_sentence_analysis_widget(lesson_number=18)
+    render_lesson_progress_summary(lesson_number=18)
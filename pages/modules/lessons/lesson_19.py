@@ -0,0 +1,274 @@
+"""Lección 19: Subjuntivo II y Consecutio"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_19():
+    from utils.learning_hub_widgets import render_lesson_progress_summary, render_vocabulary_widget, render_translation_workshop, render_sentence_analysis_widget
+
+    st.markdown("""
+    ## Lección 19: Subjuntivo Perfecto/Pluscuamperfecto y Consecutio Temporum
+    
+    ### Completando el Sistema de Subjuntivo
+    
+    Ya conoces el Subjuntivo Presente e Imperfecto. Ahora aprenderemos los **dos tiempos del Perfectum**
+    y la regla fundamental que gobierna su uso: la **consecutio temporum** (concordancia de tiempos).
+    
+    ### 1. Subjuntivo Perfecto
+    
+    **Formación**: Tema de perfecto + **-eri-** + terminaciones activas
+    
+    #### Paradigma: AMARE (Tema perfecto: amav-)
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Subjuntivo Perfecto", "Traducción"],
+        [
+            ["1a Sg", "amav**erim**", "(que) yo haya amado"],
+            ["2a Sg", "amav**eris**", "(que) tú hayas amado"],
+            ["3a Sg", "amav**erit**", "(que) él haya amado"],
+            ["1a Pl", "amav**erimus**", "(que) nosotros hayamos amado"],
+            ["2a Pl", "amav**eritis**", "(que) vosotros hayáis amado"],
+            ["3a Pl", "amav**erint**", "(que) ellos hayan amado"]
+        ]
+    )
+
+    st.markdown("""
+    
+    > **Nota**: Es casi idéntico al Futuro Perfecto Indicativo, excepto en 1a Sg: 
+    > - Fut. Perfecto: amav**ero**
+    > - Subj. Perfecto: amav**erim**
+    
+    #### Otras Conjugaciones (3a persona singular):
+    
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Perfecto Ind", "Subj. Perfecto"],
+        [
+            ["*moneo*", "monu**it**", "monu**erit**"],
+            ["*lego*", "lēg**it**", "lēg**erit**"],
+            ["*audio*", "audīv**it**", "audīv**erit**"],
+            ["*sum*", "fu**it**", "fu**erit**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 2. Subjuntivo Pluscuamperfecto
+    
+    **Formación**: Infinitivo Perfecto Activo + terminaciones activas
+    
+    **Infinitivo Perfecto**: amav**isse**, monu**isse**, lēg**isse**, audīv**isse**
+    
+    #### Paradigma: AMARE
+    
+    """
+    )
+
+    render_styled_table(
+        ["Persona", "Subjuntivo Pluscuamperfecto", "Traducción"],
+        [
+            ["1a Sg", "amavisse**m**", "(si) yo hubiera/hubiese amado"],
+            ["2a Sg", "amavisse**s**", "(si) tú hubieras amado"],
+            ["3a Sg", "amavisse**t**", "(si) él hubiera amado"],
+            ["1a Pl", "amavisē**mus**", "(si) nosotros hubiéramos amado"],
+            ["2a Sg", "amavisē**tis**", "(si) vosotros hubierais amado"],
+            ["3a Pl", "amavisse**nt**", "(si) ellos hubieran amado"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### Otras Conjugaciones (3a Sg):
+    
+    """
+    )
+
+    render_styled_table(
+        ["Verbo", "Inf. Perfecto", "Subj. Pluscuamperfecto"],
+        [
+            ["*moneo*", "monu**isse**", "monuisse**t**"],
+            ["*lego*", "lēg**isse**", "lēgisse**t**"],
+            ["*sum*", "fu**isse**", "fuisse**t**"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 3. Resumen: Los Cuatro Tiempos del Subjuntivo
+    
+    """
+    )
+
+    render_styled_table(
+        ["Tiempo", "Formación", "Ejemplo (1a Sg)", "Traducción"],
+        [
+            ["**Presente**", "Vocal temática cambiada", "am**em**", "(que) yo ame"],
+            ["**Imperfecto**", "Infinitivo presente + -m", "amāre**m**", "(si) yo amara"],
+            ["**Perfecto**", "Tema perfecto + -erim", "amav**erim**", "(que) yo haya amado"],
+            ["**Pluscuamperfecto**", "Inf. perfecto + -m", "amavisse**m**", "(si) yo hubiera amado"]
+        ]
+    )
+
+    st.markdown("""
+    
+    """)
+
+    st.image("static/images/lesson_19_timeline.png", caption="Línea Temporal: La relación entre tiempos verbales", width="stretch")
+
+    st.markdown("""
+    ### 4. Consecutio Temporum (Concordancia de Tiempos)
+
+    Esta es **LA REGLA MÁS IMPORTANTE** del subjuntivo en oraciones subordinadas.
+    
+    **Principio**: El tiempo del subjuntivo en la subordinada depende de:
+    1. El tiempo del verbo principal
+    2. La relación temporal (simultaneidad, anterioridad, posterioridad)
+    
+    #### Regla Simplificada:
+    
+    **A. Oración Principal en Tiempo Primario** (Presente, Fut., Fut. Perf., Imperativo):
+    - **Simultaneidad/Posterioridad**: Subjuntivo **Presente**
+    - **Anterioridad**: Subjuntivo **Perfecto**
+    
+    **B. Oración Principal en Tiempo Histórico** (Imperfecto, Perfecto, Pluscuamperfecto):
+    - **Simultaneidad/Posterioridad**: Subjuntivo **Imperfecto**
+    - **Anterioridad**: Subjuntivo **Pluscuamperfecto**
+    
+    #### Tabla Completa de Consecutio Temporum:
+    
+    """
+    )
+
+    render_styled_table(
+        ["Principal", "Relación", "Subordinada", "Ejemplo"],
+        [
+            ["**Presente**", "Simult.", "Pres. Subj.", "*Timeo **ut veniat*** (Temo que venga)"],
+            ["**Presente**", "Ant.", "Perf. Subj.", "*Timeo **ut venerit*** (Temo que haya venido)"],
+            ["**Imperfecto**", "Simult.", "Imp. Subj.", "*Timebam **ut venīret*** (Temía que viniera)"],
+            ["**Imperfecto**", "Ant.", "Plusc. Subj.", "*Timebam **ut venisset*** (Temía que hubiera venido)"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 5. Ejemplos Detallados de Consecutio Temporum
+    
+    #### Ejemplo 1: Subordinada Completiva con UT
+    
+    **Principal Primaria**:
+    *   *Rogo **ut venias**.* (Te pido que vengas) - Simultaneidad -> Pres. Subj.
+    *   *Rogo **ut veneris**.* (Te pido que hayas venido) - Anterioridad -> Perf. Subj.
+    
+    **Principal Histórica**:
+    *   *Rogavi **ut venīres**.* (Te pedí que vinieras) - Simultaneidad -> Imp. Subj.
+    *   *Rogavi **ut venisses**.* (Te pedí que hubieras venido) - Anterioridad -> Plusc. Subj.
+    
+    #### Ejemplo 2: Subordinada Final
+    
+    **Principal Primaria**:
+    *   *Venio **ut te videam**.* (Vengo para verte) - Presente Subj.
+    
+    **Principal Histórica**:
+    *   *Veni **ut te viderem**.* (Vine para verte) - Imperfecto Subj.
+    
+    #### Ejemplo 3: Subordinada Consecutiva
+    
+    **Principal Primaria**:
+    *   *Tam fortis est **ut vincere possit**.* (Es tan fuerte que puede vencer) - Pres. Subj.
+    
+    **Principal Histórica**:
+    *   *Tam fortis erat **ut vincere posset**.* (Era tan fuerte que podía vencer) - Imp. Subj.
+    
+    ### 6. Excepciones y Casos Especiales
+    
+    #### A. Perfecto con valor de Presente
+    Cuando el Perfecto tiene valor de presente (perfecto resultativo), usa tiempos primarios:
+    
+    *   *Audivi **quid dicas**.* (He oído lo que dices) - Pres. Subj.
+    
+    #### B. Imperfecto/Pluscuamperfecto de Indicativo
+    Siempre usan tiempos históricos del subjuntivo:
+    
+    *   *Nesciebam **quid faceret**.* (No sabía qué hacía)
+    
+    #### C. Condicionales Irreales
+    En condicionales irreales, se rompe la consecutio normal:
+    
+    *   *Si hoc **faceres**, felix **esses**.* (Si hicieras esto, serías feliz)
+       - Ambas: Imperfecto Subjuntivo (irrealidad presente)
+    
+    """)
+
+    st.image("static/images/lesson_19_structure.png", caption="Estructura de la Consecutio Temporum", width="stretch")
+
+    st.markdown("""
+    """)
+
+    if os.path.exists("static/images/curso_gramatica/leccion19_consecutio_temporum_diagram.png"):
+        st.image("static/images/curso_gramatica/leccion19_consecutio_temporum_diagram.png",
+                 caption="Tabla Maestra de Consecutio Temporum",
+                 width="stretch")
+    elif os.path.exists("static/images/curso_gramatica/leccion19_consecutio_temporum.png"):
+        st.image("static/images/curso_gramatica/leccion19_consecutio_temporum.png",
+                 caption="Esquema de la Consecutio Temporum",
+                 width="stretch")
+
+    st.markdown("""
+    ### 8. Ejercicios de Aplicación
+    
+    Completa con el tiempo correcto del subjuntivo:
+    
+    1. *Rogo ut ______ (venire).*
+       -> **venias** (Principal presente -> Pres. Subj.)
+    
+    2. *Rogavi ut ______ (venire).*
+       -> **venīres** (Principal perfecto -> Imp. Subj.)
+    
+    3. *Timeo ne hoc ______ (facere) iam.*
+       -> **fecerit** (Anterioridad + Principal pres. -> Perf. Subj.)
+    
+    4. *Si hoc ______ (facere), felix ______ (esse).*
+       -> **faceres**, **esses** (Condicional irreal presente)
+    
+    5. *Tam sapienter loquitur ut omnes eum ______ (audire).*
+       -> **audiant** (Consecutiva + Principal pres. -> Pres. Subj.)
+    
+    ### 9. Resumen Final: Dominio del Subjuntivo
+    
+    ¡Felicidades! Ahora dominas:
+    
+    ✓ **4 tiempos** del Subjuntivo (Pres, Imp, Perf, Plusc)
+    ✓ **Usos independientes** (Optativo, Yusivo, Dubitativo, Potencial)
+    ✓ **Consecutio Temporum** (la regla de oro de las subordinadas)
+    ✓ **Verbos irregulares** en subjuntivo (sum, possum)
+    
+    Estás listo para enfrentar cualquier texto latino con subjuntivo.
+    
+    ### Vocabulario Esencial
+    *   **ut**: que, para que (+ subjuntivo)
+    *   **ne**: que no, para que no
+    *   **cum**: cuando, como quiera que
+    *   **si**: si
+    *   **nisi**: si no, a menos que
+    *   **quamvis**: aunque (+ subjuntivo)
+    """)
+    
+    # Infografía Cultural: El Senado Romano
+    if os.path.exists("static/images/curso_gramatica/leccion19_senado_discurso.png"):
+        st.image("static/images/curso_gramatica/leccion19_senado_discurso.png",
+                 caption="El Senado Romano: Oratoria y Debate Político",
+                 width="stretch")
+    
+    render_vocabulary_widget(lesson_number=19)
+    render_translation_workshop(lesson_number=19)
+    render_sentence_analysis_widget(lesson_number=19)
+    render_lesson_progress_summary(lesson_number=19)
@@ -0,0 +1,233 @@
+"""Lección 20: Infinitivos y AcI"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+
+
+def render_lesson_20():
+    from utils.learning_hub_widgets import (
+        render_lesson_progress_summary, 
+        render_vocabulary_widget, 
+        render_translation_workshop, 
+        render_sentence_analysis_widget,
+        render_vocabulary_match_exercise,
+        render_multiple_choice_exercise,
+        render_sentence_completion_exercise
+    )
+
+    st.markdown("""
+    ## Lección 20: Infinitivos y Oraciones de Infinitivo (AcI)
+    
+    ### 1. El Infinitivo: Sustantivo Verbal
+    
+    El **infinitivo** es una forma nominal del verbo. Funciona como un sustantivo neutro.
+    En español tenemos formas simples (amar, haber amado). En latín, el sistema es más rico y preciso.
+    
+    ### 2. Morfología de los Infinitivos
+    """)
+
+    if os.path.exists("static/images/curso_gramatica/leccion20_infinitivos.png"):
+        st.image("static/images/curso_gramatica/leccion20_infinitivos.png",
+                 caption="Tabla de Infinitivos Latinos",
+                 width="stretch")
+
+    st.markdown("""
+    El latín tiene infinitivos para **tres tiempos** (Presente, Perfecto, Futuro) y **dos voces** (Activa, Pasiva).
+    
+    #### A. Infinitivo Presente (Simultaneidad)
+    """)
+    
+    render_styled_table(
+        ["Conjugación", "Activa", "Pasiva", "Traducción (Act/Pas)"],
+        [
+            ["**1a (amare)**", "amā**re**", "amā**ri**", "amar / ser amado"],
+            ["**2a (monere)**", "monē**re**", "monē**ri**", "aconsejar / ser aconsejado"],
+            ["**3a (legere)**", "leg**ĕre**", "leg**i**", "leer / ser leído"],
+            ["**4a (audire)**", "audī**re**", "audī**ri**", "oír / ser oído"],
+            ["**Mixta (capere)**", "cap**ĕre**", "cap**i**", "tomar / ser tomado"]
+        ]
+    )
+
+    st.markdown("""
+    
+    > **¡Ojo a la 3a conjugación pasiva!** Termina en **-i** (no -eri). *Legi*, *duci*, *mitti*.
+    
+    #### B. Infinitivo Perfecto (Anterioridad)
+    """)
+    
+    render_styled_table(
+        ["Voz", "Formación", "Ejemplo", "Traducción"],
+        [
+            ["**Activa**", "Tema Perf. + **-isse**", "*amavisse*", "haber amado"],
+            ["**Pasiva**", "PPP (Acusativo) + **esse**", "*amatum, -am, -um esse*", "haber sido amado"]
+        ]
+    )
+
+    st.markdown("""
+    
+    #### C. Infinitivo Futuro (Posterioridad)
+    """)
+    
+    render_styled_table(
+        ["Voz", "Formación", "Ejemplo", "Traducción"],
+        [
+            ["**Activa**", "PFA (Acusativo) + **esse**", "*amaturum, -am, -um esse*", "haber de amar / que amará"],
+            ["**Pasiva**", "Supino + **iri**", "*amatum iri*", "(raro) que será amado"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 3. La Construcción de Acusativo con Infinitivo (AcI)
+    
+    Esta es una de las estructuras más características del latín. Se usa tras verbos de **lengua, entendimiento y sentido** (*verba dicendi, sentiendi et affectuum*).
+    
+    En español usamos una subordinada con "que" + verbo personal:
+    *   "Dico **que tú vienes**."
+    
+    En latín, el sujeto de la subordinada va en **ACUSATIVO** y el verbo en **INFINITIVO**:
+    *   *Dico **te venire**.* (Literalmente: "Digo te venir")
+    
+    #### Reglas de la AcI:
+    1.  El **Sujeto** de la subordinada se pone en **Acusativo**.
+    2.  El **Verbo** de la subordinada se pone en **Infinitivo**.
+    3.  Si hay **Atributo** o predicativo, también va en **Acusativo** (concordando con el sujeto).
+    
+    #### Ejemplos:
+    """)
+    
+    render_styled_table(
+        ["Latín (AcI)", "Traducción Literal", "Traducción Correcta"],
+        [
+            ["*Video **puerum currere**.*", "Veo al niño correr", "Veo **que el niño corre**."],
+            ["*Scio **terram rotundam esse**.*", "Sé la tierra redonda ser", "Sé **que la tierra es redonda**."],
+            ["*Credo **Deum bonum esse**.*", "Creo a Dios bueno ser", "Creo **que Dios es bueno**."],
+            ["*Dicit **se Romanum esse**.*", "Dice se romano ser", "Dice **que él (mismo) es romano**."]
+        ]
+    )
+
+    st.markdown("""
+    
+    > **Nota sobre el reflexivo 'se'**: Si el sujeto de la subordinada es el mismo que el de la principal, se usa el acusativo **se**.
+    > *   *Caesar dicit **se** vincere.* (César dice que él [César] vence)
+    > *   *Caesar dicit **eum** vincere.* (César dice que él [otro] vence)
+    
+    ### 4. Concordancia de Tiempos en AcI
+    
+    El tiempo del infinitivo es **relativo** al verbo principal:
+    
+    *   **Inf. Presente** = Acción simultánea (al mismo tiempo que el verbo principal).
+    *   **Inf. Perfecto** = Acción anterior (antes del verbo principal).
+    *   **Inf. Futuro** = Acción posterior (después del verbo principal).
+    
+    #### Tabla de Relatividad Temporal:
+    """)
+    
+    render_styled_table(
+        ["Verbo Principal", "Infinitivo", "Traducción", "Relación"],
+        [
+            ["*Dico* (Digo)", "*te **venire***", "...que vienes", "Simultaneidad (Presente)"],
+            ["*Dico* (Digo)", "*te **venisse***", "...que viniste / has venido", "Anterioridad (Pasado)"],
+            ["*Dico* (Digo)", "*te **venturum esse***", "...que vendrás", "Posterioridad (Futuro)"],
+            ["", "", "", ""],
+            ["*Dixi* (Dije)", "*te **venire***", "...que venías", "Simultaneidad (Pasado)"],
+            ["*Dixi* (Dije)", "*te **venisse***", "...que habías venido", "Anterioridad (Pluscuamperfecto)"],
+            ["*Dixi* (Dije)", "*te **venturum esse***", "...que vendrías", "Posterioridad (Condicional)"]
+        ]
+    )
+
+    st.markdown("""
+    
+    ### 5. Ejercicios de Análisis
+    
+    Analiza y traduce:
+    
+    1.  *Thales dixit aquam initium omnium rerum esse.*
+        *   **Thales dixit**: Tales dijo (Verbo principal)
+        *   **aquam** (Ac, Suj): que el agua
+        *   **initium** (Ac, Atrib): el principio
+        *   **omnium rerum** (Gen Pl): de todas las cosas
+        *   **esse** (Inf Pres): era (simultaneidad con 'dijo')
+        *   -> **Tales dijo que el agua era el principio de todas las cosas.**
+    
+    2.  *Sentio vos laetos esse.*
+        *   -> Siento que vosotros estáis contentos.
+    
+    3.  *Credimus Romam aeternam fore (= futuram esse).*
+        *   -> Creemos que Roma será eterna.
+    
+    ### Vocabulario Esencial
+    *   **Dico, dicere, dixi, dictum**: decir
+    *   **Scio, scire, scivi, scitum**: saber
+    *   **Credo, credere, credidi, creditum**: creer
+    *   **Puto, putare**: pensar
+    *   **Video, videre, vidi, visum**: ver
+    *   **Audio, audire**: oír
+    *   **Sentio, sentire**: sentir, darse cuenta
+    *   **Spero, sperare**: esperar (que algo suceda)
+    *   **Nego, negare**: negar (decir que no)
+    """)
+    
+    # Infografía Cultural: Filosofía Romana
+    if os.path.exists("static/images/curso_gramatica/leccion20_filosofia_romana.png"):
+        st.image("static/images/curso_gramatica/leccion20_filosofia_romana.png",
+                 caption="Escuelas Filosóficas Romanas: Estoicismo, Epicureísmo y Eclecticismo",
+                 width="stretch")
+    
+    # Infografía Cultural: Teatro Romano
+    st.markdown("### 🎭 Cultura Romana: El Teatro")
+    st.info("Los géneros teatrales romanos se expresaban con infinitivos y oraciones de AcI en las obras.")
+    if os.path.exists("static/images/curso_gramatica/cultura_teatro_romano.png"):
+        st.image("static/images/curso_gramatica/cultura_teatro_romano.png",
+                 caption="El Teatro Romano: Tragoedia, Comoedia, géneros y dramaturgos",
+                 width="stretch")
+
+    # --- EJERCICIOS ESTÁTICOS CURADOS ---
+    st.divider()
+    from utils.static_exercise_loader import get_all_exercise_types
+    static_ex = get_all_exercise_types(20)
+    
+    if static_ex and any(static_ex.values()):
+        st.markdown("### 📝 Ejercicios de la Lección")
+        st.caption("Ejercicios curados específicos para el contenido de esta lección.")
+        
+        from utils.learning_hub_widgets import (
+            render_vocabulary_match_exercise,
+            render_multiple_choice_exercise,
+            render_sentence_completion_exercise
+        )
+        
+        # Opción múltiple
+        if static_ex.get("multiple_choice"):
+            with st.expander("📋 Opción Múltiple", expanded=True):
+                render_multiple_choice_exercise(static_ex["multiple_choice"], 20)
+        
+        # Completar oraciones
+        if static_ex.get("sentence_completion"):
+            with st.expander("✏️ Completar Oraciones", expanded=False):
+                render_sentence_completion_exercise(static_ex["sentence_completion"], 20)
+        
+        # Emparejamiento de vocabulario
+        if static_ex.get("vocabulary_match"):
+            with st.expander("🔗 Emparejamiento de Vocabulario", expanded=False):
+                for vm_idx, vm_ex in enumerate(static_ex["vocabulary_match"]):
+                    if "pairs" in vm_ex:
+                        render_vocabulary_match_exercise(vm_ex["pairs"], 20, exercise_index=vm_idx, key_suffix="static")
+
+        # Opción Múltiple
+        if static_ex.get("multiple_choice"):
+            with st.expander("🧠 Selección Múltiple", expanded=False):
+                render_multiple_choice_exercise(static_ex["multiple_choice"], 20, key_suffix="static")
+
+        # Completar Frases
+        if static_ex.get("sentence_completion"):
+             with st.expander("✍️ Completar Frases", expanded=False):
+                render_sentence_completion_exercise(static_ex["sentence_completion"], 20, key_suffix="static")
+
+    render_vocabulary_widget(lesson_number=20)
+    render_translation_workshop(lesson_number=20)
+    render_sentence_analysis_widget(lesson_number=20)
+    render_lesson_progress_summary(lesson_number=20)
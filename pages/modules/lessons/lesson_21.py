@@ -0,0 +1,143 @@
+"""Lección 21: Participios"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_21():
+    def theory_content():
+        st.markdown("""
+        ## Leccion 21: Los Participios
+        
+        ### 1. ¿Que es un Participio?
+        
+        El participio es un **adjetivo verbal**: una forma hibrida que combina caracteristicas de verbo y adjetivo.
+        *   Como **adjetivo**: concuerda en Genero, Numero y Caso con un sustantivo.
+        *   Como **verbo**: tiene Tiempo y Voz, y puede regir complementos (OD, circunstanciales, etc.).
+        
+        > En espanol tenemos "amado" (pasivo) y "amante" (activo), pero el latin tiene un sistema mucho mas completo.
+        
+        ### 2. El Sistema de Participios Latino
+        
+        El latin tiene **TRES participios** que cubren todas las combinaciones de tiempo y voz:
+        
+        """)
+        
+        render_styled_table(
+            ["Participio", "Tiempo", "Voz", "Formacion", "Ejemplo (AMARE)"],
+            [
+                ["**Presente**", "Presente", "Activa", "Tema + **-ns, -ntis**", "*ama-**ns**, ama-**ntis***"],
+                ["**Perfecto**", "Pasado", "Pasiva", "Tema Supino + **-us, -a, -um**", "*ama-**tus, -a, -um***"],
+                ["**Futuro**", "Futuro", "Activa", "Tema Supino + **-urus, -a, -um**", "*ama-**turus, -a, -um***"]
+            ]
+        )
+        
+        st.markdown("""
+        
+        ### 3. Participio Presente Activo (-ns, -ntis)
+        
+        Indica una accion **simultanea** con la accion principal.
+        Se declina como adjetivo de 3a declinacion (una terminacion).
+        
+        **Formacion**:
+        *   1a/2a Conjugacion: Tema + **-ns** -> *amans, monens*
+        *   3a Conjugacion: Tema + **-ens** -> *legens*
+        *   4a Conjugacion: Tema + **-iens** -> *audiens*
+        
+        **Declinacion** (Modelo: *amans, amantis* - que ama / amante):
+        
+        """)
+        
+        render_styled_table(
+            ["Caso", "Masc/Fem Sg", "Neutro Sg", "Masc/Fem Pl", "N Pl"],
+            [
+                ["**Nom**", "ama**ns**", "ama**ns**", "ama**ntes**", "ama**ntia**"],
+                ["**Ac**", "ama**ntem**", "ama**ns**", "ama**ntes**", "ama**ntia**"],
+                ["**Gen**", "ama**ntis**", "ama**ntis**", "ama**ntium**", "ama**ntium**"],
+                ["**Dat**", "ama**nti**", "ama**nti**", "ama**ntibus**", "ama**ntibus**"],
+                ["**Abl**", "ama**nte/-i**", "ama**nte/-i**", "ama**ntibus**", "ama**ntibus**"]
+            ]
+        )
+        
+        st.markdown("""
+        
+        **Ejemplos**:
+        *   *Puer **currens** cadit.* (El nino, **corriendo**, cae / El nino **que corre** cae).
+        *   *Milites **pugnantes** vicerunt.* (Los soldados **que luchaban** vencieron).
+        *   *Video puellam **canentem**.* (Veo a la nina **que canta**).
+        
+        ### 4. Participio Perfecto Pasivo (-tus, -a, -um)
+        
+        Indica una accion **anterior** a la accion principal, con sentido **pasivo**.
+        Se declina como adjetivo de 1a Clase (2-1-2: *bonus, -a, -um*).
+        
+        **Formacion**: Se forma del **tema de supino** (4a forma del enunciado):
+        *   *Amare, amavi, **amatum*** -> *ama**tus**, -a, -um* (amado/a)
+        *   *Legere, legi, **lectum*** -> *lec**tus**, -a, -um* (leido/a)
+        *   *Capere, cepi, **captum*** -> *cap**tus**, -a, -um* (capturado/a)
+        
+        **Ejemplos**:
+        *   *Urbs, ab hostibus **capta**, incensa est.*
+            *   La ciudad, **capturada** por los enemigos, fue incendiada.
+            *   (Primero fue capturada, luego incendiada)
+        *   *Poeta, a rege **laudatus**, felix erat.*
+            *   El poeta, **alabado** por el rey, era feliz.
+        *   *Liber **lectus** bonus est.*
+            *   El libro **leido** es bueno.
+        
+        ### 5. Participio Futuro Activo (-urus, -a, -um)
+        
+        Indica **intencion** o **accion futura** respecto a la principal.
+        Se declina como adjetivo de 1a Clase.
+        
+        **Formacion**: Tema de supino + **-urus, -a, -um**:
+        *   *Amare* -> *ama**turus**, -a, -um* (que va a amar / a punto de amar)
+        *   *Legere* -> *lec**turus**, -a, -um* (que va a leer)
+        *   *Mori* -> *mori**turus**, -a, -um* (que va a morir)
+        
+        **Ejemplos**:
+        *   ***Ave, Caesar, morituri te salutant.***
+            *   Salve, Cesar, **los que van a morir** te saludan.
+            *   (Frase famosa de los gladiadores)
+        *   *Nuntii **venturi** sunt.*
+            *   Los mensajeros **estan a punto de llegar**.
+        
+        ### 6. Traduccion de Participios al Espanol
+        
+        Los participios latinos se pueden traducir de varias formas:
+        
+        1.  **Como participio** (cuando existe): "amado", "corriendo"
+        2.  **Como oracion de relativo**: "que ama", "que fue amado"
+        3.  **Como oracion adverbial**:
+            *   Temporal: "cuando ama", "despues de ser amado"
+            *   Causal: "porque ama", "como fue amado"
+            *   Concesiva: "aunque ama"
+        
+        **Ejemplo de multiples traducciones**:
+        *Consul, **urbem videns**, laetus erat.*
+        
+        *   El consul, **viendo la ciudad**, estaba contento. (Gerundio)
+        *   El consul, **que veia la ciudad**, estaba contento. (Relativo)
+        *   El consul, **cuando vio la ciudad**, estaba contento. (Temporal)
+        *   El consul, **porque veia la ciudad**, estaba contento. (Causal)
+        
+        ### Vocabulario Esencial
+        *   **Curro, currere**: correr
+        *   **Pugno, pugnare**: luchar
+        *   **Cano, canere**: cantar
+        *   **Incendo, incendere**: incendiar, quemar
+        *   **Laudo, laudare**: alabar
+        *   **Saluto, salutare**: saludar
+        
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion21_participios.png"):
+            st.image("static/images/curso_gramatica/leccion21_participios.png",
+                     caption="Sistema de Participios Latinos: Presente, Perfecto y Futuro",
+                     width="stretch")
+    
+    render_lesson_with_tabs(21, theory_content)
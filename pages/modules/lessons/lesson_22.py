@@ -0,0 +1,166 @@
+"""Lección 22: Ablativo Absoluto"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_22():
+    def theory_content():
+        st.markdown("""
+        ## Leccion 22: El Ablativo Absoluto
+        
+        ### 1. La Construccion Reina del Latin
+        
+        El **Ablativo Absoluto** es una construccion sintactica fundamental y muy frecuente en latin clasico.
+        Equivale a una **oracion subordinada circunstancial** (temporal, causal, concesiva, condicional).
+        
+        Se llama "absoluto" (*absolutus* = desatado, suelto) porque gramaticalmente esta **desligado** de la oracion principal:
+        *   Su sujeto NO es el sujeto de la principal.
+        *   Su sujeto NO es el objeto de la principal.
+        *   Funciona como un complemento circunstancial independiente.
+        
+        ### 2. Estructura Basica
+        
+        Se compone de **DOS elementos en caso ABLATIVO**:
+        
+        1.  **Sujeto** (Sustantivo o Pronombre en Ablativo)
+        2.  **Predicado** (Participio, Adjetivo o Sustantivo en Ablativo)
+        
+        **Formula**: **[Sust. Ablativo] + [Participio/Adj/Sust Ablativo]**
+        
+        ### 3. Tipos de Ablativo Absoluto
+        
+        """)
+        
+        render_styled_table(
+            ["Tipo", "Estructura", "Significado", "Ejemplo"],
+            [
+                ["**Con Part. Presente**", "Abl + Part. Pres", "Simultaneidad", "*Sole **oriente*** (Saliendo el sol)"],
+                ["**Con Part. Perfecto**", "Abl + Part. Perf", "Anterioridad", "*Urbe **capta*** (Capturada la ciudad)"],
+                ["**Nominal**", "Abl + Sust/Adj", "Estado/Circunstancia", "*Me **consule*** (Siendo yo consul)"]
+            ]
+        )
+        
+        st.markdown("""
+        
+        ### 4. Ablativo Absoluto con Participio Presente
+        
+        Expresa una **accion simultanea** a la principal.
+        
+        **Ejemplos**:
+        *   *Sole **oriente**, aves canunt.*
+            *   **Saliendo el sol** / **Al salir el sol**, las aves cantan.
+            *   (= Cuando sale el sol)
+        
+        *   *Caesare **duce**, Romani vincebant.*
+            *   **Siendo Cesar el jefe** / **Bajo el mando de Cesar**, los romanos vencian.
+        
+        *   *Me **tacente**, tu loquebaris.*
+            * **Callando yo** / **Mientras yo callaba**, tu hablabas.
+        
+        ### 5. Ablativo Absoluto con Participio Perfecto
+        
+        Expresa una **accion anterior** a la principal (la mas comun).
+        
+        **Ejemplos**:
+        *   *Urbe **capta**, hostes redierunt.*
+            *   **Capturada la ciudad** / **Despues de capturar la ciudad**, los enemigos regresaron.
+            *   (Primero capturaron, luego regresaron)
+        
+        *   *His rebus **cognitis**, Caesar exercitum movit.*
+            *   **Conocidas estas cosas** / **Cuando supo esto**, Cesar movio el ejercito.
+        
+        *   *Romulo **regnante**, urbs condita est.*
+            *   **Reinando Romulo** / **En el reinado de Romulo**, la ciudad fue fundada.
+        
+        ### 6. Ablativo Absoluto Nominal (sin Participio)
+        
+        Cuando NO hay participio, se sobreentiende el verbo **SUM** ("ser/estar").
+        
+        **Estructura**: Sustantivo/Pronombre + Sustantivo/Adjetivo (ambos en Ablativo)
+        
+        **Ejemplos**:
+        *   *Me **consule**, pax erat.*
+            *   **Siendo yo consul** / **Durante mi consulado**, habia paz.
+            *   (= Cum ego consul essem)
+        
+        *   *Cicerone **oratore**, Romani eloquentes erant.*
+            *   **Siendo Ciceron orador** / **Con Ciceron como orador**, los romanos eran elocuentes.
+        
+        *   ***Vivo** patre, felix sum.*
+            *   **Viviendo el padre** / **Estando vivo el padre**, soy feliz.
+        
+        ### 7. Como Traducir el Ablativo Absoluto
+        
+        El Ablativo Absoluto puede tener diversos matices y traducirse de varias formas:
+        
+        """)
+        
+        render_styled_table(
+            ["Matiz", "Conjuncion Espanola", "Ejemplo Traduccion"],
+            [
+                ["**Temporal**", "Cuando, Al, Mientras", "**Cuando** el sol salia..."],
+                ["**Causal**", "Como, Porque, Ya que", "**Como** la ciudad fue capturada..."],
+                ["**Concesivo**", "Aunque", "**Aunque** el padre vivia..."],
+                ["**Condicional**", "Si", "**Si** el consul hubiera muerto..."]
+            ]
+        )
+        
+        st.markdown("""
+        
+        ### 8. Diferencia con el Participio Concertado
+        
+        Es crucial NO confundir:
+        
+        **Participio Concertado**: El participio concuerda con un elemento de la oracion principal (Sujeto, OD, etc.)
+        *   *Consul, **urbem videns**, laetus erat.*
+        *   El consul, **viendo la ciudad**, estaba contento.
+        *   (*videns* concuerda con *consul*, que es el sujeto)
+        
+        **Ablativo Absoluto**: El participio esta en Ablativo con su propio sujeto, separado de la principal.
+        *   ***Sole oriente**, consul laetus erat.*
+        *   **Al salir el sol**, el consul estaba contento.
+        *   (*oriente* esta con *sole*, en Ablativo, independiente de *consul*)
+        
+        ### 9. Ejercicios de Analisis
+        
+        Identifica y traduce:
+        
+        1.  *Romanis **pugnan tibus**, hostes fugerunt.*
+            *   Ablativo Absoluto con Participio Presente.
+            *   **Luchando los romanos** / **Mientras los romanos luchaban**, los enemigos huyeron.
+        
+        2.  *Caesare **mortuo**, Marcus consul factus est.*
+            *   Ablativo Absoluto con Participio Perfecto.
+            *   **Muerto Cesar** / **Despues de morir Cesar**, Marco fue hecho consul.
+        
+        3.  *Te **duce**, vincere possumus.*
+            *   Ablativo Absoluto Nominal (sin participio, se sobreentiende *sum*).
+            *   **Siendo tu el jefe** / **Contigo como jefe**, podemos vencer.
+        
+        4.  *Omnibus **audientibus**, orator dixit.*
+            *   Ablativo Absoluto con Participio Presente.
+            *   **Escuchando todos** / **Mientras todos escuchaban**, el orador hablo.
+        
+        ### Vocabulario Esencial
+        *   **Orior, oriri, ortus sum**: salir, levantarse (el sol)
+        *   **Dux, ducis** (m): jefe, general
+        *   **Taceo, tacere**: callar
+        *   **Loquor, loqui**: hablar (deponente)
+        *   **Cognosco, cognoscere, cognovi**: conocer, enterarse
+        *   **Moveo, movere**: mover
+        *   **Exercitus, -us** (m): ejercito
+        *   **Eloquens, -entis**: elocuente
+        
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion22_ablativo_absoluto.png"):
+            st.image("static/images/curso_gramatica/leccion22_ablativo_absoluto.png",
+                     caption="El Ablativo Absoluto: Estructura y Tipos",
+                     width="stretch")
+    
+    render_lesson_with_tabs(22, theory_content)
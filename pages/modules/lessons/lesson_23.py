@@ -0,0 +1,102 @@
+"""Lección 23: Gerundio y Gerundivo"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_23():
+    def theory_content():
+        st.markdown("""
+        ## Lección 23: Gerundio y Gerundivo
+        
+        ### 1. Dos Caras de la Misma Moneda
+        
+        El latín tiene dos formas verbales que a menudo se confunden pero tienen funciones distintas:
+        
+        1.  **Gerundio**: Es un **Sustantivo Verbal** Activo. (Equivale a "el acto de amar").
+        2.  **Gerundivo**: Es un **Adjetivo Verbal** Pasivo. (Equivale a "que debe ser amado").
+        
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion23_gerundio_gerundivo.png"):
+            st.image("static/images/curso_gramatica/leccion23_gerundio_gerundivo.png",
+                     caption="Diferencias clave: Gerundio vs Gerundivo",
+                     width="stretch")
+        
+        st.markdown("""
+        ### 2. El Gerundio (Sustantivo Verbal)
+        
+        El Gerundio sirve para **declinar el infinitivo**.
+        El infinitivo (*amare*) se usa como Nominativo. Para los demás casos, usamos el Gerundio.
+        
+        **Formación**: Tema de presente + **-nd-** + terminaciones de segunda declinación neutra singular.
+        
+        """
+        )
+
+        render_styled_table(
+            ["Caso", "Forma", "Traducción", "Uso"],
+            [
+                ["**Nom**", "*(Amare)*", "El amar", "Sujeto"],
+                ["**Gen**", "Ama**ndi**", "De amar / Del amar", "Complemento de nombre/adjetivo"],
+                ["**Dat**", "Ama**ndo**", "Para amar", "Finalidad (poco usado)"],
+                ["**Ac**", "*(Amare)* / ad ama**ndum**", "A amar / Para amar", "Objeto / Finalidad (con *ad*)"],
+                ["**Abl**", "Ama**ndo**", "Amando / Por amar", "Modo / Instrumento"]
+            ]
+        )
+
+        st.markdown("""
+        
+        **Ejemplos**:
+        *   *Ars **amandi*** (El arte **de amar**).
+        *   *Paratus ad **pugnandum*** (Preparado **para luchar**).
+        *   *Discimus **legendo*** (Aprendemos **leyendo**).
+        
+        ### 3. El Gerundivo (Adjetivo Verbal)
+        
+        El Gerundivo es un **adjetivo de la primera clase** (*-ndus, -nda, -ndum*).
+        Indica **necesidad u obligación pasiva**.
+        
+        **Concordancia**: Como adjetivo, **concuerda** con un sustantivo en género, número y caso.
+        
+        **Ejemplos**:
+        *   *Liber **legendus*** (Un libro **que debe ser leído** / Un libro **para leer**).
+        *   *Virtus **laudanda*** (Una virtud **que debe ser alabada** / digna de alabanza).
+        
+        ### 4. La Construcción de Gerundivo (Sustitución)
+        
+        En latín clásico, se prefiere usar el **Gerundivo** en lugar del Gerundio cuando hay un Objeto Directo.
+        
+        **Transformación**:
+        1.  **Gerundio + OD**: *Cupidus **videndi** (Gen) **urbem** (Ac)* -> "Deseoso de ver la ciudad".
+        2.  **Gerundivo (Concertado)**: *Cupidus **urbis** (Gen) **videndae** (Gen)* -> "Deseoso de la ciudad que debe ser vista".
+        
+        > **Regla**: El sustantivo toma el caso del gerundio, y el gerundivo concuerda con el sustantivo.
+        
+        ### 5. Ejercicios de Análisis
+        
+        Distingue si es Gerundio o Gerundivo:
+        
+        1.  *Tempus **legendī**.*
+            *   **Gerundio** (Genitivo). No concuerda con nada.
+            *   -> Tiempo **de leer**.
+        
+        2.  *Ad **pacem petendam** venerunt.*
+            *   **Gerundivo**. *Petendam* concuerda con *pacem* (Acusativo Fem. Sing).
+            *   -> Vinieron **para pedir la paz**.
+        
+        3.  *In **libro legendo**.*
+            *   **Gerundivo**. *Legendo* concuerda con *libro* (Ablativo Masc. Sing).
+            *   -> **Al leer el libro** (En el libro que debe ser leído).
+        
+        ### Vocabulario Esencial
+        *   **Cupidus, -a, -um**: deseoso (+ Gen)
+        *   **Peritus, -a, -um**: experto (+ Gen)
+        *   **Ad**: para (+ Acusativo)
+        *   **Causa / Gratia**: por causa de, para (+ Genitivo)
+        """)
+    render_lesson_with_tabs(23, theory_content)
@@ -0,0 +1,112 @@
+"""Lección 24: Perifrásticas"""
+
+import os
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_24():
+    def theory_content():
+        st.markdown("""
+        ## Lección 24: Conjugaciones Perifrásticas
+        
+        ### 1. ¿Qué es una Perifrástica?
+        
+        Una conjugación perifrástica es un rodeo ("perífrasis") para expresar matices que los tiempos normales no tienen, como **intención** o **obligación**.
+        
+        Se forman con un **Participio** + el verbo **SUM**.
+        
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion24_perifrastica.png"):
+            st.image("static/images/curso_gramatica/leccion24_perifrastica.png",
+                     caption="Conjugaciones Perifrásticas: Activa vs Pasiva",
+                     width="stretch")
+        
+        st.markdown("""
+        ### 2. Perifrástica Activa (Intención)
+        
+        Expresa **intención** de hacer algo o un **futuro inminente**.
+        
+        **Fórmula**: Participio de Futuro Activo (*-urus, -a, -um*) + *SUM*.
+        
+        *   **Presente**: *Amaturus sum* -> **Voy a amar** / Tengo intención de amar.
+        *   **Imperfecto**: *Amaturus eram* -> **Iba a amar** / Tenía intención de amar.
+        *   **Futuro**: *Amaturus ero* -> **Estaré a punto de amar**.
+        *   **Subjuntivo**: *Amaturus sim* -> (Que) vaya a amar.
+        
+        > **Ejemplo clásico**: *Ave, Caesar, **morituri sumus**.* (Los que vamos a morir...).
+        
+        ### 3. Perifrástica Pasiva (Obligación)
+        
+        Expresa **obligación** o **necesidad**. Es muy común y potente.
+        
+        **Fórmula**: Gerundivo (*-ndus, -a, -um*) + *SUM*.
+        
+        #### A. Construcción Personal (con Sujeto)
+        El sujeto "debe ser" algo.
+        
+        *   *Hic liber **legendus est**.*
+            *   Este libro **debe ser leído** (por alguien).
+            *   -> **Hay que leer** este libro.
+        *   *Virtus **colenda est**.*
+            *   La virtud **debe ser cultivada**.
+        
+        #### B. Construcción Impersonal (sin Sujeto, verbos intransitivos)
+        Se usa el neutro singular (*-ndum est*).
+        
+        *   ***Nunc est bibendum**.* (Horacio)
+            *   Ahora **se debe beber** / Ahora **hay que beber**.
+        *   ***Pugnandum est**.*
+            *   **Hay que luchar**.
+        
+        ### 4. El Dativo Agente
+        
+        En la Perifrástica Pasiva, la persona QUE tiene la obligación no va en Ablativo (con *a/ab*), sino en **DATIVO**.
+        
+        *   *Liber **mihi** legendus est.*
+            *   Literal: El libro debe ser leído **para mí**.
+            *   Traducción: **Yo debo leer** el libro. / **Tengo que leer** el libro.
+        
+        *   *Carthago **nobis** delenda est.*
+            *   Cartago debe ser destruida **por nosotros**.
+            *   -> **Debemos destruir** Cartago.
+        
+        ### 5. Ejercicios de Traducción
+        
+        Traduce estas oraciones con matiz de obligación o intención:
+        
+        1.  *Bellum **gesturi sumus**.*
+            *   Perifrástica Activa (Part. Futuro).
+            *   -> **Vamos a hacer** la guerra / Tenemos intención de hacer la guerra.
+        
+        2.  *Pacta **servanda sunt**.*
+            *   Perifrástica Pasiva (Gerundivo).
+            *   -> Los pactos **deben ser cumplidos** (o conservados).
+        
+        3.  *Hoc **tibi faciendum est**.*
+            *   Perifrástica Pasiva + Dativo Agente (*tibi*).
+            *   -> Esto debe ser hecho **por ti**.
+            *   -> **Tú tienes que hacer** esto.
+
+        4.  ***Scripturus sum** epistulam.*
+            *   Perifrástica Activa.
+            *   -> **Voy a escribir** una carta / Estoy a punto de escribir una carta.
+
+        5.  ***Delenda est Carthago**.* (Catón el Viejo)
+            *   Perifrástica Pasiva.
+            *   -> Cartago **debe ser destruida**.
+
+        6.  ***Nunc est bibendum**.* (Horacio)
+            *   Perifrástica Pasiva Impersonal.
+            *   -> Ahora **hay que beber** (es momento de celebrar).
+        
+        ### Vocabulario Esencial
+        *   **Gero, gerere**: llevar a cabo, hacer (guerra)
+        *   **Servo, servare**: guardar, cumplir, conservar
+        *   **Colo, colere**: cultivar, honrar
+        *   **Deleo, delere**: destruir
+        """)
+    render_lesson_with_tabs(24, theory_content)
@@ -0,0 +1,171 @@
+"""Lección 25: Sintaxis I: Coordinación y Causales"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+from utils.mermaid_helper import render_mermaid
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_25():
+    def theory_content():
+        st.markdown("""
+        ## Lección 25: Sintaxis I - Coordinación y Subordinadas (Causales/Temp)
+        
+        ### 1. La Oración Compuesta y la Coordinación
+        
+        Antes de entrar en las subordinadas, es vital dominar las **conjunciones coordinantes** que unen oraciones del mismo nivel.
+
+        #### A. Copulativas (Suman)
+        *   **et**: y (la más común).
+        *   **-que**: y (enclítica, se une a la segunda palabra). *Senatus Populus**que** Romanus* (El Senado **y** el Pueblo Romano).
+        *   **atque / ac**: y además, y también (más fuerte).
+        *   **etiam**: también, incluso.
+        *   **neque / nec**: y no, ni. *Nec possum nec volo* (Ni puedo ni quiero).
+        
+        #### B. Disyuntivas (Eligen)
+        *   **aut**: o (una cosa o la otra, excluyente). *Vincere **aut** mori* (Vencer **o** morir).
+        *   **vel**: o (puedes elegir, incluyente).
+        *   **-ve**: o (enclítica). *Bis ter**ve*** (Dos **o** tres veces).
+        
+        #### C. Adversativas (Oponen)
+        *   **sed**: pero, sino. *Non est vivere **sed** valere vita* (La vida no es vivir, **sino** estar sano).
+        *   **autem**: pero, en cambio (suele ir en segunda posición).
+        *   **tamen**: sin embargo.
+        *   **at**: pero (objeción fuerte).
+        
+        #### D. Ilativas (Deducen)
+        *   **ergo**: por tanto, luego. *Cogito, **ergo** sum* (Pienso, **luego** existo).
+        *   **igitur**: así pues (suele ir en segunda posición).
+        *   **itaque**: así que, por consiguiente.
+        
+        #### E. Causales Coordinadas (Explican)
+        *   **nam**: pues, porque (al principio de frase). *Nam tua res agitur* (Pues se trata de tu asunto).
+        *   **enim**: pues, en efecto (en segunda posición).
+        *   **etenim**: y en efecto.
+        """)
+        
+        # Infografía de Coordinación
+        if os.path.exists("static/images/curso_gramatica/leccion25_coordinacion.png"):
+            st.image("static/images/curso_gramatica/leccion25_coordinacion.png",
+                     caption="Mapa Mental de las Conjunciones Coordinantes",
+                     width="stretch")
+        elif os.path.exists("static/images/curso_gramatica/leccion25_coordinadas.png"):
+            st.image("static/images/curso_gramatica/leccion25_coordinadas.png",
+                     caption="Las Conjunciones Coordinantes en Latín",
+                     width="stretch")
+
+        st.markdown("### 🧠 Mnemotecnia: Palabras Invariables Frecuentes")
+        if os.path.exists("static/images/curso_gramatica/palabras_invariables_50_frecuentes.png"):
+            st.image("static/images/curso_gramatica/palabras_invariables_50_frecuentes.png",
+                     caption="Las 50 Palabras Invariables Más Frecuentes (Adverbios, Conjunciones, Preposiciones)",
+                     width="stretch")
+
+        st.markdown("""
+        ---
+
+        ### 2. La Lógica de la Subordinación
+        
+        Las oraciones subordinadas adverbiales funcionan como un adverbio: indican **cuándo** (tiempo), **por qué** (causa), **para qué** (fin), etc.
+        
+        En latín, el uso del **Indicativo** o **Subjuntivo** depende del matiz:
+        *   **Indicativo**: Hecho real, objetivo temporal.
+        *   **Subjuntivo**: Causa subjetiva, circunstancia histórica, matiz lógico.
+        
+        ### 2. El "Cum" Histórico (Narrativo)
+        """)
+
+        st.markdown("""
+        Es una de las construcciones más frecuentes en la narración histórica (César, Tito Livio).
+        
+        **Estructura**: **CUM + Subjuntivo** (Imperfecto o Pluscuamperfecto).
+        
+        **Traducción**:
+        *   **Gerundio simple**: *Cum videret* -> "Viendo..."
+        *   **Gerundio compuesto**: *Cum vidisset* -> "Habiendo visto..."
+        *   **Al + Infinitivo**: "Al ver..."
+        *   **Como + Subjuntivo**: "Como viera..."
+        
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion25_causales_temporales.png"):
+            st.image("static/images/curso_gramatica/leccion25_causales_temporales.png",
+                     caption="Línea Temporal: Cum Histórico y Oraciones Causales",
+                     width="stretch")
+        else:
+            render_mermaid(r"""
+        graph LR
+            A[CUM + Subjuntivo] --> B{Tiempo}
+            B -->|Imperfecto| C["Simultaneidad en el pasado<br/>'Cum veniret' = Al venir / Viniendo"]
+            B -->|Pluscuamperfecto| D["Anterioridad en el pasado<br/>'Cum venisset' = Al haber venido / Habiendo venido"]
+        """)
+        
+        st.markdown("""
+        ### 3. Otras Oraciones Temporales (con Indicativo)
+        
+        Indican el momento exacto (tiempo puro) y suelen llevar **Indicativo**.
+        
+        #### Tabla de Conjunciones Temporales:
+        """)
+        
+        render_styled_table(
+            ["Conjunción", "Significado", "Ejemplo", "Traducción"],
+            [
+                ["**Cum** (+ Ind)", "Cuando", "*Cum eum videbis...*", "**Cuando** lo veas..."],
+                ["**Ubi**", "Cuando / Donde", "*Ubi Caesar venit...*", "**Cuando** César llegó..."],
+                ["**Postquam**", "Después de que", "*Postquam hostes fugerunt...*", "**Después de que** los enemigos huyeron..."],
+                ["**Dum** (+ Pres)", "Mientras", "*Dum haec geruntur...*", "**Mientras** esto sucedía..."]
+            ]
+        )
+
+        st.markdown("""
+        
+        > **Ojo con DUM!** Suele llevar Presente de Indicativo aunque narre el pasado ("Presente Histórico").
+        
+        ### 4. Oraciones Causales
+        
+        Explican el motivo de la acción principal.
+        
+        *   **Quod, Quia, Quoniam** + **Indicativo**: Causa real / objetiva.
+            *   *Gaudeo **quod vales**.* (Me alegro **porque estás bien** - es un hecho).
+        
+        *   **Cum, Quod** + **Subjuntivo**: Causa subjetiva / supuesta.
+            *   *Laudatur **quod fuerit** fortis.* (Es alabado **porque [dicen que] fue** valiente).
+            *   ***Cum** sis bonus, te amo.* (**Puesto que / Como** eres bueno, te amo).
+        
+        ### 5. Ejercicios de Análisis
+        
+        Analiza y traduce:
+        
+        1.  *Cum Caesar in Galliam venisset, Romani laeti erant.*
+            *   *Cum ... venisset* (Cum Histórico, Plusc. Subj).
+            *   -> **Habiendo llegado César a la Galia**, los romanos estaban contentos.
+            *   -> **Al llegar César a la Galia**...
+        
+        2.  *Dum Romae sum, multos libros lego.*
+            *   *Dum* + Presente.
+            *   -> **Mientras estoy en Roma**, leo muchos libros.
+        
+        3.  *Postquam urbs capta est, milites redierunt.*
+            *   *Postquam* + Perfecto Indicativo.
+            *   -> **Después de que la ciudad fue tomada**, los soldados regresaron.
+
+        4.  *Quod vales, gaudeo.*
+            *   *Quod* + Indicativo (Causa real).
+            *   -> **Porque estás bien**, me alegro.
+
+        5.  *Socrates accusatus est quod corrumperet juventutem.*
+            *   *Quod* + Subjuntivo (Causa alegada/subjetiva).
+            *   -> Sócrates fue acusado **porque (supuestamente) corrompía** a la juventud.
+        
+        ### Vocabulario Esencial
+        *   **Cum**: cuando, como, aunque (depende del contexto)
+        *   **Ubi**: cuando, donde
+        *   **Postquam**: después de que
+        *   **Dum**: mientras
+        *   **Quod / Quia**: porque
+        """)
+    
+    render_lesson_with_tabs(25, theory_content)
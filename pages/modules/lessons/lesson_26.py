@@ -0,0 +1,172 @@
+"""Lección 26: Subordinadas Sustantivas"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_26():
+    def theory_content():
+        st.markdown("""
+        ## Lección 26: Subordinadas Sustantivas (Completivas)
+        
+        ### 1. ¿Qué son las Oraciones Completivas?
+        
+        Las oraciones completivas **funcionan como un sustantivo**: son el **Sujeto** o el **Objeto Directo** del verbo principal.
+        
+        Por ejemplo:
+        - "**Quiero** que vengas" → "Que vengas" es el objeto de "quiero"
+        - "**Es necesario** que estudies" → "Que estudies" es el sujeto de "es necesario"
+        
+        En latín, estas oraciones se construyen de formas diferentes según el tipo de verbo principal.
+        
+        ---
+        
+        ### 2. Completivas con UT / NE (Verbos de Voluntad y Mandato)
+        
+        Dependen de verbos que expresan **voluntad, deseo, mandato, ruego**:
+        - *Volo* (querer), *Nolo* (no querer), *Malo* (preferir)
+        - *Oro* (rogar), *Peto* (pedir)
+        - *Impero* (mandar), *Hortor* (exhortar)
+        
+        """
+        )
+
+        if os.path.exists("static/images/curso_gramatica/leccion26_volo_nolo_malo.png"):
+            st.image("static/images/curso_gramatica/leccion26_volo_nolo_malo.png",
+                     caption="Los Tres Deseos: Volo, Nolo, Malo",
+                     width="stretch")
+
+        st.markdown("""
+        **Estructura**: Verbo principal + **UT** (que) / **NE** (que no) + **Subjuntivo**
+        
+        **Ejemplos**:
+        *   *Impero tibi **ut venias**.*
+            - Te mando **que vengas**.
+        *   *Oro te **ne eas**.*
+            - Te ruego **que no vayas**.
+        *   *Volo **ut discas**.*
+            - Quiero **que aprendas**.
+        
+        ---
+        
+        ### 3. Verbos de Temor (*Verba Timendi*)
+        
+        ⚠️ **¡Atención!** Los verbos de temor usan UT/NE de forma **contraintuitiva**:
+        
+        - **Timeo NE...** = Temo **QUE** ocurra (algo que NO quiero)
+        - **Timeo UT...** = Temo **QUE NO** ocurra (algo que SÍ quiero)
+        
+        **Ejemplos**:
+        *   *Timeo **ne** pluat.*
+            - Temo **que** llueva. [No quiero que llueva]
+        *   *Timeo **ut** veniat.*
+            - Temo **que no** venga. [Quiero que venga]
+        *   *Vereor **ne** hostes urbem capiant.*
+            - Temo **que** los enemigos tomen la ciudad.
+        
+        **Verbos de temor comunes**: *Timeo, vereor, metuo* (temer)
+        
+        ---
+        
+        ### 4. Interrogativas Indirectas
+        
+        Las **preguntas indirectas** también son completivas. Usan:
+        - Partículas interrogativas (*quis, quid, cur, quando, ubi, quo, unde*)
+        - **Subjuntivo** (aunque en español usamos indicativo)
+        
+        **Ejemplos**:
+        *   *Nescio **quid** **facias**.*
+            - No sé **qué** haces. (Lit: "qué hagas")
+        *   *Rogat **cur** **veneris**.*
+            - Pregunta **por qué** has venido.
+        *   *Ignoro **ubi** **sit**.*
+            - Ignoro **dónde** está. (Lit: "dónde esté")
+        
+        ---
+        
+        ### 5. Cuadro Resumen
+        
+        """)
+        
+        render_styled_table(
+            ["Tipo", "Conjunción", "Modo", "Ejemplo", "Traducción"],
+            [
+                ["**Voluntad**", "UT", "Subjuntivo", "*Volo ut venias*", "Quiero que vengas"],
+                ["**Voluntad (Neg)**", "NE", "Subjuntivo", "*Nolo ne eas*", "No quiero que vayas"],
+                ["**Temor**", "NE", "Subjuntivo", "*Timeo ne pluat*", "Temo que llueva"],
+                ["**Temor (Neg)**", "UT", "Subjuntivo", "*Timeo ut veniat*", "Temo que NO venga"],
+                ["**Interrog. Ind.**", "Quis/Quid/Cur/etc", "Subjuntivo", "*Nescio quid faciam*", "No sé qué hacer"]
+            ]
+        )
+        
+        st.markdown("""
+        
+        ---
+        
+        ### 6. Ejercicios de Análisis
+        
+        Identifica el tipo de completiva y traduce:
+        
+        1.  *Imperavit militibus **ut** oppugnarent.*
+            - Verbo de mando + *ut* → **Completiva de Voluntad**
+            - **Traducción**: Mandó a los soldados **que** atacaran.
+        
+        2.  *Timeo **ne** hostes veniant.*
+            - Verbo de temor + *ne* → **Completiva de Temor**
+            - **Traducción**: Temo **que** los enemigos vengan.
+        
+        3.  *Peto **ne** me relinquas.*
+            - Verbo de ruego + *ne* → **Completiva de Voluntad (negativa)**
+            - **Traducción**: Pido **que no** me abandones.
+        
+        4.  *Nescio **quo** fugerint.*
+            - Verbo de ignorancia + *quo* → **Interrogativa Indirecta**
+            - **Traducción**: No sé **a dónde** huyeron.
+        
+        5.  *Vereor **ut** id facere possit.*
+            - Verbo de temor + *ut* → **Completiva de Temor (negativa)**
+            - **Traducción**: Temo **que no** pueda hacerlo.
+        
+        ---
+        
+        ### Vocabulario Esencial
+        
+        **Verbos de Voluntad**:
+        *   **Volo, velle, volui**: querer
+        *   **Nolo, nolle, nolui**: no querer
+        *   **Malo, malle, malui**: preferir
+        *   **Cupio, cupere**: desear
+        *   **Hortor, hortari**: exhortar
+        
+        **Verbos de Mandato**:
+        *   **Impero, imperare**: mandar
+        *   **Iubeo, iubere**: ordenar
+        *   **Rogo, rogare**: rogar, pedir
+        *   **Peto, petere**: pedir, solicitar
+        
+        **Verbos de Temor**:
+        *   **Timeo, timere**: temer
+        *   **Vereor, vereri**: temer (deponente)
+        *   **Metuo, metuere**: temer
+        
+        **Conjunciones**:
+        *   **Ut**: que (afirmativo)
+        *   **Ne**: que no (negativo)
+        
+        """)
+        
+        # Imagen de Completivas si existe
+        if os.path.exists("static/images/curso_gramatica/completivas_sustantivas.png"):
+            st.image("static/images/curso_gramatica/completivas_sustantivas.png",
+                     caption="Oraciones Subordinadas Sustantivas (Completivas)",
+                     width="stretch")
+        elif os.path.exists("static/images/curso_gramatica/leccion26_sustantivas.png"):
+            st.image("static/images/curso_gramatica/leccion26_sustantivas.png",
+                     caption="Oraciones Subordinadas Sustantivas (Completivas)",
+                     width="stretch")
+    
+    render_lesson_with_tabs(26, theory_content)
@@ -0,0 +1,194 @@
+"""Lección 27: Sub. Adverbiales II (Cond/Fin/Cons)"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_27():
+    def theory_content():
+        st.markdown("""
+        ## Lección 27: Subordinadas Adverbiales II (Finales, Consecutivas y Condicionales)
+        
+        En esta lección completamos las subordinadas adverbiales, añadiendo tres tipos esenciales:
+        **Finales** (para qué), **Consecutivas** (con qué resultado), y **Condicionales** (si...).
+        
+        ---
+        
+        ### 1. Oraciones Finales (Propósito)
+        
+        Responden a: **¿Para qué?** / **¿Con qué fin?**
+        
+        **Estructura**:
+        *   **Afirmativa**: **UT** + Subjuntivo
+        *   **Negativa**: **NE** + Subjuntivo
+        
+        **Ejemplos**:
+        *   *Edo **ut vivam**.*
+            *   Como **para vivir**.
+        *   *Portas clausit **ne** hostes **intrarent**.*
+            *   Cerró las puertas **para que** los enemigos **no entraran**.
+        *   *Legatos misit **ut** pacem **peterent**.*
+            *   Envió embajadores **para pedir** la paz.
+        
+        ---
+        
+        ### 2. Oraciones Consecutivas (Consecuencia)
+        
+        Responden a: **¿Con qué consecuencia?** / **¿Con qué resultado?**
+        
+        Suelen estar **anunciadas** en la principal por un adverbio de intensidad:
+        **Tam, Ita, Sic, Adeo, Tantus, Talis**
+        
+        **Estructura**:
+        *   **Afirmativa**: **UT** + Subjuntivo
+        *   **Negativa**: **UT NON** + Subjuntivo (¡No *NE*!)
+        
+        **Ejemplos**:
+        *   ***Tam** stultus est **ut** nihil **intelligat**.*
+            *   Es **tan** tonto **que no entiende** nada.
+        *   ***Ita** locutus est **ut** omnes **flerent**.*
+            *   Habló **de tal modo que** todos lloraban.
+        *   ***Tantus** erat timor **ut** nemo **exiret**.*
+            *   **Tanto** era el miedo **que** nadie salía.
+        
+        ---
+        
+        ### 3. Diferencia entre Finales y Consecutivas
+        
+        Ambas usan **UT**, pero tienen significados muy distintos:
+        
+        """)
+        
+        render_styled_table(
+            ["Característica", "Finales", "Consecutivas"],
+            [
+                ["**Significado**", "Intención / Propósito", "Resultado / Efecto"],
+                ["**Negación**", "**NE**", "**UT NON**"],
+                ["**Pistas**", "Verbos de movimiento, voluntad", "*Tam, Ita, Sic, Tantus, Adeo* en la principal"],
+                ["**Ejemplo**", "*Venit ut me videat*", "*Tam fortis est ut vincat*"]
+            ]
+        )
+        
+        st.markdown("""
+        
+        ---
+        
+        ### 4. Oraciones Condicionales
+        
+        Expresan una **condición** (prótasis: "Si...") y su **consecuencia** (apódosis: "...entonces").
+        
+        Hay **tres tipos** según el grado de realidad:
+        
+        #### A. Tipo I: Real (Indicativo)
+        
+        Expresa un hecho real o lógico. *Si pasa A, pasa B.*
+        
+        *   **Modo**: **Indicativo** en ambas partes
+        *   *Si hoc **facis**, **erras**.*
+            *   Si haces esto, te equivocas.
+        
+        #### B. Tipo II: Posible (Subjuntivo Presente/Perfecto)
+        
+        Expresa algo que **podría** ocurrir en el futuro.
+        
+        *   **Modo**: **Subjuntivo Presente**
+        *   *Si hoc **facias**, **erres**.*
+            *   Si hicieras esto (en el futuro), te equivocarías.
+        
+        #### C. Tipo III: Irreal (Subjuntivo Imperfecto/Pluscuamperfecto)
+        
+        Expresa algo que **no ocurre** (presente) o **no ocurrió** (pasado).
+        
+        *   **Irreal de Presente**: Subjuntivo Imperfecto
+            *   *Si hoc **faceres**, **errares**.*
+                *   Si hicieras esto (ahora, pero no lo haces), te equivocarías.
+        
+        *   **Irreal de Pasado**: Subjuntivo Pluscuamperfecto
+            *   *Si hoc **fecisses**, **erravisses**.*
+                *   Si hubieras hecho esto, te habrías equivocado.
+        
+        ---
+        
+        ### 5. Cuadro Resumen Completo
+        
+        """)
+        
+        render_styled_table(
+            ["Tipo", "Conjunción", "Modo", "Ejemplo", "Traducción"],
+            [
+                ["**Final**", "UT / NE", "Subjuntivo", "*Venit ut me videat*", "Viene para verme"],
+                ["**Consecutiva**", "UT / UT NON", "Subjuntivo", "*Tam fortis est ut vincat*", "Es tan fuerte que vence"],
+                ["**Cond. Real**", "SI", "Indicativo", "*Si facis, erras*", "Si haces, te equivocas"],
+                ["**Cond. Posible**", "SI", "Subj. Pres.", "*Si facias, erres*", "Si hicieras, te equivocarías"],
+                ["**Cond. Irreal Pres.**", "SI", "Subj. Imperf.", "*Si faceres, errares*", "Si hicieras (ahora), te equivocarías"],
+                ["**Cond. Irreal Pas.**", "SI", "Subj. Plusc.", "*Si fecisses, erravisses*", "Si hubieras hecho, te habrías equivocado"]
+            ]
+        )
+        
+        # Infografías de Condicionales y Finales/Consecutivas
+        col1, col2 = st.columns(2)
+        with col1:
+            if os.path.exists("static/images/curso_gramatica/leccion27_condicionales.png"):
+                st.image("static/images/curso_gramatica/leccion27_condicionales.png",
+                         caption="Los Tres Tipos de Oraciones Condicionales",
+                         width="stretch")
+        with col2:
+            if os.path.exists("static/images/curso_gramatica/leccion26_finales_consecutivas.png"):
+                st.image("static/images/curso_gramatica/leccion26_finales_consecutivas.png",
+                         caption="Finales vs Consecutivas",
+                         width="stretch")
+        
+        st.markdown("""
+        
+        ---
+        
+        ### 6. Ejercicios de Análisis
+        
+        Identifica el tipo de subordinada y traduce:
+        
+        1.  *Milites pugnant **ut** urbem **defendant**.*
+            *   ¿Pista de intensidad? No. ¿Es propósito? Sí.
+            *   → **Final**: Los soldados luchan **para defender** la ciudad.
+        
+        2.  *Solis ardor **tam** magnus est **ut** herba **arescat**.*
+            *   Pista: *Tam* (tan).
+            *   → **Consecutiva**: El calor del sol es **tan** grande **que** la hierba se seca.
+        
+        3.  *Si venisses, laetus fuissem.*
+            *   Subjuntivo Pluscuamperfecto.
+            *   → **Condicional Irreal de Pasado**: **Si hubieras venido**, habría estado contento.
+        
+        4.  *Portas clausit **ne** hostes **intrarent**.*
+            *   Negación *NE*.
+            *   → **Final**: Cerró las puertas **para que** los enemigos **no entraran**.
+        
+        5.  *Si dives sim, orbem peragrem.*
+            *   Subjuntivo Presente.
+            *   → **Condicional Posible**: **Si fuera rico**, recorrería el mundo.
+        
+        ---
+        
+        ### Vocabulario Esencial
+        
+        **Conjunciones Finales**:
+        *   **Ut**: para que (afirmativa)
+        *   **Ne**: para que no (negativa)
+        
+        **Adverbios de Intensidad** (anuncian Consecutivas):
+        *   **Tam**: tan
+        *   **Ita / Sic**: así, de tal modo
+        *   **Adeo**: tanto, hasta tal punto
+        *   **Tantus, -a, -um**: tanto, tan grande
+        *   **Talis, -e**: tal, de tal clase
+        
+        **Conjunciones Condicionales**:
+        *   **Si**: si
+        *   **Nisi**: si no, a menos que
+        *   **Sin**: pero si, si por el contrario
+        """)
+    
+    render_lesson_with_tabs(27, theory_content)
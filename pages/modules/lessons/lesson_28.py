@@ -0,0 +1,118 @@
+"""Lección 28: Subordinadas Adjetivas (Relativas)"""
+
+import os
+
+import streamlit as st
+
+from utils.ui_helpers import render_styled_table
+from utils.mermaid_helper import render_mermaid
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_28():
+    def theory_content():
+        st.markdown("""
+        ## Lección 28: Subordinadas Adjetivas (Relativas)
+        
+        ### 1. El Pronombre Relativo (Qui, Quae, Quod)
+        
+        Las oraciones de relativo adjetivan a un sustantivo anterior llamado **antecedente**.
+        
+        *   "El libro **que** lees es bueno."
+            *   Antecedente: *Libro*.
+            *   Relativo: *Que*.
+        
+        ### 2. La Regla de Oro de la Concordancia
+        
+        El pronombre relativo concuerda con su antecedente en **GÉNERO y NÚMERO**.
+        Pero su **CASO** depende de su función **dentro de la oración subordinada**.
+        
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion28_oraciones_relativas.png"):
+            st.image("static/images/curso_gramatica/leccion28_oraciones_relativas.png",
+                     caption="Árbol de Concordancia del Relativo",
+                     width="stretch")
+        elif os.path.exists("static/images/curso_gramatica/leccion_subordinadas_adjetivas.png"):
+            st.image("static/images/curso_gramatica/leccion_subordinadas_adjetivas.png",
+                     caption="Oraciones Subordinadas Adjetivas (Relativas)",
+                     width="stretch")
+        else:
+            render_mermaid(r"""
+    graph LR
+        Ant[Antecedente] -- "Género y Número" --> Rel["Relativo (Qui/Quae/Quod)"]
+        Sub["Oración Subordinada"] -- "Función Sintáctica" --> Caso["Caso del Relativo"]
+        
+        Rel --> Caso
+    """)
+        
+        st.markdown("""
+        ### 3. Declinación de Qui, Quae, Quod
+        
+        #### Declinación del Relativo:
+        """)
+        
+        render_styled_table(
+            ["Caso", "Masc. Sg", "Fem. Sg", "Neut. Sg", "Masc. Pl", "Fem. Pl", "Neut. Pl"],
+            [
+                ["**Nom**", "**qui**", "**quae**", "**quod**", "**qui**", "**quae**", "**quae**"],
+                ["**Ac**", "**quem**", "**quam**", "**quod**", "**quos**", "**quas**", "**quae**"],
+                ["**Gen**", "**cuius**", "**cuius**", "**cuius**", "**quorum**", "**quarum**", "**quorum**"],
+                ["**Dat**", "**cui**", "**cui**", "**cui**", "**quibus**", "**quibus**", "**quibus**"],
+                ["**Abl**", "**quo**", "**qua**", "**quo**", "**quibus**", "**quibus**", "**quibus**"]
+            ]
+        )
+
+        st.markdown("""
+        
+        ### 4. Ejemplos de Análisis de Caso
+        
+        1.  *Puer, **quem** vides, amicus meus est.*
+            *   Antecedente: *Puer* (Masc, Sg).
+            *   Función en sub.: Objeto Directo de *vides* (tú ves al niño).
+            *   → Relativo: Masc, Sg, **Acusativo** = **QUEM**.
+            *   "El niño, **al cual** ves, es mi amigo."
+        
+        2.  *Puella, **cui** librum dedi, laeta est.*
+            *   Antecedente: *Puella* (Fem, Sg).
+            *   Función en sub.: Objeto Indirecto de *dedi* (di el libro a la niña).
+            *   → Relativo: Fem, Sg, **Dativo** = **CUI**.
+            *   "La niña, **a la cual** di el libro, está contenta."
+        
+        3.  *Urbs, **in qua** habito, magna est.*
+            *   Antecedente: *Urbs* (Fem, Sg).
+            *   Función en sub.: CC Lugar (*in* + Abl).
+            *   → Relativo: Fem, Sg, **Ablativo** = **QUA**.
+            *   "La ciudad **en la que** vivo es grande."
+        
+        ### 5. Relativas con Subjuntivo
+        
+        Normalmente llevan Indicativo. Si llevan **Subjuntivo**, añaden un matiz circunstancial (Final, Consecut o Causal).
+        
+        *   **Final**: *Milites misit **qui** (= ut ii) nuntiarent.*
+            *   Envió soldados **para que** anunciaran (literal: "que anunciaran").
+        
+        *   **Consecutiva**: *Nemo est tam stultus **qui** (= ut is) hoc credat.*
+            *   Nadie es tan tonto **que** crea esto.
+
+        ### 6. El Relativo de Unión (Nexo Relativo)
+        
+        En latín, a veces se usa un relativo al **principio de una oración** (después de punto) para referirse a algo dicho anteriormente.
+        Se traduce como un demostrativo: "Y este...", "Este...", "El cual...".
+        
+        *   ***Quae** cum ita sint...*
+            *   Literal: Las cuales cosas como sean así...
+            *   Traducción: **Y como esto es así...** / **Puesto que esto es así...**
+        
+        *   ***Quod** cum audivisset...*
+            *   Literal: Lo cual como hubiese oído...
+            *   Traducción: **Cuando oyó esto...** / **Al oír esto...**
+        
+        ### Vocabulario Esencial
+        *   **Qui, quae, quod**: el cual, la cual, lo cual / que / quien
+        *   **Ubi** (adv. relativo): donde (= in quo)
+        *   **Unde** (adv. relativo): de donde (= ex quo)
+        *   **Quo** (adv. relativo): a donde (= ad quem)
+        """)
+    
+    render_lesson_with_tabs(28, theory_content)
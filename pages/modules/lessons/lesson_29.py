@@ -0,0 +1,142 @@
+"""Lección 29: Estilo Indirecto (Oratio Obliqua)"""
+
+import os
+
+import streamlit as st
+
+from utils.mermaid_helper import render_mermaid
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_29():
+    def theory_content():
+        st.markdown("""
+        ## Lección 29: Estilo Indirecto (Oratio Obliqua)
+        
+        ### 1. ¿Qué es la Oratio Obliqua?
+        
+        Es referir las palabras de otro **sin citarlas textualmente**.
+        *   **Directo**: César dijo: "Voy a Roma".
+        *   **Indirecto**: César dijo **que él iba a Roma**.
+        
+        En latín, esto provoca una **transformación gramatical masiva** en toda la oración.
+        
+        ---
+        
+        ### 2. Reglas de Transformación
+        
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion29_estilo_indirecto.png"):
+            st.image("static/images/curso_gramatica/leccion29_estilo_indirecto.png",
+                     caption="Transformación a Estilo Indirecto",
+                     width="stretch")
+        elif os.path.exists("static/images/curso_gramatica/leccion30_estilo_indirecto.png"):
+            st.image("static/images/curso_gramatica/leccion30_estilo_indirecto.png",
+                     caption="Transformación a Estilo Indirecto",
+                     width="stretch")
+        else:
+            render_mermaid(r"""
+    graph TD
+        Directo[ESTILO DIRECTO] --> Indirecto[ESTILO INDIRECTO]
+        
+        subgraph Oraciones Principales
+        D_Princ[Verbo Principal] -->|AcI| I_Princ[Infinitivo + Acusativo]
+        D_Imper[Imperativo] -->|Subjuntivo| I_Imper[Subjuntivo]
+        end
+        
+        subgraph Oraciones Subordinadas
+        D_Sub[Cualquier Verbo Subordinado] -->|Subjuntivo| I_Sub[Subjuntivo]
+        end
+    """)
+        
+        st.markdown("""
+        
+        ### 3. Transformación Detallada
+        
+        #### A. Oraciones Principales (Aseverativas)
+        Pasan a la construcción de **Acusativo con Infinitivo (AcI)**.
+        
+        *   Directo: *"Romani fortes **sunt**."*
+        *   Indirecto: *Dicit **Romanos** fortes **esse**.*
+        
+        #### B. Oraciones Principales (Imperativas / Desiderativas)
+        Pasan a **Subjuntivo**.
+        
+        *   Directo: *"**Veni**, Caesar!"*
+        *   Indirecto: *Orat Caesarem **ut veniat**.* (Le ruega que venga).
+        
+        #### C. Oraciones Subordinadas
+        Todos los verbos de las oraciones subordinadas pasan a **SUBJUNTIVO**.
+        
+        *   Directo: *"Romani, **qui** fortes **sunt**, vincunt."*
+        *   Indirecto: *Dicit Romanos, **qui** fortes **sint**, vincere.*
+        
+        ---
+        
+        ### 4. Ejemplo Completo de Transformación
+        
+        **Texto Original (Directo):**
+        > *"Ariovistus respondit: Ego in Galliam non veni, sed Galli ad me venerunt. Si quid vultis, pugnate!"*
+        
+        **Texto Indirecto (César, De Bello Gallico):**
+        > *Ariovistus respondit:*
+        > 1.  **se** in Galliam non **venisse** (AcI - Inf. Perf),
+        > 2.  sed **Gallos** ad **se** **venisse** (AcI - Inf. Perf).
+        > 3.  **Si** quid **vellent** (Subj. Imp - Subordinada), **pugnarent** (Subj. Imp - Imperativo transformado).
+        
+        ---
+        
+        ### 5. La Consecutio Temporum en Estilo Indirecto
+        
+        Como todo pasa a Subjuntivo o Infinitivo, la referencia temporal depende del verbo introductor (*Dicit* vs *Dixit*).
+        
+        *   *Dicit se id facere **quod vellet**.* (Dice que hace lo que quiere).
+        
+        ---
+        
+        ### 6. Ejercicios de Práctica
+        
+        Pasa a Estilo Indirecto dependiendo de *Dicit* (Dice):
+        
+        1.  *"Puer currit."*
+            *   → *Dicit **puerum currere**.*
+        
+        2.  *"Ego laetus sum."*
+            *   → *Dicit **se** laetum **esse**.*
+        
+        3.  *"Milites, qui pugnant, vincunt."*
+            *   → *Dicit **milites**, qui **pugnent**, **vincere**.*
+        
+        ---
+        
+        ### 7. Ejemplo Completo de Análisis
+        
+        **Texto**: *Caesar dixit se, postquam hostes vicisset, Romam venturum esse.*
+        
+        *   **Verbo introductor**: *Dixit* (Dijo) → Tiempo histórico.
+        *   **Oración Principal Indirecta**: *se ... Romam venturum esse*.
+            *   *se*: Sujeto (César) en Acusativo.
+            *   *venturum esse*: Infinitivo Futuro (Posterioridad).
+            *   → "Que él vendría a Roma".
+        *   **Oración Subordinada**: *postquam hostes vicisset*.
+            *   *vicisset*: Pluscuamperfecto Subjuntivo.
+            *   ¿Por qué Pluscuamperfecto?
+                *   1. Subjuntivo por Estilo Indirecto.
+                *   2. Pluscuamperfecto por **Anterioridad** respecto a un tiempo histórico (*Dixit*).
+            *   → "Después de que hubiera vencido a los enemigos".
+        
+        **Traducción final**: César dijo que él, después de haber vencido a los enemigos, vendría a Roma.
+        
+        ---
+        
+        ### Vocabulario Esencial
+        *   **Aio / Inquam**: decir (defectivos, usados en directo)
+        *   **Dico, dicere**: decir
+        *   **Nego**: decir que no, negar
+        *   **Respondeo**: responder
+        *   **Nuntio**: anunciar
+        *   **Polliceor**: prometer (+ AcI Futuro)
+        """)
+    
+    render_lesson_with_tabs(29, theory_content)
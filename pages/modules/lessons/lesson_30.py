@@ -0,0 +1,81 @@
+"""Lección 30: Verbos Irregulares y Síntesis"""
+
+import os
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_30():
+    def theory_content():
+        st.markdown("""
+        ## Lección 30: Verbos Irregulares y Síntesis Final
+        
+        ### 1. Los Tres Irregulares Clásicos
+        
+        Para completar tu dominio del latín, debes conocer tres verbos irregulares omnipresentes que desafían las reglas normales.
+        
+        #### A. Fero, ferre, tuli, latum (Llevar, soportar)
+        
+        Es irregular porque **pierde la vocal de unión** en Presente.
+        
+        *   **Presente**: *Fero, Fers, Fert, Ferimus, Fertis, Ferunt*.
+        *   **Infinitivo**: *Ferre* (no *ferere*).
+        *   **Compuestos**: *Au-fero* (llevarse), *In-fero* (introducir), *Con-fero* (reunir).
+        
+        """
+        )
+
+        if os.path.exists("static/images/curso_gramatica/leccion30_fero_v2.png"):
+            st.image("static/images/curso_gramatica/leccion30_fero_v2.png",
+                     caption="El Viajero FERO: Sus múltiples equipajes (compuestos)",
+                     width="stretch")
+
+        st.markdown("""
+        #### B. Eo, ire, ii, itum (Ir)
+        
+        La raíz es **i-**. Se transforma en **e-** ante vocal (*eo, eunt*).
+        
+        *   **Presente**: *Eo, Is, It, Imus, Itis, Eunt*.
+        *   **Futuro**: *Ibo, ibis...* (Como la 1ª/2ª conj).
+        *   **Compuestos**: *Ex-eo* (salir), *Red-eo* (volver), *Transe-o* (cruzar).
+        
+        #### C. Fio, fieri, factus sum (Hacerse, suceder)
+        
+        Funciona como la **voz pasiva de *Facio*** (hacer).
+        
+        *   **Presente**: *Fio, Fis, Fit, Fimus, Fitis, Fiunt*.
+        *   **Significado**:
+            *   *Hoc **fit**.* = Esto **sucede** / Esto **es hecho**.
+            *   *Consul **factus est**.* = **Se hizo** (fue nombrado) cónsul.
+        
+        ---
+
+        ### 2. La Métrica Latina (Bonus)
+        
+        El latín clásico no se basaba en la rima, sino en la **cantidad** (duración) de las sílabas.
+        
+        *   **Sílaba Larga (-)**: Dura dos tiempos.
+        *   **Sílaba Breve (u)**: Dura un tiempo.
+        
+        El verso más famoso es el **Hexametro Dactílico** (usado en la Eneida).
+        
+        ### 3. Síntesis y Despedida
+        
+        Has recorrido el camino desde `Rosa, -ae` hasta el Estilo Indirecto y los verbos anómalos. Tienes, ahora sí, las llaves de Roma.
+        
+        > **Per aspera ad astra**
+        > (A través de las dificultades, hacia las estrellas)
+        
+        A partir de aquí, el aprendizaje continúa leyendo a los clásicos: César, Cicerón, Virgilio.
+        
+        **¡Felicidades, Grammaticus!**
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion30_sintesis.png"):
+             st.image("static/images/curso_gramatica/leccion30_sintesis.png",
+                      caption="Síntesis del Curso",
+                      width="stretch")
+
+    render_lesson_with_tabs(30, theory_content)
@@ -0,0 +1,48 @@
+"""Lección 31: César y Prosa Militar"""
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_31():
+    def theory_content():
+        st.markdown("""
+        ## Lección 31: César y la Prosa Militar
+        
+        ### 1. C. Iulius Caesar (100-44 a.C.)
+        
+        Julio César no solo fue uno de los generales y políticos más brillantes de Roma, sino también un **maestro de la prosa latina**. Sus *Commentarii* (Comentarios) son el modelo de la latinidad pura.
+        """)
+
+        st.image("static/images/curso_gramatica/leccion31_cesar.png",
+                 caption="Julio César: Conquistador y Escritor",
+                 width="stretch")
+
+        st.markdown("""
+        ### 2. Estilo: *Pura et Illustris Brevitas*
+        
+        El estilo de César se caracteriza por:
+        *   **Brevedad y Claridad**: Evita palabras raras o arcaicas.
+        *   **Uso de la 3ª Persona**: Se refiere a sí mismo como "César" para dar apariencia de objetividad.
+        *   **Vocabulario Militar**: Preciso y técnico (*acies, legio, castra, imperator*).
+        *   **Ablativo Absoluto**: Uso frecuente para acelerar la narración.
+        
+        ### 3. Texto: De Bello Gallico (I.1)
+        
+        El inicio más famoso de la literatura latina histórica:
+        
+        > *Gallia est omnis divisa in partes tres, quarum unam incolunt Belgae, aliam Aquitani, tertiam qui ipsorum lingua Celtae, nostra Galli appellantur.*
+        
+        **Traducción**:
+        "Toda la Galia está dividida en tres partes, de las cuales una la habitan los Belgas, otra los Aquitanos, la tercera los que en su propia lengua se llaman Celtas, en la nuestra Galos."
+        
+        ### 4. Vocabulario de Autor
+        *   **Divido, -ere, -visi, -visum**: dividir
+        *   **Incolo, -ere, -ui**: habitar
+        *   **Appello, -are**: llamar
+        *   **Lex, legis**: ley
+        *   **Proelium, -ii**: batalla
+        """)
+    
+    render_lesson_with_tabs(31, theory_content)
@@ -0,0 +1,47 @@
+"""Lección 32: Cicerón y Retórica"""
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_32():
+    def theory_content():
+        st.markdown("""
+        ## Lección 32: Cicerón y la Retórica
+        
+        ### 1. M. Tullius Cicero (106-43 a.C.)
+        
+        Cicerón es la cumbre de la oratoria romana y el creador del lenguaje filosófico latino. Su vida estuvo dedicada a la defensa de la República.
+        """)
+        
+        st.image("static/images/curso_gramatica/leccion32_ciceron.png",
+                 caption="Cicerón denunciando a Catilina en el Senado",
+                 width="stretch")
+
+        st.markdown("""
+        ### 2. Estilo: El Periodo Oratorio
+        
+        A diferencia de la brevedad de César, Cicerón busca la **amplitud y el ritmo**:
+        *   **Concinnitas**: Equilibrio y simetría en las frases.
+        *   **Cláusulas Métricas**: El final de las frases tiene un ritmo poético.
+        *   **Anáfora y Tricolon**: Repetición de palabras y estructuras de tres elementos.
+        
+        ### 3. Texto: In Catilinam (I.1)
+        
+        El ataque directo contra el conspirador Catilina:
+        
+        > *Quousque tandem abutere, Catilina, patientia nostra? Quamdiu etiam furor iste tuus nos eludet? Quem ad finem sese effrenata iactabit audacia?*
+        
+        **Traducción**:
+        "¿Hasta cuándo, finalmente, abusarás, Catilina, de nuestra paciencia? ¿Cuánto tiempo todavía esa locura tuya se burlará de nosotros? ¿Hasta qué límite se arrojará esa audacia desenfrenada?"
+        
+        ### 4. Vocabulario de Autor
+        *   **Abutor, -i, -usus sum** (+ Abl): abusar
+        *   **Patientia, -ae**: paciencia
+        *   **Furor, -oris**: locura
+        *   **Eludo, -ere**: burlar, esquivar
+        *   **Audacia, -ae**: audacia, osadía
+        """)
+    
+    render_lesson_with_tabs(32, theory_content)
@@ -0,0 +1,46 @@
+"""Lección 33: Salustio y Historiografía"""
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_33():
+    def theory_content():
+        st.markdown("""
+        ## Lección 33: Salustio y la Historiografía
+        
+        ### 1. C. Sallustius Crispus (86-34 a.C.)
+        
+        Salustio creó la **monografía histórica**. Se centró en la corrupción moral de Roma que llevó al fin de la República.
+        """)
+        
+        st.image("static/images/curso_gramatica/leccion33_salustio.png",
+                 caption="Salustio: El Historiador Moralista",
+                 width="stretch")
+
+        st.markdown("""
+        ### 2. Estilo: *Inconcinnitas* y Arcaísmo
+        
+        Salustio se opone al estilo de Cicerón:
+        *   **Brevitas**: Concisión extrema, a veces oscura.
+        *   **Inconcinnitas**: Evita la simetría deliberadamente para sorprender.
+        *   **Arcaísmos**: Usa palabras antiguas para dar gravedad (*optumus* en vez de *optimus*).
+        *   **Infinitivo Histórico**: Usa infinitivos como verbos principales para dar rapidez.
+        
+        ### 3. Texto: Retrato de Catilina (5.1)
+        
+        > *Lucius Catilina, nobili genere natus, fuit magna vi et animi et corporis, sed ingenio malo pravoque.*
+        
+        **Traducción**:
+        "Lucio Catilina, nacido de noble linaje, fue de gran fuerza tanto de espíritu como de cuerpo, pero de carácter malo y depravado."
+        
+        ### 4. Vocabulario de Autor
+        *   **Ingenium, -ii**: carácter, talento natural
+        *   **Pravus, -a, -um**: torcido, depravado
+        *   **Inedia, -ae**: falta de comida, ayuno
+        *   **Algor, -oris**: frío
+        *   **Vigilia, -ae**: falta de sueño, guardia
+        """)
+    
+    render_lesson_with_tabs(33, theory_content)
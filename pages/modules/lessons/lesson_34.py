@@ -0,0 +1,49 @@
+"""Lección 34: Catulo y Lírica"""
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_34():
+    def theory_content():
+        st.markdown("""
+        ## Lección 34: Catulo y la Lírica
+        
+        ### 1. C. Valerius Catullus (84-54 a.C.)
+        
+        Líder de los *Poetae Novi* (Neotéricos). Se alejó de la épica y la política para centrarse en **el arte por el arte** y los **sentimientos personales**.
+        """)
+        
+        st.image("static/images/curso_gramatica/leccion34_catulo.png",
+                 caption="Catulo y Lesbia: El Odio y el Amor",
+                 width="stretch")
+
+        st.markdown("""
+        ### 2. Estilo: Pasión y Erudición
+        
+        *   **Endecasílabo Falecio**: Su metro favorito (11 sílabas).
+        *   **Diminutivos**: Uso afectivo (*libellus, ocellus*).
+        *   **Coloquialismos**: Lenguaje de la calle mezclado con mitología griega.
+        *   **Lesbia**: Pseudónimo de su amada Clodia.
+        
+        ### 3. Texto: Odi et Amo (Carmen 85)
+        
+        Dos versos que resumen la complejidad del amor:
+        
+        > *Odi et amo. Quare id faciam, fortasse requiris.*
+        > *Nescio, sed fieri sentio et excrucior.*
+        
+        **Traducción**:
+        "Odio y amo. Por qué hago esto, quizás preguntas.
+        No lo sé, pero siento que sucede y me torturo."
+        
+        ### 4. Vocabulario de Autor
+        *   **Odi** (defectivo): odiar
+        *   **Requiro, -ere**: preguntar, buscar
+        *   **Fio, fieri**: suceder, hacerse
+        *   **Sentio, -ire**: sentir
+        *   **Excrucior, -ari**: ser torturado (crucificado)
+        """)
+    
+    render_lesson_with_tabs(34, theory_content)
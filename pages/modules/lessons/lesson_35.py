@@ -0,0 +1,49 @@
+"""Lección 35: Virgilio y Épica"""
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_35():
+    def theory_content():
+        st.markdown("""
+        ## Lección 35: Virgilio y la Épica
+        
+        ### 1. P. Vergilius Maro (70-19 a.C.)
+        
+        El poeta nacional de Roma. Su obra glorifica los orígenes míticos de Roma y la familia Julia (Augusto).
+        """)
+        
+        st.image("static/images/curso_gramatica/leccion35_virgilio.png",
+                 caption="Virgilio leyendo la Eneida a Augusto",
+                 width="stretch")
+
+        st.markdown("""
+        ### 2. Estilo: La Perfección del Hexámetro
+        
+        *   **Hexámetro Dactílico**: Virgilio llevó este metro a su máxima perfección y armonía.
+        *   **Pietas**: El tema central de Eneas, el deber hacia los dioses, la patria y la familia.
+        *   **Pathos**: Gran sensibilidad hacia el sufrimiento humano (las "lágrimas de las cosas").
+        
+        ### 3. Texto: La Eneida (I.1-3)
+        
+        El inicio de la gran epopeya romana:
+        
+        > *Arma virumque cano, Troiae qui primus ab oris*
+        > *Italiam, fato profugus, Laviniaque venit*
+        > *litora...*
+        
+        **Traducción**:
+        "Canto a las armas y al hombre que, el primero desde las costas de Troya,
+        llegó a Italia, prófugo por el destino, y a las costas de Lavinio..."
+        
+        ### 4. Vocabulario de Autor
+        *   **Cano, -ere, cecini**: cantar (poéticamente)
+        *   **Ora, -ae**: costa, orilla
+        *   **Fatum, -i**: destino, hado
+        *   **Profugus, -a, -um**: prófugo, fugitivo
+        *   **Litus, -oris**: playa, costa
+        """)
+    
+    render_lesson_with_tabs(35, theory_content)
@@ -0,0 +1,45 @@
+"""Lección 36: Horacio y Odas"""
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_36():
+    def theory_content():
+        st.markdown("""
+        ## Lección 36: Horacio y las Odas
+        
+        ### 1. Q. Horatius Flaccus (65-8 a.C.)
+        
+        Amigo de Virgilio y protegido de Mecenas. Es el maestro de la lírica reflexiva y la sátira.
+        """)
+        
+        st.image("static/images/curso_gramatica/leccion36_horacio.png",
+                 caption="Horacio: El Poeta del Carpe Diem",
+                 width="stretch")
+
+        st.markdown("""
+        ### 2. Estilo: *Curiosa Felicitas*
+        
+        *   **Curiosa Felicitas**: La "dicha cuidadosamente buscada". Perfección técnica que parece natural.
+        *   **Aurea Mediocritas**: El ideal del "dorado término medio", la moderación.
+        *   **Temas**: El paso del tiempo, el vino, la amistad, la vida sencilla.
+        
+        ### 3. Texto: Carpe Diem (Odas I.11)
+        
+        > *Carpe diem, quam minimum credula postero.*
+        
+        **Traducción**:
+        "Aprovecha el día, confiando lo menos posible en el mañana."
+        (Literalmente: "Cosecha el día...")
+        
+        ### 4. Vocabulario de Autor
+        *   **Carpo, -ere, carpsi**: arrancar, cosechar, aprovechar
+        *   **Credulus, -a, -um**: crédulo, confiado
+        *   **Posterus, -a, -um**: siguiente, futuro
+        *   **Aetas, -atis**: edad, tiempo, vida
+        *   **Fugio, -ere**: huir
+        """)
+    
+    render_lesson_with_tabs(36, theory_content)
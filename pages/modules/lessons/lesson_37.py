@@ -0,0 +1,46 @@
+"""Lección 37: Ovidio y Metamorfosis"""
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_37():
+    def theory_content():
+        st.markdown("""
+        ## Lección 37: Ovidio y la Mitología
+        
+        ### 1. P. Ovidius Naso (43 a.C. - 17 d.C.)
+        
+        El más joven de los elegíacos. Poeta del amor (*Amores*, *Ars Amatoria*) y de los mitos (*Metamorfosis*). Murió en el exilio.
+        """)
+        
+        st.image("static/images/curso_gramatica/leccion37_ovidio.png",
+                 caption="Ovidio: Las Metamorfosis",
+                 width="stretch")
+
+        st.markdown("""
+        ### 2. Estilo: Ingenio y Fluidez
+        
+        *   **Facilidad Versificadora**: "Todo lo que intentaba decir se convertía en verso".
+        *   **Narrativa Visual**: Sus descripciones son casi cinematográficas.
+        *   **Psicología Femenina**: Gran capacidad para retratar los sentimientos de sus heroínas (Heroidas).
+        
+        ### 3. Texto: Dafne y Apolo (Met. I.452)
+        
+        > *Primus amor Phoebi Daphne Peneia, quem non*
+        > *fors ignara dedit, sed saeva Cupidinis ira.*
+        
+        **Traducción**:
+        "El primer amor de Febo (Apolo) fue Dafne, hija de Peneo, el cual no
+        lo dio el azar ignorante, sino la ira cruel de Cupido."
+        
+        ### 4. Vocabulario de Autor
+        *   **Amor, -oris**: amor
+        *   **Ira, -ae**: ira
+        *   **Saevus, -a, -um**: cruel, fiero
+        *   **Fors, fortis**: suerte, azar
+        *   **Ignarus, -a, -um**: ignorante
+        """)
+    
+    render_lesson_with_tabs(37, theory_content)
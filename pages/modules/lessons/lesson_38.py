@@ -0,0 +1,40 @@
+"""Lección 38: Latín Medieval"""
+
+import os
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_38():
+    def theory_content():
+        st.markdown("""
+        ## Lección 38: Latín Medieval
+        
+        ### 1. Características Generales
+        
+        El latín medieval (aprox. 500-1400 d.C.) fue la lengua franca de la cultura, la iglesia y la universidad en Europa.
+        
+        *   **Simplificación Sintáctica**: Menos uso de oraciones subordinadas complejas; preferencia por *quod* + indicativo en lugar de AcI.
+        *   **Cambios Fonéticos**: *ae/oe* > *e* (caelum > celum).
+        *   **Vocabulario**: Influencia cristiana y germánica.
+        
+        ### 2. Texto: Dies Irae (Tomás de Celano, s. XIII)
+        
+        > *Dies irae, dies illa,*
+        > *Solvet saeclum in favilla,*
+        > *Teste David cum Sibylla.*
+        
+        **Traducción**:
+        "Día de ira, aquel día,
+        disolverá el mundo en cenizas,
+        como testigos David con la Sibila."
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion38_latin_medieval.png"):
+            st.image("static/images/curso_gramatica/leccion38_latin_medieval.png",
+                     caption="Manuscrito Medieval",
+                     width="stretch")
+    
+    render_lesson_with_tabs(38, theory_content)
@@ -0,0 +1,39 @@
+"""Lección 39: Latín Eclesiástico"""
+
+import os
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_39():
+    def theory_content():
+        st.markdown("""
+        ## Lección 39: Latín Eclesiástico
+        
+        ### 1. El Latín de la Iglesia
+        
+        Es la forma de latín usada en la liturgia católica. Se basa en el latín tardío y la Vulgata de San Jerónimo.
+        
+        *   **Pronunciación**: "Italianizante" (c ante e/i = ch; g ante e/i = y).
+        *   **Vocabulario**: Términos teológicos griegos latinizados (*ecclesia, angelus, baptisma*).
+        
+        ### 2. Texto: Pater Noster
+        
+        > *Pater noster, qui es in caelis,*
+        > *sanctificetur nomen tuum.*
+        > *Adveniat regnum tuum.*
+        
+        **Traducción**:
+        "Padre nuestro, que estás en los cielos,
+        santificado sea tu nombre.
+        Venga tu reino."
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion39_latin_eclesiastico.png"):
+            st.image("static/images/curso_gramatica/leccion39_latin_eclesiastico.png",
+                     caption="Latín Eclesiástico",
+                     width="stretch")
+    
+    render_lesson_with_tabs(39, theory_content)
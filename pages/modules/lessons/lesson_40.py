@@ -0,0 +1,42 @@
+"""Lección 40: Latín Renacentista"""
+
+import os
+
+import streamlit as st
+
+from pages.modules.course_view import render_lesson_with_tabs
+
+
+def render_lesson_40():
+    def theory_content():
+        st.markdown("""
+        ## Lección 40: Latín Renacentista y Científico
+        
+        ### 1. El Retorno a los Clásicos y la Ciencia
+        
+        En el Renacimiento, los humanistas intentaron volver al latín de Cicerón. Más tarde, el latín se convirtió en el idioma universal de la ciencia (Newton, Linneo, Descartes).
+        
+        *   **Neologismos**: Creación de palabras para conceptos nuevos (*microscopium, electricitas*).
+        *   **Estilo**: Preciso, lógico y descriptivo.
+        
+        ### 2. Texto: Descartes (Principia Philosophiae)
+        
+        > *Cogito, ergo sum.*
+        
+        **Traducción**:
+        "Pienso, luego existo."
+        
+        ### 3. Texto: Newton (Principia Mathematica)
+        
+        > *Hypotheses non fingo.*
+        
+        **Traducción**:
+        "No invento hipótesis."
+        """)
+        
+        if os.path.exists("static/images/curso_gramatica/leccion40_latin_renacentista.png"):
+            st.image("static/images/curso_gramatica/leccion40_latin_renacentista.png",
+                     caption="Latín Científico",
+                     width="stretch")
+    
+    render_lesson_with_tabs(40, theory_content)
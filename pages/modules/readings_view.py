@@ -5,9 +5,10 @@ import os
 
 
 from database.connection import get_session
-from database import Word, Text, TextWordLink, ReviewLog, UserProfile
+from database import Word, Text, TextWordLink, UserProfile
 from utils.text_analyzer import LatinTextAnalyzer
-from utils.text_cache import get_text_analysis_from_cache
+from utils.text_cache import get_text_analysis_snapshot
+from utils.reading_mastery import get_text_mastery, get_word_mastery_map
 from utils.i18n import get_text
 from utils.ui_helpers import load_css
 from sqlmodel import select
@@ -151,57 +152,24 @@ def add_interactive_text_css(font_size=1.3):
 
 def calculate_mastery(session, text_id):
     """Calculate mastery percentage for a text based on word reviews"""
-    links = session.exec(select(TextWordLink).where(TextWordLink.text_id == text_id)).all()
-    
-    if not links:
-        return 0
-    
-    known_words = 0
-    for link in links:
-        # Check if word has been reviewed with interval >= 3 days
-        latest_review = session.exec(
-            select(ReviewLog)
-            .where(ReviewLog.word_id == link.word_id)
-            .order_by(ReviewLog.review_date.desc())
-        ).first()
-        
-        if latest_review and latest_review.interval >= 3:
-            known_words += 1
-    
-    return int((known_words / len(links)) * 100)
+    return get_text_mastery(session).get(text_id, 0)
 
 def get_word_mastery(session, word_id):
     """Get mastery level for a specific word"""
-    latest_review = session.exec(
-        select(ReviewLog)
-        .where(ReviewLog.word_id == word_id)
-        .order_by(ReviewLog.review_date.desc())
-    ).first()
-    
-    if not latest_review:
-        return 0
-    
-    # Mastery based on interval
-    if latest_review.interval >= 7:
-        return 100
-    elif latest_review.interval >= 3:
-        return 70
-    elif latest_review.interval >= 1:
-        return 40
-    else:
-        return 20
+    return get_word_mastery_map(session).get(word_id, 0)
 
 def render_interactive_text(text_id: int, text_content: str, session):
     """Renderiza texto latino con tooltips hover para análisis morfológico"""
-    from utils.text_cache import get_text_analysis_from_cache
-    
-    # Intentar obtener análisis CLTK cacheado
-    analyzed_text = get_text_analysis_from_cache(session, text_id)
+    # Intentar obtener análisis CLTK cacheado (snapshot serializado del texto)
+    analyzed_text = get_text_analysis_snapshot(session, text_id, text_content)
     
     # Si no hay análisis CLTK, usar sistema actual con InflectedForm
     if not analyzed_text:
         analyzed_text = LatinTextAnalyzer.analyze_text(text_content, session)
     
+    # Maestría de todas las palabras del usuario (una consulta, cacheada)
+    word_mastery = get_word_mastery_map(session)
+    
     # Renderizar con tooltips hover - ESTILOS INLINE para forzar visualización
     html_parts = ['<div class="latin-text-container" style="font-size: 24px; line-height: 2.0; color: #1a1a1a; background: #fafafa; border-radius: 8px;"><p>']
     
@@ -245,7 +213,7 @@ def render_interactive_text(text_id: int, text_content: str, session):
             if lemma:
                 # Determinar color según maestría
                 if word_id:
-                    mastery = get_word_mastery(session, word_id)
+                    mastery = word_mastery.get(word_id, 0)
                     if mastery >= 70:
                         css_class = "word-known"
                     elif mastery >= 40:
@@ -364,7 +332,7 @@ def render_readings_content():
                     st.info("Corrige traducciones mientras lees.")
                     
                     # Get analysis data for the editor
-                    analysis_data = get_text_analysis_from_cache(session, selected_text.id)
+                    analysis_data = get_text_analysis_snapshot(session, selected_text.id, selected_text.content)
                     
                     if analysis_data:
                         # Filter valid words with IDs
@@ -499,6 +467,9 @@ def render_readings_content():
                 
                 tabs = st.tabs(["🌱 Básico (1-10)", "💎 Intermedio (11-20)", "🏆 Avanzado (21-30)"])
                 
+                # Maestría de todos los textos en una sola consulta agregada
+                text_mastery = get_text_mastery(session)
+                
                 for tab_idx, (tab, text_group) in enumerate(zip(tabs, [basic, intermediate, advanced])):
                     with tab:
                         if not text_group:
@@ -506,7 +477,7 @@ def render_readings_content():
                             continue
                         
                         for text in text_group:
-                            mastery = calculate_mastery(session, text.id)
+                            mastery = text_mastery.get(text.id, 0)
                             
                             with st.container():
                                 col1, col2, col3 = st.columns([5, 1, 1])
@@ -1,10 +1,12 @@
 import streamlit as st
 import json
 import pandas as pd
-from sqlalchemy.orm import selectinload
+from sqlalchemy import JSON, and_, case, cast, exists, func, or_
+from sqlalchemy.orm import defer, selectinload
 from sqlmodel import select
 from database.connection import get_session
 from database import SentenceAnalysis, SyntaxCategory, TokenAnnotation, SentenceStructure
+from utils.diagram_store import get_diagram_store
 from utils.ui_helpers import load_css
 from utils.auth_helpers import is_admin_authenticated, render_admin_login_compact
 
@@ -83,6 +85,210 @@ def undo_last_change():
         return False
 
 
+# --- Sentence browser queries ---
+
+SENTENCES_PER_PAGE = 10
+DEFAULT_CONSTRUCTIONS = ["ablative_absolute", "accusative_infinitive", "dative_possession"]
+AUTO_ANNOTATION_MARKER = "Generado automáticamente"
+
+# Light columns for the sentence list; dependency_json, syntax_roles and the
+# tree diagram (the largest ones) are loaded separately for the page shown
+LIST_COLUMNS = (
+    SentenceAnalysis.id,
+    SentenceAnalysis.latin_text,
+    SentenceAnalysis.spanish_translation,
+    SentenceAnalysis.complexity_level,
+    SentenceAnalysis.sentence_type,
+    SentenceAnalysis.source,
+    SentenceAnalysis.lesson_number,
+    SentenceAnalysis.constructions,
+    SentenceAnalysis.verified,
+)
+
+
+def _token_count_expr(session):
+    """Number of tokens in dependency_json, computed by the database (-1 if invalid JSON)."""
+    column = SentenceAnalysis.dependency_json
+    if session.get_bind().dialect.name == "postgresql":
+        return func.json_array_length(cast(column, JSON))
+    return case((func.json_valid(column) == 1, func.json_array_length(column)), else_=-1)
+
+
+def _annotation_count_expr():
+    return (
+        select(func.count(TokenAnnotation.id))
+        .where(TokenAnnotation.sentence_id == SentenceAnalysis.id)
+        .correlate(SentenceAnalysis)
+        .scalar_subquery()
+    )
+
+
+def sentence_conditions(session, min_level, max_level, sources=None, constructions=None,
+                        lesson_number=None, verified_only=False):
+    """
+    Build the WHERE conditions for the sentence browser.
+    
+    Args:
+        min_level, max_level: Complexity level range
+        sources: Source prefixes (substring match, any of them)
+        constructions: Constructions that must all be present
+        lesson_number: Lesson filter (None for all lessons)
+        verified_only: Only sentences verified or 100% annotated without auto-generated notes
+        
+    Returns:
+        list: SQLAlchemy conditions
+    """
+    conditions = [
+        SentenceAnalysis.complexity_level >= min_level,
+        SentenceAnalysis.complexity_level <= max_level,
+        SentenceAnalysis.dependency_json != "[]",
+    ]
+    if sources:
+        conditions.append(or_(*[
+            SentenceAnalysis.source.contains(src, autoescape=True) for src in sources
+        ]))
+    for construction in constructions or []:
+        conditions.append(SentenceAnalysis.constructions.contains(f'"{construction}"', autoescape=True))
+    if lesson_number is not None:
+        conditions.append(SentenceAnalysis.lesson_number == lesson_number)
+    if verified_only:
+        auto_generated = exists().where(
+            TokenAnnotation.sentence_id == SentenceAnalysis.id,
+            TokenAnnotation.explanation.contains(AUTO_ANNOTATION_MARKER, autoescape=True)
+        )
+        conditions.append(or_(
+            SentenceAnalysis.verified == True,
+            and_(_token_count_expr(session) == _annotation_count_expr(), ~auto_generated)
+        ))
+    return conditions
+
+
+def get_sentence_facets(session):
+    """
+    Count sentences per source prefix, complexity level and construction
+    with GROUP BY queries (no sentence rows are loaded).
+    
+    Returns:
+        dict: {'sources': {prefix: n}, 'levels': {level: n}, 'constructions': {name: n}}
+    """
+    analysed = SentenceAnalysis.dependency_json != "[]"
+    
+    sources = {}
+    for source, count in session.exec(
+        select(SentenceAnalysis.source, func.count(SentenceAnalysis.id))
+        .where(analysed).group_by(SentenceAnalysis.source)
+    ).all():
+        if source:
+            prefix = source.split('_')[0]
+            sources[prefix] = sources.get(prefix, 0) + count
+    
+    levels = dict(session.exec(
+        select(SentenceAnalysis.complexity_level, func.count(SentenceAnalysis.id))
+        .where(analysed).group_by(SentenceAnalysis.complexity_level)
+    ).all())
+    
+    # Few distinct JSON arrays: group by the raw value, then split in Python
+    constructions = {}
+    for raw, count in session.exec(
+        select(SentenceAnalysis.constructions, func.count(SentenceAnalysis.id))
+        .where(analysed, SentenceAnalysis.constructions != None)
+        .group_by(SentenceAnalysis.constructions)
+    ).all():
+        try:
+            names = set(json.loads(raw) or [])
+        except (TypeError, ValueError):
+            continue
+        for name in names:
+            constructions[name] = constructions.get(name, 0) + count
+    
+    return {'sources': sources, 'levels': levels, 'constructions': constructions}
+
+
+def count_sentences(session, conditions):
+    return session.exec(select(func.count(SentenceAnalysis.id)).where(*conditions)).one()
+
+
+def fetch_sentence_page(session, conditions, after_id=0, limit=SENTENCES_PER_PAGE):
+    """
+    Keyset pagination: the `limit` sentences with id > after_id.
+    
+    Only light columns are read, plus token/annotation counts and whether
+    a tree diagram exists, all computed by the database.
+    
+    Returns:
+        list: Sentence dicts ordered by id
+    """
+    rows = session.exec(
+        select(
+            *LIST_COLUMNS,
+            _token_count_expr(session).label('token_count'),
+            _annotation_count_expr().label('annotation_count'),
+            (SentenceAnalysis.tree_diagram_svg != None).label('has_inline_tree'),
+        )
+        .where(*conditions, SentenceAnalysis.id > after_id)
+        .order_by(SentenceAnalysis.id)
+        .limit(limit)
+    ).all()
+    return [dict(row._mapping) for row in rows]
+
+
+def load_sentence_details(session, sentence_ids):
+    """
+    Load dependency data and annotations for the sentences on the current page
+    (one query plus one per relationship); tree_diagram_svg stays deferred.
+    
+    Returns:
+        dict: sentence_id -> details dict
+    """
+    if not sentence_ids:
+        return {}
+    results = session.exec(
+        select(SentenceAnalysis).options(
+            defer(SentenceAnalysis.tree_diagram_svg),
+            selectinload(SentenceAnalysis.token_annotations),
+            selectinload(SentenceAnalysis.structures)
+        ).where(SentenceAnalysis.id.in_(sentence_ids))
+    ).all()
+    
+    details = {}
+    for s in results:
+        details[s.id] = {
+            'dependency_json': s.dependency_json,
+            'syntax_roles': s.syntax_roles,
+            'token_annotations': [
+                {
+                    'token_index': ann.token_index,
+                    'pedagogical_role': ann.pedagogical_role,
+                    'case_function': ann.case_function,
+                    'explanation': ann.explanation
+                }
+                for ann in s.token_annotations
+            ] if s.token_annotations else [],
+            'structures': [
+                {
+                    'clause_type': struct.clause_type,
+                    'notes': struct.notes
+                }
+                for struct in s.structures
+            ] if s.structures else []
+        }
+    return details
+
+
+def load_tree_diagram(sentence):
+    """
+    SVG tree of one sentence, on demand: from the content-addressed diagram
+    store (rendered and cached on first view), or the legacy inline column.
+    """
+    svg = get_diagram_store().get_or_render(sentence['dependency_json'])
+    if svg:
+        return svg
+    with get_session() as session:
+        return session.exec(
+            select(SentenceAnalysis.tree_diagram_svg).where(SentenceAnalysis.id == sentence['id'])
+        ).first()
+
+
 def render_content():
     
     # Custom CSS for syntax highlighting (roles en español)
@@ -171,16 +377,25 @@ def render_content():
     with st.sidebar:
         st.header("Filtros")
         
+        # Facets (aggregate counts, no sentence rows loaded)
+        with get_session() as session:
+            facets = get_sentence_facets(session)
+        
         # Level Filter
         min_level, max_level = st.slider("Nivel de Complejidad", 1, 10, (1, 10))
+        if facets['levels']:
+            st.caption(" · ".join(
+                f"N{level}: {count}" for level, count in sorted(facets['levels'].items())
+            ))
         
         # Source Filter
-        with get_session() as session:
-            sources = session.exec(select(SentenceAnalysis.source).distinct()).all()
-            # Clean sources for display
-            unique_sources = sorted(list(set([s.split('_')[0] for s in sources if s])))
+        source_counts = facets['sources']
+        unique_sources = sorted(source_counts)
         
-        selected_source = st.multiselect("Fuente", unique_sources, default=unique_sources)
+        selected_source = st.multiselect(
+            "Fuente", unique_sources, default=unique_sources,
+            format_func=lambda x: f"{x} ({source_counts[x]})"
+        )
         
         # Lesson Filter
         lesson_filter = st.selectbox(
@@ -191,10 +406,12 @@ def render_content():
         )
         
         # Construction Filter
-        constructions = [
-            "ablative_absolute", "accusative_infinitive", "dative_possession"
-        ]
-        selected_constructions = st.multiselect("Construcciones Especiales", constructions)
+        construction_counts = facets['constructions']
+        constructions = sorted(set(DEFAULT_CONSTRUCTIONS) | set(construction_counts))
+        selected_constructions = st.multiselect(
+            "Construcciones Especiales", constructions,
+            format_func=lambda x: f"{x} ({construction_counts.get(x, 0)})"
+        )
         
         
         st.markdown("---")
@@ -225,127 +442,24 @@ def render_content():
     
     # --- Main Content ---
     
-    def get_sentences(min_l, max_l, sources_list, constr_list, lesson_num):
-        with get_session() as session:
-            query = select(SentenceAnalysis).options(
-                selectinload(SentenceAnalysis.token_annotations),
-                selectinload(SentenceAnalysis.structures)
-            ).where(
-                SentenceAnalysis.complexity_level >= min_l,
-                SentenceAnalysis.complexity_level <= max_l
-            )
-            
-            # Filter for completeness (User Request)
-            # query = query.where(SentenceAnalysis.tree_diagram_svg != None) # Relaxed for manual seed
-            query = query.where(SentenceAnalysis.dependency_json != "[]")
-            
-            results = session.exec(query).all()
-            
-            # Filter in python for complex logic
-            filtered = []
-            for s in results:
-                # Source check
-                src_match = False
-                if not sources_list:
-                    src_match = True
-                else:
-                    for src in sources_list:
-                        if src in s.source:
-                            src_match = True
-                            break
-                
-                # Construction check
-                constr_match = True
-                if constr_list:
-                    if not s.constructions:
-                        constr_match = False
-                    else:
-                        s_constr = json.loads(s.constructions)
-                        for c in constr_list:
-                            if c not in s_constr:
-                                constr_match = False
-                                break
-                
-                if src_match and constr_match:
-                    # Lesson filter check
-                    lesson_match = True
-                    if lesson_filter != "Todas":
-                        if s.lesson_number != lesson_filter:
-                            lesson_match = False
-                    
-                    if lesson_match:
-                        # Convert to dict to avoid DetachedInstanceError
-                        sent_dict = {
-                        'id': s.id,
-                        'latin_text': s.latin_text,
-                        'spanish_translation': s.spanish_translation,
-                        'complexity_level': s.complexity_level,
-                        'sentence_type': s.sentence_type,
-                        'source': s.source,
-                        'lesson_number': s.lesson_number,
-                        'dependency_json': s.dependency_json,
-                        'syntax_roles': s.syntax_roles,
-                        'tree_diagram_svg': s.tree_diagram_svg,
-                        'constructions': s.constructions,
-                        'verified': getattr(s, 'verified', False),  # Add verified field safely
-                        'token_annotations': [
-                            {
-                                'token_index': ann.token_index,
-                                'pedagogical_role': ann.pedagogical_role,
-                                'case_function': ann.case_function,
-                                'explanation': ann.explanation
-                            }
-                            for ann in s.token_annotations
-                        ] if s.token_annotations else [],
-                        'structures': [
-                            {
-                                'clause_type': struct.clause_type,
-                                'notes': struct.notes
-                            }
-                            for struct in s.structures
-                        ] if s.structures else []
-                    }
-                    filtered.append(sent_dict)
-                    
-            return filtered
-    
-    def is_sentence_complete(sentence):
-        """Check if sentence is ready for public view (Verified)."""
-        # If explicitly marked as verified in DB (syntax checked), it's good.
-        if sentence.get('verified'):
-            return True
-
-        # Otherwise fall back to annotation completeness
-        try:
-            deps = json.loads(sentence['dependency_json'])
-            n_tokens = len(deps)
-            n_anns = len(sentence['token_annotations'])
-            
-            # 1. Coverage check
-            if n_tokens != n_anns:
-                return False
-                
-            # 2. Quality check (User Request: Strictness)
-            for ann in sentence['token_annotations']:
-                if ann['explanation'] and "Generado automáticamente" in ann['explanation']:
-                    return False
-                    
-            return True
-        except:
-            return False
+    verified_only = view_mode == "📚 Corpus Verificado"
     
-    # Apply View Mode Filter
-    raw_sentences = get_sentences(min_level, max_level, selected_source, selected_constructions, lesson_filter)
-    sentences = []
+    with get_session() as session:
+        conditions = sentence_conditions(
+            session, min_level, max_level,
+            sources=selected_source,
+            constructions=selected_constructions,
+            lesson_number=None if lesson_filter == "Todas" else lesson_filter,
+            verified_only=verified_only
+        )
+        total_sentences = count_sentences(session, conditions)
     
-    if view_mode == "📚 Corpus Verificado":
-        sentences = [s for s in raw_sentences if is_sentence_complete(s)]
-        st.success(f"Mostrando {len(sentences)} oraciones verificadas (syntax verified or 100% annotated)")
+    if verified_only:
+        st.success(f"Mostrando {total_sentences} oraciones verificadas (syntax verified or 100% annotated)")
     else:
         # Zona de Espera: Show ALL sentences matching filters, regardless of completeness
         # but mark them visually later
-        sentences = raw_sentences 
-        st.warning(f"Mostrando {len(sentences)} oraciones en zona de espera (incluye analizadas y pendientes)")
+        st.warning(f"Mostrando {total_sentences} oraciones en zona de espera (incluye analizadas y pendientes)")
     
     # --- Visualization Helpers ---
     
@@ -564,21 +678,38 @@ def render_content():
     
     # --- Display List ---
     
-    # Pagination
-    items_per_page = 10
-    if 'page_number' not in st.session_state:
+    # Pagination (keyset: syntax_page_cursors[i] is the last id before page i)
+    filter_key = (min_level, max_level, tuple(selected_source), tuple(selected_constructions), lesson_filter, view_mode)
+    if (st.session_state.get('syntax_filter_key') != filter_key
+            or len(st.session_state.get('syntax_page_cursors', [])) != st.session_state.get('page_number', 0) + 1):
+        st.session_state.syntax_filter_key = filter_key
+        st.session_state.syntax_page_cursors = [0]
         st.session_state.page_number = 0
     
-    total_pages = max(1, (len(sentences) + items_per_page - 1) // items_per_page)
+    total_pages = max(1, (total_sentences + SENTENCES_PER_PAGE - 1) // SENTENCES_PER_PAGE)
     current_page = st.session_state.page_number
     
+    with get_session() as session:
+        page_sentences = fetch_sentence_page(
+            session, conditions,
+            after_id=st.session_state.syntax_page_cursors[-1],
+            limit=SENTENCES_PER_PAGE + 1
+        )
+        has_next_page = len(page_sentences) > SENTENCES_PER_PAGE
+        page_sentences = page_sentences[:SENTENCES_PER_PAGE]
+        details = load_sentence_details(session, [sent['id'] for sent in page_sentences])
+    for sent in page_sentences:
+        sent.update(details.get(sent['id'], {}))
+    
     col_prev, col_page, col_next = st.columns([1, 2, 1])
     with col_prev:
         if st.button("⬅️ Anterior") and current_page > 0:
+            st.session_state.syntax_page_cursors.pop()
             st.session_state.page_number -= 1
             st.rerun()
     with col_next:
-        if st.button("Siguiente ➡️") and current_page < total_pages - 1:
+        if st.button("Siguiente ➡️") and has_next_page:
+            st.session_state.syntax_page_cursors.append(page_sentences[-1]['id'])
             st.session_state.page_number += 1
             st.rerun()
     with col_page:
@@ -633,18 +764,11 @@ def render_content():
     
     st.markdown("---")
     
-    start_idx = current_page * items_per_page
-    end_idx = start_idx + items_per_page
-    page_sentences = sentences[start_idx:end_idx]
-    
     for sent in page_sentences:
         # Calculate completeness for display
-        try:
-            total_tokens = len(json.loads(sent['dependency_json']))
-            annotated_tokens = len(sent['token_annotations'])
-            completeness_pct = int((annotated_tokens / total_tokens) * 100) if total_tokens > 0 else 0
-        except:
-            completeness_pct = 0
+        total_tokens = sent['token_count']
+        annotated_tokens = sent['annotation_count']
+        completeness_pct = int((annotated_tokens / total_tokens) * 100) if total_tokens > 0 else 0
             
         title_prefix = "✅" if completeness_pct == 100 else f"🚧 {completeness_pct}%"
         
@@ -680,14 +804,22 @@ def render_content():
                     st.info(f"**Traducción:** {sent['spanish_translation']}")
     
             with tabs[1]:
-                if sent['tree_diagram_svg']:
-                    # Envolver en un div con scroll horizontal para árboles grandes
-                    # Force white background for visibility in dark mode
-                    st.markdown(f"""
-                    <div style="overflow-x: auto; border: 1px solid #ddd; border-radius: 5px; padding: 10px; background-color: white;">
-                        {sent['tree_diagram_svg']}
-                    </div>
-                    """, unsafe_allow_html=True)
+                if sent['token_count'] > 0 or sent['has_inline_tree']:
+                    # The SVG is the largest payload: load (or render) it only when requested
+                    tree_key = f"show_tree_{sent['id']}"
+                    if st.session_state.get(tree_key) or st.button("🌲 Mostrar árbol", key=f"load_tree_{sent['id']}"):
+                        st.session_state[tree_key] = True
+                        tree_svg = load_tree_diagram(sent)
+                        if tree_svg:
+                            # Envolver en un div con scroll horizontal para árboles grandes
+                            # Force white background for visibility in dark mode
+                            st.markdown(f"""
+                            <div style="overflow-x: auto; border: 1px solid #ddd; border-radius: 5px; padding: 10px; background-color: white;">
+                                {tree_svg}
+                            </div>
+                            """, unsafe_allow_html=True)
+                        else:
+                            st.warning("Diagrama de árbol no disponible para esta oración.")
                 else:
                     st.warning("Diagrama de árbol no disponible para esta oración.")
     
@@ -6,15 +6,46 @@ from datetime import datetime, timedelta
 
 
 from database.connection import get_session
-from database import Word, ReviewLog, UserProfile, Text, TextWordLink, LessonVocabulary, UserProgressSummary
+from database import Word, ReviewState, UserProfile, TextWordLink, UserProgressSummary
 from sqlmodel import select
 from utils.i18n import get_text
-from utils.srs import calculate_next_review
+from utils.srs import (
+    record_review,
+    get_due_cards,
+    count_due_cards,
+    unreviewed_words_clause,
+    ensure_review_states
+)
 from utils.gamification import process_xp_gain
+from utils.content_catalog import get_content_catalog
 from utils.ui_helpers import load_css
 from utils.ui_components import render_flashcard
 import json
 
+# Tarjetas vencidas que se precargan por consulta
+SRS_PREFETCH_SIZE = 20
+
+
+def _next_due_word_id(session, queue_key, word_ids=None):
+    """
+    Siguiente tarjeta vencida de la cola precargada en session_state.
+    
+    La cola se rellena con una consulta indexada (get_due_cards) cuando se
+    vacía o cambia el modo/lección; el total de vencidas se cuenta a la vez.
+    """
+    if st.session_state.get('srs_queue_key') != queue_key:
+        st.session_state.srs_queue_key = queue_key
+        st.session_state.srs_queue = []
+        st.session_state.srs_due_count = None
+    
+    if not st.session_state.srs_queue:
+        st.session_state.srs_queue = get_due_cards(session, SRS_PREFETCH_SIZE, word_ids=word_ids)
+        st.session_state.srs_due_count = (
+            count_due_cards(session, word_ids=word_ids) if st.session_state.srs_queue else 0
+        )
+    
+    return st.session_state.srs_queue[0] if st.session_state.srs_queue else None
+
 
 def render_content():
     
@@ -48,7 +79,7 @@ def render_content():
         progress_summary = session.exec(select(UserProgressSummary).where(UserProgressSummary.user_id == 1)).first()
         current_lesson = progress_summary.current_lesson if progress_summary else 1
         
-        texts = session.exec(select(Text)).all()
+        texts = get_content_catalog().texts()
         
         # Banner contextual
         st.info(f"📚 **Estás en Lección {current_lesson}** | El vocabulario se filtrará automáticamente a menos que elijas otra opción.")
@@ -76,7 +107,7 @@ def render_content():
                 st.session_state.selected_lesson = lesson_filter
             elif mode == "text_prep":
                 if texts:
-                    text_options = {t.id: f"{t.title} ({t.author.name if t.author else 'Anónimo'})" for t in texts}
+                    text_options = {t.id: f"{t.title} ({t.author_name or 'Anónimo'})" for t in texts}
                     selected = st.selectbox(
                         "Selecciona un texto:",
                         options=list(text_options.keys()),
@@ -90,11 +121,9 @@ def render_content():
         with col3:
             if mode == "lesson":
                 # Mostrar progreso de vocabulario de la lección
-                lesson_vocab_links = session.exec(
-                    select(LessonVocabulary).where(LessonVocabulary.lesson_number == lesson_filter)
-                ).all()
-                if lesson_vocab_links:
-                    st.metric("Palabras", len(lesson_vocab_links))
+                lesson_vocab_ids = get_content_catalog().lesson_word_ids(lesson_filter)
+                if lesson_vocab_ids:
+                    st.metric("Palabras", len(lesson_vocab_ids))
                 else:
                     st.caption("Sin vocab asignado")
     
@@ -114,24 +143,15 @@ def render_content():
     # Define handle_review BEFORE using it
     def handle_review(session, word, quality):
         """Handle SRS review logic"""
-        # Get previous review for this word
-        previous_review = session.exec(
-            select(ReviewLog).where(ReviewLog.word_id == word.id).order_by(ReviewLog.review_date.desc())
-        ).first()
-        
-        # Calculate next review
-        result = calculate_next_review(quality, previous_review)
+        # Log the review and reschedule the word (ReviewState.due_at)
+        record_review(session, word.id, quality)
         
-        # Create new review log
-        new_review = ReviewLog(
-            word_id=word.id,
-            review_date=datetime.now(),
-            quality=quality,
-            ease_factor=result['ease_factor'],
-            interval=result['interval'],
-            repetitions=result['repetitions']
-        )
-        session.add(new_review)
+        # Drop it from the prefetched due queue
+        queue = st.session_state.get('srs_queue') or []
+        if word.id in queue:
+            queue.remove(word.id)
+            if st.session_state.get('srs_due_count'):
+                st.session_state.srs_due_count -= 1
         
         # Update user XP
         user = session.exec(select(UserProfile)).first()
@@ -163,36 +183,16 @@ def render_content():
             
             # --- WORD SELECTION LOGIC ---
             
-            # 1. Check for due reviews first (SRS)
-            due_word_ids = []
+            # 1. Due reviews come from the prefetched queue (indexed ReviewState.due_at)
+            ensure_review_states(session)
+            due_word_id = None
             
-            if st.session_state.study_mode in ["general", "lesson"]:
-                # Get the latest review for each word
-                all_reviews = session.exec(
-                    select(ReviewLog).order_by(ReviewLog.review_date.desc())
-                ).all()
-                
-                latest_reviews = {}
-                for review in all_reviews:
-                    if review.word_id not in latest_reviews:
-                        latest_reviews[review.word_id] = review
-                
-                # Find due words
-                now = datetime.utcnow()
-                for word_id, review in latest_reviews.items():
-                    next_review = review.review_date + timedelta(days=review.interval)
-                    if next_review <= now:
-                        due_word_ids.append(word_id)
-                        
             # 2. Select word
             
             # MODE: LESSON - Practice vocabulary from specific lesson
             if st.session_state.study_mode == "lesson":
                 lesson_num = st.session_state.get('selected_lesson', 1)
-                lesson_vocab_links = session.exec(
-                    select(LessonVocabulary).where(LessonVocabulary.lesson_number == lesson_num)
-                ).all()
-                lesson_word_ids = [link.word_id for link in lesson_vocab_links]
+                lesson_word_ids = list(get_content_catalog().lesson_word_ids(lesson_num))
                 
                 if not lesson_word_ids:
                     st.warning(f"⚠️ La Lección {lesson_num} no tiene vocabulario asignado aún.")
@@ -200,13 +200,18 @@ def render_content():
                     st.stop()
                 
                 # Priority 1: Due reviews from this lesson
-                lesson_due = [wid for wid in due_word_ids if wid in lesson_word_ids]
-                if lesson_due:
-                    st.info(f"📝 Tienes {len(lesson_due)} palabras de Lección {lesson_num} para repasar.")
-                    word = session.get(Word, random.choice(lesson_due))
+                due_word_id = _next_due_word_id(session, ("lesson", lesson_num), lesson_word_ids)
+                if due_word_id is not None:
+                    st.info(f"📝 Tienes {st.session_state.srs_due_count} palabras de Lección {lesson_num} para repasar.")
+                    word = session.get(Word, due_word_id)
                 else:
                     # Priority 2: New words from this lesson (not yet reviewed)
-                    reviewed_ids = list(latest_reviews.keys()) if 'latest_reviews' in locals() else []
+                    reviewed_ids = set(session.exec(
+                        select(ReviewState.word_id).where(
+                            ReviewState.user_id == 1,
+                            ReviewState.word_id.in_(lesson_word_ids)
+                        )
+                    ).all())
                     new_lesson_words = [wid for wid in lesson_word_ids if wid not in reviewed_ids]
                     
                     if new_lesson_words:
@@ -217,10 +222,12 @@ def render_content():
                         st.success(f"✅ ¡Has visto todas las palabras de Lección {lesson_num}!")
             
             # PRIORITY 1: Due Reviews (SRS) - Mode GENERAL
-            elif due_word_ids and st.session_state.study_mode == "general":
-                st.info(f"📝 Tienes {len(due_word_ids)} palabras para repasar hoy.")
-                word_id = random.choice(due_word_ids)
-                word = session.get(Word, word_id)
+            elif (
+                st.session_state.study_mode == "general"
+                and (due_word_id := _next_due_word_id(session, ("general",))) is not None
+            ):
+                st.info(f"📝 Tienes {st.session_state.srs_due_count} palabras para repasar hoy.")
+                word = session.get(Word, due_word_id)
                 
             # PRIORITY 2: New Words (if no reviews due) - Mode GENERAL
             elif st.session_state.study_mode == "general":
@@ -233,9 +240,7 @@ def render_content():
                 query = select(Word).where(Word.status == 'active')
                 
                 # Exclude words that have already been reviewed (and are not due)
-                reviewed_word_ids = list(latest_reviews.keys()) if 'latest_reviews' in locals() else []
-                if reviewed_word_ids:
-                    query = query.where(Word.id.not_in(reviewed_word_ids))
+                query = query.where(unreviewed_words_clause())
                 
                 if isinstance(priority_tier, int):
                     query = query.where(Word.frequency_rank_global <= priority_tier)
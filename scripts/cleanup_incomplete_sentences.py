@@ -12,7 +12,7 @@ def cleanup_incomplete_sentences():
     """
     Elimina oraciones que no cumplen con los criterios de calidad:
     1. Traducción faltante o vacía.
-    2. Diagrama SVG faltante o vacío.
+    2. Diagrama SVG faltante o vacío (sin SVG en línea ni árbol de dependencias).
     """
     with Session(engine) as session:
         # 1. Check for missing translations
@@ -24,9 +24,13 @@ def cleanup_incomplete_sentences():
         count_trans = len(results_trans)
         
         # 2. Check for missing SVG
+        # Diagrams are rendered on demand from dependency_json (utils/diagram_store.py),
+        # so a sentence only lacks one if it has neither inline SVG nor dependency tree
         statement_svg = select(SentenceAnalysis).where(
             (SentenceAnalysis.tree_diagram_svg == None) | 
-            (SentenceAnalysis.tree_diagram_svg == "")
+            (SentenceAnalysis.tree_diagram_svg == ""),
+            (SentenceAnalysis.dependency_json == None) |
+            (SentenceAnalysis.dependency_json.in_(["", "[]"]))
         )
         results_svg = session.exec(statement_svg).all()
         count_svg = len(results_svg)
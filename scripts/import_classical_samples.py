@@ -9,6 +9,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from database.connection import engine
 from database.syntax_models import SentenceAnalysis
+from utils.diagram_store import get_diagram_store
 from utils.syntax_analyzer import LatinSyntaxAnalyzer
 
 def import_classical_samples():
@@ -57,7 +58,7 @@ def import_classical_samples():
                 analysis.verified = True # We manually verified these
                 
                 # Validation
-                if not analysis.tree_diagram_svg or len(analysis.tree_diagram_svg) < 100:
+                if not get_diagram_store().get_or_render(analysis.dependency_json):
                     print(f"  [WARNING] SVG generation failed for: {latin_text[:30]}")
                     continue
                     
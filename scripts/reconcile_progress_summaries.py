@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Job periódico: reconcilia UserProgressSummary con agregados SQL
+
+Los eventos mantienen el resumen de forma incremental (utils/progress_tracker.py);
+este job corrige cualquier deriva. Programarlo, por ejemplo, a diario con cron:
+
+    python3 scripts/reconcile_progress_summaries.py --max-age-hours 24
+"""
+import sys
+import os
+
+# Añadir el directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import get_session
+from utils.progress_tracker import reconcile_all_summaries
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Reconcilia los resúmenes de progreso de los usuarios")
+    parser.add_argument("--max-age-hours", type=int, default=None,
+                        help="Solo resúmenes no reconciliados en estas horas (por defecto: todos)")
+    args = parser.parse_args()
+    
+    with get_session() as session:
+        count = reconcile_all_summaries(session, max_age_hours=args.max_age_hours)
+    
+    print(f"✅ Resúmenes reconciliados: {count}")
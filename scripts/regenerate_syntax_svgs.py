@@ -1,72 +1,140 @@
 #!/usr/bin/env python3
 """
-Script para regenerar todos los diagramas SVG de las oraciones con las nuevas traducciones
+Script para regenerar los diagramas SVG de las oraciones en el almacén de diagramas
+
+Los SVG se dibujan desde dependency_json (sin volver a pasar por spaCy) y se
+guardan comprimidos en utils/diagram_store.py, direccionados por el hash del
+árbol + DIAGRAM_STYLE_VERSION. Solo se dibujan los árboles que aún no están en
+el almacén (árbol nuevo o cambiado, o estilo nuevo); --force los redibuja todos.
 
 IMPORTANTE: Ejecutar desde el entorno virtual activado:
     source .venv/bin/activate  # o: . .venv/bin/activate
-    python3 scripts/regenerate_syntax_svgs.py
+    python3 scripts/regenerate_syntax_svgs.py [--workers 4] [--clear-inline] [--prune]
 """
 import sys
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 # Añadir el directorio raíz al path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from database.connection import get_session
 from database.syntax_models import SentenceAnalysis
+from sqlalchemy import update
 from sqlmodel import select
-from utils.syntax_analyzer import LatinSyntaxAnalyzer
-
-def regenerate_all_svgs():
-    """Regenera los SVG de todas las oraciones en la base de datos"""
-    
-    print("🔄 Inicializando analizador sintáctico...")
-    analyzer = LatinSyntaxAnalyzer("la_core_web_lg")
-    
+from utils.diagram_store import diagram_key, get_diagram_store, render_diagram
+
+# Oraciones por UPDATE al vaciar la columna en línea
+UPDATE_CHUNK = 500
+
+
+def regenerate_all_svgs(workers: int = None, force: bool = False, clear_inline: bool = False,
+                        prune: bool = False, chunk_size: int = 64):
+    """
+    Dibuja en paralelo los diagramas que faltan en el almacén
+
+    Args:
+        workers: Procesos de dibujo (None = núcleos disponibles, 1 = en serie)
+        force: Redibujar también los que ya están en el almacén
+        clear_inline: Vaciar SentenceAnalysis.tree_diagram_svg de las oraciones
+            cuyo diagrama ya está en el almacén
+        prune: Borrar del almacén los diagramas que ya no corresponden a ninguna oración
+        chunk_size: Árboles por tarea enviada a cada proceso
+    """
+    store = get_diagram_store()
+
+    # 1. Árboles actuales (solo id + dependency_json, sin cargar los SVG)
     with get_session() as session:
-        # Obtener todas las oraciones
-        query = select(SentenceAnalysis)
-        sentences = session.exec(query).all()
-        
-        total = len(sentences)
-        print(f"\n📊 Total de oraciones a procesar: {total}\n")
-        
-        updated = 0
-        errors = 0
-        
-        for i, sentence in enumerate(sentences, 1):
-            try:
-                # Regenerar el SVG usando el código actualizado
-                doc = analyzer.nlp(sentence.latin_text)
-                new_svg = analyzer._generate_tree_diagram(doc)
-                
-                if new_svg:
-                    sentence.tree_diagram_svg = new_svg
-                    updated += 1
-                    print(f"✅ [{i}/{total}] {sentence.latin_text[:50]}...")
+        rows = session.exec(select(SentenceAnalysis.id, SentenceAnalysis.dependency_json)).all()
+
+    sentence_keys = {}
+    trees = {}
+    for sentence_id, dependency_json in rows:
+        key = diagram_key(dependency_json)
+        if key is None:
+            continue
+        sentence_keys[sentence_id] = key
+        trees.setdefault(key, dependency_json)
+
+    existing = set() if force else store.existing_keys(trees)
+    pending = [key for key in trees if key not in existing]
+
+    print(f"\n📊 Oraciones: {len(rows)} | árboles distintos: {len(trees)} | "
+          f"ya en el almacén: {len(existing)} | por dibujar: {len(pending)}\n")
+
+    # 2. Dibujo en paralelo (displaCy es CPU puro: un proceso por núcleo)
+    rendered = 0
+    errors = 0
+    started = time.time()
+    if pending:
+        sources = [trees[key] for key in pending]
+        if workers == 1:
+            svgs = map(render_diagram, sources)
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            svgs = pool.map(render_diagram, sources, chunksize=chunk_size)
+
+        try:
+            batch = []
+            for i, (key, svg) in enumerate(zip(pending, svgs), 1):
+                if svg:
+                    batch.append((key, svg))
                 else:
-                    print(f"⚠️  [{i}/{total}] No se pudo generar SVG para: {sentence.latin_text[:50]}")
                     errors += 1
-                    
-            except Exception as e:
-                print(f"❌ [{i}/{total}] Error procesando '{sentence.latin_text[:50]}': {e}")
-                errors += 1
-        
-        # Guardar cambios
-        print(f"\n💾 Guardando cambios en la base de datos...")
-        session.commit()
-        
-        print(f"\n✨ Proceso completado:")
-        print(f"   - SVG actualizados: {updated}")
-        print(f"   - Errores: {errors}")
-        print(f"   - Total: {total}")
-        
-        if updated > 0:
-            print(f"\n✅ Los árboles de dependencias ahora muestran términos en español con arcos rectos.")
+                if len(batch) >= chunk_size or i == len(pending):
+                    rendered += store.put_many(batch)
+                    batch = []
+                    print(f"✅ [{i}/{len(pending)}] diagramas dibujados", end="\r")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        print()
+
+    # 3. Limpieza del almacén
+    pruned = store.prune(sentence_keys.values()) if prune else 0
+
+    # 4. Vaciar la columna en línea de las oraciones ya cubiertas por el almacén
+    cleared = 0
+    if clear_inline:
+        stored = store.existing_keys(trees)
+        ids = [sentence_id for sentence_id, key in sentence_keys.items() if key in stored]
+        with get_session() as session:
+            for start in range(0, len(ids), UPDATE_CHUNK):
+                result = session.exec(
+                    update(SentenceAnalysis)
+                    .where(SentenceAnalysis.id.in_(ids[start:start + UPDATE_CHUNK]))
+                    .where(SentenceAnalysis.tree_diagram_svg != None)
+                    .values(tree_diagram_svg=None)
+                )
+                cleared += result.rowcount
+            session.commit()
+
+    stats = store.get_stats()
+    print(f"\n✨ Proceso completado en {time.time() - started:.1f}s:")
+    print(f"   - SVG dibujados: {rendered}")
+    print(f"   - Errores: {errors}")
+    if prune:
+        print(f"   - Diagramas obsoletos borrados: {pruned}")
+    if clear_inline:
+        print(f"   - SVG en línea vaciados: {cleared}")
+    print(f"   - Almacén: {stats['disk_entries']} diagramas, "
+          f"{(stats['disk_compressed_bytes'] or 0) / 1024:.0f} KB comprimidos "
+          f"({(stats['disk_bytes'] or 0) / 1024:.0f} KB sin comprimir)")
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Regenera los diagramas SVG de SentenceAnalysis en el almacén de diagramas")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos de dibujo (por defecto, uno por núcleo)")
+    parser.add_argument("--force", action="store_true", help="Redibujar también los diagramas ya guardados")
+    parser.add_argument("--clear-inline", action="store_true", help="Vaciar tree_diagram_svg de las oraciones ya guardadas en el almacén")
+    parser.add_argument("--prune", action="store_true", help="Borrar diagramas que ya no usa ninguna oración")
+    args = parser.parse_args()
+
     try:
-        regenerate_all_svgs()
+        regenerate_all_svgs(workers=args.workers, force=args.force, clear_inline=args.clear_inline, prune=args.prune)
     except KeyboardInterrupt:
         print("\n\n⚠️  Proceso interrumpido por el usuario.")
         sys.exit(1)
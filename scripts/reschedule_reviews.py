@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Recalcula la programación SRS de todas las palabras desde ReviewLog
+
+Útil tras cambiar los parámetros de SM-2 o importar revisiones:
+
+    python3 scripts/reschedule_reviews.py
+    python3 scripts/reschedule_reviews.py --update-logs --second-interval 4
+    python3 scripts/reschedule_reviews.py --dry-run --simulate-days 30
+"""
+import sys
+import os
+
+# Añadir el directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from database.connection import get_session
+from utils.srs import SM2Parameters
+from utils.srs_batch import reschedule_reviews, simulate_user_workload
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    defaults = SM2Parameters()
+    parser = argparse.ArgumentParser(description="Recalcula ReviewState a partir del historial de ReviewLog")
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--update-logs", action="store_true",
+                        help="Reescribir también ease_factor/interval/repetitions de ReviewLog")
+    parser.add_argument("--dry-run", action="store_true", help="No guardar cambios")
+    parser.add_argument("--simulate-days", type=int, default=0,
+                        help="Mostrar la carga de repasos prevista para estos días")
+    parser.add_argument("--initial-ease", type=float, default=defaults.initial_ease)
+    parser.add_argument("--min-ease", type=float, default=defaults.min_ease)
+    parser.add_argument("--first-interval", type=int, default=defaults.first_interval)
+    parser.add_argument("--second-interval", type=int, default=defaults.second_interval)
+    parser.add_argument("--fail-interval", type=int, default=defaults.fail_interval)
+    args = parser.parse_args()
+    
+    params = SM2Parameters(
+        initial_ease=args.initial_ease,
+        min_ease=args.min_ease,
+        first_interval=args.first_interval,
+        second_interval=args.second_interval,
+        fail_interval=args.fail_interval,
+    )
+    
+    with get_session() as session:
+        start = time.time()
+        stats = reschedule_reviews(session, params, user_id=args.user_id, update_logs=args.update_logs)
+        elapsed = time.time() - start
+        
+        print(f"✅ {stats['reviews']} revisiones reprocesadas, {stats['words']} palabras reprogramadas ({elapsed:.2f}s)")
+        
+        if args.simulate_days:
+            workload = simulate_user_workload(session, args.user_id, days=args.simulate_days, params=params)
+            print("\n📅 Repasos previstos por día:")
+            for day, count in enumerate(workload):
+                print(f"   +{day:>3}d  {count}")
+        
+        if args.dry_run:
+            session.rollback()
+            print("\n(dry-run: cambios descartados)")
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Script para auditar las imágenes de lecciones en Lingua Latina Viva.
-Identifica imágenes referenciadas en course_view.py que no existen físicamente.
+Identifica imágenes referenciadas en course_view.py y en las lecciones
+(pages/modules/lessons/) que no existen físicamente.
 """
 
 import os
@@ -11,6 +12,7 @@ from pathlib import Path
 # Directorio base del proyecto
 BASE_DIR = Path(__file__).parent
 COURSE_VIEW_FILE = BASE_DIR / "pages" / "modules" / "course_view.py"
+LESSONS_DIR = BASE_DIR / "pages" / "modules" / "lessons"
 
 def extract_image_paths(file_path):
     """Extrae todas las rutas de imágenes del archivo course_view.py"""
@@ -43,6 +45,8 @@ def main():
     
     # Extraer rutas de imágenes
     image_paths = extract_image_paths(COURSE_VIEW_FILE)
+    for lesson_file in sorted(LESSONS_DIR.glob("*.py")):
+        image_paths.extend(extract_image_paths(lesson_file))
     print(f"Total de referencias a imágenes encontradas: {len(image_paths)}")
     print()
     
@@ -157,7 +157,10 @@ def cmd_process_batch(args):
         input_path,
         source,
         format=format,
-        progress_callback=progress_cb if not args.json else None
+        progress_callback=progress_cb if not args.json else None,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        checkpoint_dir=args.checkpoint_dir
     )
     
     print()  # Nueva línea después del progreso
@@ -370,6 +373,9 @@ Ejemplos:
     p_process.add_argument('--period', help='Período (clásico, post-clásico, etc.)')
     p_process.add_argument('--genre', help='Género')
     p_process.add_argument('--output', help='Archivo de salida para reporte')
+    p_process.add_argument('--workers', type=int, default=1, help='Procesos en paralelo (cada uno con su analizador)')
+    p_process.add_argument('--chunk-size', type=int, default=10, help='Textos por fragmento de trabajo')
+    p_process.add_argument('--checkpoint-dir', help='Directorio de checkpoint para reanudar lotes interrumpidos')
     p_process.add_argument('--json', action='store_true', help='Output en JSON')
     p_process.set_defaults(func=cmd_process_batch)
     
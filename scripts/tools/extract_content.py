@@ -1,12 +1,16 @@
 import re
 import os
+import glob
 
 def extract_lessons():
-    source_file = "pages/modules/course_view.py"
+    # Cada lección vive en su propio módulo (pages/modules/lessons/lesson_NN.py)
+    source_files = sorted(glob.glob("pages/modules/lessons/lesson_*.py"))
     output_file = "full_course_content.md"
     
-    with open(source_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = ""
+    for source_file in source_files:
+        with open(source_file, "r", encoding="utf-8") as f:
+            content += f.read() + "\n"
 
     # Find all render_lesson_X functions
     # Pattern looks for def render_lesson_(\d+): ... st.markdown("""(.*?)""")
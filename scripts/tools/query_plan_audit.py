@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+AUDITORÍA DE PLANES DE CONSULTA - Lingua Latina Viva
+
+Ejecuta las consultas calientes de la aplicación bajo EXPLAIN QUERY PLAN
+(SQLite) y marca los recorridos completos de tabla ("SCAN tabla" sin índice)
+y las ordenaciones en B-tree temporal, para detectar regresiones de índices
+a medida que crecen las tablas.
+
+Dos fuentes de consultas:
+- El catálogo integrado HOT_QUERIES (las mismas consultas que usan
+  text_cache, reading_service, readings_view, unlock_service, etc.).
+- Un fichero JSONL capturado de la app real con QUERY_CAPTURE_FILE
+  (ver database/connection.py), con --replay.
+
+Uso:
+    python scripts/tools/query_plan_audit.py                 # BD configurada
+    python scripts/tools/query_plan_audit.py --fresh         # esquema vacío en memoria
+    QUERY_CAPTURE_FILE=queries.jsonl streamlit run app.py    # capturar
+    python scripts/tools/query_plan_audit.py --replay queries.jsonl
+
+Sale con código 1 si alguna consulta filtrada recorre una tabla completa.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel, select
+
+from database import (
+    ExerciseAttempt,
+    InflectedForm,
+    LessonVocabulary,
+    ReviewLog,
+    TextWordLink,
+    UserVocabularyProgress,
+    Word,
+)
+
+# Recorrido completo: "SCAN tabla" (sin "USING ... INDEX")
+FULL_SCAN_PATTERN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?!.*USING)")
+TEMP_SORT_PATTERN = re.compile(r"USE TEMP B-TREE FOR (ORDER BY|GROUP BY|DISTINCT)")
+
+
+# ============================================================================
+# CATÁLOGO DE CONSULTAS CALIENTES
+# ============================================================================
+
+HOT_QUERIES: List[Tuple[str, Callable[[], Any]]] = [
+    ("text_cache: enlaces de un texto + Word", lambda: (
+        select(TextWordLink.form, TextWordLink.word_id, Word.latin, Word.translation)
+        .outerjoin(Word, Word.id == TextWordLink.word_id)
+        .where(TextWordLink.text_id == 1)
+        .order_by(TextWordLink.sentence_number, TextWordLink.position_in_sentence)
+    )),
+    ("reading_service: enlaces con palabra de un texto", lambda: (
+        select(TextWordLink, Word)
+        .join(Word, TextWordLink.word_id == Word.id)
+        .where(TextWordLink.text_id == 1)
+        .order_by(TextWordLink.sentence_number, TextWordLink.position_in_sentence)
+    )),
+    ("text_snapshots: textos que enlazan unas palabras", lambda: (
+        select(TextWordLink.text_id).where(TextWordLink.word_id.in_([1, 2, 3])).distinct()
+    )),
+    ("readings_view: última revisión de una palabra", lambda: (
+        select(ReviewLog).where(ReviewLog.word_id == 1).order_by(ReviewLog.review_date.desc()).limit(1)
+    )),
+    ("unlock_service: intentos de una lección", lambda: (
+        select(ExerciseAttempt).where(ExerciseAttempt.user_id == 1, ExerciseAttempt.lesson_number == 1)
+    )),
+    ("unlock_service: vocabulario esencial de una lección", lambda: (
+        select(LessonVocabulary).where(
+            LessonVocabulary.lesson_number == 1, LessonVocabulary.is_essential == True  # noqa: E712
+        )
+    )),
+    ("unlock_service: progreso de usuario en una palabra", lambda: (
+        select(UserVocabularyProgress).where(
+            UserVocabularyProgress.user_id == 1, UserVocabularyProgress.word_id == 1
+        )
+    )),
+    ("recommendation_service: palabras vencidas", lambda: (
+        select(UserVocabularyProgress)
+        .where(
+            UserVocabularyProgress.user_id == 1,
+            UserVocabularyProgress.next_review_date <= datetime(2030, 1, 1),
+        )
+        .order_by(UserVocabularyProgress.next_review_date)
+    )),
+    ("unlock_service: vocabulario reciente por lección", lambda: (
+        select(UserVocabularyProgress, LessonVocabulary.lesson_number)
+        .join(LessonVocabulary, UserVocabularyProgress.word_id == LessonVocabulary.word_id)
+        .where(UserVocabularyProgress.user_id == 1)
+    )),
+    ("text_analyzer: formas flexionadas (IN)", lambda: (
+        select(InflectedForm.normalized_form, InflectedForm.word_id)
+        .where(InflectedForm.normalized_form.in_(["rosa", "rosam"]))
+    )),
+]
+
+
+# ============================================================================
+# EXPLAIN QUERY PLAN
+# ============================================================================
+
+def compile_statement(statement, engine: Engine) -> Tuple[str, Any]:
+    """Compila una sentencia SQLAlchemy a (sql, parámetros posicionales)"""
+    compiled = statement.compile(dialect=engine.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.construct_params()
+    # Para el plan solo importa la forma de la consulta: fechas como texto ISO
+    params = {k: str(v) if isinstance(v, datetime) else v for k, v in params.items()}
+    if compiled.positiontup:
+        return str(compiled), tuple(params[name] for name in compiled.positiontup)
+    return str(compiled), params
+
+
+def explain(engine: Engine, sql: str, params: Any) -> List[str]:
+    """Devuelve las líneas de detalle de EXPLAIN QUERY PLAN"""
+    if isinstance(params, list):
+        params = tuple(params)
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params or ()).fetchall()
+    return [row[-1] for row in rows]
+
+
+def audit_query(engine: Engine, name: str, sql: str, params: Any, ignore_tables=()) -> Dict[str, Any]:
+    """Analiza el plan de una consulta y clasifica sus problemas"""
+    result: Dict[str, Any] = {"name": name, "sql": " ".join(sql.split()), "plan": [], "full_scans": [], "temp_sorts": []}
+    try:
+        result["plan"] = explain(engine, sql, params)
+    except Exception as e:
+        result["error"] = str(e)
+        return result
+
+    # Los listados sin filtro recorren la tabla por diseño
+    filtered = re.search(r"\bWHERE\b", sql, re.IGNORECASE) is not None
+    for detail in result["plan"]:
+        scan = FULL_SCAN_PATTERN.match(detail)
+        if (
+            scan and filtered
+            and scan.group(1) not in ignore_tables
+            and not scan.group(1).startswith("sqlite_")
+            and scan.group(1) != "CONSTANT"
+        ):
+            result["full_scans"].append(detail)
+        sort = TEMP_SORT_PATTERN.search(detail)
+        if sort:
+            result["temp_sorts"].append(detail)
+    return result
+
+
+def load_replay(path: str) -> List[Tuple[str, str, Any]]:
+    """Lee un fichero JSONL capturado con QUERY_CAPTURE_FILE"""
+    queries = []
+    with open(path, encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            queries.append((f"captured #{line_num}", entry["sql"], entry.get("params")))
+    return queries
+
+
+def run_audit(engine: Engine, replay: Optional[str] = None, ignore_tables=()) -> List[Dict[str, Any]]:
+    """Ejecuta la auditoría sobre el catálogo integrado o sobre un fichero capturado"""
+    if replay:
+        queries = load_replay(replay)
+    else:
+        queries = []
+        for name, build in HOT_QUERIES:
+            sql, params = compile_statement(build(), engine)
+            queries.append((name, sql, params))
+
+    return [audit_query(engine, name, sql, params, ignore_tables) for name, sql, params in queries]
+
+
+def print_report(results: List[Dict[str, Any]]) -> None:
+    for result in results:
+        if result.get("error"):
+            status = "⚠️ "
+        elif result["full_scans"]:
+            status = "❌"
+        elif result["temp_sorts"]:
+            status = "🟡"
+        else:
+            status = "✅"
+        print(f"{status} {result['name']}")
+        for detail in result["plan"]:
+            print(f"      {detail}")
+        if result.get("error"):
+            print(f"      error: {result['error']}")
+
+    scans = sum(1 for r in results if r["full_scans"])
+    sorts = sum(1 for r in results if r["temp_sorts"])
+    print(f"\n📊 {len(results)} consultas | {scans} con recorrido completo | {sorts} con ordenación temporal")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Auditoría EXPLAIN QUERY PLAN de las consultas calientes")
+    parser.add_argument("--replay", help="Fichero JSONL capturado con QUERY_CAPTURE_FILE")
+    parser.add_argument("--fresh", action="store_true", help="Auditar un esquema vacío en memoria creado desde los modelos")
+    parser.add_argument("--ignore-table", action="append", default=[], help="Tabla pequeña cuyos recorridos se aceptan")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    args = parser.parse_args()
+
+    if args.fresh:
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+    else:
+        from database.connection import engine
+
+    if engine.dialect.name != "sqlite":
+        print("❌ EXPLAIN QUERY PLAN solo está soportado para SQLite")
+        sys.exit(2)
+
+    results = run_audit(engine, replay=args.replay, ignore_tables=set(args.ignore_table))
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print_report(results)
+
+    sys.exit(1 if any(r["full_scans"] for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
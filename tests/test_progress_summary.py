@@ -0,0 +1,117 @@
+"""
+El resumen incremental (UserProgressSummary) debe coincidir con la
+reconciliación por agregados SQL cuando se mezclan desbloqueos de
+vocabulario y prácticas.
+
+Ejecutar: python -m pytest tests/test_progress_summary.py
+"""
+
+import pytest
+from sqlmodel import SQLModel, Session, create_engine
+
+from database import LessonVocabulary, UserProgressSummary, Word
+from utils import progress_tracker
+from utils.progress_service import record_exercise_attempt, record_lesson_view
+from utils.progress_tracker import record_vocabulary_practice, update_user_summary
+from utils.reading_service import ReadingService
+from utils.unlock_service import auto_unlock_check, unlock_vocabulary_for_lesson
+
+USER_ID = 1
+
+# Campos del resumen que mantiene el camino incremental
+SUMMARY_FIELDS = (
+    "vocab_words_total",
+    "vocab_mastery_sum",
+    "vocab_mastery_avg",
+    "total_words_learned",
+    "total_words_mastered",
+    "exercises_completed_total",
+    "exercises_correct_total",
+    "texts_read_total",
+    "lessons_in_progress",
+)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        # Lecciones 1-3 con cuatro palabras cada una
+        for lesson_number in (1, 2, 3):
+            for i in range(4):
+                word = Word(latin=f"verbum{lesson_number}{i}", translation="palabra", part_of_speech="noun")
+                session.add(word)
+                session.flush()
+                session.add(LessonVocabulary(lesson_number=lesson_number, word_id=word.id))
+        session.commit()
+        # Resumen ya reconciliado: los eventos siguientes aplican deltas
+        update_user_summary(session, USER_ID)
+        yield session
+
+
+def _summary_values(session):
+    summary = session.get(UserProgressSummary, USER_ID)
+    return {field: getattr(summary, field) for field in SUMMARY_FIELDS}
+
+
+def _reconciled_values(session):
+    summary = session.get(UserProgressSummary, USER_ID)
+    progress_tracker._reconcile(session, summary)
+    return {field: getattr(summary, field) for field in SUMMARY_FIELDS}
+
+
+def test_unlock_and_practice_match_reconcile(session):
+    lesson_one = [lv.word_id for lv in session.query(LessonVocabulary).filter_by(lesson_number=1)]
+    lesson_three = [lv.word_id for lv in session.query(LessonVocabulary).filter_by(lesson_number=3)]
+
+    # Práctica de una palabra aún no desbloqueada
+    record_vocabulary_practice(session, USER_ID, lesson_three[0], was_correct=True)
+
+    # Desbloqueo explícito y primera práctica de palabras desbloqueadas (times_seen == 0)
+    assert unlock_vocabulary_for_lesson(session, USER_ID, 1) == 4
+    record_vocabulary_practice(session, USER_ID, lesson_one[0], was_correct=True)
+    record_vocabulary_practice(session, USER_ID, lesson_one[1], was_correct=False)
+
+    # Desbloqueo automático (lecciones 1-2; la 1 ya está desbloqueada)
+    unlocked = auto_unlock_check(session, USER_ID)
+    assert unlocked["vocabulary"] == ["vocab_l2"]
+    record_vocabulary_practice(session, USER_ID, lesson_one[0], was_correct=True)
+    record_vocabulary_practice(session, USER_ID, lesson_one[2], was_correct=True)
+
+    incremental = _summary_values(session)
+    reconciled = _reconciled_values(session)
+
+    assert incremental["vocab_words_total"] == 9
+    assert incremental == pytest.approx(reconciled)
+
+
+def test_unlock_on_stale_summary_is_counted_once(session):
+    summary = session.get(UserProgressSummary, USER_ID)
+    summary.reconciled_at = None
+    session.commit()
+
+    # El resumen se reconcilia dentro del desbloqueo: las filas nuevas no se suman dos veces
+    unlock_vocabulary_for_lesson(session, USER_ID, 2)
+
+    assert _summary_values(session)["vocab_words_total"] == 4
+    assert _summary_values(session) == pytest.approx(_reconciled_values(session))
+
+
+def test_service_writes_keep_summary_in_sync(session):
+    # Progreso escrito por servicios fuera de progress_tracker
+    record_exercise_attempt(session, USER_ID, 1, "mc", is_correct=True)
+    record_exercise_attempt(session, USER_ID, 1, "mc", is_correct=False)
+    record_lesson_view(session, USER_ID, 2)
+    ReadingService(session).mark_reading_as_completed(USER_ID, text_id=1)
+    
+    # Práctica de una palabra (las vistas de ejercicios pasan por el tracker)
+    word_id = session.query(LessonVocabulary).filter_by(lesson_number=3).first().word_id
+    record_vocabulary_practice(session, USER_ID, word_id, was_correct=True)
+    record_vocabulary_practice(session, USER_ID, word_id, was_correct=False)
+    
+    incremental = _summary_values(session)
+    
+    assert incremental["exercises_completed_total"] == 2
+    assert incremental["texts_read_total"] == 1
+    assert incremental == pytest.approx(_reconciled_values(session))
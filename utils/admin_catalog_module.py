@@ -211,12 +211,37 @@ class CatalogAdminModule:
             
             conn.commit()
             conn.close()
+            
+            # sqlite3 directo: los listeners de sesión no ven estas filas
+            self._invalidate_caches(results)
         
         except Exception as e:
             results['errors'].append(f"Error crítico: {e}")
         
         return results
     
+    def _invalidate_caches(self, results: Dict[str, Any]):
+        """Invalida las cachés del proceso afectadas por la importación"""
+        try:
+            from utils.content_catalog import invalidate_content_catalog, WORDS, TEXTS
+            
+            kinds = []
+            if results['vocab_imported']:
+                from utils.dictionary_search import get_search_index
+                from utils.morphology_index import invalidate_morphology_index
+                from utils.similarity_index import invalidate_similarity_indexes
+                
+                kinds.append(WORDS)
+                get_search_index().mark_bulk_insert()
+                invalidate_similarity_indexes()
+                invalidate_morphology_index()
+            if results['sent_imported']:
+                kinds.append(TEXTS)
+            if kinds:
+                invalidate_content_catalog(kinds)
+        except Exception as e:
+            logger.warning(f"No se pudieron invalidar las cachés tras la importación: {e}")
+    
     def render(self, section: str) -> bool:
         """
         Renderiza el módulo si está disponible
@@ -19,6 +19,12 @@ from enum import Enum
 from sqlmodel import select
 from database.connection import get_session
 from database import Word, Text, SentenceAnalysis
+from utils.similarity_index import (
+    SENTENCE_SIMILARITY_THRESHOLD,
+    WORD_SIMILARITY_THRESHOLD,
+    get_sentence_similarity_index,
+    get_word_similarity_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -148,31 +154,30 @@ class DuplicateValidator:
                             'pos': match.part_of_speech,
                         })
                 
-                # Búsqueda de similares (si no es strict)
+                # Búsqueda de similares (si no es strict), vía índice de trigramas
                 if not strict and not duplicates:
-                    # Buscar variaciones de la palabra base
-                    from difflib import SequenceMatcher
+                    index = get_word_similarity_index(session)
+                    matches = index.search(latin_word, WORD_SIMILARITY_THRESHOLD)
+                    words = {
+                        word.id: word
+                        for word in session.exec(
+                            select(Word).where(Word.id.in_([word_id for word_id, _ in matches]))
+                        ).all()
+                    } if matches else {}
                     
-                    all_words = session.exec(select(Word)).all()
-                    similar_threshold = 0.85
-                    
-                    for word in all_words:
-                        similarity = SequenceMatcher(
-                            None,
-                            latin_word.lower(),
-                            word.latin.lower()
-                        ).ratio()
-                        
-                        if similarity > similar_threshold:
-                            duplicates.append({
-                                'id': word.id,
-                                'type': 'similar',
-                                'similarity': round(similarity, 2),
-                                'latin': word.latin,
-                                'translation': word.translation,
-                                'level': word.level,
-                                'pos': word.part_of_speech,
-                            })
+                    for word_id, similarity in matches:
+                        word = words.get(word_id)
+                        if word is None:
+                            continue
+                        duplicates.append({
+                            'id': word.id,
+                            'type': 'similar',
+                            'similarity': round(similarity, 2),
+                            'latin': word.latin,
+                            'translation': word.translation,
+                            'level': word.level,
+                            'pos': word.part_of_speech,
+                        })
         
         except Exception as e:
             logger.error(f"Error checking vocabulary duplicates: {e}")
@@ -183,7 +188,8 @@ class DuplicateValidator:
     @staticmethod
     def check_sentence_duplicate(
         latin_text: str,
-        translation: str = None
+        translation: str = None,
+        strict: bool = True
     ) -> Tuple[bool, List[Dict[str, Any]]]:
         """
         Detecta duplicados de oraciones
@@ -191,6 +197,7 @@ class DuplicateValidator:
         Args:
             latin_text: Texto de la oración en latín
             translation: Traducción (opcional)
+            strict: Si True, busca coincidencias exactas. Si False, también casi duplicados (MinHash)
         
         Returns:
             (es_duplicado, lista_de_duplicados)
@@ -217,6 +224,32 @@ class DuplicateValidator:
                             'spanish_translation': match.spanish_translation,
                             'difficulty': match.complexity_level,
                         })
+                
+                # Casi duplicados (si no es strict), vía índice MinHash
+                if not strict and not duplicates:
+                    index = get_sentence_similarity_index(session)
+                    matches = index.search(latin_text, SENTENCE_SIMILARITY_THRESHOLD)
+                    sentences = {
+                        sentence.id: sentence
+                        for sentence in session.exec(
+                            select(SentenceAnalysis).where(
+                                SentenceAnalysis.id.in_([sentence_id for sentence_id, _ in matches])
+                            )
+                        ).all()
+                    } if matches else {}
+                    
+                    for sentence_id, similarity in matches:
+                        sentence = sentences.get(sentence_id)
+                        if sentence is None:
+                            continue
+                        duplicates.append({
+                            'id': sentence.id,
+                            'type': 'similar',
+                            'similarity': round(similarity, 2),
+                            'latin_text': sentence.latin_text,
+                            'spanish_translation': sentence.spanish_translation,
+                            'difficulty': sentence.complexity_level,
+                        })
         
         except Exception as e:
             logger.error(f"Error checking sentence duplicates: {e}")
@@ -654,7 +687,8 @@ class ComprehensiveValidator:
         
         if check_duplicates:
             is_dup, duplicates = self.duplicate_validator.check_sentence_duplicate(
-                data.get('latin_text', '')
+                data.get('latin_text', ''),
+                strict=(self.level == ValidationLevel.STRICT)
             )
             
             if is_dup and self.level == ValidationLevel.STRICT:
@@ -0,0 +1,282 @@
+"""
+Caché persistente y direccionada por contenido para ComprehensiveLatinAnalyzer
+
+Dos niveles:
+- Memoria: LRU acotada por número de entradas y por bytes (valores serializados).
+- Disco: almacén SQLite compartido entre procesos y reinicios de Streamlit,
+  acotado por tamaño total y con desalojo por último acceso.
+
+La clave es un hash SHA-256 de (oración normalizada, versiones de los
+analizadores, opciones de análisis), de modo que cambiar de versión de
+PyCollatinus/LatinCy o de opciones invalida las entradas automáticamente.
+
+Configuración por entorno (o argumentos del constructor):
+    ANALYSIS_CACHE_PATH             Ruta del fichero SQLite ("" = solo memoria)
+    ANALYSIS_CACHE_MEMORY_ENTRIES   Máximo de entradas en memoria (def. 512)
+    ANALYSIS_CACHE_MEMORY_MB        Máximo de MB en memoria (def. 64)
+    ANALYSIS_CACHE_DISK_MB          Máximo de MB en disco (def. 512)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.getenv("USER_DATA_DIR", "."), "cache", "analysis_cache.sqlite")
+
+ANALYSIS_CACHE_PATH = os.getenv("ANALYSIS_CACHE_PATH", DEFAULT_CACHE_PATH)
+ANALYSIS_CACHE_MEMORY_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MEMORY_ENTRIES", "512"))
+ANALYSIS_CACHE_MEMORY_MB = int(os.getenv("ANALYSIS_CACHE_MEMORY_MB", "64"))
+ANALYSIS_CACHE_DISK_MB = int(os.getenv("ANALYSIS_CACHE_DISK_MB", "512"))
+
+
+def normalize_sentence(sentence: str) -> str:
+    """Normalización usada en la clave: espacios colapsados y sin bordes"""
+    return " ".join(sentence.split())
+
+
+def make_cache_key(sentence: str, versions: Dict[str, Any], options: Dict[str, Any]) -> str:
+    """Hash de (oración normalizada, versiones de analizadores, opciones)"""
+    payload = json.dumps(
+        {"text": normalize_sentence(sentence), "versions": versions, "options": options},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """LRU en memoria respaldada por un almacén SQLite en disco"""
+
+    def __init__(
+        self,
+        path: Optional[str] = ANALYSIS_CACHE_PATH,
+        max_memory_entries: int = ANALYSIS_CACHE_MEMORY_ENTRIES,
+        max_memory_bytes: int = ANALYSIS_CACHE_MEMORY_MB * 1024 * 1024,
+        max_disk_bytes: int = ANALYSIS_CACHE_DISK_MB * 1024 * 1024,
+    ):
+        """
+        Args:
+            path: Fichero SQLite del nivel en disco (None o "" = solo memoria)
+            max_memory_entries: Entradas máximas en la LRU de memoria
+            max_memory_bytes: Bytes serializados máximos en memoria
+            max_disk_bytes: Bytes máximos en disco antes de desalojar
+        """
+        self.path = path or None
+        self.max_memory_entries = max_memory_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._disk_disabled = False
+
+        self.counters: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "puts": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+            "errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Nivel en disco
+    # ------------------------------------------------------------------
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        """Conexión SQLite del proceso actual (se reabre tras un fork)"""
+        if not self.path or self._disk_disabled:
+            return None
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_analysis_cache_last_access "
+                "ON analysis_cache (last_access)"
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Caché en disco deshabilitada ({self.path}): {e}")
+            self._disk_disabled = True
+            return None
+
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def _evict_disk(self, conn: sqlite3.Connection) -> None:
+        """Desaloja las entradas menos usadas hasta quedar bajo el límite"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM analysis_cache").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+
+        excess = total - self.max_disk_bytes
+        freed = 0
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM analysis_cache ORDER BY last_access"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+
+        conn.executemany("DELETE FROM analysis_cache WHERE key = ?", victims)
+        self.counters["disk_evictions"] += len(victims)
+
+    # ------------------------------------------------------------------
+    # Nivel en memoria
+    # ------------------------------------------------------------------
+
+    def _remember(self, key: str, blob: bytes) -> None:
+        if len(blob) > self.max_memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = blob
+        self._memory_bytes += len(blob)
+
+        while self._memory and (
+            len(self._memory) > self.max_memory_entries
+            or self._memory_bytes > self.max_memory_bytes
+        ):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.counters["memory_evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        """Devuelve una copia nueva del valor cacheado, o None si no existe"""
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return pickle.loads(blob)
+
+            conn = self._disk()
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT value FROM analysis_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        conn.execute(
+                            "UPDATE analysis_cache SET last_access = ? WHERE key = ?",
+                            (time.time(), key),
+                        )
+                        conn.commit()
+                        blob = row[0]
+                        self._remember(key, blob)
+                        self.counters["disk_hits"] += 1
+                        return pickle.loads(blob)
+                except (sqlite3.Error, pickle.UnpicklingError) as e:
+                    logger.warning(f"Error leyendo caché de análisis: {e}")
+                    self.counters["errors"] += 1
+
+            self.counters["misses"] += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Guarda un valor (serializado) en memoria y en disco"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, blob)
+            self.counters["puts"] += 1
+
+            conn = self._disk()
+            if conn is not None:
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO analysis_cache (key, value, size, created_at, last_access) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (key, blob, len(blob), now, now),
+                    )
+                    self._evict_disk(conn)
+                    conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Error escribiendo caché de análisis: {e}")
+                    self.counters["errors"] += 1
+
+    def clear(self, disk: bool = True) -> None:
+        """Vacía la memoria (y el disco si disk=True)"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            conn = self._disk() if disk else None
+            if conn is not None:
+                conn.execute("DELETE FROM analysis_cache")
+                conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Contadores de aciertos/fallos, tamaños y límites configurados"""
+        with self._lock:
+            disk_entries = disk_bytes = None
+            conn = self._disk()
+            if conn is not None:
+                try:
+                    disk_entries, disk_bytes = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM analysis_cache"
+                    ).fetchone()
+                except sqlite3.Error:
+                    pass
+
+            lookups = self.counters["memory_hits"] + self.counters["disk_hits"] + self.counters["misses"]
+            hits = self.counters["memory_hits"] + self.counters["disk_hits"]
+            return {
+                **self.counters,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": disk_entries,
+                "disk_bytes": disk_bytes,
+                "limits": {
+                    "path": self.path,
+                    "max_memory_entries": self.max_memory_entries,
+                    "max_memory_bytes": self.max_memory_bytes,
+                    "max_disk_bytes": self.max_disk_bytes,
+                },
+            }
+
+
+# Instancia global del proceso (lazy loading)
+_global_cache: Optional[AnalysisCache] = None
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """Obtiene la caché compartida del proceso (configurada por entorno)"""
+    global _global_cache
+    if _global_cache is None:
+        _global_cache = AnalysisCache()
+    return _global_cache
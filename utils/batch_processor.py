@@ -13,9 +13,13 @@ Diseñado para ejecutar como tarea independiente (CLI, scheduler, etc.)
 from typing import List, Dict, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import logging
 from datetime import datetime
 import json
+import os
+import pickle
+import time
 from pathlib import Path
 import hashlib
 
@@ -101,6 +105,13 @@ class BatchProcessingReport:
     # Métricas
     average_quality_score: float = 0.0
     total_processing_time: float = 0.0
+    wall_clock_time: float = 0.0
+    
+    # Rendimiento por worker: {worker_id: {'texts', 'busy_seconds', 'texts_per_second'}}
+    worker_stats: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    
+    # Textos recuperados de un checkpoint previo (no reprocesados)
+    resumed_texts: int = 0
     
     # Resultados
     results: List[ProcessingResult] = field(default_factory=list)
@@ -122,7 +133,10 @@ class BatchProcessingReport:
             'metrics': {
                 'avg_quality': self.average_quality_score,
                 'total_time': self.total_processing_time,
+                'wall_clock_time': self.wall_clock_time,
+                'resumed_texts': self.resumed_texts,
             },
+            'workers': self.worker_stats,
             'summary': {
                 'success_rate': (
                     (self.successfully_processed / self.total_texts * 100)
@@ -261,13 +275,38 @@ class BatchTextProcessor:
         
         return result
     
+    def _process_chunk(
+        self,
+        items: List[Dict[str, Any]],
+        source: TextSource,
+        callback: Optional[Callable[[ProcessingResult], None]] = None
+    ) -> List[ProcessingResult]:
+        """Procesa un fragmento de textos en este proceso"""
+        results = []
+        for text_data in items:
+            results.append(self.process_text(
+                text=text_data.get('text', ''),
+                source=source,
+                text_id=text_data.get('id'),
+                translation=text_data.get('translation'),
+                lesson_number=text_data.get('lesson_number'),
+                difficulty_level=text_data.get('difficulty_level', 1),
+                callback=callback
+            ))
+        return results
+    
     def process_batch(
         self,
         texts: List[Dict[str, Any]],
         source: TextSource,
         batch_id: Optional[str] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
-        result_callback: Optional[Callable[[ProcessingResult], None]] = None
+        result_callback: Optional[Callable[[ProcessingResult], None]] = None,
+        workers: int = 1,
+        chunk_size: int = 10,
+        checkpoint_dir: Optional[str] = None,
+        analyzer_kwargs: Optional[Dict[str, Any]] = None,
+        replay_vocabulary: bool = True
     ) -> BatchProcessingReport:
         """
         Procesa un lote de textos
@@ -278,6 +317,18 @@ class BatchTextProcessor:
             batch_id: ID del lote (generado automáticamente si no se proporciona)
             progress_callback: Función llamada con (current, total)
             result_callback: Función llamada para cada resultado
+            workers: Número de procesos. Con >1 cada worker crea su propio
+                ComprehensiveLatinAnalyzer una sola vez y los resultados llegan
+                al proceso principal a medida que se completa cada fragmento
+            chunk_size: Textos por fragmento (unidad de trabajo y de checkpoint)
+            checkpoint_dir: Directorio donde guardar cada fragmento terminado;
+                si ya contiene un checkpoint del mismo lote, se reanuda desde ahí.
+                Los resultados recuperados pasan también por el historial y
+                result_callback
+            analyzer_kwargs: Argumentos para el ComprehensiveLatinAnalyzer de cada worker
+            replay_vocabulary: Aplicar al vocab_manager los resultados recuperados
+                del checkpoint (False si su repositorio es persistente y ya los
+                recibió en la ejecución interrumpida)
             
         Returns:
             BatchProcessingReport con resultados detallados
@@ -288,32 +339,88 @@ class BatchTextProcessor:
         report = BatchProcessingReport(batch_id=batch_id)
         report.total_texts = len(texts)
         
-        logger.info(f"Iniciando procesamiento de lote {batch_id} ({len(texts)} textos)")
+        chunk_size = max(1, chunk_size)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
         
-        quality_scores = []
+        checkpoint = BatchCheckpoint(checkpoint_dir, texts, chunk_size) if checkpoint_dir else None
+        chunk_results: Dict[int, List[ProcessingResult]] = checkpoint.load() if checkpoint else {}
+        report.resumed_texts = sum(len(results) for results in chunk_results.values())
+        pending = [idx for idx in range(len(chunks)) if idx not in chunk_results]
+        
+        logger.info(
+            f"Iniciando procesamiento de lote {batch_id} ({len(texts)} textos, "
+            f"{len(pending)}/{len(chunks)} fragmentos pendientes, {workers} worker(s))"
+        )
         
-        for idx, text_data in enumerate(texts):
-            # Preparar parámetros
-            text = text_data.get('text', '')
-            text_id = text_data.get('id')
-            translation = text_data.get('translation')
-            lesson_number = text_data.get('lesson_number')
-            difficulty_level = text_data.get('difficulty_level', 1)
+        wall_start = time.time()
+        completed = report.resumed_texts
+        
+        def absorb(results: List[ProcessingResult], update_vocabulary: bool = True):
+            """Vocabulario, historial y callback de resultados obtenidos fuera de process_text"""
+            if update_vocabulary and self.vocab_manager:
+                for result in results:
+                    if result.status == ProcessingStatus.COMPLETED and result.analysis:
+                        self._update_vocabulary(result.analysis)
+            self._processing_history.extend(results)
+            if result_callback:
+                for result in results:
+                    result_callback(result)
+        
+        # Fragmentos recuperados del checkpoint, en orden
+        for idx in sorted(chunk_results):
+            absorb(chunk_results[idx], update_vocabulary=replay_vocabulary)
+        
+        def on_chunk_done(idx: int, worker_id: str, results: List[ProcessingResult], busy: float):
+            nonlocal completed
+            # El vocabulario vive en el proceso principal
+            if workers > 1:
+                absorb(results)
             
-            # Procesar
-            result = self.process_text(
-                text=text,
-                source=source,
-                text_id=text_id,
-                translation=translation,
-                lesson_number=lesson_number,
-                difficulty_level=difficulty_level,
-                callback=result_callback
-            )
+            if checkpoint:
+                checkpoint.save_chunk(idx, results)
+            chunk_results[idx] = results
             
-            report.results.append(result)
+            stats = report.worker_stats.setdefault(worker_id, {'texts': 0, 'busy_seconds': 0.0})
+            stats['texts'] += len(results)
+            stats['busy_seconds'] += busy
             
-            # Actualizar estadísticas
+            completed += len(results)
+            if progress_callback:
+                progress_callback(completed, len(texts))
+        
+        if workers > 1 and pending:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.quality_threshold, analyzer_kwargs or {})
+            ) as executor:
+                futures = [
+                    executor.submit(_process_chunk_in_worker, idx, chunks[idx], source)
+                    for idx in pending
+                ]
+                for future in as_completed(futures):
+                    idx, worker_id, results, busy = future.result()
+                    on_chunk_done(idx, worker_id, results, busy)
+        else:
+            for idx in pending:
+                start = time.time()
+                results = self._process_chunk(chunks[idx], source, callback=result_callback)
+                on_chunk_done(idx, f"main-{os.getpid()}", results, time.time() - start)
+        
+        report.wall_clock_time = time.time() - wall_start
+        
+        for stats in report.worker_stats.values():
+            stats['texts_per_second'] = (
+                stats['texts'] / stats['busy_seconds'] if stats['busy_seconds'] > 0 else 0.0
+            )
+        
+        # Resultados en el orden original
+        for idx in range(len(chunks)):
+            report.results.extend(chunk_results.get(idx, []))
+        
+        # Actualizar estadísticas
+        quality_scores = []
+        for result in report.results:
             if result.status == ProcessingStatus.COMPLETED:
                 report.successfully_processed += 1
                 quality_scores.append(result.quality_score)
@@ -321,10 +428,6 @@ class BatchTextProcessor:
                 report.failed += 1
             elif result.status == ProcessingStatus.REQUIRES_REVIEW:
                 report.requires_review += 1
-            
-            # Callback de progreso
-            if progress_callback:
-                progress_callback(idx + 1, len(texts))
         
         # Calcular métricas finales
         if quality_scores:
@@ -505,6 +608,105 @@ class BatchTextProcessor:
         return f"batch_{timestamp}"
 
 
+# ============================================================================
+# EJECUCIÓN EN PARALELO Y CHECKPOINTS
+# ============================================================================
+
+# Procesador local de cada worker (se crea una vez por proceso en _init_worker)
+_worker_processor: Optional[BatchTextProcessor] = None
+
+
+def _init_worker(quality_threshold: float, analyzer_kwargs: Dict[str, Any]) -> None:
+    """Inicializa el analizador propio del worker (una sola vez por proceso)"""
+    global _worker_processor
+    analyzer = ComprehensiveLatinAnalyzer(**analyzer_kwargs)
+    _worker_processor = BatchTextProcessor(analyzer, quality_threshold=quality_threshold)
+
+
+def _process_chunk_in_worker(
+    chunk_index: int,
+    items: List[Dict[str, Any]],
+    source: TextSource
+) -> Tuple[int, str, List[ProcessingResult], float]:
+    """Procesa un fragmento en el worker; devuelve (índice, worker, resultados, segundos)"""
+    start = time.time()
+    results = _worker_processor._process_chunk(items, source)
+    # Los resultados se devuelven al proceso principal: el worker no guarda historial
+    _worker_processor._processing_history.clear()
+    return chunk_index, f"worker-{os.getpid()}", results, time.time() - start
+
+
+class BatchCheckpoint:
+    """
+    Checkpoint en disco de un lote: un fichero por fragmento terminado
+    
+    El manifiesto guarda una huella de los textos de entrada y el tamaño de
+    fragmento, de modo que solo se reanuda un lote idéntico.
+    """
+    
+    MANIFEST = "manifest.json"
+    
+    def __init__(self, directory: str, texts: List[Dict[str, Any]], chunk_size: int):
+        self.directory = Path(directory)
+        self.chunk_size = chunk_size
+        self.fingerprint = self._fingerprint(texts)
+        self.total_texts = len(texts)
+    
+    @staticmethod
+    def _fingerprint(texts: List[Dict[str, Any]]) -> str:
+        digest = hashlib.sha256()
+        for text_data in texts:
+            digest.update(json.dumps(text_data, sort_keys=True, default=str).encode('utf-8'))
+            digest.update(b"\n")
+        return digest.hexdigest()
+    
+    def _chunk_path(self, chunk_index: int) -> Path:
+        return self.directory / f"chunk_{chunk_index:06d}.pickle"
+    
+    def load(self) -> Dict[int, List[ProcessingResult]]:
+        """Carga los fragmentos ya terminados (o inicializa el directorio)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.directory / self.MANIFEST
+        manifest = {
+            'fingerprint': self.fingerprint,
+            'chunk_size': self.chunk_size,
+            'total_texts': self.total_texts,
+        }
+        
+        if manifest_path.exists():
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+            if existing != manifest:
+                raise ValueError(
+                    f"El checkpoint en {self.directory} pertenece a otro lote "
+                    f"(textos o chunk_size distintos). Usa otro directorio."
+                )
+        else:
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+        
+        done: Dict[int, List[ProcessingResult]] = {}
+        for path in sorted(self.directory.glob("chunk_*.pickle")):
+            chunk_index = int(path.stem.split('_')[1])
+            try:
+                with open(path, 'rb') as f:
+                    done[chunk_index] = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"Checkpoint ilegible {path.name}, se reprocesará: {e}")
+        
+        if done:
+            logger.info(f"Reanudando desde checkpoint: {len(done)} fragmentos ya procesados")
+        return done
+    
+    def save_chunk(self, chunk_index: int, results: List[ProcessingResult]) -> None:
+        """Guarda un fragmento terminado de forma atómica"""
+        path = self._chunk_path(chunk_index)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(results, f)
+        os.replace(tmp_path, path)
+
+
 # ============================================================================
 # HERRAMIENTAS DE INTEGRACIÓN CON BD
 # ============================================================================
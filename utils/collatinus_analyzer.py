@@ -11,27 +11,18 @@ import pickle
 import sys
 from typing import List, Dict, Optional, Any
 
-# Intentar importar pycollatinus, manejar error si no está instalado
-# Intentar importar pycollatinus, manejar error si no está instalado
-try:
-    # Parche para compatibilidad con Python 3.10+ (pycollatinus usa collections.Callable)
-    import collections
-    import collections.abc
-    if not hasattr(collections, 'Callable'):
-        collections.Callable = collections.abc.Callable
+from utils.lemmatizer_registry import get_lemmatiseur, is_lemmatiseur_available
 
-    from pycollatinus import Lemmatiseur
-    PYCOLLATINUS_AVAILABLE = True
-except ImportError:
-    PYCOLLATINUS_AVAILABLE = False
+# Comprobar si pycollatinus está instalado (el modelo se carga en el registro compartido)
+PYCOLLATINUS_AVAILABLE = is_lemmatiseur_available()
 
 class LatinMorphAnalyzer:
     """
     Wrapper para el lemmatizador de Collatinus.
-    Implementa patrón Singleton para cargar los datos una sola vez.
+    Implementa patrón Singleton; el Lemmatiseur se toma prestado del registro
+    compartido (utils.lemmatizer_registry) la primera vez que se usa.
     """
     _instance = None
-    _analyzer = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -40,111 +31,85 @@ class LatinMorphAnalyzer:
 
     def __init__(self):
         # Evitar re-inicialización si ya existe
-        if self._analyzer is not None:
+        if getattr(self, '_initialized', False):
             return
+        self._initialized = True
+        self._lemmatiseur = None
+        self._borrowed = False
 
         if not PYCOLLATINUS_AVAILABLE:
             print("⚠️ PyCollatinus no está instalado. Funcionalidad limitada.")
-            return
 
-        try:
-            # Intentar cargar versión compilada primero (más rápido ~3s vs ~5s)
-            compiled_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'collatinus_compiled.pickle')
+        # Mapeo de traducción Francés -> Español
+        self.translations = {
+            # Casos
+            'nominatif': 'Nominativo',
+            'vocatif': 'Vocativo',
+            'accusatif': 'Acusativo',
+            'génitif': 'Genitivo',
+            'datif': 'Dativo',
+            'ablatif': 'Ablativo',
+            'locatif': 'Locativo',
             
-            if os.path.exists(compiled_path):
-                print(f"📦 Cargando PyCollatinus compilado desde {compiled_path}...")
-                try:
-                    self._analyzer = Lemmatiseur.load(compiled_path)
-                    print("✅ PyCollatinus compilado cargado exitosamente")
-                except Exception as e:
-                    print(f"⚠️ Error cargando versión compilada: {e}")
-                    print("Cargando versión estándar...")
-                    self._analyzer = Lemmatiseur()
-            else:
-                print("📚 Cargando PyCollatinus (primera vez, puede tardar unos segundos)...")
-                self._analyzer = Lemmatiseur()
-                
-                # Compilar para futuras cargas
-                print("🔧 Compilando PyCollatinus para futuras cargas...")
-                try:
-                    os.makedirs(os.path.dirname(compiled_path), exist_ok=True)
-                    # compile() no acepta argumentos, guarda en su propia ubicación
-                    self._analyzer.compile()
-                    # Intentar copiar el archivo compilado a nuestra ubicación
-                    import shutil
-                    default_compiled = self._analyzer.path('compiled.pickle')
-                    if os.path.exists(default_compiled):
-                        shutil.copy(default_compiled, compiled_path)
-                        print(f"✅ PyCollatinus compilado guardado en {compiled_path}")
-                except Exception as e:
-                    print(f"⚠️ No se pudo compilar: {e}")
-
+            # Números
+            'singulier': 'Singular',
+            'pluriel': 'Plural',
             
-            # Mapeo de traducción Francés -> Español
-            self.translations = {
-                # Casos
-                'nominatif': 'Nominativo',
-                'vocatif': 'Vocativo',
-                'accusatif': 'Acusativo',
-                'génitif': 'Genitivo',
-                'datif': 'Dativo',
-                'ablatif': 'Ablativo',
-                'locatif': 'Locativo',
-                
-                # Números
-                'singulier': 'Singular',
-                'pluriel': 'Plural',
-                
-                # Géneros
-                'masculin': 'Masculino',
-                'féminin': 'Femenino',
-                'neutre': 'Neutro',
-                
-                # Personas
-                '1ère': '1ª Persona',
-                '2ème': '2ª Persona',
-                '3ème': '3ª Persona',
-                
-                # Tiempos
-                'présent': 'Presente',
-                'imparfait': 'Imperfecto',
-                'futur': 'Futuro',
-                'parfait': 'Perfecto',
-                'plus-que-parfait': 'Pluscuamperfecto',
-                'futur antérieur': 'Futuro Perfecto',
-                
-                # Modos
-                'indicatif': 'Indicativo',
-                'subjonctif': 'Subjuntivo',
-                'impératif': 'Imperativo',
-                'infinitif': 'Infinitivo',
-                'participe': 'Participio',
-                'gérondif': 'Gerundio',
-                'supin': 'Supino',
-                
-                # Voces
-                'actif': 'Activa',
-                'passif': 'Pasiva',
-                'déponent': 'Deponente',
-                
-                # Grados
-                'positif': 'Positivo',
-                'comparatif': 'Comparativo',
-                'superlatif': 'Superlativo',
-                
-                # Otros
-                'adjectif': 'Adjetivo',
-                'adverbe': 'Adverbio',
-                'préposition': 'Preposición',
-                'conjonction': 'Conjunción',
-                'interjection': 'Interjección',
-                'numéral': 'Numeral',
-                'pronom': 'Pronombre',
-            }
+            # Géneros
+            'masculin': 'Masculino',
+            'féminin': 'Femenino',
+            'neutre': 'Neutro',
             
-        except Exception as e:
-            print(f"❌ Error inicializando PyCollatinus: {e}")
-            self._analyzer = None
+            # Personas
+            '1ère': '1ª Persona',
+            '2ème': '2ª Persona',
+            '3ème': '3ª Persona',
+            
+            # Tiempos
+            'présent': 'Presente',
+            'imparfait': 'Imperfecto',
+            'futur': 'Futuro',
+            'parfait': 'Perfecto',
+            'plus-que-parfait': 'Pluscuamperfecto',
+            'futur antérieur': 'Futuro Perfecto',
+            
+            # Modos
+            'indicatif': 'Indicativo',
+            'subjonctif': 'Subjuntivo',
+            'impératif': 'Imperativo',
+            'infinitif': 'Infinitivo',
+            'participe': 'Participio',
+            'gérondif': 'Gerundio',
+            'supin': 'Supino',
+            
+            # Voces
+            'actif': 'Activa',
+            'passif': 'Pasiva',
+            'déponent': 'Deponente',
+            
+            # Grados
+            'positif': 'Positivo',
+            'comparatif': 'Comparativo',
+            'superlatif': 'Superlativo',
+            
+            # Otros
+            'adjectif': 'Adjetivo',
+            'adverbe': 'Adverbio',
+            'préposition': 'Preposición',
+            'conjonction': 'Conjunción',
+            'interjection': 'Interjección',
+            'numéral': 'Numeral',
+            'pronom': 'Pronombre',
+        }
+
+    @property
+    def _analyzer(self):
+        """Lemmatiseur compartido (carga perezosa en el primer uso)"""
+        if not self._borrowed:
+            self._borrowed = True
+            if PYCOLLATINUS_AVAILABLE:
+                self._lemmatiseur = get_lemmatiseur()
+        return self._lemmatiseur
 
     def is_ready(self) -> bool:
         """Verifica si el analizador está listo para usarse"""
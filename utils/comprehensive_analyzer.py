@@ -23,11 +23,16 @@ import hashlib
 from .collatinus_analyzer import LatinMorphAnalyzer
 from .syntax_analyzer import LatinSyntaxAnalyzer
 from .latin_logic import LatinLogicEngine
+from .analysis_cache import AnalysisCache, get_analysis_cache, make_cache_key
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Versión del analizador integral (forma parte de la clave de caché)
+# 1.1: la semántica de la BD ya no se guarda en la caché
+ANALYZER_VERSION = "1.1"
+
 
 # ============================================================================
 # ENUMERACIONES Y TIPOS
@@ -186,7 +191,7 @@ class ComprehensiveSentenceAnalysis:
     
     # Metadata
     analysis_timestamp: datetime = field(default_factory=datetime.now)
-    analyzer_version: str = "1.0"
+    analyzer_version: str = ANALYZER_VERSION
     
     # Para BD
     db_id: Optional[int] = None
@@ -225,17 +230,24 @@ class ComprehensiveLatinAnalyzer:
     Diseñado para producir análisis de alta calidad listos para la BD.
     """
     
-    def __init__(self, db_connection=None, cache_enabled: bool = True):
+    def __init__(
+        self,
+        db_connection=None,
+        cache_enabled: bool = True,
+        cache: Optional[AnalysisCache] = None
+    ):
         """
         Inicializa el analizador
         
         Args:
             db_connection: Conexión a la base de datos (opcional)
             cache_enabled: Habilitar caché de resultados
+            cache: Caché a usar (por defecto la compartida del proceso)
         """
         self.db = db_connection
         self.cache_enabled = cache_enabled
-        self._cache: Dict[str, Any] = {}
+        self._cache: Optional[AnalysisCache] = (cache or get_analysis_cache()) if cache_enabled else None
+        self._versions: Optional[Dict[str, Any]] = None
         
         # Inicializar analizadores componentes
         logger.info("Inicializando analizadores componentes...")
@@ -292,35 +304,121 @@ class ComprehensiveLatinAnalyzer:
         sentences = self._split_sentences(text)
         
         if len(sentences) == 1:
-            result = self._analyze_single_sentence(
+            return self._analyze_sentence_cached(
                 sentences[0],
                 translation=translation,
                 source=source,
                 lesson_number=lesson_number,
-                difficulty_level=difficulty_level
+                difficulty_level=difficulty_level,
+                validate=validate
             )
-            
-            if validate:
-                result = self._validate_analysis(result)
-            
-            return result
         else:
-            results = []
-            for sent in sentences:
-                result = self._analyze_single_sentence(
+            return [
+                self._analyze_sentence_cached(
                     sent,
                     translation=None,
                     source=source,
                     lesson_number=lesson_number,
-                    difficulty_level=difficulty_level
+                    difficulty_level=difficulty_level,
+                    validate=validate
                 )
-                
-                if validate:
-                    result = self._validate_analysis(result)
-                
-                results.append(result)
+                for sent in sentences
+            ]
+    
+    def _analyze_sentence_cached(
+        self,
+        sentence: str,
+        translation: Optional[str],
+        source: Optional[str],
+        lesson_number: Optional[int],
+        difficulty_level: int,
+        validate: bool
+    ) -> ComprehensiveSentenceAnalysis:
+        """
+        Analiza (y valida) una oración pasando por la caché de análisis
+        """
+        key = None
+        if self._cache is not None:
+            key = make_cache_key(
+                sentence,
+                self._analyzer_versions(),
+                {
+                    "translation": translation,
+                    "source": source,
+                    "lesson_number": lesson_number,
+                    "difficulty_level": difficulty_level,
+                    "validate": validate,
+                }
+            )
+            cached = self._cache.get(key)
+            if cached is not None:
+                return self._apply_db_semantics(cached)
+        
+        # Con caché, la semántica de la BD (definiciones, frecuencia, etimología)
+        # no entra en el resultado guardado: el vocabulario puede editarse y la
+        # clave no lo refleja. Se añade después de guardar, en cada consulta.
+        result = self._analyze_single_sentence(
+            sentence,
+            translation=translation,
+            source=source,
+            lesson_number=lesson_number,
+            difficulty_level=difficulty_level,
+            use_db=key is None
+        )
+        
+        if validate:
+            result = self._validate_analysis(result)
+        
+        if key is not None:
+            self._cache.put(key, result)
+            result = self._apply_db_semantics(result)
+        
+        return result
+    
+    def _apply_db_semantics(
+        self,
+        analysis: ComprehensiveSentenceAnalysis
+    ) -> ComprehensiveSentenceAnalysis:
+        """
+        Completa la semántica de cada palabra con los datos actuales de la BD
+        (el resultado cacheado no los contiene)
+        """
+        if not self.db:
+            return analysis
+        for wa in analysis.word_analyses:
+            wa.semantics = self._analyze_semantics(wa.word, wa.morphology)
+        return analysis
+    
+    def _analyzer_versions(self) -> Dict[str, Any]:
+        """
+        Versiones que forman parte de la clave de caché: cambiar de analizador
+        o de modelo invalida las entradas existentes
+        """
+        if self._versions is None:
+            versions: Dict[str, Any] = {"comprehensive": ANALYZER_VERSION}
             
-            return results
+            try:
+                from importlib.metadata import version, PackageNotFoundError
+                try:
+                    versions["pycollatinus"] = version("pycollatinus") if self.morph_analyzer else None
+                except PackageNotFoundError:
+                    versions["pycollatinus"] = None
+            except ImportError:
+                versions["pycollatinus"] = None
+            
+            nlp = getattr(self.syntax_analyzer, "nlp", None)
+            meta = getattr(nlp, "meta", None) or {}
+            versions["spacy_model"] = (
+                f"{meta.get('lang', '')}_{meta.get('name', '')}-{meta.get('version', '')}" if nlp else None
+            )
+            versions["logic_engine"] = self.logic_engine is not None
+            
+            self._versions = versions
+        return self._versions
+    
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Aciertos, fallos y tamaño de la caché de análisis (None si está deshabilitada)"""
+        return self._cache.get_stats() if self._cache is not None else None
     
     def _analyze_single_sentence(
         self,
@@ -328,10 +426,14 @@ class ComprehensiveLatinAnalyzer:
         translation: Optional[str] = None,
         source: Optional[str] = None,
         lesson_number: Optional[int] = None,
-        difficulty_level: int = 1
+        difficulty_level: int = 1,
+        use_db: bool = True
     ) -> ComprehensiveSentenceAnalysis:
         """
         Analiza una única oración de manera integral
+        
+        Args:
+            use_db: Incluir la semántica de la BD (False para el resultado cacheable)
         """
         logger.info(f"Analizando: {sentence}")
         
@@ -353,7 +455,8 @@ class ComprehensiveLatinAnalyzer:
                 token,
                 sentence,
                 idx,
-                tokens
+                tokens,
+                use_db=use_db
             )
             analysis.word_analyses.append(word_analysis)
         
@@ -371,7 +474,8 @@ class ComprehensiveLatinAnalyzer:
         word: str,
         sentence: str,
         position: int,
-        tokens: List[str]
+        tokens: List[str],
+        use_db: bool = True
     ) -> ComprehensiveWordAnalysis:
         """
         Análisis integral de una palabra individual
@@ -380,7 +484,7 @@ class ComprehensiveLatinAnalyzer:
         morphology = self._analyze_morphology(word)
         
         # Análisis semántico
-        semantics = self._analyze_semantics(word, morphology)
+        semantics = self._analyze_semantics(word, morphology, use_db=use_db)
         
         # Análisis sintáctico (en contexto)
         syntax = self._analyze_syntax(word, sentence, position, tokens, morphology)
@@ -450,7 +554,8 @@ class ComprehensiveLatinAnalyzer:
     def _analyze_semantics(
         self,
         word: str,
-        morphology: MorphologicalData
+        morphology: MorphologicalData,
+        use_db: bool = True
     ) -> SemanticData:
         """
         Análisis semántico y búsqueda de significados
@@ -458,7 +563,7 @@ class ComprehensiveLatinAnalyzer:
         semantics = SemanticData()
         
         # Intentar obtener del DB si disponible
-        if self.db:
+        if self.db and use_db:
             try:
                 db_word = self.db.get_word(morphology.lemma)
                 if db_word:
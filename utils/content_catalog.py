@@ -0,0 +1,240 @@
+"""
+Catálogo de contenido compartido (Word, Text, Lesson, LessonVocabulary)
+
+Un único catálogo por proceso, compartido por todas las sesiones de Streamlit,
+con instantáneas de solo lectura del contenido que casi nunca cambia. Evita que
+cada vista (y cada usuario) ejecute su propio select(Word).all() en cada render
+o guarde su copia en st.session_state.
+
+Invalidación por versión: cada tipo de contenido tiene un contador de versión.
+Se incrementa (database/invalidation.py) al hacer commit de cambios en sus modelos
+(altas/ediciones del panel de administración, importaciones masivas...), y la
+siguiente lectura recarga la instantánea. Solo un hilo recarga; el resto espera
+y reutiliza el resultado.
+
+Las entradas son namedtuples inmutables con las columnas de la tabla (mismo
+acceso por atributo que el modelo: word.latin, lesson.title...), seguras de
+compartir entre hilos y sin riesgo de DetachedInstanceError.
+
+Uso:
+    catalog = get_content_catalog()
+    for word in catalog.words(): ...
+    catalog.lesson_word_ids(3)
+"""
+
+import logging
+import threading
+from collections import namedtuple
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from sqlmodel import select
+
+from database import Author, Lesson, LessonVocabulary, Text, Word
+from database.connection import get_read_session
+from database.invalidation import register_invalidation
+
+logger = logging.getLogger(__name__)
+
+# Tipos de contenido del catálogo
+WORDS = "words"
+TEXTS = "texts"
+LESSONS = "lessons"
+LESSON_VOCABULARY = "lesson_vocabulary"
+CONTENT_KINDS = (WORDS, TEXTS, LESSONS, LESSON_VOCABULARY)
+
+# Modelo -> tipos de contenido que invalida
+_MODEL_KINDS = {
+    Word: (WORDS,),
+    Text: (TEXTS,),
+    Author: (TEXTS,),  # author_name de los textos
+    Lesson: (LESSONS,),
+    LessonVocabulary: (LESSON_VOCABULARY,),
+}
+
+# Registros inmutables con las columnas de cada tabla
+WordRecord = namedtuple("WordRecord", [c.name for c in Word.__table__.columns])
+_TEXT_COLUMNS = list(Text.__table__.columns)
+TextRecord = namedtuple("TextRecord", [c.name for c in _TEXT_COLUMNS] + ["author_name"])
+LessonRecord = namedtuple("LessonRecord", [c.name for c in Lesson.__table__.columns])
+
+
+def _load_words(session) -> Dict[str, Any]:
+    rows = session.exec(select(*Word.__table__.columns).order_by(Word.id)).all()
+    words = tuple(WordRecord(*row) for row in rows)
+    pos_counts: Dict[str, int] = {}
+    for word in words:
+        pos = word.part_of_speech or 'unknown'
+        pos_counts[pos] = pos_counts.get(pos, 0) + 1
+    return {
+        "all": words,
+        "by_id": {word.id: word for word in words},
+        "pos_counts": pos_counts,
+    }
+
+
+def _load_texts(session) -> Dict[str, Any]:
+    rows = session.exec(
+        select(*_TEXT_COLUMNS, Author.name)
+        .outerjoin(Author, Author.id == Text.author_id)
+        .order_by(Text.id)
+    ).all()
+    texts = tuple(TextRecord(*row) for row in rows)
+    return {"all": texts, "by_id": {text.id: text for text in texts}}
+
+
+def _load_lessons(session) -> Dict[str, Any]:
+    rows = session.exec(select(*Lesson.__table__.columns).order_by(Lesson.lesson_number)).all()
+    lessons = tuple(LessonRecord(*row) for row in rows)
+    return {"all": lessons, "by_number": {lesson.lesson_number: lesson for lesson in lessons}}
+
+
+def _load_lesson_vocabulary(session) -> Dict[str, Any]:
+    rows = session.exec(
+        select(LessonVocabulary.lesson_number, LessonVocabulary.word_id)
+        .order_by(LessonVocabulary.lesson_number, LessonVocabulary.presentation_order, LessonVocabulary.id)
+    ).all()
+    by_lesson: Dict[int, list] = {}
+    for lesson_number, word_id in rows:
+        by_lesson.setdefault(lesson_number, []).append(word_id)
+    return {"by_lesson": {number: tuple(ids) for number, ids in by_lesson.items()}}
+
+
+_LOADERS: Dict[str, Callable] = {
+    WORDS: _load_words,
+    TEXTS: _load_texts,
+    LESSONS: _load_lessons,
+    LESSON_VOCABULARY: _load_lesson_vocabulary,
+}
+
+
+class ContentCatalog:
+    """Instantáneas compartidas del contenido, invalidadas por versión"""
+
+    def __init__(self, session_factory: Callable = get_read_session):
+        self._session_factory = session_factory
+        self._versions: Dict[str, int] = {kind: 0 for kind in CONTENT_KINDS}
+        # kind -> (versión con la que se cargó, datos)
+        self._snapshots: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._versions_lock = threading.Lock()
+        self._load_locks = {kind: threading.Lock() for kind in CONTENT_KINDS}
+        self.loads = 0
+
+    # --- Versiones / invalidación ---
+
+    def version(self, kind: str) -> int:
+        return self._versions[kind]
+
+    def invalidate(self, kinds: Optional[Iterable[str]] = None):
+        """Incrementa la versión de los tipos dados (o de todos)"""
+        with self._versions_lock:
+            for kind in (kinds or CONTENT_KINDS):
+                self._versions[kind] += 1
+
+    # --- Carga ---
+
+    def _get(self, kind: str) -> Dict[str, Any]:
+        version = self._versions[kind]
+        snapshot = self._snapshots.get(kind)
+        if snapshot is not None and snapshot[0] == version:
+            return snapshot[1]
+
+        with self._load_locks[kind]:
+            # Otro hilo pudo recargar mientras esperábamos
+            version = self._versions[kind]
+            snapshot = self._snapshots.get(kind)
+            if snapshot is not None and snapshot[0] == version:
+                return snapshot[1]
+
+            with self._session_factory() as session:
+                data = _LOADERS[kind](session)
+            # Se guarda con la versión leída ANTES de cargar: si hubo una
+            # invalidación durante la carga, la próxima lectura recarga
+            self._snapshots[kind] = (version, data)
+            self.loads += 1
+            logger.debug(f"Content catalog reloaded {kind} (version {version})")
+            return data
+
+    # --- Palabras ---
+
+    def words(self) -> Tuple[WordRecord, ...]:
+        return self._get(WORDS)["all"]
+
+    def word(self, word_id: int) -> Optional[WordRecord]:
+        return self._get(WORDS)["by_id"].get(word_id)
+
+    def pos_counts(self) -> Dict[str, int]:
+        """Número de palabras por categoría gramatical"""
+        return self._get(WORDS)["pos_counts"]
+
+    # --- Textos ---
+
+    def texts(self) -> Tuple[TextRecord, ...]:
+        return self._get(TEXTS)["all"]
+
+    def text(self, text_id: int) -> Optional[TextRecord]:
+        return self._get(TEXTS)["by_id"].get(text_id)
+
+    # --- Lecciones ---
+
+    def lessons(self) -> Tuple[LessonRecord, ...]:
+        return self._get(LESSONS)["all"]
+
+    def lesson(self, lesson_number: int) -> Optional[LessonRecord]:
+        return self._get(LESSONS)["by_number"].get(lesson_number)
+
+    def lesson_word_ids(self, lesson_number: int) -> Tuple[int, ...]:
+        """Ids de las palabras de una lección (por orden de presentación)"""
+        return self._get(LESSON_VOCABULARY)["by_lesson"].get(lesson_number, ())
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "versions": dict(self._versions),
+            "loaded": {kind: len(data.get("all", data.get("by_lesson", ()))) for kind, (_, data) in self._snapshots.items()},
+            "loads": self.loads,
+        }
+
+
+# Instancia compartida por todo el proceso
+_catalog: Optional[ContentCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_content_catalog() -> ContentCatalog:
+    """Catálogo de contenido del proceso (singleton)"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = ContentCatalog()
+    return _catalog
+
+
+def invalidate_content_catalog(kinds: Optional[Iterable[str]] = None):
+    """Fuerza la recarga de los tipos dados (o de todo el catálogo)"""
+    get_content_catalog().invalidate(kinds)
+
+
+def _kinds_for(mapper_class) -> Tuple[str, ...]:
+    for model, kinds in _MODEL_KINDS.items():
+        if issubclass(mapper_class, model):
+            return kinds
+    return ()
+
+
+def _collect_catalog_changes(session, objects, kinds: set):
+    """Anota los tipos de contenido modificados; se invalidan al hacer commit"""
+    for obj in objects:
+        kinds.update(_kinds_for(type(obj)))
+
+
+def _collect_catalog_bulk_changes(orm_execute_state, model, kinds: set):
+    kinds.update(_kinds_for(model))
+
+
+register_invalidation(
+    "content_catalog",
+    tuple(_MODEL_KINDS),
+    on_flush=_collect_catalog_changes,
+    on_bulk=_collect_catalog_bulk_changes,
+    on_commit=invalidate_content_catalog,
+)
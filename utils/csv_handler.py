@@ -7,9 +7,12 @@ in CSV and Excel formats, with validation and template generation.
 
 import pandas as pd
 import io
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from database import Word
 
+# Filas por bloque en la importación en streaming
+IMPORT_CHUNK_SIZE = 5000
+
 
 class VocabularyImporter:
     """Handles importing vocabulary from CSV/Excel files"""
@@ -33,6 +36,47 @@ class VocabularyImporter:
         'defaults': {'level': 1, 'is_invariable': False}
     }
     
+    @staticmethod
+    def get_schema(word_type: str) -> Dict:
+        """Esquema de columnas para un tipo de palabra"""
+        if word_type == 'noun':
+            return VocabularyImporter.NOUN_SCHEMA
+        elif word_type == 'verb':
+            return VocabularyImporter.VERB_SCHEMA
+        return VocabularyImporter.OTHER_SCHEMA
+    
+    @staticmethod
+    def detect_word_type(columns) -> str:
+        """Detecta el tipo de palabra a partir de las columnas"""
+        if 'genitive' in columns:
+            return 'noun'
+        elif 'principal_parts' in columns:
+            return 'verb'
+        return 'other'
+    
+    @staticmethod
+    def iter_file_chunks(file_bytes: bytes, filename: str,
+                         chunk_size: int = IMPORT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """
+        Lee CSV/Excel por bloques de `chunk_size` filas.
+        Los CSV se leen en streaming; Excel no lo permite y se trocea tras leerlo.
+        """
+        try:
+            if filename.endswith('.csv'):
+                yield from pd.read_csv(io.BytesIO(file_bytes), chunksize=chunk_size)
+                return
+            elif filename.endswith(('.xlsx', '.xls')):
+                df = pd.read_excel(io.BytesIO(file_bytes))
+            else:
+                raise ValueError("Formato no soportado. Use .csv, .xlsx o .xls")
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Error al leer archivo: {str(e)}")
+        
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+    
     @staticmethod
     def parse_file(file_bytes: bytes, filename: str) -> pd.DataFrame:
         """Parse CSV or Excel file into DataFrame"""
@@ -91,22 +135,47 @@ class VocabularyImporter:
         return len(errors) == 0, errors
     
     @staticmethod
-    def dataframe_to_words(df: pd.DataFrame, word_type: str) -> List[Word]:
-        """Convert validated DataFrame to list of Word objects"""
-        words = []
+    def row_errors(df: pd.DataFrame, word_type: str) -> Dict[Any, str]:
+        """
+        Errores por fila (índice -> mensaje) con las mismas reglas que
+        validate_dataframe, evaluadas de forma vectorizada sobre el bloque.
+        """
+        schema = VocabularyImporter.get_schema(word_type)
+        checks = []
+        
+        for col in schema['required']:
+            if col in df.columns:
+                checks.append((df[col].isna(), f"'{col}' vacío"))
+        if 'gender' in df.columns:
+            checks.append((~df['gender'].isin(['m', 'f', 'n']), "género inválido (use m, f, n)"))
+        if 'declension' in df.columns:
+            checks.append((~df['declension'].astype(str).isin(['1', '2', '3', '4', '5']), "declinación inválida (use 1-5)"))
+        if 'conjugation' in df.columns:
+            valid_conj = ['1', '2', '3', '4', 'irregular']
+            checks.append((~df['conjugation'].astype(str).isin(valid_conj), "conjugación inválida"))
+        
+        errors: Dict[Any, List[str]] = {}
+        for mask, message in checks:
+            for index in df.index[mask.to_numpy()]:
+                errors.setdefault(index, []).append(message)
+        return {index: ", ".join(messages) for index, messages in errors.items()}
+    
+    @staticmethod
+    def dataframe_to_records(df: pd.DataFrame, word_type: str) -> List[Dict[str, Any]]:
+        """Convert validated DataFrame to Word column dicts (plain Python values)"""
+        records = []
         
         # Select schema for defaults
+        schema = VocabularyImporter.get_schema(word_type)
         if word_type == 'noun':
-            schema = VocabularyImporter.NOUN_SCHEMA
             pos = 'noun'
         elif word_type == 'verb':
-            schema = VocabularyImporter.VERB_SCHEMA
             pos = 'verb'
         else:
-            schema = VocabularyImporter.OTHER_SCHEMA
             pos = None  # Will come from data
         
-        for _, row in df.iterrows():
+        # to_dict evita construir una Series por fila (iterrows)
+        for row in df.to_dict('records'):
             word_data = {
                 'latin': row['latin'],
                 'translation': row['translation'],
@@ -134,9 +203,18 @@ class VocabularyImporter:
             if 'category' not in word_data or pd.isna(word_data['category']):
                 word_data['category'] = word_data['part_of_speech']
             
-            words.append(Word(**word_data))
+            # numpy -> Python (el driver no adapta numpy.int64)
+            records.append({
+                key: value.item() if hasattr(value, 'item') else value
+                for key, value in word_data.items()
+            })
         
-        return words
+        return records
+    
+    @staticmethod
+    def dataframe_to_words(df: pd.DataFrame, word_type: str) -> List[Word]:
+        """Convert validated DataFrame to list of Word objects"""
+        return [Word(**record) for record in VocabularyImporter.dataframe_to_records(df, word_type)]
 
 
 class VocabularyExporter:
@@ -289,44 +367,95 @@ class TemplateGenerator:
 # FUNCIONES WRAPPER PARA COMPATIBILIDAD CON IMPORTS LEGACY
 # =============================================================================
 
-def import_vocabulary_from_csv(file_bytes: bytes, filename: str, session) -> Tuple[int, List[str]]:
+class _InvalidRow:
+    """Fila rechazada por la validación del bloque"""
+    __slots__ = ('message',)
+    
+    def __init__(self, message: str):
+        self.message = message
+
+
+def _parse_import_row(row) -> Dict[str, Any]:
+    if isinstance(row, _InvalidRow):
+        raise ValueError(row.message)
+    return row
+
+
+def import_vocabulary_from_csv(file_bytes: bytes, filename: str, session,
+                               chunk_size: int = IMPORT_CHUNK_SIZE,
+                               progress_callback: Optional[Callable] = None) -> Tuple[int, List[str]]:
     """
     Wrapper para importar vocabulario desde CSV/Excel.
     
+    Lee y valida el fichero por bloques, omite las palabras que ya existen
+    (mismo lema y categoría) e inserta cada bloque con un INSERT masivo en
+    su propia transacción (ver database/bulk_import.py). Las filas inválidas
+    se omiten y se informan en la lista de errores.
+    
     Usado por: Admin.py
     
+    Args:
+        progress_callback: Recibe el ImportReport tras cada bloque
+    
     Returns:
-        Tuple[int, List[str]]: (número de palabras importadas, lista de errores)
+        Tuple[int, List[str]]: (número de palabras importadas, lista de errores);
+        si falla un bloque, cuentan las de los bloques ya confirmados
     """
+    from database.bulk_import import ImportReport, bulk_import_words
+    
+    importer = VocabularyImporter()
+    report = ImportReport()
     try:
-        importer = VocabularyImporter()
-        df = importer.parse_file(file_bytes, filename)
+        chunks = importer.iter_file_chunks(file_bytes, filename, chunk_size)
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            return 0, ["El archivo está vacío"]
         
         # Detectar tipo de palabra basado en columnas
-        if 'genitive' in df.columns:
-            word_type = 'noun'
-        elif 'principal_parts' in df.columns:
-            word_type = 'verb'
-        else:
-            word_type = 'other'
+        word_type = importer.detect_word_type(first_chunk.columns)
         
-        # Validar
-        is_valid, errors = importer.validate_dataframe(df, word_type)
-        if not is_valid:
-            return 0, errors
+        # Las columnas requeridas se comprueban una vez, antes de importar nada
+        missing_cols = set(importer.get_schema(word_type)['required']) - set(first_chunk.columns)
+        if missing_cols:
+            return 0, [f"Columnas requeridas faltantes: {', '.join(missing_cols)}"]
         
-        # Convertir a objetos Word
-        words = importer.dataframe_to_words(df, word_type)
+        def rows():
+            for chunk in _chain_first(first_chunk, chunks):
+                # Validar el bloque
+                errors = importer.row_errors(chunk, word_type)
+                valid = chunk.drop(index=list(errors)) if errors else chunk
+                records = iter(importer.dataframe_to_records(valid, word_type))
+                
+                # Convertir a registros manteniendo el orden de las filas
+                for index in chunk.index:
+                    if index in errors:
+                        yield _InvalidRow(errors[index])
+                    else:
+                        yield next(records)
         
-        # Guardar en base de datos
-        for word in words:
-            session.add(word)
-        session.commit()
+        report = bulk_import_words(
+            session,
+            rows(),
+            _parse_import_row,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            report=report,
+        )
         
-        return len(words), []
+        errors = list(report.errors)
+        if report.invalid > len(report.errors):
+            errors.append(f"... y {report.invalid - len(report.errors)} filas inválidas más")
+        return report.inserted, errors
     
     except Exception as e:
-        return 0, [f"Error al importar: {str(e)}"]
+        session.rollback()
+        # Los bloques anteriores al fallo ya se confirmaron
+        return report.inserted, list(report.errors) + [f"Error al importar: {str(e)}"]
+
+
+def _chain_first(first, rest):
+    yield first
+    yield from rest
 
 
 def export_vocabulary_to_excel(words: List[Word], word_type: str = 'noun') -> bytes:
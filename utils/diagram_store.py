@@ -0,0 +1,308 @@
+"""
+Almacén de diagramas de dependencias (SVG) direccionado por contenido
+
+Los SVG de displaCy son la columna más pesada de SentenceAnalysis. Este
+almacén los guarda fuera de la tabla, comprimidos con zlib, en un SQLite
+propio (mismo esquema de uso que utils/analysis_cache.py):
+
+- Clave: SHA-256 de los campos del árbol que afectan al dibujo (id, text,
+  pos, dep, head) + DIAGRAM_STYLE_VERSION. Dos oraciones con el mismo árbol
+  comparten entrada; cambiar lema o morfología no obliga a redibujar.
+- Renderizado perezoso: get_or_render dibuja el SVG la primera vez que se pide
+  (LatinSyntaxAnalyzer.render_dependency_svg) y lo guarda.
+- Memoria: LRU pequeña de SVG ya descomprimidos.
+
+Al cambiar el estilo de render_dependency_svg (etiquetas, opciones de
+displaCy) hay que incrementar DIAGRAM_STYLE_VERSION; las claves cambian y
+scripts/regenerate_syntax_svgs.py vuelve a dibujar solo lo necesario.
+
+Configuración por entorno:
+    DIAGRAM_STORE_PATH              Ruta del fichero SQLite ("" = solo memoria)
+    DIAGRAM_STORE_MEMORY_ENTRIES    SVG descomprimidos en memoria (def. 256)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Incrementar al cambiar el aspecto de LatinSyntaxAnalyzer.render_dependency_svg
+DIAGRAM_STYLE_VERSION = 1
+
+DEFAULT_STORE_PATH = os.path.join(os.getenv("USER_DATA_DIR", "."), "cache", "syntax_diagrams.sqlite")
+
+DIAGRAM_STORE_PATH = os.getenv("DIAGRAM_STORE_PATH", DEFAULT_STORE_PATH)
+DIAGRAM_STORE_MEMORY_ENTRIES = int(os.getenv("DIAGRAM_STORE_MEMORY_ENTRIES", "256"))
+
+# Campos del árbol que cambian el dibujo
+_RENDER_FIELDS = ("id", "text", "pos", "dep", "head")
+
+# Máximo de parámetros por consulta IN (...) de SQLite
+_SQLITE_CHUNK = 500
+
+
+def parse_dependencies(dependencies: Union[str, List[Dict], None]) -> List[Dict]:
+    """Acepta dependency_json (texto) o la lista ya decodificada"""
+    if isinstance(dependencies, str):
+        try:
+            dependencies = json.loads(dependencies or "[]")
+        except ValueError:
+            return []
+    return dependencies if isinstance(dependencies, list) else []
+
+
+def diagram_key(dependencies: Union[str, List[Dict]], style_version: int = DIAGRAM_STYLE_VERSION) -> Optional[str]:
+    """Hash del árbol (solo campos de dibujo) y la versión de estilo; None si no hay árbol"""
+    tokens = parse_dependencies(dependencies)
+    if not tokens:
+        return None
+    payload = json.dumps(
+        {"tree": [[token.get(field) for field in _RENDER_FIELDS] for token in tokens], "style": style_version},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_diagram(dependencies: Union[str, List[Dict]]) -> str:
+    """Dibuja el SVG (sin caché); "" si no se puede"""
+    from utils.syntax_analyzer import LatinSyntaxAnalyzer
+
+    tokens = parse_dependencies(dependencies)
+    if not tokens:
+        return ""
+    return LatinSyntaxAnalyzer.render_dependency_svg(tokens) or ""
+
+
+class DiagramStore:
+    """SVG comprimidos en SQLite, con una LRU en memoria"""
+
+    def __init__(
+        self,
+        path: Optional[str] = DIAGRAM_STORE_PATH,
+        max_memory_entries: int = DIAGRAM_STORE_MEMORY_ENTRIES,
+    ):
+        """
+        Args:
+            path: Fichero SQLite del almacén (None o "" = solo memoria)
+            max_memory_entries: SVG descomprimidos en la LRU de memoria
+        """
+        self.path = path or None
+        self.max_memory_entries = max_memory_entries
+
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._disk_disabled = False
+
+        self.counters: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "renders": 0,
+            "puts": 0,
+            "errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Nivel en disco
+    # ------------------------------------------------------------------
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        """Conexión SQLite del proceso actual (se reabre tras un fork)"""
+        if not self.path or self._disk_disabled:
+            return None
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS syntax_diagrams ("
+                " key TEXT PRIMARY KEY,"
+                " svg BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " compressed_size INTEGER NOT NULL,"
+                " style_version INTEGER NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Almacén de diagramas en disco deshabilitado ({self.path}): {e}")
+            self._disk_disabled = True
+            return None
+
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def _remember(self, key: str, svg: str) -> None:
+        self._memory[key] = svg
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[str]:
+        """SVG guardado con esa clave, o None"""
+        with self._lock:
+            svg = self._memory.get(key)
+            if svg is not None:
+                self._memory.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return svg
+
+            conn = self._disk()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT svg FROM syntax_diagrams WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                svg = zlib.decompress(row[0]).decode("utf-8")
+            except (sqlite3.Error, zlib.error) as e:
+                logger.warning(f"Error leyendo diagrama {key[:12]}: {e}")
+                self.counters["errors"] += 1
+                return None
+
+            self._remember(key, svg)
+            self.counters["disk_hits"] += 1
+            return svg
+
+    def put_many(self, items: Iterable[Tuple[str, str]], style_version: int = DIAGRAM_STYLE_VERSION) -> int:
+        """Guarda pares (clave, svg) en una sola transacción; devuelve cuántos"""
+        now = time.time()
+        rows = []
+        with self._lock:
+            for key, svg in items:
+                if not svg:
+                    continue
+                data = svg.encode("utf-8")
+                blob = zlib.compress(data, 9)
+                rows.append((key, blob, len(data), len(blob), style_version, now))
+                self._remember(key, svg)
+            self.counters["puts"] += len(rows)
+
+            conn = self._disk()
+            if conn is not None and rows:
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO syntax_diagrams "
+                        "(key, svg, size, compressed_size, style_version, created_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Error escribiendo diagramas: {e}")
+                    self.counters["errors"] += 1
+        return len(rows)
+
+    def put(self, key: str, svg: str, style_version: int = DIAGRAM_STYLE_VERSION) -> None:
+        self.put_many([(key, svg)], style_version=style_version)
+
+    def get_or_render(self, dependencies: Union[str, List[Dict]]) -> str:
+        """
+        SVG del árbol: del almacén si ya existe, si no se dibuja y se guarda
+
+        Args:
+            dependencies: dependency_json (texto o lista decodificada)
+
+        Returns:
+            SVG, o "" si el árbol está vacío o no se pudo dibujar
+        """
+        tokens = parse_dependencies(dependencies)
+        key = diagram_key(tokens)
+        if key is None:
+            return ""
+        svg = self.get(key)
+        if svg is not None:
+            return svg
+
+        svg = render_diagram(tokens)
+        self.counters["renders"] += 1
+        if svg:
+            self.put(key, svg)
+        return svg
+
+    def existing_keys(self, keys: Iterable[str]) -> Set[str]:
+        """Subconjunto de claves que ya están en el almacén"""
+        keys = list(dict.fromkeys(keys))
+        with self._lock:
+            found = {key for key in keys if key in self._memory}
+            conn = self._disk()
+            if conn is None:
+                return found
+            pending = [key for key in keys if key not in found]
+            for start in range(0, len(pending), _SQLITE_CHUNK):
+                chunk = pending[start:start + _SQLITE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    row[0] for row in conn.execute(
+                        f"SELECT key FROM syntax_diagrams WHERE key IN ({placeholders})", chunk
+                    )
+                )
+            return found
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Borra las entradas que no están en `keep` (árboles o estilos ya sin uso)"""
+        keep = set(keep)
+        with self._lock:
+            for key in [key for key in self._memory if key not in keep]:
+                del self._memory[key]
+            conn = self._disk()
+            if conn is None:
+                return 0
+            stale = [(row[0],) for row in conn.execute("SELECT key FROM syntax_diagrams") if row[0] not in keep]
+            conn.executemany("DELETE FROM syntax_diagrams WHERE key = ?", stale)
+            conn.commit()
+            return len(stale)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Contadores, entradas y bytes (sin comprimir / comprimidos)"""
+        with self._lock:
+            entries = size = compressed = None
+            conn = self._disk()
+            if conn is not None:
+                try:
+                    entries, size, compressed = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(compressed_size), 0) "
+                        "FROM syntax_diagrams"
+                    ).fetchone()
+                except sqlite3.Error:
+                    pass
+            return {
+                **self.counters,
+                "memory_entries": len(self._memory),
+                "disk_entries": entries,
+                "disk_bytes": size,
+                "disk_compressed_bytes": compressed,
+                "style_version": DIAGRAM_STYLE_VERSION,
+                "path": self.path,
+            }
+
+
+# Instancia global del proceso (lazy loading)
+_global_store: Optional[DiagramStore] = None
+
+
+def get_diagram_store() -> DiagramStore:
+    """Obtiene el almacén compartido del proceso (configurado por entorno)"""
+    global _global_store
+    if _global_store is None:
+        _global_store = DiagramStore()
+    return _global_store
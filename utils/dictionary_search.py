@@ -0,0 +1,363 @@
+"""
+Búsqueda del diccionario con índice de texto completo (SQLite FTS5)
+
+Sustituye `Word.latin == ...` / `Word.latin.contains(...)` (LIKE '%x%', recorrido
+completo de la tabla) por una tabla virtual FTS5 `word_search` con una fila por
+palabra (rowid = word.id) y cuatro columnas:
+
+- lemma: lema normalizado (sin macrones, minúsculas)
+- forms: formas inflectadas normalizadas (InflectedForm.normalized_form)
+- translation: traducción
+- definition: definición de Collatinus (definition_es)
+
+El tokenizador `unicode61 remove_diacritics 2` hace la búsqueda insensible a
+macrones y mayúsculas, y el índice de prefijos (2 y 3 caracteres) resuelve las
+consultas `puel*` sin recorrer el léxico. Los resultados se ordenan por
+coincidencia exacta del lema, luego por `frequency_rank_global` y por bm25.
+
+Actualización incremental: se anotan las palabras modificadas (Word o sus
+InflectedForm, vía database/invalidation.py) y, tras el commit, se reindexan solo
+esas filas antes de la siguiente búsqueda. Las escrituras masivas de palabras
+indexan las filas nuevas (id > último indexado); las masivas de formas
+reconstruyen el índice.
+
+Con SEARCH_INDEX_ENABLED=false, con bases de datos que no son SQLite o sin
+FTS5, search_words usa consultas LIKE sobre lema, traducción y definición.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import or_, text
+from sqlmodel import select
+
+from database import InflectedForm, Word
+from database.invalidation import register_invalidation
+from utils.text_utils import normalize_latin
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_ENABLED = os.getenv("SEARCH_INDEX_ENABLED", "True").lower() == "true"
+
+SEARCH_TABLE = "word_search"
+
+# Pesos bm25 por columna: lemma, forms, translation, definition
+_BM25_WEIGHTS = "10.0, 5.0, 2.0, 1.0"
+
+# Filas por INSERT al (re)construir el índice
+_BUILD_BATCH_SIZE = 5000
+
+
+_CREATE_TABLE_SQL = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+    lemma, forms, translation, definition,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+_INSERT_SQL = text(
+    f"INSERT INTO {SEARCH_TABLE} (rowid, lemma, forms, translation, definition) "
+    "VALUES (:id, :lemma, :forms, :translation, :definition)"
+)
+
+_SEARCH_SQL = text(f"""
+SELECT s.rowid
+FROM {SEARCH_TABLE} AS s
+JOIN word AS w ON w.id = s.rowid
+WHERE {SEARCH_TABLE} MATCH :query
+ORDER BY (s.lemma = :term) DESC,
+         (w.frequency_rank_global IS NULL OR w.frequency_rank_global <= 0),
+         w.frequency_rank_global,
+         bm25({SEARCH_TABLE}, {_BM25_WEIGHTS})
+LIMIT :limit
+""")
+
+
+def normalize_search_text(value: Optional[str]) -> str:
+    """Texto normalizado para el índice: sin macrones ni diacríticos, minúsculas"""
+    return normalize_latin(value or "").lower()
+
+
+def search_tokens(term: str) -> List[str]:
+    """Palabras de la consulta, normalizadas"""
+    return re.findall(r"\w+", normalize_search_text(term))
+
+
+def build_match_query(tokens: List[str], mode: str = "prefix") -> str:
+    """
+    Expresión MATCH de FTS5 (los tokens van entre comillas: sin operadores del usuario)
+
+    Args:
+        tokens: Salida de search_tokens
+        mode: "exact" (lema o forma inflectada idénticos) o "prefix"
+            (prefijos en todas las columnas)
+    """
+    quoted = ['"' + token.replace('"', '""') + '"' for token in tokens]
+    if mode == "exact":
+        return "{lemma forms} : " + '"' + " ".join(tokens).replace('"', '""') + '"'
+    return " AND ".join(f"{q}*" for q in quoted)
+
+
+class DictionarySearchIndex:
+    """Índice FTS5 de palabras con actualización incremental"""
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._checked = False
+        self.available = False
+        # Cambios confirmados pendientes de aplicar al índice
+        self._pending_ids: Set[int] = set()
+        self._needs_catch_up = False
+        self._needs_rebuild = False
+        self.build_time_ms: float = 0.0
+        self.updates = 0
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from database.connection import engine
+            self._engine = engine
+        return self._engine
+
+    # --- Creación / reconstrucción ---
+
+    def ensure(self) -> bool:
+        """Crea (y llena si hace falta) el índice una vez por proceso"""
+        if self._checked:
+            return self.available
+        with self._lock:
+            if self._checked:
+                return self.available
+            self._checked = True
+            if not SEARCH_INDEX_ENABLED or self.engine.dialect.name != "sqlite":
+                return False
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(text(_CREATE_TABLE_SQL))
+                    indexed = conn.execute(text(f"SELECT count(*) FROM {SEARCH_TABLE}")).scalar()
+                    words = conn.execute(text("SELECT count(*) FROM word")).scalar()
+                self.available = True
+            except Exception as e:
+                logger.warning(f"Dictionary search index unavailable, using LIKE search: {e}")
+                return False
+
+            # Índice nuevo, o desfasado respecto a la tabla word (escrituras externas)
+            if indexed != words:
+                self._rebuild_locked()
+            return True
+
+    def rebuild(self) -> int:
+        """Reconstruye el índice completo; devuelve el número de palabras indexadas"""
+        if not self.ensure():
+            return 0
+        with self._lock:
+            return self._rebuild_locked()
+
+    def _rebuild_locked(self) -> int:
+        start = time.time()
+        with self.engine.begin() as conn:
+            conn.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+            count = self._index_words(conn)
+        self._pending_ids.clear()
+        self._needs_catch_up = self._needs_rebuild = False
+        self.build_time_ms = (time.time() - start) * 1000
+        logger.info(f"Dictionary search index built: {count} words in {self.build_time_ms:.0f}ms")
+        return count
+
+    def _index_words(self, conn, word_ids: Optional[Iterable[int]] = None, min_id: Optional[int] = None) -> int:
+        """Inserta las filas de las palabras dadas (todas si no se indica filtro)"""
+        # Condición sobre el id de palabra ({column}: id en word, word_id en inflectedform)
+        condition, params = "1 = 1", {}
+        if word_ids is not None:
+            ids = sorted(set(word_ids))
+            if not ids:
+                return 0
+            condition = "{column} IN (" + ", ".join(str(int(i)) for i in ids) + ")"
+        elif min_id is not None:
+            condition, params = "{column} > :min_id", {"min_id": min_id}
+
+        forms: Dict[int, str] = dict(conn.execute(
+            text(
+                "SELECT word_id, group_concat(DISTINCT normalized_form) FROM inflectedform "
+                f"WHERE {condition.format(column='word_id')} GROUP BY word_id"
+            ),
+            params
+        ).all())
+
+        rows = conn.execute(
+            text(
+                "SELECT id, latin, translation, definition_es FROM word "
+                f"WHERE {condition.format(column='id')} ORDER BY id"
+            ),
+            params
+        )
+        count, batch = 0, []
+        for word_id, latin, translation, definition in rows:
+            batch.append({
+                "id": word_id,
+                "lemma": normalize_search_text(latin),
+                "forms": forms.get(word_id) or "",
+                "translation": normalize_search_text(translation),
+                "definition": normalize_search_text(definition),
+            })
+            if len(batch) >= _BUILD_BATCH_SIZE:
+                conn.execute(_INSERT_SQL, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            conn.execute(_INSERT_SQL, batch)
+            count += len(batch)
+        return count
+
+    # --- Actualización incremental ---
+
+    def mark_words(self, word_ids: Iterable[int]):
+        """Palabras a reindexar (tras un commit)"""
+        with self._lock:
+            self._pending_ids.update(word_ids)
+
+    def mark_bulk_insert(self):
+        """INSERT masivo de palabras: indexar las filas con id nuevo"""
+        self._needs_catch_up = True
+
+    def mark_rebuild(self):
+        """Escritura masiva no localizable: reconstruir en la próxima búsqueda"""
+        self._needs_rebuild = True
+
+    def sync(self):
+        """Aplica los cambios pendientes al índice"""
+        if not (self._pending_ids or self._needs_catch_up or self._needs_rebuild):
+            return
+        if not self.ensure():
+            return
+        with self._lock:
+            if self._needs_rebuild:
+                self._rebuild_locked()
+                return
+            pending, self._pending_ids = self._pending_ids, set()
+            catch_up, self._needs_catch_up = self._needs_catch_up, False
+            with self.engine.begin() as conn:
+                if pending:
+                    ids = ", ".join(str(int(i)) for i in sorted(pending))
+                    conn.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({ids})"))
+                    self._index_words(conn, word_ids=pending)
+                if catch_up:
+                    last_id = conn.execute(text(f"SELECT coalesce(max(rowid), 0) FROM {SEARCH_TABLE}")).scalar()
+                    self._index_words(conn, min_id=last_id)
+            self.updates += 1
+
+    # --- Consulta ---
+
+    def search_ids(self, session, term: str, mode: str = "prefix", limit: int = 50) -> List[int]:
+        """Ids de palabras ordenados por relevancia"""
+        tokens = search_tokens(term)
+        if not tokens:
+            return []
+        self.sync()
+        rows = session.exec(
+            _SEARCH_SQL,
+            params={
+                "query": build_match_query(tokens, mode),
+                "term": " ".join(tokens),
+                "limit": limit,
+            }
+        ).all()
+        return [row[0] for row in rows]
+
+    def get_stats(self) -> Dict:
+        return {
+            "available": self.available,
+            "build_time_ms": round(self.build_time_ms, 1),
+            "incremental_updates": self.updates,
+            "pending_words": len(self._pending_ids),
+        }
+
+
+# Índice compartido por todo el proceso
+_search_index: Optional[DictionarySearchIndex] = None
+_search_index_lock = threading.Lock()
+
+
+def get_search_index() -> DictionarySearchIndex:
+    """Índice de búsqueda del proceso (singleton)"""
+    global _search_index
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                _search_index = DictionarySearchIndex()
+    return _search_index
+
+
+def _like_search(session, term: str, mode: str, limit: int) -> List[Word]:
+    """Búsqueda sin índice (LIKE), para bases de datos sin FTS5"""
+    normalized = normalize_search_text(term.strip())
+    if mode == "exact":
+        statement = select(Word).where(Word.latin == normalized)
+    else:
+        statement = select(Word).where(or_(
+            Word.latin.contains(normalized),
+            Word.translation.contains(normalized),
+            Word.definition_es.contains(normalized),
+        ))
+    return list(session.exec(statement.limit(limit)).all())
+
+
+def search_words(session, term: str, mode: str = "prefix", limit: int = 50) -> List[Word]:
+    """
+    Busca palabras por lema, forma inflectada, traducción o definición
+
+    Args:
+        session: Sesión de BD (puede ser de solo lectura)
+        term: Texto buscado (con o sin macrones)
+        mode: "exact" (lema o forma idénticos) o "prefix" (prefijos en todas las columnas)
+        limit: Máximo de resultados
+
+    Returns:
+        Palabras ordenadas por relevancia (lema exacto, frecuencia, bm25)
+    """
+    index = get_search_index()
+    if not index.ensure():
+        return _like_search(session, term, mode, limit)
+
+    ids = index.search_ids(session, term, mode, limit)
+    if not ids:
+        return []
+    words = {word.id: word for word in session.exec(select(Word).where(Word.id.in_(ids))).all()}
+    return [words[word_id] for word_id in ids if word_id in words]
+
+
+def _collect_search_changes(session, objects, pending: set):
+    """Anota las palabras modificadas; se reindexan tras el commit"""
+    for obj in objects:
+        word_id = obj.id if isinstance(obj, Word) else obj.word_id
+        if word_id is not None:
+            pending.add(word_id)
+
+
+def _collect_search_bulk_changes(orm_execute_state, model, pending: set):
+    # Se aplica al hacer commit (marcador en el conjunto pendiente)
+    pending.add("insert" if (orm_execute_state.is_insert and model is Word) else "rebuild")
+
+
+def _apply_search_changes_on_commit(pending: set):
+    index = get_search_index()
+    if "rebuild" in pending:
+        index.mark_rebuild()
+    if "insert" in pending:
+        index.mark_bulk_insert()
+    index.mark_words(i for i in pending if isinstance(i, int))
+
+
+register_invalidation(
+    "dictionary_search",
+    (Word, InflectedForm),
+    on_flush=_collect_search_changes,
+    on_bulk=_collect_search_bulk_changes,
+    on_commit=_apply_search_changes_on_commit,
+)
@@ -134,33 +134,18 @@ class LatinMorphologyAnalyzer:
             print(f"⚠ Error aplicando parche de compatibilidad: {e}")
     
     def _initialize_analyzer(self):
-        """Inicializa el lemmatizador de PyCollatinus"""
-        try:
-            from pycollatinus import Lemmatiseur
-            
-            if self._use_compiled:
-                try:
-                    # Intentar cargar versión compilada
-                    self._analyzer = Lemmatiseur.load()
-                    print("✓ Analizador morfológico cargado (compilado)")
-                except:
-                    # Si falla, usar versión normal y compilar
-                    self._analyzer = Lemmatiseur()
-                    try:
-                        self._analyzer.compile()
-                        print("✓ Analizador morfológico compilado para futuro uso")
-                    except:
-                        pass
-                    print("✓ Analizador morfológico cargado (normal)")
-            else:
-                self._analyzer = Lemmatiseur()
-                print("✓ Analizador morfológico cargado")
-                
-        except ImportError:
+        """Toma prestado el lemmatizador compartido de PyCollatinus (ver utils.lemmatizer_registry)"""
+        from utils.lemmatizer_registry import get_lemmatiseur, is_lemmatiseur_available
+        
+        if not is_lemmatiseur_available():
             raise ImportError(
                 "PyCollatinus no está instalado. "
                 "Instálalo con: pip install pycollatinus"
             )
+        
+        self._analyzer = get_lemmatiseur(use_compiled=self._use_compiled)
+        if self._analyzer:
+            print("✓ Analizador morfológico listo (lemmatizador compartido)")
     
     def translate_morphology(self, morph_fr: str) -> str:
         """
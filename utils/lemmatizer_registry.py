@@ -0,0 +1,176 @@
+"""
+Registro compartido del lemmatizador de PyCollatinus
+
+Cargar un `Lemmatiseur` cuesta entre 3 y 5 segundos y varios cientos de MB.
+Este módulo mantiene una única instancia por proceso, cargada de forma perezosa
+la primera vez que algún analizador la pide, para que `LatinMorphologyAnalyzer`,
+`LatinMorphAnalyzer` y `ComprehensiveLatinAnalyzer` compartan el mismo modelo
+en lugar de cargar uno cada uno.
+
+Uso:
+    from utils.lemmatizer_registry import get_lemmatiseur, get_lemmatizer_stats
+
+    lemmatiseur = get_lemmatiseur()   # None si PyCollatinus no está instalado
+    print(get_lemmatizer_stats())     # tiempo de carga y RSS
+"""
+
+import logging
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Versión compilada propia del proyecto (más rápida de cargar ~3s vs ~5s)
+COMPILED_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'collatinus_compiled.pickle')
+
+_lemmatiseur = None
+_load_attempted = False
+_registry_lock = threading.Lock()
+_stats: Dict[str, Any] = {
+    "loaded": False,
+    "source": None,
+    "load_time_s": None,
+    "rss_before_mb": None,
+    "rss_after_mb": None,
+    "rss_delta_mb": None,
+    "borrowers": 0,
+}
+
+
+def current_rss_mb() -> Optional[float]:
+    """Memoria residente actual del proceso en MB (None si no se puede medir)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+        import sys
+
+        # ru_maxrss es el pico (KB en Linux, bytes en macOS): aproximación razonable
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+    except Exception:
+        return None
+
+
+def _import_lemmatiseur():
+    """Importa Lemmatiseur aplicando el parche de collections.Callable (Python 3.10+)"""
+    import collections
+    import collections.abc
+    if not hasattr(collections, 'Callable'):
+        collections.Callable = collections.abc.Callable
+
+    from pycollatinus import Lemmatiseur
+    return Lemmatiseur
+
+
+def _load(use_compiled: bool):
+    """Carga el lemmatizador; devuelve (instancia, origen)"""
+    Lemmatiseur = _import_lemmatiseur()
+
+    if not use_compiled:
+        return Lemmatiseur(), "standard"
+
+    if os.path.exists(COMPILED_PATH):
+        try:
+            return Lemmatiseur.load(COMPILED_PATH), "project_compiled"
+        except Exception as e:
+            logger.warning(f"Error cargando PyCollatinus compilado desde {COMPILED_PATH}: {e}")
+
+    try:
+        return Lemmatiseur.load(), "package_compiled"
+    except Exception:
+        pass
+
+    lemmatiseur = Lemmatiseur()
+
+    # Compilar para futuras cargas
+    try:
+        lemmatiseur.compile()
+        default_compiled = lemmatiseur.path('compiled.pickle')
+        if os.path.exists(default_compiled):
+            os.makedirs(os.path.dirname(COMPILED_PATH), exist_ok=True)
+            shutil.copy(default_compiled, COMPILED_PATH)
+            logger.info(f"PyCollatinus compilado guardado en {COMPILED_PATH}")
+    except Exception as e:
+        logger.warning(f"No se pudo compilar PyCollatinus: {e}")
+
+    return lemmatiseur, "standard"
+
+
+def get_lemmatiseur(use_compiled: bool = True):
+    """
+    Devuelve el Lemmatiseur compartido del proceso, cargándolo la primera vez
+
+    Args:
+        use_compiled: Preferir la versión compilada (solo cuenta en la primera carga)
+
+    Returns:
+        Instancia de pycollatinus.Lemmatiseur, o None si PyCollatinus no está
+        instalado o falló la carga (no se reintenta)
+    """
+    global _lemmatiseur, _load_attempted
+
+    if _load_attempted:
+        _stats["borrowers"] += 1
+        return _lemmatiseur
+
+    with _registry_lock:
+        if not _load_attempted:
+            rss_before = current_rss_mb()
+            start = time.time()
+            try:
+                _lemmatiseur, source = _load(use_compiled)
+            except ImportError:
+                logger.warning("PyCollatinus no está instalado. Instálalo con: pip install pycollatinus")
+                _lemmatiseur, source = None, None
+            except Exception as e:
+                logger.error(f"Error inicializando PyCollatinus: {e}")
+                _lemmatiseur, source = None, None
+
+            load_time = time.time() - start
+            rss_after = current_rss_mb()
+
+            _stats.update({
+                "loaded": _lemmatiseur is not None,
+                "source": source,
+                "load_time_s": round(load_time, 2),
+                "rss_before_mb": round(rss_before, 1) if rss_before is not None else None,
+                "rss_after_mb": round(rss_after, 1) if rss_after is not None else None,
+                "rss_delta_mb": (
+                    round(rss_after - rss_before, 1)
+                    if rss_before is not None and rss_after is not None else None
+                ),
+            })
+            _load_attempted = True
+
+            if _lemmatiseur is not None:
+                logger.info(
+                    f"✅ PyCollatinus cargado ({source}) en {load_time:.2f}s, "
+                    f"RSS +{_stats['rss_delta_mb']} MB"
+                )
+
+        _stats["borrowers"] += 1
+        return _lemmatiseur
+
+
+def is_lemmatiseur_available() -> bool:
+    """Indica si PyCollatinus se puede importar (sin cargar el modelo)"""
+    try:
+        _import_lemmatiseur()
+        return True
+    except ImportError:
+        return False
+
+
+def get_lemmatizer_stats() -> Dict[str, Any]:
+    """Tiempo de carga, origen, memoria usada y número de préstamos del lemmatizador"""
+    return dict(_stats)
@@ -0,0 +1,284 @@
+"""
+Índice morfológico reverso en memoria (forma normalizada → análisis)
+
+Sustituye la consulta por token a `InflectedForm` (más la carga perezosa de
+`match.word`) por un único mapa hash construido una vez por proceso a partir de
+las tablas `InflectedForm` y `Word`. Con el índice cargado, analizar un texto
+completo no ejecuta ninguna consulta SQL por palabra.
+
+Representación compacta:
+- Cada morfología distinta (JSON) se interna una sola vez y recibe un código entero.
+- Cada entrada del índice es un entero empaquetado: (word_id << MORPH_BITS) | código.
+- Los metadatos de cada palabra se guardan una sola vez como tupla.
+
+El índice es de solo lectura. El commit de cualquier escritura ORM sobre
+`InflectedForm` o `Word` (en cualquier sesión del proceso) lo invalida, y se
+reconstruye de forma perezosa en la siguiente consulta. Una sesión con
+escrituras sin confirmar construye su propio índice pero no lo publica.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlmodel import select
+
+from database import InflectedForm, Word
+from database.invalidation import has_pending_changes, register_invalidation
+from utils.latin_logic import LatinMorphology
+
+logger = logging.getLogger(__name__)
+
+# Permite desactivar el índice (p. ej. despliegues con poca memoria); en ese caso
+# LatinTextAnalyzer usa el modo por lotes con una consulta IN por texto
+MORPH_INDEX_ENABLED = os.getenv("MORPH_INDEX_ENABLED", "True").lower() == "true"
+
+# Bits reservados para el código de morfología dentro de cada entrada empaquetada
+MORPH_BITS = 20
+MORPH_MASK = (1 << MORPH_BITS) - 1
+
+# Campos de Word guardados en el índice (orden de la tupla de metadatos)
+_WORD_FIELDS = ("latin", "translation", "part_of_speech", "declension", "conjugation", "gender")
+
+
+class MorphologyIndex:
+    """Índice de solo lectura forma normalizada → análisis morfológicos"""
+
+    def __init__(self):
+        self._forms: Dict[str, Tuple[int, ...]] = {}
+        self._invariables: Dict[str, Tuple[int, ...]] = {}
+        self._words: Dict[int, Tuple] = {}
+        self._morphologies: List[Dict] = []
+        self.build_time_ms: float = 0.0
+
+    @classmethod
+    def build(cls, session) -> "MorphologyIndex":
+        """
+        Construye el índice con dos consultas (palabras y formas)
+
+        Args:
+            session: Sesión de base de datos SQLModel
+
+        Returns:
+            Índice listo para consultas
+        """
+        start = time.time()
+        index = cls()
+
+        word_rows = session.exec(
+            select(
+                Word.id, Word.latin, Word.translation, Word.part_of_speech,
+                Word.declension, Word.conjugation, Word.gender, Word.is_invariable
+            )
+        ).all()
+
+        invariables: Dict[str, List[int]] = {}
+        for row in word_rows:
+            word_id = row[0]
+            index._words[word_id] = tuple(row[1:7])
+            if row[7]:
+                normalized = LatinMorphology.normalize_latin(row[1])
+                invariables.setdefault(normalized, []).append(word_id)
+
+        index._invariables = {key: tuple(ids) for key, ids in invariables.items()}
+
+        form_rows = session.exec(
+            select(InflectedForm.normalized_form, InflectedForm.word_id, InflectedForm.morphology)
+            .order_by(InflectedForm.id)
+        ).all()
+
+        morph_codes: Dict[str, int] = {}
+        forms: Dict[str, List[int]] = {}
+        for normalized_form, word_id, morphology in form_rows:
+            # Igual que la consulta original: ignorar formas huérfanas
+            if word_id not in index._words:
+                continue
+
+            code = morph_codes.get(morphology)
+            if code is None:
+                code = len(index._morphologies)
+                if code > MORPH_MASK:
+                    raise ValueError("Demasiadas morfologías distintas para el índice")
+                morph_codes[morphology] = code
+                index._morphologies.append(json.loads(morphology))
+
+            forms.setdefault(normalized_form, []).append((word_id << MORPH_BITS) | code)
+
+        index._forms = {key: tuple(entries) for key, entries in forms.items()}
+        index.build_time_ms = (time.time() - start) * 1000
+
+        logger.info(
+            f"Índice morfológico construido: {len(index._forms)} formas, "
+            f"{len(index._words)} palabras, {len(index._morphologies)} morfologías "
+            f"({index.build_time_ms:.0f}ms)"
+        )
+        return index
+
+    def _word_fields(self, word_id: int) -> Dict:
+        return dict(zip(_WORD_FIELDS, self._words[word_id]))
+
+    def lookup(self, normalized: str) -> List[Dict]:
+        """
+        Devuelve los análisis de una forma ya normalizada (sin macrones)
+
+        El formato es idéntico al de `LatinTextAnalyzer.analyze_word`.
+        """
+        results = []
+        for packed in self._forms.get(normalized, ()):
+            word_id = packed >> MORPH_BITS
+            word = self._word_fields(word_id)
+            results.append({
+                "lemma": word["latin"],
+                "translation": word["translation"],
+                "pos": word["part_of_speech"],
+                "morphology": dict(self._morphologies[packed & MORPH_MASK]),
+                "confidence": 1.0,
+                "word_id": word_id,
+                "declension": word["declension"],
+                "conjugation": word["conjugation"],
+                "gender": word["gender"]
+            })
+        return results
+
+    def lookup_invariable(self, normalized: str) -> List[Dict]:
+        """Análisis heurístico: palabras invariables cuyo lema normalizado coincide"""
+        results = []
+        for word_id in self._invariables.get(normalized, ()):
+            word = self._word_fields(word_id)
+            results.append({
+                "lemma": word["latin"],
+                "translation": word["translation"],
+                "pos": word["part_of_speech"],
+                "morphology": {"invariable": True},
+                "confidence": 0.9,
+                "word_id": word_id,
+                "declension": None,
+                "conjugation": None,
+                "gender": None
+            })
+        return results
+
+    def get_stats(self) -> Dict:
+        """Resumen del tamaño del índice"""
+        return {
+            "forms": len(self._forms),
+            "words": len(self._words),
+            "invariables": len(self._invariables),
+            "morphologies": len(self._morphologies),
+            "build_time_ms": round(self.build_time_ms, 2),
+        }
+
+
+# ============================================================================
+# INSTANCIA GLOBAL (lazy loading + invalidación por escritura)
+# ============================================================================
+
+_global_index: Optional[MorphologyIndex] = None
+_invariable_lookup: Optional[Dict[str, Tuple[Tuple, ...]]] = None
+_index_version = 0
+_index_lock = threading.Lock()
+
+# Nombre de la caché en database/invalidation.py
+_INVALIDATION_NAME = "morphology_index"
+
+
+def get_morphology_index(session) -> MorphologyIndex:
+    """
+    Obtiene el índice global del proceso, construyéndolo si hace falta
+
+    Args:
+        session: Sesión usada solo si hay que (re)construir el índice
+
+    Returns:
+        Índice morfológico compartido
+    """
+    global _global_index
+
+    # Con escrituras sin confirmar, la sesión ve su propio índice (no compartido)
+    if has_pending_changes(session, _INVALIDATION_NAME):
+        return MorphologyIndex.build(session)
+
+    index = _global_index
+    if index is not None:
+        return index
+
+    with _index_lock:
+        if _global_index is None:
+            version = _index_version
+            index = MorphologyIndex.build(session)
+            # Si hubo una escritura durante la construcción, no publicar el índice
+            if version != _index_version:
+                return index
+            _global_index = index
+        return _global_index
+
+
+def get_invariable_lookup(session) -> Dict[str, Tuple[Tuple, ...]]:
+    """
+    Diccionario precalculado lema normalizado → palabras invariables
+
+    Evita recorrer todas las palabras invariables por cada token desconocido.
+    Cada valor es una tupla de (word_id, latin, translation, part_of_speech).
+    """
+    global _invariable_lookup
+
+    local = has_pending_changes(session, _INVALIDATION_NAME)
+    lookup = _invariable_lookup
+    if lookup is not None and not local:
+        return lookup
+
+    with _index_lock:
+        if _invariable_lookup is None or local:
+            version = _index_version
+            rows = session.exec(
+                select(Word.id, Word.latin, Word.translation, Word.part_of_speech)
+                .where(Word.is_invariable == True)
+                .order_by(Word.id)
+            ).all()
+
+            grouped: Dict[str, List[Tuple]] = {}
+            for row in rows:
+                normalized = LatinMorphology.normalize_latin(row[1])
+                grouped.setdefault(normalized, []).append(tuple(row))
+
+            lookup = {key: tuple(words) for key, words in grouped.items()}
+            if local or version != _index_version:
+                return lookup
+            _invariable_lookup = lookup
+        return _invariable_lookup
+
+
+def invalidate_morphology_index():
+    """Descarta el índice global; se reconstruirá en la próxima consulta"""
+    global _global_index, _invariable_lookup, _index_version
+    _index_version += 1
+    if _global_index is not None:
+        logger.debug("Índice morfológico invalidado")
+    _global_index = None
+    _invariable_lookup = None
+
+
+def _collect_index_changes(session, objects, pending: set):
+    """Anota escrituras ORM de formas o palabras; el índice se invalida tras el commit"""
+    pending.add(True)
+
+
+def _collect_index_bulk_changes(orm_execute_state, model, pending: set):
+    """Anota UPDATE/DELETE/INSERT masivos sobre formas o palabras"""
+    pending.add(True)
+
+
+def _invalidate_on_commit(pending: set):
+    invalidate_morphology_index()
+
+
+register_invalidation(
+    _INVALIDATION_NAME,
+    (InflectedForm, Word),
+    on_flush=_collect_index_changes,
+    on_bulk=_collect_index_bulk_changes,
+    on_commit=_invalidate_on_commit,
+)
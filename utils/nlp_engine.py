@@ -1,8 +1,9 @@
 
-import spacy
 import logging
 from typing import Dict, List, Optional, Any
 
+from utils.nlp_model_pool import get_pipeline
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -10,7 +11,8 @@ logger = logging.getLogger(__name__)
 class LatinNLP:
     """
     NLP Engine for Latin text analysis using Spacy.
-    Singleton pattern to load the model only once.
+    Singleton pattern; the model itself comes from the shared pool
+    (utils.nlp_model_pool), so it is only loaded once per process.
     """
     _instance = None
     _nlp = None
@@ -28,7 +30,7 @@ class LatinNLP:
         """Loads the Spacy Latin model."""
         try:
             logger.info("Loading Spacy Latin model 'la_core_web_lg'...")
-            self._nlp = spacy.load("la_core_web_lg")
+            self._nlp = get_pipeline("la_core_web_lg", profile="full")
             logger.info("Model loaded successfully.")
         except OSError:
             logger.error("Failed to load model 'la_core_web_lg'. Is it installed?")
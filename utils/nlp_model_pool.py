@@ -0,0 +1,233 @@
+"""
+Pool compartido de modelos spaCy/LatinCy
+
+`LatinNLP`, `LatinSyntaxAnalyzer`, `UDEnhancer` y `ComprehensiveLatinAnalyzer`
+obtienen sus pipelines de aquí en lugar de llamar a `spacy.load` cada uno, de
+modo que un worker de Streamlit mantiene una sola copia de cada modelo.
+
+Cada consumidor pide un perfil de componentes ("lemma", "syntax", "full"); el
+pool devuelve una vista ligera del modelo compartido que desactiva por llamada
+los componentes que ese perfil no necesita (sin modificar el modelo, por lo
+que es seguro entre hilos).
+
+Si se define NLP_MEMORY_BUDGET_MB y cargar el modelo grande superaría ese
+presupuesto, se usa `la_core_web_sm` en su lugar. Lo mismo ocurre si el modelo
+pedido no está instalado.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.lemmatizer_registry import current_rss_mb
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "la_core_web_lg"
+FALLBACK_MODEL = "la_core_web_sm"
+
+# Presupuesto de memoria del proceso en MB (0 = sin límite)
+NLP_MEMORY_BUDGET_MB = int(os.getenv("NLP_MEMORY_BUDGET_MB", "0"))
+
+# Memoria aproximada que ocupa cada modelo cargado (MB)
+MODEL_SIZE_ESTIMATES_MB = {
+    "la_core_web_lg": 900,
+    "la_core_web_md": 250,
+    "la_core_web_sm": 60,
+    "la_core_web_trf": 1200,
+}
+
+# Componentes desactivados por perfil de uso
+PIPELINE_PROFILES = {
+    # Todo el pipeline
+    "full": (),
+    # Lemas, POS y morfología: sin parser ni NER
+    "lemma": ("parser", "ner", "senter"),
+    # Árbol de dependencias: todo salvo NER
+    "syntax": ("ner",),
+}
+
+
+class PooledPipeline:
+    """
+    Vista de un modelo compartido con un conjunto de componentes desactivados
+
+    Se comporta como un `spacy.Language` (llamada, `pipe`, atributos), pero
+    pasa `disable=` en cada llamada en lugar de modificar el modelo.
+    """
+
+    def __init__(self, nlp, disabled: Iterable[str], model_name: str, profile: str):
+        self._nlp = nlp
+        self.disabled: List[str] = [name for name in disabled if name in nlp.pipe_names]
+        self.model_name = model_name
+        self.profile = profile
+
+    def __call__(self, text: str, **kwargs):
+        kwargs.setdefault("disable", self.disabled)
+        return self._nlp(text, **kwargs)
+
+    def pipe(self, texts, **kwargs):
+        kwargs.setdefault("disable", self.disabled)
+        return self._nlp.pipe(texts, **kwargs)
+
+    @property
+    def language(self):
+        """Modelo spaCy subyacente (compartido; no modificar)"""
+        return self._nlp
+
+    def __getattr__(self, name):
+        return getattr(self._nlp, name)
+
+    def __repr__(self):
+        return f"<PooledPipeline {self.model_name} profile={self.profile} disabled={self.disabled}>"
+
+
+class NLPModelPool:
+    """Carga cada modelo spaCy una sola vez por proceso y lo reparte por perfiles"""
+
+    def __init__(self, memory_budget_mb: int = NLP_MEMORY_BUDGET_MB):
+        self.memory_budget_mb = memory_budget_mb
+        self._models: Dict[str, Any] = {}
+        # Nombre pedido → nombre realmente cargado (tras fallbacks)
+        self._resolved: Dict[str, str] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _exceeds_budget(self, model_name: str) -> bool:
+        if not self.memory_budget_mb:
+            return False
+        rss = current_rss_mb()
+        if rss is None:
+            return False
+        estimate = MODEL_SIZE_ESTIMATES_MB.get(model_name, 0)
+        return rss + estimate > self.memory_budget_mb
+
+    def _load(self, model_name: str, fallback_from: Optional[str] = None):
+        import spacy
+
+        rss_before = current_rss_mb()
+        start = time.time()
+        nlp = spacy.load(model_name)
+        load_time = time.time() - start
+        rss_after = current_rss_mb()
+
+        self._models[model_name] = nlp
+        self._stats[model_name] = {
+            "load_time_s": round(load_time, 2),
+            "rss_delta_mb": (
+                round(rss_after - rss_before, 1)
+                if rss_before is not None and rss_after is not None else None
+            ),
+            "pipe_names": list(nlp.pipe_names),
+            "fallback_from": fallback_from,
+            "loaded_at": time.time(),
+        }
+        logger.info(f"✅ Modelo spaCy '{model_name}' cargado en {load_time:.2f}s")
+        return nlp
+
+    def get_model(self, model_name: str = DEFAULT_MODEL, allow_blank: bool = False):
+        """
+        Devuelve el modelo spaCy completo (compartido) para un nombre
+
+        Args:
+            model_name: Modelo pedido (p. ej. "la_core_web_lg")
+            allow_blank: Si no hay ningún modelo instalado, devolver spacy.blank("la")
+
+        Raises:
+            OSError: Si ni el modelo ni el fallback están instalados (y allow_blank=False)
+        """
+        resolved = self._resolved.get(model_name)
+        if resolved is not None:
+            return self._models[resolved]
+
+        with self._lock:
+            resolved = self._resolved.get(model_name)
+            if resolved is not None:
+                return self._models[resolved]
+
+            candidates = [model_name]
+            if model_name != FALLBACK_MODEL:
+                if self._exceeds_budget(model_name):
+                    logger.warning(
+                        f"⚠️ '{model_name}' superaría el presupuesto de memoria "
+                        f"({self.memory_budget_mb} MB); usando '{FALLBACK_MODEL}'"
+                    )
+                    candidates = [FALLBACK_MODEL]
+                else:
+                    candidates.append(FALLBACK_MODEL)
+
+            last_error: Optional[Exception] = None
+            for candidate in candidates:
+                if candidate in self._models:
+                    self._resolved[model_name] = candidate
+                    return self._models[candidate]
+                try:
+                    fallback_from = model_name if candidate != model_name else None
+                    self._load(candidate, fallback_from=fallback_from)
+                    self._resolved[model_name] = candidate
+                    return self._models[candidate]
+                except (OSError, ImportError) as e:
+                    logger.warning(f"⚠️ No se pudo cargar el modelo '{candidate}': {e}")
+                    last_error = e
+
+            if not allow_blank:
+                raise OSError(f"No hay ningún modelo spaCy disponible para '{model_name}'") from last_error
+
+            import spacy
+
+            logger.warning("⚠️ Usando modelo en blanco 'la' como fallback. El análisis será limitado.")
+            blank_name = "blank:la"
+            if blank_name not in self._models:
+                self._models[blank_name] = spacy.blank("la")
+                self._stats[blank_name] = {
+                    "load_time_s": 0.0,
+                    "rss_delta_mb": None,
+                    "pipe_names": [],
+                    "fallback_from": model_name,
+                    "loaded_at": time.time(),
+                }
+            self._resolved[model_name] = blank_name
+            return self._models[blank_name]
+
+    def get_pipeline(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        profile: str = "full",
+        allow_blank: bool = False,
+    ) -> PooledPipeline:
+        """
+        Devuelve una vista del modelo compartido con solo los componentes del perfil
+
+        Args:
+            model_name: Modelo pedido
+            profile: "full", "lemma" o "syntax" (ver PIPELINE_PROFILES)
+            allow_blank: Ver get_model
+        """
+        if profile not in PIPELINE_PROFILES:
+            raise ValueError(f"Perfil de pipeline desconocido: {profile}")
+        nlp = self.get_model(model_name, allow_blank=allow_blank)
+        return PooledPipeline(nlp, PIPELINE_PROFILES[profile], self._resolved[model_name], profile)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tiempos de carga, memoria y resolución de cada modelo del pool"""
+        return {
+            "memory_budget_mb": self.memory_budget_mb,
+            "resolved": dict(self._resolved),
+            "models": {name: dict(stats) for name, stats in self._stats.items()},
+        }
+
+
+# Instancia global del proceso
+model_pool = NLPModelPool()
+
+
+def get_pipeline(model_name: str = DEFAULT_MODEL, profile: str = "full", allow_blank: bool = False) -> PooledPipeline:
+    """Atajo a model_pool.get_pipeline"""
+    return model_pool.get_pipeline(model_name, profile=profile, allow_blank=allow_blank)
+
+
+def get_model_pool_stats() -> Dict[str, Any]:
+    """Atajo a model_pool.get_stats"""
+    return model_pool.get_stats()
@@ -78,6 +78,8 @@ def record_lesson_view(session: Session, user_id: int, lesson_number: int):
     Si es la primera vez, crea el registro.
     Actualiza el timestamp de último acceso.
     """
+    from utils.progress_tracker import _summary_for_delta, _set_lesson_status
+    
     # Buscar registro existente
     progress = session.exec(
         select(LessonProgress).where(
@@ -88,6 +90,8 @@ def record_lesson_view(session: Session, user_id: int, lesson_number: int):
     
     now = datetime.utcnow()
     
+    is_new = progress is None
+    
     if not progress:
         # Crear nuevo registro
         progress = LessonProgress(
@@ -104,6 +108,12 @@ def record_lesson_view(session: Session, user_id: int, lesson_number: int):
         progress.last_accessed_at = now
         session.add(progress)
         
+    # Una lección nueva entra en progreso en el resumen (ver utils/progress_tracker.py)
+    if is_new:
+        tracked = _summary_for_delta(session, user_id)
+        if tracked is not None:
+            _set_lesson_status(tracked, lesson_number, 'in_progress')
+    
     # Actualizar lección actual en el resumen si es mayor a la actual
     summary = get_user_progress(session, user_id)
     if lesson_number > summary.current_lesson:
@@ -140,6 +150,7 @@ def record_exercise_attempt(
         time_spent_seconds: Time spent on the exercise
     """
     from database import ExerciseAttempt, UserProfile
+    from utils.progress_tracker import _summary_for_delta, _apply_exercise_delta
     
     # 1. Record the attempt
     attempt = ExerciseAttempt(
@@ -155,6 +166,11 @@ def record_exercise_attempt(
     )
     session.add(attempt)
     
+    # Mantener el resumen global (ver utils/progress_tracker.py)
+    summary = _summary_for_delta(session, user_id)
+    if summary is not None:
+        _apply_exercise_delta(summary, is_correct)
+    
     # 2. Award XP if correct
     if is_correct and xp_earned == 0:
         xp_earned = 10  # Default XP for correct answer
@@ -1,12 +1,19 @@
 """
 Servicio de Seguimiento de Progreso (Progress Tracker)
 Registra y actualiza el progreso del usuario en todas las áreas.
+
+El resumen global (UserProgressSummary) se mantiene de forma incremental:
+cada evento aplica su delta a contadores y sumas acumuladas en O(1). Cada
+SUMMARY_RECONCILE_HOURS (o si el resumen nunca se reconcilió) se recalcula
+con agregados SQL para corregir cualquier deriva.
 """
 
-from typing import Optional, Dict, List
-from sqlmodel import Session, select
-from datetime import datetime
+from typing import Optional, Dict, List, Tuple
+from sqlmodel import Session, select, func
+from sqlalchemy import case
+from datetime import datetime, timedelta
 import json
+import os
 
 from database import (
     LessonProgress, UserVocabularyProgress, ExerciseAttempt,
@@ -15,6 +22,107 @@ from database import (
 )
 from utils.unlock_service import get_user_summary, auto_unlock_check
 
+# Umbrales de dominio usados en el resumen
+LEARNED_THRESHOLD = 0.5
+MASTERED_THRESHOLD = 0.8
+
+# Antigüedad máxima del resumen antes de reconciliarlo con agregados SQL
+SUMMARY_RECONCILE_HOURS = int(os.getenv("SUMMARY_RECONCILE_HOURS", "24"))
+
+
+# ============================================================================
+# MANTENIMIENTO INCREMENTAL DEL RESUMEN
+# ============================================================================
+
+def _summary_for_delta(session: Session, user_id: int) -> Optional[UserProgressSummary]:
+    """
+    Devuelve el resumen listo para aplicar un delta incremental.
+    
+    Si el resumen nunca se reconcilió o está caducado, lo reconcilia con
+    agregados SQL (que ya incluyen el evento pendiente) y devuelve None.
+    """
+    summary = get_user_summary(session, user_id)
+    max_age = timedelta(hours=SUMMARY_RECONCILE_HOURS)
+    
+    if summary.reconciled_at is None or datetime.utcnow() - summary.reconciled_at > max_age:
+        _reconcile(session, summary)
+        return None
+    
+    summary.last_updated = datetime.utcnow()
+    summary.last_activity = datetime.utcnow()
+    return summary
+
+
+def _set_lesson_status(summary: UserProgressSummary, lesson_number: int, status: str):
+    """Mueve una lección entre las listas de completadas / en progreso"""
+    completed = set(get_json_list(summary.lessons_completed))
+    in_progress = set(get_json_list(summary.lessons_in_progress))
+    
+    completed.discard(lesson_number)
+    in_progress.discard(lesson_number)
+    if status == "completed":
+        completed.add(lesson_number)
+    elif status == "in_progress":
+        in_progress.add(lesson_number)
+    
+    _set_lesson_lists(summary, completed, in_progress)
+
+
+def _set_lesson_lists(summary: UserProgressSummary, completed, in_progress):
+    summary.lessons_completed = set_json_list(sorted(completed))
+    summary.lessons_in_progress = set_json_list(sorted(in_progress))
+    
+    # current_lesson: la más alta completada + 1, o la más alta en progreso
+    if completed:
+        summary.current_lesson = max(completed) + 1
+    elif in_progress:
+        summary.current_lesson = max(in_progress)
+    else:
+        summary.current_lesson = 1
+
+
+def _apply_vocab_delta(summary: UserProgressSummary, old_mastery: Optional[float], new_mastery: float):
+    """Delta de una palabra: old_mastery=None si aún no cuenta en el resumen (sin progreso previo)"""
+    if old_mastery is None:
+        summary.vocab_words_total += 1
+        old_mastery = 0.0
+        was_counted = False
+    else:
+        was_counted = True
+    
+    summary.vocab_mastery_sum += new_mastery - old_mastery
+    
+    for attr, threshold in (("total_words_learned", LEARNED_THRESHOLD),
+                            ("total_words_mastered", MASTERED_THRESHOLD)):
+        before = was_counted and old_mastery >= threshold
+        after = new_mastery >= threshold
+        if after != before:
+            setattr(summary, attr, getattr(summary, attr) + (1 if after else -1))
+    
+    if summary.vocab_words_total > 0:
+        summary.vocab_mastery_avg = summary.vocab_mastery_sum / summary.vocab_words_total
+
+
+def _apply_exercise_delta(summary: UserProgressSummary, is_correct: bool):
+    """Delta de un intento de ejercicio"""
+    summary.exercises_completed_total += 1
+    if is_correct:
+        summary.exercises_correct_total += 1
+    summary.exercises_accuracy_avg = summary.exercises_correct_total / summary.exercises_completed_total
+
+
+def _reading_contribution(status: str, score: float) -> Tuple[int, int, float]:
+    """(lecturas completadas, lecturas con score, suma de scores) de una lectura"""
+    if status != "completed":
+        return 0, 0, 0.0
+    if score and score > 0:
+        return 1, 1, score
+    return 1, 0, 0.0
+
+
+# ============================================================================
+# REGISTRO DE EVENTOS
+# ============================================================================
 
 def update_lesson_progress(session: Session, user_id: int, lesson_number: int, 
                            status: str, time_spent: Optional[int] = None):
@@ -34,6 +142,7 @@ def update_lesson_progress(session: Session, user_id: int, lesson_number: int,
         LessonProgress.lesson_number == lesson_number
     )
     progress = session.exec(statement).first()
+    is_new = progress is None
     
     if not progress:
         progress = LessonProgress(
@@ -58,10 +167,12 @@ def update_lesson_progress(session: Session, user_id: int, lesson_number: int,
     if time_spent:
         progress.total_time_spent += time_spent
     
-    session.commit()
+    # Actualizar resumen global (incremental)
+    summary = _summary_for_delta(session, user_id)
+    if summary is not None and (is_new or old_status != status):
+        _set_lesson_status(summary, lesson_number, status)
     
-    # Actualizar resumen global
-    update_user_summary(session, user_id)
+    session.commit()
     
     # Verificar desbloqueos automáticos
     auto_unlock_check(session, user_id)
@@ -101,10 +212,13 @@ def record_exercise_attempt(session: Session, user_id: int, lesson_number: int,
     )
     
     session.add(attempt)
-    session.commit()
     
-    # Actualizar resumen global
-    update_user_summary(session, user_id)
+    # Actualizar resumen global (incremental)
+    summary = _summary_for_delta(session, user_id)
+    if summary is not None:
+        _apply_exercise_delta(summary, is_correct)
+    
+    session.commit()
     
     # Verificar desbloqueos
     auto_unlock_check(session, user_id)
@@ -128,6 +242,8 @@ def record_vocabulary_practice(session: Session, user_id: int, word_id: int,
     )
     progress = session.exec(statement).first()
     
+    old_mastery = progress.mastery_level if progress else None
+    
     if not progress:
         progress = UserVocabularyProgress(
             user_id=user_id,
@@ -155,10 +271,12 @@ def record_vocabulary_practice(session: Session, user_id: int, word_id: int,
     if progress.mastery_level >= 0.95:
         progress.is_learning = False
     
-    session.commit()
+    # Actualizar resumen global (incremental)
+    summary = _summary_for_delta(session, user_id)
+    if summary is not None:
+        _apply_vocab_delta(summary, old_mastery, progress.mastery_level)
     
-    # Actualizar resumen global
-    update_user_summary(session, user_id)
+    session.commit()
 
 
 def record_reading_progress(session: Session, user_id: int, text_id: int,
@@ -187,6 +305,7 @@ def record_reading_progress(session: Session, user_id: int, text_id: int,
         ReadingProgress.text_id == text_id
     )
     progress = session.exec(statement).first()
+    is_new = progress is None
     
     if not progress:
         progress = ReadingProgress(
@@ -198,6 +317,7 @@ def record_reading_progress(session: Session, user_id: int, text_id: int,
     
     # Actualizar estado y timestamps
     old_status = progress.status
+    old_contribution = (0, 0, 0.0) if is_new else _reading_contribution(old_status, progress.comprehension_score)
     progress.status = status
     progress.last_accessed_at = datetime.utcnow()
     
@@ -225,10 +345,17 @@ def record_reading_progress(session: Session, user_id: int, text_id: int,
     if difficulty_rating is not None:
         progress.difficulty_rating = difficulty_rating
     
-    session.commit()
+    # Actualizar resumen global (incremental)
+    summary = _summary_for_delta(session, user_id)
+    if summary is not None:
+        new_contribution = _reading_contribution(progress.status, progress.comprehension_score)
+        summary.texts_read_total += new_contribution[0] - old_contribution[0]
+        summary.comprehension_count += new_contribution[1] - old_contribution[1]
+        summary.comprehension_sum += new_contribution[2] - old_contribution[2]
+        if summary.comprehension_count > 0:
+            summary.comprehension_avg = summary.comprehension_sum / summary.comprehension_count
     
-    # Actualizar resumen global
-    update_user_summary(session, user_id)
+    session.commit()
     
     # Verificar desbloqueos
     auto_unlock_check(session, user_id)
@@ -274,6 +401,8 @@ def record_syntax_analysis(session: Session, user_id: int, sentence_analysis_id:
         )
         session.add(progress)
     
+    was_analyzed = bool(progress.analyzed)
+    
     # Actualizar datos
     if viewed and not progress.viewed:
         progress.viewed = True
@@ -289,81 +418,121 @@ def record_syntax_analysis(session: Session, user_id: int, sentence_analysis_id:
         progress.functions_identified_incorrect += functions_identified_incorrect
         progress.time_spent_analyzing += time_spent_analyzing
     
-    session.commit()
+    # Actualizar resumen global (incremental)
+    summary = _summary_for_delta(session, user_id)
+    if summary is not None and progress.analyzed and not was_analyzed:
+        summary.sentences_analyzed_total += 1
     
-    # Actualizar resumen global
-    update_user_summary(session, user_id)
+    session.commit()
 
 
 def update_user_summary(session: Session, user_id: int):
     """
-    Actualiza el resumen global de progreso del usuario.
-    Esta función recalcula todas las métricas agregadas.
+    Recalcula el resumen global de progreso del usuario desde cero.
+    
+    Los eventos ya mantienen el resumen de forma incremental; esta función
+    es la reconciliación completa (agregados SQL, una consulta por tabla).
     """
     summary = get_user_summary(session, user_id)
+    _reconcile(session, summary)
+    session.commit()
+    return summary
+
+
+def _reconcile(session: Session, summary: UserProgressSummary):
+    """Rellena el resumen y sus acumuladores con agregados SQL"""
+    user_id = summary.user_id
+    
+    # Lecciones
+    lesson_rows = session.exec(
+        select(LessonProgress.lesson_number, LessonProgress.status).where(
+            LessonProgress.user_id == user_id,
+            LessonProgress.status.in_(["completed", "in_progress"])
+        )
+    ).all()
+    completed = {n for n, status in lesson_rows if status == "completed"}
+    in_progress = {n for n, status in lesson_rows if status == "in_progress"}
+    _set_lesson_lists(summary, completed, in_progress)
+    
+    # Vocabulario
+    vocab_total, mastery_sum, learned, mastered = session.exec(
+        select(
+            func.count(UserVocabularyProgress.id),
+            func.coalesce(func.sum(UserVocabularyProgress.mastery_level), 0.0),
+            func.coalesce(func.sum(case((UserVocabularyProgress.mastery_level >= LEARNED_THRESHOLD, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((UserVocabularyProgress.mastery_level >= MASTERED_THRESHOLD, 1), else_=0)), 0),
+        ).where(UserVocabularyProgress.user_id == user_id)
+    ).one()
+    summary.vocab_words_total = vocab_total
+    summary.vocab_mastery_sum = float(mastery_sum)
+    summary.total_words_learned = learned
+    summary.total_words_mastered = mastered
+    summary.vocab_mastery_avg = mastery_sum / vocab_total if vocab_total else 0.0
+    
+    # Ejercicios
+    exercise_total, exercise_correct = session.exec(
+        select(
+            func.count(ExerciseAttempt.id),
+            func.coalesce(func.sum(case((ExerciseAttempt.is_correct == True, 1), else_=0)), 0),
+        ).where(ExerciseAttempt.user_id == user_id)
+    ).one()
+    summary.exercises_completed_total = exercise_total
+    summary.exercises_correct_total = exercise_correct
+    summary.exercises_accuracy_avg = exercise_correct / exercise_total if exercise_total else 0.0
+    
+    # Lecturas completadas (el promedio solo cuenta las que tienen score)
+    texts_read, scored, score_sum = session.exec(
+        select(
+            func.count(ReadingProgress.id),
+            func.coalesce(func.sum(case((ReadingProgress.comprehension_score > 0, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((ReadingProgress.comprehension_score > 0, ReadingProgress.comprehension_score), else_=0.0)), 0.0),
+        ).where(
+            ReadingProgress.user_id == user_id,
+            ReadingProgress.status == "completed"
+        )
+    ).one()
+    summary.texts_read_total = texts_read
+    summary.comprehension_count = scored
+    summary.comprehension_sum = float(score_sum)
+    summary.comprehension_avg = score_sum / scored if scored else 0.0
+    
+    # Sintaxis
+    summary.sentences_analyzed_total = session.exec(
+        select(func.count(SyntaxAnalysisProgress.id)).where(
+            SyntaxAnalysisProgress.user_id == user_id,
+            SyntaxAnalysisProgress.analyzed == True
+        )
+    ).one()
     
-    # Actualizar lecciones
-    statement = select(LessonProgress).where(LessonProgress.user_id == user_id)
-    all_lessons = session.exec(statement).all()
-    
-    completed_lessons = [l.lesson_number for l in all_lessons if l.status == "completed"]
-    in_progress_lessons = [l.lesson_number for l in all_lessons if l.status == "in_progress"]
-    
-    summary.lessons_completed = set_json_list(sorted(completed_lessons))
-    summary.lessons_in_progress = set_json_list(sorted(in_progress_lessons))
-    
-    # Actualizar current_lesson (la más alta completada + 1, o la más alta en progreso)
-    if completed_lessons:
-        summary.current_lesson = max(completed_lessons) + 1
-    elif in_progress_lessons:
-        summary.current_lesson = max(in_progress_lessons)
-    else:
-        summary.current_lesson = 1
-    
-    # Actualizar vocabulario
-    statement = select(UserVocabularyProgress).where(UserVocabularyProgress.user_id == user_id)
-    vocab_progress = session.exec(statement).all()
-    
-    if vocab_progress:
-        learned = [v for v in vocab_progress if v.mastery_level >= 0.5]
-        mastered = [v for v in vocab_progress if v.mastery_level >= 0.8]
-        
-        summary.total_words_learned = len(learned)
-        summary.total_words_mastered = len(mastered)
-        summary.vocab_mastery_avg = sum(v.mastery_level for v in vocab_progress) / len(vocab_progress)
-    
-    # Actualizar ejercicios
-    statement = select(ExerciseAttempt).where(ExerciseAttempt.user_id == user_id)
-    exercises = session.exec(statement).all()
-    
-    if exercises:
-        summary.exercises_completed_total = len(exercises)
-        correct = sum(1 for e in exercises if e.is_correct)
-        summary.exercises_accuracy_avg = correct / len(exercises)
-    
-    # Actualizar lecturas
-    statement = select(ReadingProgress).where(
-        ReadingProgress.user_id == user_id,
-        ReadingProgress.status == "completed"
-    )
-    readings = session.exec(statement).all()
-    
-    if readings:
-        summary.texts_read_total = len(readings)
-        scores = [r.comprehension_score for r in readings if r.comprehension_score > 0]
-        if scores:
-            summary.comprehension_avg = sum(scores) / len(scores)
+    # Actualizar timestamps
+    now = datetime.utcnow()
+    summary.reconciled_at = now
+    summary.last_updated = now
+    summary.last_activity = now
+    session.add(summary)
+
+
+def reconcile_all_summaries(session: Session, max_age_hours: Optional[int] = None) -> int:
+    """
+    Job periódico: reconcilia los resúmenes no reconciliados en max_age_hours.
     
-    # Actualizar sintaxis
-    statement = select(SyntaxAnalysisProgress).where(
-        SyntaxAnalysisProgress.user_id == user_id,
-        SyntaxAnalysisProgress.analyzed == True
-    )
-    syntax_analyses = session.exec(statement).all()
-    summary.sentences_analyzed_total = len(syntax_analyses)
+    Args:
+        session: Sesión de BD
+        max_age_hours: Antigüedad máxima (None = reconciliar todos)
     
-    # Actualizar timestamps
-    summary.last_updated = datetime.utcnow()
-    summary.last_activity = datetime.utcnow()
+    Returns:
+        Número de resúmenes reconciliados
+    """
+    statement = select(UserProgressSummary)
+    if max_age_hours is not None:
+        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+        statement = statement.where(
+            (UserProgressSummary.reconciled_at == None) | (UserProgressSummary.reconciled_at < cutoff)
+        )
     
-    session.commit()
+    count = 0
+    for summary in session.exec(statement).all():
+        _reconcile(session, summary)
+        session.commit()
+        count += 1
+    return count
@@ -0,0 +1,175 @@
+"""
+Maestría de lecturas calculada en lote
+
+Sustituye el cálculo por palabra de readings_view (una consulta a ReviewLog
+por cada TextWordLink del texto, y otra por cada palabra al pintar el texto)
+por dos consultas por usuario, sobre ReviewState (último repaso de cada
+palabra y usuario, mantenido por utils/srs.record_review):
+
+- Maestría de todos los textos: un único GROUP BY de TextWordLink con LEFT JOIN
+  a ReviewState (palabras con intervalo >= KNOWN_INTERVAL_DAYS / enlaces).
+- Maestría por palabra: intervalo del último repaso de cada palabra repasada.
+
+Los resultados se guardan por usuario con un contador de versión, que se
+incrementa (database/invalidation.py) al hacer commit de repasos
+(ReviewState) del usuario o de cambios en los enlaces de los textos
+(TextWordLink).
+
+Uso:
+    text_mastery = get_text_mastery(session)        # {text_id: %}
+    word_mastery = get_word_mastery_map(session)    # {word_id: nivel}
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import and_, case, func
+from sqlmodel import select
+
+from database import ReviewState, TextWordLink
+from database.invalidation import register_invalidation
+from utils.srs import ensure_review_states
+
+logger = logging.getLogger(__name__)
+
+# Intervalo (días) a partir del cual una palabra cuenta como conocida en un texto
+KNOWN_INTERVAL_DAYS = 3
+
+# Marca de "todos los usuarios" (cambios en TextWordLink)
+_ALL_USERS = "*"
+
+
+def word_mastery_level(interval: Optional[int]) -> int:
+    """Nivel de maestría (0-100) según el intervalo del último repaso; 0 si nunca se repasó"""
+    if interval is None:
+        return 0
+    if interval >= 7:
+        return 100
+    elif interval >= 3:
+        return 70
+    elif interval >= 1:
+        return 40
+    else:
+        return 20
+
+
+def _load_text_mastery(session, user_id: int) -> Dict[int, int]:
+    known = case((ReviewState.interval >= KNOWN_INTERVAL_DAYS, 1), else_=0)
+    rows = session.exec(
+        select(TextWordLink.text_id, func.count(TextWordLink.id), func.sum(known))
+        .outerjoin(ReviewState, and_(
+            ReviewState.word_id == TextWordLink.word_id,
+            ReviewState.user_id == user_id
+        ))
+        .group_by(TextWordLink.text_id)
+    ).all()
+    return {
+        text_id: int(((known_words or 0) / total) * 100)
+        for text_id, total, known_words in rows
+        if total
+    }
+
+
+def _load_word_mastery(session, user_id: int) -> Dict[int, int]:
+    rows = session.exec(
+        select(ReviewState.word_id, ReviewState.interval).where(ReviewState.user_id == user_id)
+    ).all()
+    return {word_id: word_mastery_level(interval) for word_id, interval in rows}
+
+
+_LOADERS = {
+    "texts": _load_text_mastery,
+    "words": _load_word_mastery,
+}
+
+
+class ReadingMasteryCache:
+    """Maestría por usuario, invalidada por versión"""
+
+    def __init__(self):
+        self._versions: Dict[Any, int] = {}
+        # (user_id, tipo) -> (versión con la que se cargó, datos)
+        self._snapshots: Dict[Tuple[int, str], Tuple[int, Dict[int, int]]] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def _version(self, user_id: int) -> int:
+        return self._versions.get(user_id, 0) + self._versions.get(_ALL_USERS, 0)
+
+    def invalidate(self, user_ids: Optional[Iterable[int]] = None):
+        """Incrementa la versión de los usuarios dados (o de todos)"""
+        with self._lock:
+            for user_id in (user_ids if user_ids is not None else [_ALL_USERS]):
+                self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    def get(self, session, kind: str, user_id: int) -> Dict[int, int]:
+        snapshot = self._snapshots.get((user_id, kind))
+        if snapshot is not None and snapshot[0] == self._version(user_id):
+            return snapshot[1]
+
+        # Repasos anteriores a ReviewState (solo la primera vez en el proceso)
+        ensure_review_states(session, user_id)
+        version = self._version(user_id)
+        data = _LOADERS[kind](session, user_id)
+        # Se guarda con la versión leída ANTES de cargar: si hubo un repaso
+        # durante la carga, la próxima lectura recarga
+        self._snapshots[(user_id, kind)] = (version, data)
+        self.loads += 1
+        logger.debug(f"Reading mastery reloaded {kind} for user {user_id} (version {version})")
+        return data
+
+
+# Instancia compartida por todo el proceso
+_cache = ReadingMasteryCache()
+
+
+def get_text_mastery(session, user_id: int = 1) -> Dict[int, int]:
+    """
+    Maestría (%) de todos los textos con palabras enlazadas
+
+    Returns:
+        {text_id: porcentaje de enlaces cuya palabra tiene intervalo >= KNOWN_INTERVAL_DAYS}
+    """
+    return _cache.get(session, "texts", user_id)
+
+
+def get_word_mastery_map(session, user_id: int = 1) -> Dict[int, int]:
+    """
+    Nivel de maestría de cada palabra repasada por el usuario
+
+    Returns:
+        {word_id: 20/40/70/100}; las palabras sin repasar no aparecen (nivel 0)
+    """
+    return _cache.get(session, "words", user_id)
+
+
+def invalidate_reading_mastery(user_ids: Optional[Iterable[int]] = None):
+    """Fuerza el recálculo para los usuarios dados (o para todos)"""
+    _cache.invalidate(user_ids)
+
+
+def _collect_mastery_changes(session, objects, users: set):
+    """Anota los usuarios con repasos nuevos; se invalidan al hacer commit"""
+    for obj in objects:
+        users.add(obj.user_id if isinstance(obj, ReviewState) else _ALL_USERS)
+
+
+def _collect_mastery_bulk_changes(orm_execute_state, model, users: set):
+    users.add(_ALL_USERS)
+
+
+def _invalidate_mastery_on_commit(users: set):
+    if _ALL_USERS in users:
+        invalidate_reading_mastery()
+    else:
+        invalidate_reading_mastery(users)
+
+
+register_invalidation(
+    "reading_mastery",
+    (ReviewState, TextWordLink),
+    on_flush=_collect_mastery_changes,
+    on_bulk=_collect_mastery_bulk_changes,
+    on_commit=_invalidate_mastery_on_commit,
+)
@@ -7,9 +7,70 @@ Funciones principales:
 - enrich_reading_with_tooltips: Añade tooltips HTML interactivos a las palabras difíciles
 """
 
+import hashlib
+import html
+import re
+import threading
+from collections import OrderedDict
 from typing import Optional, Dict, List, Tuple
 from sqlmodel import Session, select
-from database import Text, TextWordLink, Word, ReadingProgress
+from database import Text, TextWordLink, Word
+from database.text_snapshots import get_link_version
+
+# Palabras (letras Unicode, incluidas vocales con macron) y el resto del texto
+TOKEN_PATTERN = re.compile(r"[^\W\d_]+|[^\w]+|[\d_]+")
+
+# Enlaces posteriores que se consideran al realinear tokens con TextWordLink
+ALIGN_LOOKAHEAD = 3
+
+# HTML enriquecido por texto: text_id -> (clave de versión, html)
+_TOOLTIP_CACHE_SIZE = 128
+_tooltip_cache: "OrderedDict[int, Tuple[tuple, str]]" = OrderedDict()
+_tooltip_cache_lock = threading.Lock()
+
+
+def _tooltip_span(form: str, word: Word) -> str:
+    definition = word.definition_es or word.translation
+    title = html.escape(f"{definition} ({word.part_of_speech})", quote=True)
+    return f"""<span class="word-tooltip" title="{title}">{form}</span>"""
+
+
+def render_tooltips(content: str, links: List[Tuple[TextWordLink, Word]]) -> str:
+    """
+    Envuelve en tooltips las palabras enlazadas, en una sola pasada
+
+    El contenido se tokeniza una vez. Los tokens de palabra se alinean en
+    orden con los enlaces (ordenados por oración/posición); si un token no
+    coincide con el enlace esperado se busca entre los siguientes
+    ALIGN_LOOKAHEAD y, en último caso, por forma en un diccionario. El coste
+    es lineal en la longitud del texto más el número de enlaces.
+    """
+    by_form: Dict[str, Word] = {}
+    for link, word in links:
+        by_form.setdefault((link.form or word.latin).lower(), word)
+
+    parts: List[str] = []
+    cursor = 0
+    for token in TOKEN_PATTERN.findall(content):
+        if not token[0].isalpha():
+            parts.append(token)
+            continue
+
+        key = token.lower()
+        word = None
+        for offset in range(cursor, min(cursor + ALIGN_LOOKAHEAD + 1, len(links))):
+            link, candidate = links[offset]
+            if (link.form or candidate.latin).lower() == key:
+                word = candidate
+                cursor = offset + 1
+                break
+        if word is None:
+            word = by_form.get(key)
+
+        parts.append(_tooltip_span(token, word) if word is not None else token)
+
+    return "".join(parts)
+
 
 class ReadingService:
     def __init__(self, session: Session):
@@ -44,70 +105,37 @@ class ReadingService:
             
         content = text.content
         
-        # Obtener enlaces de palabras para este texto
+        # Clave: versión de enlaces del texto (ver database/text_snapshots) + contenido
+        version = (
+            get_link_version(text_id),
+            hashlib.sha1(content.encode("utf-8")).hexdigest(),
+        )
+        with _tooltip_cache_lock:
+            cached = _tooltip_cache.get(text_id)
+            if cached is not None and cached[0] == version:
+                _tooltip_cache.move_to_end(text_id)
+                return cached[1]
+        
+        # Obtener enlaces de palabras para este texto, en orden de lectura
         links = self.session.exec(
             select(TextWordLink, Word)
             .join(Word, TextWordLink.word_id == Word.id)
             .where(TextWordLink.text_id == text_id)
+            .order_by(TextWordLink.sentence_number, TextWordLink.position_in_sentence)
         ).all()
         
-        # Crear un mapa de reemplazos: posición -> (palabra, definición)
-        # Nota: Esto es complejo porque requiere saber la posición exacta en el string.
-        # Simplificación: Reemplazar palabras clave usando búsqueda de texto, 
-        # teniendo cuidado de no reemplazar dentro de etiquetas HTML ya creadas.
-        
-        # Mejor enfoque: Tokenizar el contenido y reconstruirlo.
-        # Por ahora, haremos una sustitución simple de las palabras conocidas.
-        
-        enriched_content = content
-        
-        # Ordenar por longitud descendente para evitar reemplazar subcadenas primero
-        # (ej: reemplazar 'ama' dentro de 'amat')
-        links_sorted = sorted(links, key=lambda x: len(x[1].latin), reverse=True)
+        enriched_content = render_tooltips(content, links)
         
-        for link, word in links_sorted:
-            # Crear el HTML del tooltip
-            # Usamos un estilo simple compatible con Streamlit (title attribute)
-            # O un componente custom si fuera necesario.
-            
-            latin_form = link.form or word.latin
-            definition = word.definition_es or word.translation
-            pos = word.part_of_speech
-            
-            tooltip_html = f"""<span class="word-tooltip" title="{definition} ({pos})">{latin_form}</span>"""
-            
-            # Reemplazo seguro (solo palabras completas)
-            # Esto es frágil con regex simple, pero servirá para el prototipo.
-            # En producción usaríamos un tokenizador real.
-            import re
-            pattern = re.compile(r'\b' + re.escape(latin_form) + r'\b', re.IGNORECASE)
-            enriched_content = pattern.sub(tooltip_html, enriched_content)
+        with _tooltip_cache_lock:
+            _tooltip_cache[text_id] = (version, enriched_content)
+            _tooltip_cache.move_to_end(text_id)
+            while len(_tooltip_cache) > _TOOLTIP_CACHE_SIZE:
+                _tooltip_cache.popitem(last=False)
             
         return enriched_content
 
     def mark_reading_as_completed(self, user_id: int, text_id: int):
-        """Registra que el usuario ha completado la lectura."""
-        from datetime import datetime
+        """Registra que el usuario ha completado la lectura (vía progress_tracker, que mantiene el resumen)."""
+        from utils.progress_tracker import record_reading_progress
         
-        progress = self.session.exec(
-            select(ReadingProgress).where(
-                ReadingProgress.user_id == user_id,
-                ReadingProgress.text_id == text_id
-            )
-        ).first()
-        
-        if not progress:
-            progress = ReadingProgress(
-                user_id=user_id,
-                text_id=text_id,
-                status="completed",
-                started_at=datetime.utcnow(),
-                completed_at=datetime.utcnow()
-            )
-            self.session.add(progress)
-        else:
-            progress.status = "completed"
-            progress.completed_at = datetime.utcnow()
-            self.session.add(progress)
-            
-        self.session.commit()
+        record_reading_progress(self.session, user_id, text_id, status="completed")
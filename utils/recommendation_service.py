@@ -8,28 +8,169 @@ Funciones principales:
 - suggest_next_action: Sugiere la próxima acción más apropiada
 """
 
-from typing import List, Dict, Optional
-from sqlmodel import Session
+from typing import List, Dict, Optional, Any
+from sqlmodel import Session, select, func
+from sqlalchemy import case
 from datetime import datetime, timedelta
 import json
+import threading
 
 from database import (
     Recommendation,
     UserProgressSummary,
+    ExerciseAttempt,
+    UserVocabularyProgress,
+    LessonVocabulary,
+    LessonProgress,
     get_json_list,
     set_json_list
 )
+from database.invalidation import register_invalidation
 from utils.unlock_service import (
     get_user_summary,
     get_lesson_progress,
-    get_vocab_mastery,
-    get_exercises_stats,
+    get_vocab_mastery_by_lesson,
     get_sentences_analyzed_count,
     check_unlock_conditions
 )
 
+# Nombres legibles de los tipos de ejercicio
+EXERCISE_TYPE_NAMES = {
+    'declension': 'Declinación',
+    'conjugation': 'Conjugación',
+    'translation': 'Traducción',
+    'construction': 'Construcción activa',
+    'identification': 'Identificación de casos'
+}
 
-def identify_weak_areas(session: Session, user_id: int) -> List[str]:
+# Agregados de áreas débiles por usuario: user_id -> stats
+# (se invalidan al registrar intentos o práctica de vocabulario)
+_weak_area_cache: Dict[int, Dict[str, Any]] = {}
+_weak_area_lock = threading.Lock()
+
+
+def invalidate_weak_area_stats(user_id: Optional[int] = None):
+    """Descarta los agregados cacheados de un usuario (o de todos)"""
+    with _weak_area_lock:
+        if user_id is None:
+            _weak_area_cache.clear()
+        else:
+            _weak_area_cache.pop(user_id, None)
+
+
+def _invalidate_weak_areas_on_flush(session, objects, pending_users: set):
+    """Invalida los agregados de los usuarios con nuevos intentos o progreso"""
+    for obj in objects:
+        if isinstance(obj, LessonVocabulary):
+            invalidate_weak_area_stats()
+        else:
+            invalidate_weak_area_stats(obj.user_id)
+            # De nuevo al hacer commit, por si otra sesión cacheó el estado anterior
+            pending_users.add(obj.user_id)
+
+
+def _invalidate_weak_areas_on_bulk_write(orm_execute_state, model, pending_users: set):
+    invalidate_weak_area_stats()
+
+
+def _invalidate_weak_areas_on_commit(pending_users: set):
+    for user_id in pending_users:
+        invalidate_weak_area_stats(user_id)
+
+
+register_invalidation(
+    "weak_area_stats",
+    (ExerciseAttempt, UserVocabularyProgress, LessonProgress, LessonVocabulary),
+    on_flush=_invalidate_weak_areas_on_flush,
+    on_bulk=_invalidate_weak_areas_on_bulk_write,
+    on_commit=_invalidate_weak_areas_on_commit,
+)
+
+
+def get_weak_area_stats(session: Session, user_id: int,
+                        summary: Optional[UserProgressSummary] = None) -> Dict[str, Any]:
+    """
+    Agregados usados por identify_weak_areas y generate_recommendations.
+    
+    Tres consultas GROUP BY sobre la ventana de lecciones (actual y dos
+    anteriores), cacheadas por usuario hasta que se registra un nuevo
+    intento, práctica de vocabulario o cambio de lección.
+    
+    Retorna:
+    {
+        'current_lesson': int,
+        'lessons': [int, ...],
+        'exercises': {lesson: {'count': int, 'accuracy': float}},
+        'exercise_types': {lesson: {tipo: {'total': int, 'correct': int}}},
+        'vocab_mastery': {lesson: float},
+        'difficult_words': int
+    }
+    """
+    if summary is None:
+        summary = get_user_summary(session, user_id)
+    current = summary.current_lesson
+    
+    with _weak_area_lock:
+        cached = _weak_area_cache.get(user_id)
+    if cached is not None and cached['current_lesson'] == current:
+        return cached
+    
+    lessons = list(range(max(1, current - 2), current + 1))
+    
+    # 1. Ejercicios por lección y tipo
+    rows = session.exec(
+        select(
+            ExerciseAttempt.lesson_number,
+            ExerciseAttempt.exercise_type,
+            func.count(ExerciseAttempt.id),
+            func.sum(case((ExerciseAttempt.is_correct == True, 1), else_=0))
+        )
+        .where(
+            ExerciseAttempt.user_id == user_id,
+            ExerciseAttempt.lesson_number.in_(lessons)
+        )
+        .group_by(ExerciseAttempt.lesson_number, ExerciseAttempt.exercise_type)
+    ).all()
+    
+    exercise_types: Dict[int, Dict[str, Dict[str, int]]] = {n: {} for n in lessons}
+    for lesson_num, ex_type, total, correct in rows:
+        exercise_types[lesson_num][ex_type] = {'total': total, 'correct': correct or 0}
+    
+    exercises = {}
+    for lesson_num, by_type in exercise_types.items():
+        count = sum(d['total'] for d in by_type.values())
+        correct = sum(d['correct'] for d in by_type.values())
+        exercises[lesson_num] = {'count': count, 'accuracy': correct / count if count else 0.0}
+    
+    # 2. Dominio medio del vocabulario esencial por lección
+    vocab_mastery = {n: 0.0 for n in lessons}
+    vocab_mastery.update(get_vocab_mastery_by_lesson(session, user_id, lessons))
+    
+    # 3. Palabras vistas al menos 5 veces con dominio bajo
+    difficult_words = session.exec(
+        select(func.count(UserVocabularyProgress.id)).where(
+            UserVocabularyProgress.user_id == user_id,
+            UserVocabularyProgress.times_seen >= 5,
+            UserVocabularyProgress.mastery_level < 0.5
+        )
+    ).one()
+    
+    stats = {
+        'current_lesson': current,
+        'lessons': lessons,
+        'exercises': exercises,
+        'exercise_types': exercise_types,
+        'vocab_mastery': vocab_mastery,
+        'difficult_words': difficult_words,
+    }
+    
+    with _weak_area_lock:
+        _weak_area_cache[user_id] = stats
+    return stats
+
+
+def identify_weak_areas(session: Session, user_id: int,
+                        stats: Optional[Dict[str, Any]] = None) -> List[str]:
     """
     Analiza el progreso del usuario e identifica áreas débiles.
     
@@ -40,75 +181,44 @@ def identify_weak_areas(session: Session, user_id: int) -> List[str]:
     
     Retorna: Lista de strings describiendo áreas débiles
     """
-    from database import ExerciseAttempt, UserVocabularyProgress, LessonVocabulary
-    from sqlmodel import select
+    summary = get_user_summary(session, user_id)
+    if stats is None:
+        stats = get_weak_area_stats(session, user_id, summary)
     
     weak_areas = []
-    summary = get_user_summary(session, user_id)
-    current = summary.current_lesson
     
     # 1. Analizar ejercicios de las últimas 3 lecciones
-    for lesson_num in range(max(1, current - 2), current + 1):
-        stats = get_exercises_stats(session, user_id, lesson_num)
+    for lesson_num in stats['lessons']:
+        lesson_stats = stats['exercises'][lesson_num]
         
-        if stats['count'] >= 5 and stats['accuracy'] < 0.7:
+        if lesson_stats['count'] >= 5 and lesson_stats['accuracy'] < 0.7:
             weak_areas.append(f"Ejercicios de Lección {lesson_num}")
         
-        # Analizar por tipo de ejercicio
-        statement = select(ExerciseAttempt).where(
-            ExerciseAttempt.user_id == user_id,
-            ExerciseAttempt.lesson_number == lesson_num
-        )
-        attempts = session.exec(statement).all()
-        
-        # Agrupar por tipo
-        by_type = {}
-        for attempt in attempts:
-            ex_type = attempt.exercise_type
-            if ex_type not in by_type:
-                by_type[ex_type] = {'correct': 0, 'total': 0}
-            by_type[ex_type]['total'] += 1
-            if attempt.is_correct:
-                by_type[ex_type]['correct'] += 1
-        
         # Identificar tipos problemáticos
-        for ex_type, data in by_type.items():
+        for ex_type, data in stats['exercise_types'][lesson_num].items():
             if data['total'] >= 3:
                 accuracy = data['correct'] / data['total']
                 if accuracy < 0.65:
-                    type_name = {
-                        'declension': 'Declinación',
-                        'conjugation': 'Conjugación',
-                        'translation': 'Traducción',
-                        'construction': 'Construcción activa',
-                        'identification': 'Identificación de casos'
-                    }.get(ex_type, ex_type)
-                    weak_areas.append(type_name)
+                    weak_areas.append(EXERCISE_TYPE_NAMES.get(ex_type, ex_type))
     
     # 2. Analizar vocabulario con bajo dominio
-    for lesson_num in range(max(1, current - 2), current + 1):
-        mastery = get_vocab_mastery(session, user_id, lesson_num)
+    for lesson_num in stats['lessons']:
+        mastery = stats['vocab_mastery'][lesson_num]
         if mastery > 0 and mastery < 0.6:  # Ha practicado pero le va mal
             weak_areas.append(f"Vocabulario de Lección {lesson_num}")
     
     # 3. Analizar palabras específicas difíciles
-    statement = select(UserVocabularyProgress).where(
-        UserVocabularyProgress.user_id == user_id,
-        UserVocabularyProgress.times_seen >= 5  # Vistas al menos 5 veces
-    )
-    vocab_progress = session.exec(statement).all()
-    
-    difficult_words_count = sum(1 for vp in vocab_progress if vp.mastery_level < 0.5)
-    if difficult_words_count >= 10:
+    if stats['difficult_words'] >= 10:
         weak_areas.append("Retención de vocabulario general")
     
     # 4. TODO: Analizar errores en casos específicos (requiere más datos)
     # Por ahora, detectar patrón genérico
     
-    # Actualizar summary
-    summary = get_user_summary(session, user_id)
-    summary.weak_areas = set_json_list(list(set(weak_areas)))  # Eliminar duplicados
-    session.commit()
+    # Actualizar summary (solo si cambió)
+    weak_areas_json = set_json_list(list(set(weak_areas)))  # Eliminar duplicados
+    if summary.weak_areas != weak_areas_json:
+        summary.weak_areas = weak_areas_json
+        session.commit()
     
     return weak_areas
 
@@ -131,11 +241,14 @@ def generate_recommendations(session: Session, user_id: int) -> List[Dict]:
     summary = get_user_summary(session, user_id)
     current = summary.current_lesson
     
+    # Agregados compartidos con identify_weak_areas (cacheados por usuario)
+    stats = get_weak_area_stats(session, user_id, summary)
+    
     # 1. ¿Acabó de completar una lección? → Practicar vocabulario
     lesson_prog = get_lesson_progress(session, user_id, current - 1)
     if lesson_prog and lesson_prog.status == 'completed':
         # Verificar si ya practica el vocabulario
-        vocab_mastery = get_vocab_mastery(session, user_id, current - 1)
+        vocab_mastery = stats['vocab_mastery'][current - 1]
         if vocab_mastery < 0.8:
             recommendations.append({
                 'type': 'vocabulary',
@@ -150,10 +263,10 @@ def generate_recommendations(session: Session, user_id: int) -> List[Dict]:
         if lesson_num < 1:
             continue
         
-        vocab_mastery = get_vocab_mastery(session, user_id, lesson_num)
-        stats = get_exercises_stats(session, user_id, lesson_num)
+        vocab_mastery = stats['vocab_mastery'][lesson_num]
+        exercise_stats = stats['exercises'][lesson_num]
         
-        if 0.5 <= vocab_mastery < 0.9 and stats['count'] < 10:
+        if 0.5 <= vocab_mastery < 0.9 and exercise_stats['count'] < 10:
             recommendations.append({
                 'type': 'exercises',
                 'action': 'start_exercises',
@@ -164,7 +277,7 @@ def generate_recommendations(session: Session, user_id: int) -> List[Dict]:
             break  # Solo una recomendación de ejercicios
     
     # 3. ¿Tiene áreas débiles? → Repasar
-    weak_areas = identify_weak_areas(session, user_id)
+    weak_areas = identify_weak_areas(session, user_id, stats)
     for weak_area in weak_areas[:2]:  # Máximo 2 recomendaciones de repaso
         # Intentar extraer número de lección si está en el nombre
         lesson_num = None
@@ -0,0 +1,351 @@
+"""
+Índices de similitud para la detección de duplicados (panel Admin)
+
+Sustituyen el recorrido completo con difflib.SequenceMatcher contra cada Word
+(O(N) por candidato) por índices en memoria, compartidos por el proceso y
+mantenidos al insertar/editar/borrar:
+
+- TrigramIndex (palabras): índice invertido de trigramas sobre la forma
+  normalizada (sin macrones, minúsculas). Por el lema de q-gramas, dos cadenas
+  con SequenceMatcher.ratio() > umbral comparten un mínimo de trigramas; solo se
+  recorren las listas de los trigramas más raros de la consulta (filtro de
+  prefijo) y los candidatos se verifican con SequenceMatcher. Sin falsos
+  negativos respecto al recorrido completo.
+- MinHashIndex (oraciones): firmas MinHash de los shingles de palabras con LSH
+  por bandas; los candidatos se verifican con la similitud de Jaccard exacta.
+
+Los cambios de Word / SentenceAnalysis se aplican al índice tras el commit
+(database/invalidation.py); las escrituras masivas (INSERT/UPDATE masivo)
+marcan el índice para reconstruirlo en la siguiente consulta.
+"""
+
+import logging
+import math
+import random
+import re
+import threading
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlmodel import select
+
+from database import SentenceAnalysis, Word
+from database.invalidation import register_invalidation
+from utils.text_utils import normalize_latin
+
+logger = logging.getLogger(__name__)
+
+# Umbrales por defecto (mismos que la validación anterior para palabras)
+WORD_SIMILARITY_THRESHOLD = 0.85
+SENTENCE_SIMILARITY_THRESHOLD = 0.6
+
+# MinHash: 63 permutaciones en 21 bandas de 3 filas; un par con Jaccard 0.6
+# llega a candidato con probabilidad 1 - (1 - 0.6³)²¹ ≈ 0.994
+MINHASH_PERMUTATIONS = 63
+MINHASH_BANDS = 21
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalize_form(text: Optional[str]) -> str:
+    """Forma normalizada para comparar: sin macrones, minúsculas, sin espacios extremos"""
+    return normalize_latin(text or "").strip().lower()
+
+
+def trigrams(normalized: str) -> List[str]:
+    """Trigramas con relleno (len + 2 trigramas), con repeticiones"""
+    padded = f"  {normalized}  "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _max_edits(len_a: int, len_b: int, threshold: float) -> int:
+    """
+    Cota de la distancia de edición si ratio > threshold.
+
+    ratio = 2M / (la + lb) y la distancia de inserción/borrado es la + lb - 2M,
+    luego distancia < (1 - threshold) * (la + lb).
+    """
+    return int(math.floor((1 - threshold) * (len_a + len_b)))
+
+
+def _required_common(len_a: int, len_b: int, threshold: float) -> int:
+    """Trigramas comunes mínimos (lema de q-gramas: max(la, lb) + q - 1 - k·q)"""
+    return max(len_a, len_b) + 2 - 3 * _max_edits(len_a, len_b, threshold)
+
+
+class TrigramIndex:
+    """Índice invertido de trigramas con verificación por SequenceMatcher"""
+
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._forms: Dict[int, str] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._forms)
+
+    def add(self, item_id: int, text: str):
+        normalized = normalize_form(text)
+        with self._lock:
+            self.remove(item_id)
+            self._forms[item_id] = normalized
+            for gram in set(trigrams(normalized)):
+                self._postings[gram].add(item_id)
+
+    def remove(self, item_id: int):
+        with self._lock:
+            normalized = self._forms.pop(item_id, None)
+            if normalized is None:
+                return
+            for gram in set(trigrams(normalized)):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(item_id)
+                    if not posting:
+                        del self._postings[gram]
+
+    def search(self, text: str, threshold: float = WORD_SIMILARITY_THRESHOLD,
+               limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Elementos con SequenceMatcher.ratio() > threshold sobre la forma normalizada
+
+        Returns:
+            Lista (id, ratio) ordenada por similitud descendente
+        """
+        query = normalize_form(text)
+        if not query:
+            return []
+        grams = trigrams(query)
+        distinct = set(grams)
+        len_q = len(query)
+
+        # Longitudes posibles: 2·min / (la + lb) > threshold
+        max_len = int(len_q * (2 - threshold) / threshold)
+        min_len = int(math.ceil(len_q * threshold / (2 - threshold)))
+        required = min(_required_common(len_q, length, threshold) for length in range(min_len, max_len + 1))
+        # Con conjuntos (sin repeticiones) la cota baja en el número de repetidos
+        required -= len(grams) - len(distinct)
+
+        with self._lock:
+            if required <= 0:
+                # Cota inútil (umbral muy bajo): todas las formas de longitud compatible
+                candidates = {i for i, form in self._forms.items() if min_len <= len(form) <= max_len}
+            else:
+                # Filtro de prefijo: toda coincidencia comparte al menos uno de los
+                # (|G| - required + 1) trigramas más raros de la consulta
+                rare = sorted(distinct, key=lambda g: len(self._postings.get(g, ())))
+                candidates = set()
+                for gram in rare[:len(rare) - required + 1]:
+                    candidates.update(self._postings.get(gram, ()))
+            forms = [(i, self._forms[i]) for i in candidates]
+
+        matches = []
+        for item_id, form in forms:
+            if not min_len <= len(form) <= max_len:
+                continue
+            matcher = SequenceMatcher(None, query, form)
+            if matcher.real_quick_ratio() <= threshold or matcher.quick_ratio() <= threshold:
+                continue
+            ratio = matcher.ratio()
+            if ratio > threshold:
+                matches.append((item_id, ratio))
+        matches.sort(key=lambda m: (-m[1], m[0]))
+        return matches[:limit] if limit else matches
+
+
+def shingles(text: str) -> Set[str]:
+    """Shingles de 2 palabras de la oración normalizada (palabras sueltas si es corta)"""
+    tokens = re.findall(r"\w+", normalize_form(text))
+    if len(tokens) < 2:
+        return set(tokens)
+    return {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHashIndex:
+    """Firmas MinHash con LSH por bandas; verificación por Jaccard exacto"""
+
+    def __init__(self, num_perm: int = MINHASH_PERMUTATIONS, bands: int = MINHASH_BANDS, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._buckets: List[Dict[Tuple[int, ...], Set[int]]] = [defaultdict(set) for _ in range(bands)]
+        self._items: Dict[int, Tuple[Set[str], Tuple[int, ...]]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def signature(self, items: Set[str]) -> Tuple[int, ...]:
+        hashes = [hash(item) & _MAX_HASH for item in items] or [0]
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes) & _MAX_HASH
+            for a, b in self._perms
+        )
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(self._bands):
+            yield band, signature[band * self._rows:(band + 1) * self._rows]
+
+    def add(self, item_id: int, text: str):
+        items = shingles(text)
+        signature = self.signature(items)
+        with self._lock:
+            self.remove(item_id)
+            self._items[item_id] = (items, signature)
+            for band, key in self._band_keys(signature):
+                self._buckets[band][key].add(item_id)
+
+    def remove(self, item_id: int):
+        with self._lock:
+            entry = self._items.pop(item_id, None)
+            if entry is None:
+                return
+            for band, key in self._band_keys(entry[1]):
+                bucket = self._buckets[band].get(key)
+                if bucket is not None:
+                    bucket.discard(item_id)
+                    if not bucket:
+                        del self._buckets[band][key]
+
+    def search(self, text: str, threshold: float = SENTENCE_SIMILARITY_THRESHOLD,
+               limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Elementos con similitud de Jaccard (shingles) >= threshold
+
+        Returns:
+            Lista (id, jaccard) ordenada por similitud descendente
+        """
+        items = shingles(text)
+        if not items:
+            return []
+        signature = self.signature(items)
+        with self._lock:
+            candidates = set()
+            for band, key in self._band_keys(signature):
+                candidates.update(self._buckets[band].get(key, ()))
+            entries = [(i, self._items[i][0]) for i in candidates]
+
+        matches = [(i, jaccard(items, other)) for i, other in entries]
+        matches = [m for m in matches if m[1] >= threshold]
+        matches.sort(key=lambda m: (-m[1], m[0]))
+        return matches[:limit] if limit else matches
+
+
+class _SharedIndex:
+    """Índice del proceso construido perezosamente desde la BD"""
+
+    def __init__(self, factory: Callable, loader: Callable):
+        self._factory = factory
+        self._loader = loader
+        self._index = None
+        self._stale = False
+        self._lock = threading.Lock()
+
+    def get(self, session):
+        with self._lock:
+            if self._index is None or self._stale:
+                index = self._factory()
+                for item_id, text in self._loader(session):
+                    index.add(item_id, text)
+                self._index, self._stale = index, False
+                logger.debug(f"Similarity index built ({len(index)} items)")
+            return self._index
+
+    def apply(self, upserts: Dict[int, str], deletes: Set[int]):
+        index = self._index
+        if index is None:
+            return
+        for item_id in deletes:
+            index.remove(item_id)
+        for item_id, text in upserts.items():
+            index.add(item_id, text)
+
+    def mark_stale(self):
+        self._stale = True
+
+
+_word_index = _SharedIndex(
+    TrigramIndex,
+    lambda session: session.exec(select(Word.id, Word.latin)).all()
+)
+_sentence_index = _SharedIndex(
+    MinHashIndex,
+    lambda session: session.exec(select(SentenceAnalysis.id, SentenceAnalysis.latin_text)).all()
+)
+
+_TRACKED = {
+    Word: (_word_index, "latin"),
+    SentenceAnalysis: (_sentence_index, "latin_text"),
+}
+
+
+def get_word_similarity_index(session) -> TrigramIndex:
+    """Índice de trigramas de Word.latin (construido en la primera llamada)"""
+    return _word_index.get(session)
+
+
+def get_sentence_similarity_index(session) -> MinHashIndex:
+    """Índice MinHash de SentenceAnalysis.latin_text (construido en la primera llamada)"""
+    return _sentence_index.get(session)
+
+
+def invalidate_similarity_indexes():
+    """Fuerza la reconstrucción de ambos índices en la próxima consulta"""
+    _word_index.mark_stale()
+    _sentence_index.mark_stale()
+
+
+def _new_pending() -> Dict:
+    return {"upserts": {}, "deletes": {}, "stale": set()}
+
+
+def _collect_similarity_changes(session, objects, pending: Dict):
+    """Anota altas/ediciones/borrados; se aplican al índice tras el commit"""
+    for obj in objects:
+        tracked = _TRACKED.get(type(obj))
+        if tracked is None or obj.id is None:
+            continue
+        shared, attribute = tracked
+        if obj in session.deleted:
+            pending["upserts"].setdefault(shared, {}).pop(obj.id, None)
+            pending["deletes"].setdefault(shared, set()).add(obj.id)
+        else:
+            pending["upserts"].setdefault(shared, {})[obj.id] = getattr(obj, attribute) or ""
+
+
+def _collect_similarity_bulk_changes(orm_execute_state, model, pending: Dict):
+    tracked = _TRACKED.get(model)
+    if tracked is not None:
+        pending["stale"].add(tracked[0])
+
+
+def _apply_similarity_changes(pending: Dict):
+    for shared in pending["stale"]:
+        shared.mark_stale()
+    for shared in set(pending["upserts"]) | set(pending["deletes"]):
+        if shared not in pending["stale"]:
+            shared.apply(pending["upserts"].get(shared, {}), pending["deletes"].get(shared, set()))
+
+
+register_invalidation(
+    "similarity_index",
+    tuple(_TRACKED),
+    on_flush=_collect_similarity_changes,
+    on_bulk=_collect_similarity_bulk_changes,
+    on_commit=_apply_similarity_changes,
+    make_pending=_new_pending,
+)
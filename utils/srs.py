@@ -1,9 +1,33 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from database import ReviewLog
+from typing import Iterable, List, Optional
 
-def calculate_next_review(quality: int, previous_review: ReviewLog = None) -> dict:
+from sqlmodel import Session, select, func
+from database import ReviewLog, ReviewState, Word
+
+# Whether this process already backfilled ReviewState from ReviewLog
+_backfill_done = False
+
+
+@dataclass(frozen=True)
+class SM2Parameters:
+    """Tunable SM-2 constants (shared by calculate_next_review and utils/srs_batch.py)."""
+    initial_ease: float = 2.5
+    min_ease: float = 1.3
+    pass_quality: int = 3
+    first_interval: int = 1
+    second_interval: int = 6
+    fail_interval: int = 1
+
+
+DEFAULT_SM2 = SM2Parameters()
+
+
+def calculate_next_review(quality: int, previous_review: ReviewLog = None,
+                          params: SM2Parameters = DEFAULT_SM2) -> dict:
     """
     Implement SM-2 Algorithm.
+    previous_review may be a ReviewLog or a ReviewState (same SM-2 fields).
     Returns dict with new ease_factor, interval, repetitions.
     """
     if previous_review:
@@ -11,30 +35,178 @@ def calculate_next_review(quality: int, previous_review: ReviewLog = None) -> di
         interval = previous_review.interval
         repetitions = previous_review.repetitions
     else:
-        ease_factor = 2.5
+        ease_factor = params.initial_ease
         interval = 0
         repetitions = 0
 
-    if quality >= 3:
+    if quality >= params.pass_quality:
         if repetitions == 0:
-            interval = 1
+            interval = params.first_interval
         elif repetitions == 1:
-            interval = 6
+            interval = params.second_interval
         else:
             interval = int(interval * ease_factor)
-        
+
         repetitions += 1
         ease_factor = ease_factor + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
     else:
         repetitions = 0
-        interval = 1
-    
-    if ease_factor < 1.3:
-        ease_factor = 1.3
-        
+        interval = params.fail_interval
+
+    if ease_factor < params.min_ease:
+        ease_factor = params.min_ease
+
     return {
         "ease_factor": ease_factor,
         "interval": interval,
         "repetitions": repetitions,
         "next_review_date": datetime.utcnow() + timedelta(days=interval)
     }
+
+
+def get_review_state(session: Session, word_id: int, user_id: int = 1) -> Optional[ReviewState]:
+    """Current scheduling state of a word, or None if it was never reviewed."""
+    return session.exec(
+        select(ReviewState).where(ReviewState.user_id == user_id, ReviewState.word_id == word_id)
+    ).first()
+
+
+def record_review(session: Session, word_id: int, quality: int, user_id: int = 1,
+                  reviewed_at: Optional[datetime] = None) -> ReviewState:
+    """
+    Apply SM-2 to a review: append it to ReviewLog and update the word's ReviewState.
+    The caller commits.
+    """
+    reviewed_at = reviewed_at or datetime.utcnow()
+    state = get_review_state(session, word_id, user_id)
+
+    previous = state
+    review_count = state.review_count if state else 0
+    if state is None:
+        # Word reviewed before ReviewState existed: continue from its last log
+        previous = session.exec(
+            select(ReviewLog).where(ReviewLog.word_id == word_id).order_by(ReviewLog.review_date.desc())
+        ).first()
+        if previous is not None:
+            review_count = session.exec(
+                select(func.count(ReviewLog.id)).where(ReviewLog.word_id == word_id)
+            ).one()
+        state = ReviewState(user_id=user_id, word_id=word_id, due_at=reviewed_at)
+
+    result = calculate_next_review(quality, previous)
+
+    session.add(ReviewLog(
+        word_id=word_id,
+        review_date=reviewed_at,
+        quality=quality,
+        ease_factor=result['ease_factor'],
+        interval=result['interval'],
+        repetitions=result['repetitions']
+    ))
+
+    state.ease_factor = result['ease_factor']
+    state.interval = result['interval']
+    state.repetitions = result['repetitions']
+    state.last_quality = quality
+    state.last_review_date = reviewed_at
+    state.due_at = reviewed_at + timedelta(days=result['interval'])
+    state.review_count = review_count + 1
+    session.add(state)
+    return state
+
+
+def get_due_cards(session: Session, limit: int = 20, user_id: int = 1,
+                  word_ids: Optional[Iterable[int]] = None,
+                  exclude: Optional[Iterable[int]] = None,
+                  now: Optional[datetime] = None) -> List[int]:
+    """
+    Word ids of the next due cards, most overdue first.
+    One query on the (user_id, due_at) index; word_ids restricts to a lesson or text.
+    """
+    statement = select(ReviewState.word_id).where(
+        ReviewState.user_id == user_id,
+        ReviewState.due_at <= (now or datetime.utcnow())
+    )
+    if word_ids is not None:
+        statement = statement.where(ReviewState.word_id.in_(list(word_ids)))
+    if exclude:
+        statement = statement.where(ReviewState.word_id.not_in(list(exclude)))
+    statement = statement.order_by(ReviewState.due_at).limit(limit)
+    return list(session.exec(statement).all())
+
+
+def count_due_cards(session: Session, user_id: int = 1,
+                    word_ids: Optional[Iterable[int]] = None,
+                    now: Optional[datetime] = None) -> int:
+    """Number of cards due now (same filter as get_due_cards)."""
+    statement = select(func.count(ReviewState.id)).where(
+        ReviewState.user_id == user_id,
+        ReviewState.due_at <= (now or datetime.utcnow())
+    )
+    if word_ids is not None:
+        statement = statement.where(ReviewState.word_id.in_(list(word_ids)))
+    return session.exec(statement).one()
+
+
+def unreviewed_words_clause(user_id: int = 1):
+    """WHERE clause for Word queries: words the user has never reviewed."""
+    return ~(
+        select(ReviewState.id)
+        .where(ReviewState.user_id == user_id, ReviewState.word_id == Word.id)
+        .exists()
+    )
+
+
+def backfill_review_states(session: Session, user_id: int = 1) -> int:
+    """
+    Create ReviewState rows from the latest ReviewLog of words that have none
+    (databases created with init_db, or logs written by older code).
+    Returns the number of states created. The caller commits.
+    """
+    latest = (
+        select(
+            ReviewLog.word_id,
+            func.max(ReviewLog.review_date).label("last_date"),
+            func.count(ReviewLog.id).label("review_count")
+        )
+        .group_by(ReviewLog.word_id)
+        .subquery()
+    )
+    has_state = (
+        select(ReviewState.id)
+        .where(ReviewState.user_id == user_id, ReviewState.word_id == ReviewLog.word_id)
+        .exists()
+    )
+    rows = session.exec(
+        select(ReviewLog, latest.c.review_count)
+        .join(latest, (latest.c.word_id == ReviewLog.word_id) & (latest.c.last_date == ReviewLog.review_date))
+        .where(~has_state)
+    ).all()
+
+    created = set()
+    for log, review_count in rows:
+        if log.word_id in created:
+            continue
+        session.add(ReviewState(
+            user_id=user_id,
+            word_id=log.word_id,
+            due_at=log.review_date + timedelta(days=log.interval),
+            ease_factor=log.ease_factor,
+            interval=log.interval,
+            repetitions=log.repetitions,
+            last_quality=log.quality,
+            last_review_date=log.review_date,
+            review_count=review_count
+        ))
+        created.add(log.word_id)
+    return len(created)
+
+
+def ensure_review_states(session: Session, user_id: int = 1) -> None:
+    """Run backfill_review_states once per process."""
+    global _backfill_done
+    if _backfill_done:
+        return
+    if backfill_review_states(session, user_id):
+        session.commit()
+    _backfill_done = True
@@ -0,0 +1,245 @@
+"""
+Vectorized SM-2 over the whole ReviewLog history (NumPy).
+
+calculate_next_review (utils/srs.py) schedules one review at a time. This
+module applies the same rules to arrays, so that the full history can be
+replayed at once, e.g. after changing SM2Parameters or importing reviews:
+
+- sm2_step: one SM-2 step for many cards in parallel.
+- replay_history: recompute ease/interval/repetitions for every review.
+  It steps over the review index within each word (1st review of every
+  word, then 2nd, ...), so the cost grows with the longest history of a
+  single word, not with the number of reviews.
+- reschedule_reviews: load ReviewLog, replay it and write ReviewState (and
+  optionally the ReviewLog columns) with bulk statements.
+- simulate_workload: expected reviews per day for the coming days.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import delete, insert, update
+from sqlmodel import Session, select
+
+from database import ReviewLog, ReviewState
+from utils.srs import DEFAULT_SM2, SM2Parameters
+
+DAY = np.timedelta64(1, 'D')
+
+
+def sm2_step(ease: np.ndarray, interval: np.ndarray, repetitions: np.ndarray,
+             quality: np.ndarray, params: SM2Parameters = DEFAULT_SM2
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized calculate_next_review: returns new (ease, interval, repetitions)."""
+    passed = quality >= params.pass_quality
+
+    grown = (interval * ease).astype(np.int64)  # int() truncation, as in srs.py
+    new_interval = np.where(
+        repetitions == 0, params.first_interval,
+        np.where(repetitions == 1, params.second_interval, grown)
+    )
+    new_interval = np.where(passed, new_interval, params.fail_interval).astype(np.int64)
+
+    q = 5 - quality
+    delta = 0.1 - q * (0.08 + q * 0.02)
+    new_ease = np.where(passed, ease + delta, ease)
+    new_ease = np.maximum(new_ease, params.min_ease)
+
+    new_repetitions = np.where(passed, repetitions + 1, 0).astype(np.int64)
+    return new_ease, new_interval, new_repetitions
+
+
+@dataclass
+class ReplayResult:
+    """Per-review recomputed values (input order) and per-word final state."""
+    ease: np.ndarray
+    interval: np.ndarray
+    repetitions: np.ndarray
+    # Final state, one entry per distinct word
+    word_ids: np.ndarray
+    last_review: np.ndarray
+    last_quality: np.ndarray
+    final_ease: np.ndarray
+    final_interval: np.ndarray
+    final_repetitions: np.ndarray
+    review_count: np.ndarray
+
+    @property
+    def due_at(self) -> np.ndarray:
+        return self.last_review + self.final_interval * DAY
+
+
+def replay_history(word_ids: np.ndarray, review_dates: np.ndarray, qualities: np.ndarray,
+                   params: SM2Parameters = DEFAULT_SM2) -> ReplayResult:
+    """
+    Replay a review history from scratch.
+
+    Args:
+        word_ids: int array, one entry per review
+        review_dates: datetime64 array (same length)
+        qualities: int array of SM-2 qualities 0-5
+    """
+    word_ids = np.asarray(word_ids, dtype=np.int64)
+    review_dates = np.asarray(review_dates, dtype='datetime64[us]')
+    qualities = np.asarray(qualities, dtype=np.int64)
+    n = len(word_ids)
+
+    order = np.lexsort((review_dates, word_ids))
+    sorted_words = word_ids[order]
+    sorted_quality = qualities[order]
+
+    starts = np.flatnonzero(np.r_[True, sorted_words[1:] != sorted_words[:-1]]) if n else np.array([], dtype=np.int64)
+    counts = np.diff(np.r_[starts, n])
+
+    ease = np.full(len(starts), params.initial_ease, dtype=np.float64)
+    interval = np.zeros(len(starts), dtype=np.int64)
+    repetitions = np.zeros(len(starts), dtype=np.int64)
+
+    out_ease = np.empty(n, dtype=np.float64)
+    out_interval = np.empty(n, dtype=np.int64)
+    out_repetitions = np.empty(n, dtype=np.int64)
+
+    # Words sorted by history length (desc): the active words at step k are a prefix
+    by_length = np.argsort(-counts, kind='stable')
+    lengths = counts[by_length]
+    for k in range(int(lengths[0]) if n else 0):
+        active = by_length[:np.searchsorted(-lengths, -k, side='left')]
+        rows = starts[active] + k
+        e, i, r = sm2_step(ease[active], interval[active], repetitions[active], sorted_quality[rows], params)
+        ease[active], interval[active], repetitions[active] = e, i, r
+        out_ease[rows], out_interval[rows], out_repetitions[rows] = e, i, r
+
+    # Back to input order
+    inverse = np.empty(n, dtype=np.int64)
+    inverse[order] = np.arange(n)
+    last_rows = order[starts + counts - 1] if n else np.array([], dtype=np.int64)
+
+    return ReplayResult(
+        ease=out_ease[inverse],
+        interval=out_interval[inverse],
+        repetitions=out_repetitions[inverse],
+        word_ids=sorted_words[starts],
+        last_review=review_dates[last_rows],
+        last_quality=qualities[last_rows],
+        final_ease=ease,
+        final_interval=interval,
+        final_repetitions=repetitions,
+        review_count=counts,
+    )
+
+
+def load_review_history(session: Session) -> Dict[str, np.ndarray]:
+    """ReviewLog as column arrays (one query, no ORM objects)."""
+    rows = session.exec(
+        select(ReviewLog.id, ReviewLog.word_id, ReviewLog.review_date, ReviewLog.quality)
+    ).all()
+    if not rows:
+        return {
+            'id': np.array([], dtype=np.int64),
+            'word_id': np.array([], dtype=np.int64),
+            'review_date': np.array([], dtype='datetime64[us]'),
+            'quality': np.array([], dtype=np.int64),
+        }
+    ids, word_ids, dates, qualities = zip(*rows)
+    return {
+        'id': np.array(ids, dtype=np.int64),
+        'word_id': np.array(word_ids, dtype=np.int64),
+        'review_date': np.array(dates, dtype='datetime64[us]'),
+        'quality': np.array(qualities, dtype=np.int64),
+    }
+
+
+def reschedule_reviews(session: Session, params: SM2Parameters = DEFAULT_SM2,
+                       user_id: int = 1, update_logs: bool = False) -> Dict[str, int]:
+    """
+    Recompute every word's schedule from its ReviewLog history.
+
+    Replaces the user's ReviewState rows in bulk; with update_logs=True also
+    rewrites ease_factor/interval/repetitions of each ReviewLog row.
+    The caller commits.
+    """
+    history = load_review_history(session)
+    result = replay_history(history['word_id'], history['review_date'], history['quality'], params)
+
+    due_at = result.due_at
+    states = [
+        {
+            'user_id': user_id,
+            'word_id': int(word_id),
+            'due_at': due_at[i].astype(datetime),
+            'ease_factor': float(result.final_ease[i]),
+            'interval': int(result.final_interval[i]),
+            'repetitions': int(result.final_repetitions[i]),
+            'last_quality': int(result.last_quality[i]),
+            'last_review_date': result.last_review[i].astype(datetime),
+            'review_count': int(result.review_count[i]),
+        }
+        for i, word_id in enumerate(result.word_ids)
+    ]
+
+    session.execute(delete(ReviewState).where(ReviewState.user_id == user_id))
+    if states:
+        session.execute(insert(ReviewState), states)
+
+    if update_logs and len(history['id']):
+        session.execute(update(ReviewLog), [
+            {
+                'id': int(log_id),
+                'ease_factor': float(e),
+                'interval': int(i),
+                'repetitions': int(r),
+            }
+            for log_id, e, i, r in zip(history['id'], result.ease, result.interval, result.repetitions)
+        ])
+
+    return {'reviews': len(history['id']), 'words': len(states)}
+
+
+def simulate_workload(due_at: np.ndarray, ease: np.ndarray, interval: np.ndarray,
+                      repetitions: np.ndarray, days: int = 30, pass_rate: float = 0.85,
+                      pass_quality: int = 4, fail_quality: int = 2,
+                      start: Optional[datetime] = None, seed: Optional[int] = None,
+                      params: SM2Parameters = DEFAULT_SM2) -> np.ndarray:
+    """
+    Expected number of reviews per day for the next `days` days.
+
+    Every card is reviewed on the day it falls due (overdue cards on day 0),
+    passing with probability pass_rate, and rescheduled with sm2_step.
+    Returns an int array of length `days`.
+    """
+    start = np.datetime64(start or datetime.utcnow(), 'D')
+    day = np.maximum((np.asarray(due_at, dtype='datetime64[D]') - start).astype(np.int64), 0)
+    ease = np.asarray(ease, dtype=np.float64).copy()
+    interval = np.asarray(interval, dtype=np.int64).copy()
+    repetitions = np.asarray(repetitions, dtype=np.int64).copy()
+    rng = np.random.default_rng(seed)
+
+    workload = np.zeros(days, dtype=np.int64)
+    for d in range(days):
+        due = np.flatnonzero(day == d)
+        workload[d] = len(due)
+        if not len(due):
+            continue
+        quality = np.where(rng.random(len(due)) < pass_rate, pass_quality, fail_quality)
+        ease[due], interval[due], repetitions[due] = sm2_step(
+            ease[due], interval[due], repetitions[due], quality, params
+        )
+        day[due] = d + np.maximum(interval[due], 1)
+    return workload
+
+
+def simulate_user_workload(session: Session, user_id: int = 1, days: int = 30, **kwargs) -> np.ndarray:
+    """simulate_workload over the user's current ReviewState rows."""
+    rows = session.exec(
+        select(ReviewState.due_at, ReviewState.ease_factor, ReviewState.interval, ReviewState.repetitions)
+        .where(ReviewState.user_id == user_id)
+    ).all()
+    if not rows:
+        return np.zeros(days, dtype=np.int64)
+    due_at, ease, interval, repetitions = zip(*rows)
+    return simulate_workload(
+        np.array(due_at, dtype='datetime64[us]'), np.array(ease), np.array(interval),
+        np.array(repetitions), days=days, **kwargs
+    )
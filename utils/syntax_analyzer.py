@@ -2,8 +2,10 @@
 Utilidad para análisis sintáctico automático de oraciones latinas usando LatinCy
 """
 import json
-from typing import Optional, List, Dict
+from typing import Dict, Iterable, Iterator, List, Optional
 from database import SentenceAnalysis
+from utils.diagram_store import get_diagram_store
+from utils.nlp_model_pool import get_pipeline
 
 try:
     import spacy
@@ -27,18 +29,17 @@ class LatinSyntaxAnalyzer:
         if not LATINCY_AVAILABLE:
             print("WARNING: LatinCy/SpaCy no están completamente instalados.")
         
+        # Modelo compartido del pool; solo se usa el perfil sintáctico (sin NER)
         try:
-            self.nlp = spacy.load(model_name)
+            self.nlp = get_pipeline(model_name, profile="syntax")
         except (OSError, ImportError):
             print(f"Modelo {model_name} no encontrado. Intentando descargar...")
             try:
                 import subprocess
                 subprocess.run(["python", "-m", "spacy", "download", model_name], check=True)
-                self.nlp = spacy.load(model_name)
             except Exception as e:
                 print(f"No se pudo descargar el modelo: {e}")
-                print("⚠️ Usando modelo en blanco 'la' como fallback. El análisis sintáctico será limitado.")
-                self.nlp = spacy.blank("la")
+            self.nlp = get_pipeline(model_name, profile="syntax", allow_blank=True)
     
     def analyze_sentence(
         self,
@@ -64,6 +65,19 @@ class LatinSyntaxAnalyzer:
         # Procesar con LatinCy
         doc = self.nlp(latin_text)
         
+        return self._build_analysis(doc, latin_text, translation, source, level, lesson_number)
+    
+    def _build_analysis(
+        self,
+        doc,
+        latin_text: str,
+        translation: str = "",
+        source: str = "",
+        level: int = 1,
+        lesson_number: Optional[int] = None,
+        render_svg: bool = True
+    ) -> SentenceAnalysis:
+        """Construye el SentenceAnalysis a partir de un doc ya procesado"""
         # Extraer árbol de dependencias
         dependency_tree = self._extract_dependencies(doc)
         
@@ -76,8 +90,11 @@ class LatinSyntaxAnalyzer:
         # Clasificar tipo de oración
         sentence_type = self._classify_sentence(doc)
         
-        # Generar diagrama SVG
-        tree_svg = self._generate_tree_diagram(doc)
+        # Calentar el almacén de diagramas (opcional: puede diferirse a render_svgs).
+        # El SVG vive en el almacén, no en tree_diagram_svg: los lectores lo
+        # obtienen desde dependency_json
+        if render_svg:
+            get_diagram_store().get_or_render(dependency_tree)
         
         # Crear y retornar objeto
         return SentenceAnalysis(
@@ -89,8 +106,7 @@ class LatinSyntaxAnalyzer:
             lesson_number=lesson_number,
             dependency_json=json.dumps(dependency_tree, ensure_ascii=False),
             syntax_roles=json.dumps(syntax_roles, ensure_ascii=False),
-            constructions=json.dumps(constructions, ensure_ascii=False) if constructions else None,
-            tree_diagram_svg=tree_svg
+            constructions=json.dumps(constructions, ensure_ascii=False) if constructions else None
         )
     
     def _extract_dependencies(self, doc) -> List[Dict]:
@@ -208,6 +224,18 @@ class LatinSyntaxAnalyzer:
     
     def _generate_tree_diagram(self, doc) -> str:
         """Genera diagrama de árbol de dependencias en formato SVG con etiquetas en español"""
+        return self.render_dependency_svg(self._extract_dependencies(doc))
+    
+    @staticmethod
+    def render_dependency_svg(dependencies: List[Dict]) -> str:
+        """
+        Genera el SVG del árbol a partir de dependencias ya extraídas
+        (formato de _extract_dependencies / SentenceAnalysis.dependency_json),
+        sin necesidad de volver a pasar la oración por el pipeline
+
+        Al cambiar etiquetas u opciones de dibujo, incrementar
+        DIAGRAM_STYLE_VERSION en utils/diagram_store.py
+        """
         try:
             # Mapa de traducción de dependencias (abreviaturas en español)
             # Las abreviaturas cortas evitan que se corten en el árbol SVG
@@ -305,20 +333,20 @@ class LatinSyntaxAnalyzer:
             words = []
             arcs = []
             
-            for token in doc:
-                pos_es = pos_map.get(token.pos_, token.pos_)
+            for token in dependencies:
+                pos_es = pos_map.get(token["pos"], token["pos"])
                 words.append({
-                    "text": token.text,
+                    "text": token["text"],
                     "tag": pos_es
                 })
                 
-                if token.dep_ != "ROOT":
-                    label = dep_map.get(token.dep_, token.dep_)
+                if token["dep"] != "ROOT":
+                    label = dep_map.get(token["dep"], token["dep"])
                     arcs.append({
-                        "start": min(token.i, token.head.i),
-                        "end": max(token.i, token.head.i),
+                        "start": min(token["id"], token["head"]),
+                        "end": max(token["id"], token["head"]),
                         "label": label,
-                        "dir": "left" if token.i < token.head.i else "right"
+                        "dir": "left" if token["id"] < token["head"] else "right"
                     })
             
             manual_data = {"words": words, "arcs": arcs}
@@ -337,27 +365,97 @@ class LatinSyntaxAnalyzer:
             print(f"Error generando diagrama: {e}")
             return ""
     
+    @staticmethod
+    def _unpack_sentence(item) -> tuple:
+        """Normaliza una tupla (latin, [translation, source, level, lesson_number])"""
+        latin = item[0]
+        translation = item[1] if len(item) > 1 else ""
+        source = item[2] if len(item) > 2 else ""
+        level = item[3] if len(item) > 3 else 1
+        lesson_number = item[4] if len(item) > 4 else None
+        return latin, (latin, translation, source, level, lesson_number)
+    
+    def iter_analyze(
+        self,
+        sentences: Iterable[tuple],  # [(latin, translation, source, level[, lesson_number]), ...]
+        batch_size: int = 64,
+        n_process: int = 1,
+        render_svg: bool = False
+    ) -> Iterator[SentenceAnalysis]:
+        """
+        Analiza oraciones en streaming con nlp.pipe
+        
+        Los SentenceAnalysis se producen a medida que spaCy termina cada lote.
+        Por defecto no se genera el SVG (etapa cara); usar render_svgs después
+        solo sobre las oraciones que lo necesiten.
+        
+        Args:
+            sentences: Iterable de tuplas (latin_text, translation, source, level[, lesson_number])
+            batch_size: Oraciones por lote de nlp.pipe
+            n_process: Procesos de spaCy (>1 usa multiprocessing)
+            render_svg: Dibujar el diagrama en el almacén (como analyze_sentence)
+            
+        Yields:
+            Objetos SentenceAnalysis en el mismo orden de entrada
+        """
+        items = (self._unpack_sentence(item) for item in sentences)
+        
+        for doc, (latin, translation, source, level, lesson_number) in self.nlp.pipe(
+            items, as_tuples=True, batch_size=batch_size, n_process=n_process
+        ):
+            yield self._build_analysis(
+                doc, latin, translation, source, level, lesson_number, render_svg=render_svg
+            )
+    
+    def render_svgs(
+        self,
+        analyses: Iterable[SentenceAnalysis],
+        overwrite: bool = False,
+        inline: bool = False
+    ) -> int:
+        """
+        Etapa opcional: dibuja en el almacén de diagramas los árboles de dependency_json
+        
+        Args:
+            analyses: Objetos SentenceAnalysis (p. ej. producidos por iter_analyze)
+            overwrite: Con inline, regenerar también los que ya tienen SVG en línea
+            inline: Copiar además el SVG a tree_diagram_svg (formato antiguo)
+            
+        Returns:
+            Número de diagramas disponibles en el almacén
+        """
+        store = get_diagram_store()
+        rendered = 0
+        for analysis in analyses:
+            if inline and analysis.tree_diagram_svg and not overwrite:
+                continue
+            svg = store.get_or_render(analysis.dependency_json)
+            if not svg:
+                continue
+            if inline:
+                analysis.tree_diagram_svg = svg
+            rendered += 1
+        return rendered
+    
     def batch_analyze(
         self,
         sentences: List[tuple],  # [(latin, translation, source, level), ...]
+        batch_size: int = 64,
+        n_process: int = 1,
+        render_svg: bool = True
     ) -> List[SentenceAnalysis]:
         """
-        Analiza múltiples oraciones en batch
+        Analiza múltiples oraciones en batch (nlp.pipe)
         
         Args:
-            sentences: Lista de tuplas (latin_text, translation, source, level)
+            sentences: Lista de tuplas (latin_text, translation, source, level[, lesson_number])
+            batch_size: Oraciones por lote de nlp.pipe
+            n_process: Procesos de spaCy
+            render_svg: Dibujar también los diagramas en el almacén
             
         Returns:
             Lista de objetos SentenceAnalysis
         """
-        results = []
-        for item in sentences:
-            latin = item[0]
-            translation = item[1] if len(item) > 1 else ""
-            source = item[2] if len(item) > 2 else ""
-            level = item[3] if len(item) > 3 else 1
-            
-            analysis = self.analyze_sentence(latin, translation, source, level)
-            results.append(analysis)
-        
-        return results
+        return list(self.iter_analyze(
+            sentences, batch_size=batch_size, n_process=n_process, render_svg=render_svg
+        ))
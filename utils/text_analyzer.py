@@ -5,10 +5,18 @@ Análisis reverso: forma inflectada → lema + información morfológica
 
 import json
 import re
-from typing import List, Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 from sqlmodel import select
 from database import InflectedForm, Word
 from utils.latin_logic import LatinMorphology
+from utils.morphology_index import MORPH_INDEX_ENABLED, get_invariable_lookup, get_morphology_index
+
+# Regex para capturar palabras latinas (con macrones) y puntuación
+TOKEN_PATTERN = re.compile(r'[a-zA-ZāēīōūȳĀĒĪŌŪȲ]+|[.,;:!?]')
+PUNCTUATION = '.,;:!?'
+
+# Tamaño máximo de cada lista IN (SQLite admite 999 parámetros en versiones antiguas)
+IN_QUERY_CHUNK_SIZE = 500
 
 
 class LatinTextAnalyzer:
@@ -40,31 +48,16 @@ class LatinTextAnalyzer:
         # Normalizar para búsqueda (sin macrones)
         normalized = LatinMorphology.normalize_latin(form)
         
-        # Buscar en tabla de formas inflectadas
-        matches = session.exec(
-            select(InflectedForm)
-            .where(InflectedForm.normalized_form == normalized)
-        ).all()
+        if not MORPH_INDEX_ENABLED:
+            return LatinTextAnalyzer._resolve_forms([normalized], session)[normalized]
         
-        results = []
-        for match in matches:
-            word = match.word
-            if word:
-                results.append({
-                    "lemma": word.latin,
-                    "translation": word.translation,
-                    "pos": word.part_of_speech,
-                    "morphology": json.loads(match.morphology),
-                    "confidence": 1.0,
-                    "word_id": word.id,
-                    "declension": word.declension,
-                    "conjugation": word.conjugation,
-                    "gender": word.gender
-                })
+        # Buscar en el índice en memoria de formas inflectadas (sin SQL por token)
+        index = get_morphology_index(session)
+        results = index.lookup(normalized)
         
-        # Si no encontramos nada en la tabla, intentar análisis heurístico
+        # Si no encontramos nada en la tabla, intentar análisis heurístico (invariables)
         if not results:
-            results = LatinTextAnalyzer._heuristic_analysis(form, normalized, session)
+            results = index.lookup_invariable(normalized)
         
         return results
     
@@ -74,36 +67,103 @@ class LatinTextAnalyzer:
         Análisis heurístico para palabras no en la base de datos
         Útil para palabras invariables o formas no generadas
         """
+        # Buscar palabras invariables que coincidan exactamente
+        # (diccionario precalculado, sin recorrer la tabla por cada token)
         results = []
+        for word_id, latin, translation, pos in get_invariable_lookup(session).get(normalized, ()):
+            results.append({
+                "lemma": latin,
+                "translation": translation,
+                "pos": pos,
+                "morphology": {"invariable": True},
+                "confidence": 0.9,
+                "word_id": word_id,
+                "declension": None,
+                "conjugation": None,
+                "gender": None
+            })
         
-        # Buscar palabras invariables que coincidan exactamente
-        invariable_words = session.exec(
-            select(Word)
-            .where(Word.is_invariable == True)
-        ).all()
-        
-        for word in invariable_words:
-            word_normalized = LatinMorphology.normalize_latin(word.latin)
-            if word_normalized == normalized:
-                results.append({
+        return results
+    
+    @staticmethod
+    def _resolve_forms(normalized_forms: Iterable[str], session) -> Dict[str, List[Dict]]:
+        """
+        Resuelve un conjunto de formas normalizadas con una consulta IN unida a Word
+        
+        Las formas sin resultado se resuelven contra el diccionario de invariables.
+        
+        Returns:
+            Dict forma normalizada → lista de análisis (vacía si es desconocida)
+        """
+        unique_forms = list(dict.fromkeys(normalized_forms))
+        resolved: Dict[str, List[Dict]] = {form: [] for form in unique_forms}
+        
+        # Trocear para respetar el límite de parámetros de SQLite
+        for start in range(0, len(unique_forms), IN_QUERY_CHUNK_SIZE):
+            chunk = unique_forms[start:start + IN_QUERY_CHUNK_SIZE]
+            rows = session.exec(
+                select(InflectedForm.normalized_form, InflectedForm.morphology, Word)
+                .join(Word, InflectedForm.word_id == Word.id)
+                .where(InflectedForm.normalized_form.in_(chunk))
+                .order_by(InflectedForm.id)
+            ).all()
+            
+            for normalized_form, morphology, word in rows:
+                resolved[normalized_form].append({
                     "lemma": word.latin,
                     "translation": word.translation,
                     "pos": word.part_of_speech,
-                    "morphology": {"invariable": True},
-                    "confidence": 0.9,
+                    "morphology": json.loads(morphology),
+                    "confidence": 1.0,
                     "word_id": word.id,
-                    "declension": None,
-                    "conjugation": None,
-                    "gender": None
+                    "declension": word.declension,
+                    "conjugation": word.conjugation,
+                    "gender": word.gender
                 })
         
-        return results
+        for normalized, results in resolved.items():
+            if not results:
+                resolved[normalized] = LatinTextAnalyzer._heuristic_analysis(normalized, normalized, session)
+        
+        return resolved
+    
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        """Separa palabras latinas (con macrones) y signos de puntuación"""
+        return TOKEN_PATTERN.findall(text)
+    
+    @staticmethod
+    def _assemble(tokens: List[str], resolver: Callable[[str], List[Dict]]) -> List[Dict]:
+        """Construye la salida de analyze_text en el orden original de los tokens"""
+        analyzed = []
+        
+        for position, token in enumerate(tokens):
+            # Si es puntuación, saltar
+            if token in PUNCTUATION:
+                analyzed.append({
+                    "form": token,
+                    "analyses": [],
+                    "position": position,
+                    "is_punctuation": True
+                })
+            else:
+                analyzed.append({
+                    "form": token,
+                    "analyses": resolver(LatinMorphology.normalize_latin(token)),
+                    "position": position,
+                    "is_punctuation": False
+                })
+        
+        return analyzed
     
     @staticmethod
     def analyze_text(text: str, session) -> List[Dict]:
         """
         Analiza un texto completo palabra por palabra
         
+        Usa el índice morfológico en memoria; si está desactivado
+        (MORPH_INDEX_ENABLED=false) recurre a analyze_text_batch.
+        
         Args:
             text: Texto latino a analizar
             session: Sesión de base de datos
@@ -119,35 +179,35 @@ class LatinTextAnalyzer:
                 ...
             ]
         """
-        # Tokenización: separar palabras y mantener puntuación
-        # Regex para capturar palabras latinas (con macrones) y puntuación
-        tokens = re.findall(r'[a-zA-ZāēīōūȳĀĒĪŌŪȲ]+|[.,;:!?]', text)
+        if not MORPH_INDEX_ENABLED:
+            return LatinTextAnalyzer.analyze_text_batch(text, session)
         
-        analyzed = []
-        position = 0
+        tokens = LatinTextAnalyzer._tokenize(text)
         
-        for token in tokens:
-            # Si es puntuación, saltar
-            if token in '.,;:!?':
-                analyzed.append({
-                    "form": token,
-                    "analyses": [],
-                    "position": position,
-                    "is_punctuation": True
-                })
-            else:
-                # Analizar palabra
-                analyses = LatinTextAnalyzer.analyze_word(token, session)
-                analyzed.append({
-                    "form": token,
-                    "analyses": analyses,
-                    "position": position,
-                    "is_punctuation": False
-                })
-            
-            position += 1
+        # El índice se obtiene una sola vez para todo el texto
+        index = get_morphology_index(session)
         
-        return analyzed
+        def resolve(normalized: str) -> List[Dict]:
+            return index.lookup(normalized) or index.lookup_invariable(normalized)
+        
+        return LatinTextAnalyzer._assemble(tokens, resolve)
+    
+    @staticmethod
+    def analyze_text_batch(text: str, session) -> List[Dict]:
+        """
+        Analiza un texto completo en modo por lotes, sin índice en memoria
+        
+        Deduplica los tokens, los resuelve todos con una consulta IN unida a Word
+        y devuelve los resultados en el orden original (mismo formato que analyze_text).
+        """
+        tokens = LatinTextAnalyzer._tokenize(text)
+        
+        resolved = LatinTextAnalyzer._resolve_forms(
+            (LatinMorphology.normalize_latin(token) for token in tokens if token not in PUNCTUATION),
+            session
+        )
+        
+        return LatinTextAnalyzer._assemble(tokens, lambda normalized: list(resolved[normalized]))
     
     @staticmethod
     def format_morphology(morphology: Dict, pos: str) -> str:
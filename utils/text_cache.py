@@ -2,80 +2,178 @@
 Nuevo analizador de texto para Lectio que prioriza análisis CLTK cacheado
 """
 
-from database import TextWordLink, Word
-from sqlmodel import select
+import hashlib
 import json
+import logging
+from datetime import datetime
+
+from database import TextAnalysisSnapshot, TextWordLink, Word
+from database.invalidation import has_pending_changes
+from database.text_snapshots import SNAPSHOT_INVALIDATION_NAME
+from sqlmodel import select
+
+logger = logging.getLogger(__name__)
+
+# Subir al cambiar la estructura de los análisis guardados en el snapshot
+SNAPSHOT_FORMAT_VERSION = "1"
+
+
+def _load_json(raw):
+    """json.loads tolerante: None si está vacío o mal formado"""
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except (ValueError, TypeError):
+        return None
 
 
 def get_text_analysis_from_cache(session, text_id: int):
     """
     Obtiene el análisis de un texto desde TextWordLink (si existe análisis CLTK)
     
+    Una sola consulta (TextWordLink LEFT JOIN Word) trae todas las columnas
+    necesarias, sin cargas perezosas de `link.word` por token.
+    
     Returns:
         List[Dict] o None si no hay análisis cachillado
     """
-    links = session.exec(
-        select(TextWordLink)
+    rows = session.exec(
+        select(
+            TextWordLink.form,
+            TextWordLink.position_in_sentence,
+            TextWordLink.word_id,
+            TextWordLink.morphology_json,
+            TextWordLink.notes,
+            Word.latin,
+            Word.translation,
+            Word.part_of_speech,
+        )
+        .outerjoin(Word, Word.id == TextWordLink.word_id)
         .where(TextWordLink.text_id == text_id)
         .order_by(TextWordLink.sentence_number, TextWordLink.position_in_sentence)
     ).all()
     
-    if not links:
+    if not rows:
         return None
     
     analyses = []
-    for link in links:
+    for form, position, word_id, morphology_json, notes, latin, translation, pos in rows:
         # Construir análisis desde TextWordLink
         analysis = {
-            "form": link.form,
-            "position": link.position_in_sentence,
-            "is_punctuation": is_punctuation(link.form) if link.form else False
+            "form": form,
+            "position": position,
+            "is_punctuation": is_punctuation(form) if form else False
         }
         
-        # Si tiene word_id, obtener datos del vocabulario
-        if link.word_id:
-            word = link.word
-            analysis["word_id"] = word.id
-            analysis["lemma"] = word.latin
-            analysis["translation"] = word.translation
-            analysis["pos"] = word.part_of_speech
-            
-            # Morfología desde JSON o vacío
-            if link.morphology_json:
-                analysis["morphology"] = json.loads(link.morphology_json)
-            else:
-                analysis["morphology"] = {}
+        # Si tiene word_id, usar los datos del vocabulario (ya unidos)
+        if word_id and latin is not None:
+            analysis["word_id"] = word_id
+            analysis["lemma"] = latin
+            analysis["translation"] = translation
+            analysis["pos"] = pos
         else:
             # Palabra no en vocabulario - leer desde notes (análisis CLTK)
-            if link.notes:
-                try:
-                    notes_data = json.loads(link.notes)
-                    analysis["lemma"] = notes_data.get("lemma", link.form)
-                    analysis["pos"] = notes_data.get("pos", "unknown")
-                    analysis["translation"] = f"({notes_data.get('lemma', link.form)})"
-                    analysis["word_id"] = None
-                except:
-                    analysis["lemma"] = link.form
-                    analysis["pos"] = "unknown"
-                    analysis["translation"] = "(?)"
-                    analysis["word_id"] = None
+            notes_data = _load_json(notes)
+            if isinstance(notes_data, dict):
+                analysis["lemma"] = notes_data.get("lemma", form)
+                analysis["pos"] = notes_data.get("pos", "unknown")
+                analysis["translation"] = f"({notes_data.get('lemma', form)})"
             else:
-                analysis["lemma"] = link.form
+                analysis["lemma"] = form
                 analysis["pos"] = "unknown"
                 analysis["translation"] = "(?)"
-                analysis["word_id"] = None
-            
-            # Morfología desde JSON
-            if link.morphology_json:
-                analysis["morphology"] = json.loads(link.morphology_json)
-            else:
-                analysis["morphology"] = {}
+            analysis["word_id"] = None
+        
+        # Morfología desde JSON o vacío
+        analysis["morphology"] = _load_json(morphology_json) or {}
         
         analyses.append(analysis)
     
     return analyses
 
 
+def get_content_version(text_content: str) -> str:
+    """Versión de un texto para su snapshot: formato + hash del contenido"""
+    digest = hashlib.sha1((text_content or "").encode("utf-8")).hexdigest()[:16]
+    return f"{SNAPSHOT_FORMAT_VERSION}:{digest}"
+
+
+def get_text_analysis_snapshot(session, text_id: int, text_content: str):
+    """
+    Devuelve el análisis del texto desde su snapshot serializado (una lectura)
+    
+    Si no hay snapshot o su versión no coincide con el contenido actual, se
+    reconstruye con get_text_analysis_from_cache y se guarda aparte, en su
+    propia transacción (ver _store_snapshot). Los snapshots se invalidan al
+    cambiar los enlaces del texto (ver database/text_snapshots.py).
+    
+    Returns:
+        List[Dict] o None si el texto no tiene análisis en TextWordLink
+    """
+    version = get_content_version(text_content)
+    
+    try:
+        snapshot = session.get(TextAnalysisSnapshot, text_id)
+    except Exception as e:
+        logger.warning(f"Snapshot de análisis no disponible para texto {text_id}: {e}")
+        return get_text_analysis_from_cache(session, text_id)
+    
+    if snapshot is not None and snapshot.content_version == version:
+        analyses = _load_json(snapshot.payload)
+        if analyses:
+            return analyses
+    
+    analyses = get_text_analysis_from_cache(session, text_id)
+    if not analyses:
+        return analyses
+    
+    # Con enlaces o palabras sin confirmar en esta sesión, el análisis no es compartible
+    if not has_pending_changes(session, SNAPSHOT_INVALIDATION_NAME):
+        _store_snapshot(session, text_id, version, json.dumps(analyses, ensure_ascii=False))
+        if snapshot is not None:
+            # La fila cambió fuera de la sesión
+            session.expire(snapshot)
+    
+    return analyses
+
+
+def _store_snapshot(session, text_id: int, version: str, payload: str):
+    """
+    Guarda el snapshot en su propia transacción corta (INSERT ... ON CONFLICT)
+    
+    No toca la transacción de la página: dos lecturas simultáneas del mismo
+    texto no chocan por la clave primaria, y un fallo al guardar solo se
+    registra (el snapshot se reconstruirá en la siguiente lectura).
+    """
+    table = TextAnalysisSnapshot.__table__
+    try:
+        engine = session.get_bind().engine
+        if engine.dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        elif engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            return
+        
+        statement = insert(table).values(
+            text_id=text_id,
+            content_version=version,
+            payload=payload,
+            created_at=datetime.utcnow()
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.text_id],
+            set_={"content_version": statement.excluded.content_version,
+                  "payload": statement.excluded.payload,
+                  "created_at": statement.excluded.created_at}
+        )
+        with engine.begin() as connection:
+            connection.execute(statement)
+    except Exception as e:
+        logger.warning(f"No se pudo guardar el snapshot de análisis del texto {text_id}: {e}")
+
+
 def is_punctuation(text: str) -> bool:
     """Verifica si el texto es puntuación"""
     if not text:
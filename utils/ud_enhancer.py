@@ -10,6 +10,8 @@ from typing import Dict, List, Any, Optional
 from spacy.lang.la import Latin
 import spacy
 
+from utils.nlp_model_pool import get_pipeline
+
 class UDEnhancer:
     """
     Enhances Latin text analysis using Universal Dependencies corpora
@@ -20,8 +22,8 @@ class UDEnhancer:
         Initialize the UD Enhancer with LatinCy model
         """
         try:
-            # Load LatinCy model (should be installed as per requirements)
-            self.nlp = spacy.load("la_core_web_lg")
+            # LatinCy model from the shared pool (should be installed as per requirements)
+            self.nlp = get_pipeline("la_core_web_lg", profile="syntax")
         except OSError:
             print("Warning: LatinCy model not found. Please install it from https://huggingface.co/latincy/la_core_web_lg")
             self.nlp = None
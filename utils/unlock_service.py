@@ -7,10 +7,12 @@ Funciones principales:
 - unlock_lesson: Desbloquea una lección específica
 - unlock_vocabulary: Desbloquea vocabulario de una lección
 - auto_unlock_check: Verifica y desbloquea automáticamente todo lo que el usuario pueda acceder
+- UnlockContext: Agregados de progreso precargados para evaluar condiciones en memoria
 """
 
-from typing import Optional, Dict, List
-from sqlmodel import Session, select
+from typing import Optional, Dict, List, Iterable
+from sqlmodel import Session, select, func
+from sqlalchemy import and_, case
 from datetime import datetime
 import json
 
@@ -88,6 +90,41 @@ def get_vocab_mastery(session: Session, user_id: int, lesson_number: int) -> flo
     return total_mastery / len(lesson_words)  # Promedio sobre TODAS las palabras esenciales
 
 
+def get_vocab_mastery_by_lesson(session: Session, user_id: int,
+                                lesson_numbers: Optional[Iterable[int]] = None) -> Dict[int, float]:
+    """
+    Dominio promedio del vocabulario esencial de varias lecciones en una consulta.
+    Mismo cálculo que get_vocab_mastery (las palabras sin progreso cuentan como 0.0).
+    Retorna: {lesson_number: 0.0-1.0} (solo lecciones con vocabulario esencial)
+    """
+    from database import LessonVocabulary
+    
+    statement = (
+        select(
+            LessonVocabulary.lesson_number,
+            func.count(LessonVocabulary.id),
+            func.sum(func.coalesce(UserVocabularyProgress.mastery_level, 0.0))
+        )
+        .outerjoin(
+            UserVocabularyProgress,
+            and_(
+                UserVocabularyProgress.word_id == LessonVocabulary.word_id,
+                UserVocabularyProgress.user_id == user_id
+            )
+        )
+        .where(LessonVocabulary.is_essential == True)
+        .group_by(LessonVocabulary.lesson_number)
+    )
+    if lesson_numbers is not None:
+        statement = statement.where(LessonVocabulary.lesson_number.in_(list(lesson_numbers)))
+    
+    return {
+        lesson_num: (mastery_sum or 0.0) / total
+        for lesson_num, total, mastery_sum in session.exec(statement).all()
+        if total
+    }
+
+
 def get_exercises_stats(session: Session, user_id: int, lesson_number: int) -> Dict:
     """
     Obtiene estadísticas de ejercicios de una lección.
@@ -135,7 +172,142 @@ def get_sentences_analyzed_count(session: Session, user_id: int, lesson_number:
     return len(analyses)
 
 
-def evaluate_condition(session: Session, user_id: int, condition: Dict) -> bool:
+class _LiveContext:
+    """Contexto que consulta la BD en cada pregunta (evaluaciones sueltas)"""
+    
+    def __init__(self, session: Session, user_id: int):
+        self.session = session
+        self.user_id = user_id
+    
+    def lesson_status(self, lesson_number: int) -> Optional[str]:
+        lesson_prog = get_lesson_progress(self.session, self.user_id, lesson_number)
+        return lesson_prog.status if lesson_prog else None
+    
+    def vocab_mastery(self, lesson_number: int) -> float:
+        return get_vocab_mastery(self.session, self.user_id, lesson_number)
+    
+    def exercises_stats(self, lesson_number: int) -> Dict:
+        return get_exercises_stats(self.session, self.user_id, lesson_number)
+    
+    def reading_completed(self, text_id: int) -> bool:
+        return is_reading_completed(self.session, self.user_id, text_id)
+    
+    def sentences_analyzed(self, lesson_number: Optional[int] = None) -> int:
+        return get_sentences_analyzed_count(self.session, self.user_id, lesson_number)
+    
+    def challenges_passed(self) -> List:
+        return get_json_list(get_user_summary(self.session, self.user_id).challenges_passed)
+    
+    def unlock_rule(self, target: str) -> Optional[UnlockCondition]:
+        statement = select(UnlockCondition).where(UnlockCondition.unlocks_id == target)
+        return self.session.exec(statement).first()
+
+
+class UnlockContext:
+    """
+    Agregados de progreso de un usuario precargados en un puñado de consultas.
+    
+    Permite evaluar todas las UnlockCondition en memoria, sin consultas por
+    lección ni por condición. Es una foto del estado al construirse: tras
+    escribir progreso nuevo hay que crear otro contexto.
+    """
+    
+    def __init__(self, session: Session, user_id: int, targets: Optional[Iterable[str]] = None):
+        """
+        Args:
+            session: Sesión de BD
+            user_id: ID del usuario
+            targets: Recursos cuyas reglas precargar (None = todas)
+        """
+        self.session = session
+        self.user_id = user_id
+        self.summary = get_user_summary(session, user_id)
+        
+        # Progreso por lección
+        self.lessons: Dict[int, LessonProgress] = {}
+        for lesson_prog in session.exec(
+            select(LessonProgress).where(LessonProgress.user_id == user_id)
+        ).all():
+            self.lessons.setdefault(lesson_prog.lesson_number, lesson_prog)
+        
+        # Vocabulario esencial por lección
+        self._vocab_mastery = get_vocab_mastery_by_lesson(session, user_id)
+        
+        # Ejercicios por lección
+        self._exercises: Dict[int, Dict] = {}
+        for lesson_num, total, correct in session.exec(
+            select(
+                ExerciseAttempt.lesson_number,
+                func.count(ExerciseAttempt.id),
+                func.sum(case((ExerciseAttempt.is_correct == True, 1), else_=0))
+            )
+            .where(ExerciseAttempt.user_id == user_id)
+            .group_by(ExerciseAttempt.lesson_number)
+        ).all():
+            self._exercises[lesson_num] = {
+                'count': total,
+                'accuracy': (correct or 0) / total if total > 0 else 0.0
+            }
+        
+        # Lecturas completadas
+        self._readings_completed = set(session.exec(
+            select(ReadingProgress.text_id).where(
+                ReadingProgress.user_id == user_id,
+                ReadingProgress.status == "completed"
+            )
+        ).all())
+        
+        # Oraciones analizadas por lección (None = sin lección)
+        self._sentences: Dict[Optional[int], int] = dict(session.exec(
+            select(SyntaxAnalysisProgress.lesson_number, func.count(SyntaxAnalysisProgress.id))
+            .where(
+                SyntaxAnalysisProgress.user_id == user_id,
+                SyntaxAnalysisProgress.analyzed == True
+            )
+            .group_by(SyntaxAnalysisProgress.lesson_number)
+        ).all())
+        
+        # Reglas de desbloqueo (la primera por recurso, como check_unlock_conditions)
+        statement = select(UnlockCondition).order_by(UnlockCondition.id)
+        if targets is not None:
+            statement = statement.where(UnlockCondition.unlocks_id.in_(list(targets)))
+        self._rules: Dict[str, UnlockCondition] = {}
+        for rule in session.exec(statement).all():
+            self._rules.setdefault(rule.unlocks_id, rule)
+        self._all_rules = targets is None
+    
+    def lesson_status(self, lesson_number: int) -> Optional[str]:
+        lesson_prog = self.lessons.get(lesson_number)
+        return lesson_prog.status if lesson_prog else None
+    
+    def vocab_mastery(self, lesson_number: int) -> float:
+        return self._vocab_mastery.get(lesson_number, 0.0)
+    
+    def exercises_stats(self, lesson_number: int) -> Dict:
+        return self._exercises.get(lesson_number, {'count': 0, 'accuracy': 0.0})
+    
+    def reading_completed(self, text_id: int) -> bool:
+        return text_id in self._readings_completed
+    
+    def sentences_analyzed(self, lesson_number: Optional[int] = None) -> int:
+        if lesson_number is None:
+            return sum(self._sentences.values())
+        return self._sentences.get(lesson_number, 0)
+    
+    def challenges_passed(self) -> List:
+        return get_json_list(self.summary.challenges_passed)
+    
+    def unlock_rule(self, target: str) -> Optional[UnlockCondition]:
+        if target in self._rules or self._all_rules:
+            return self._rules.get(target)
+        # Recurso no precargado: consulta puntual
+        rule = _LiveContext(self.session, self.user_id).unlock_rule(target)
+        self._rules[target] = rule
+        return rule
+
+
+def evaluate_condition(session: Session, user_id: int, condition: Dict,
+                       context: Optional[UnlockContext] = None) -> bool:
     """
     Evalúa una sola condición.
     
@@ -147,54 +319,57 @@ def evaluate_condition(session: Session, user_id: int, condition: Dict) -> bool:
     - reading_completed: {"type": "reading_completed", "text_id": 1}
     - sentences_analyzed: {"type": "sentences_analyzed", "lesson_number": 3, "count": 3}
     - challenge_passed: {"type": "challenge_passed", "challenge_id": 3}
+    
+    Con un UnlockContext la evaluación es en memoria; sin él, consulta la BD.
     """
+    if context is None:
+        context = _LiveContext(session, user_id)
+    
     cond_type = condition.get('type')
     
     if cond_type == 'lesson_completed':
         lesson_num = condition['lesson_number']
-        lesson_prog = get_lesson_progress(session, user_id, lesson_num)
-        return lesson_prog is not None and lesson_prog.status == 'completed'
+        return context.lesson_status(lesson_num) == 'completed'
     
     elif cond_type == 'vocab_mastery':
         lesson_num = condition['lesson_number']
         threshold = condition['threshold']
-        mastery = get_vocab_mastery(session, user_id, lesson_num)
+        mastery = context.vocab_mastery(lesson_num)
         return mastery >= threshold
     
     elif cond_type == 'exercises_completed':
         lesson_num = condition['lesson_number']
         required_count = condition['count']
-        stats = get_exercises_stats(session, user_id, lesson_num)
+        stats = context.exercises_stats(lesson_num)
         return stats['count'] >= required_count
     
     elif cond_type == 'exercises_accuracy':
         lesson_num = condition['lesson_number']
         threshold = condition['threshold']
-        stats = get_exercises_stats(session, user_id, lesson_num)
+        stats = context.exercises_stats(lesson_num)
         return stats['count'] > 0 and stats['accuracy'] >= threshold
     
     elif cond_type == 'reading_completed':
         text_id = condition['text_id']
-        return is_reading_completed(session, user_id, text_id)
+        return context.reading_completed(text_id)
     
     elif cond_type == 'sentences_analyzed':
         lesson_num = condition.get('lesson_number')
         required_count = condition['count']
-        analyzed = get_sentences_analyzed_count(session, user_id, lesson_num)
+        analyzed = context.sentences_analyzed(lesson_num)
         return analyzed >= required_count
     
     elif cond_type == 'challenge_passed':
         challenge_id = condition['challenge_id']
-        summary = get_user_summary(session, user_id)
-        passed_challenges = get_json_list(summary.challenges_passed)
-        return challenge_id in passed_challenges
+        return challenge_id in context.challenges_passed()
     
     else:
         # Tipo de condición desconocido
         return False
 
 
-def check_unlock_conditions(session: Session, user_id: int, target: str) -> bool:
+def check_unlock_conditions(session: Session, user_id: int, target: str,
+                            context: Optional[UnlockContext] = None) -> bool:
     """
     Verifica si un usuario cumple las condiciones para desbloquear un recurso.
     
@@ -202,13 +377,16 @@ def check_unlock_conditions(session: Session, user_id: int, target: str) -> bool
         session: Sesión de BD
         user_id: ID del usuario
         target: ID del recurso a desbloquear (ej: 'lesson_4', 'vocab_l3', 'reading_julia')
+        context: UnlockContext precargado (opcional, para evaluar muchos recursos)
     
     Returns:
         True si cumple las condiciones, False en caso contrario
     """
+    if context is None:
+        context = _LiveContext(session, user_id)
+    
     # Buscar condiciones de desbloqueo para este target
-    statement = select(UnlockCondition).where(UnlockCondition.unlocks_id == target)
-    unlock_rule = session.exec(statement).first()
+    unlock_rule = context.unlock_rule(target)
     
     if not unlock_rule:
         # Si no hay reglas explícitas, está desbloqueado por defecto
@@ -221,7 +399,7 @@ def check_unlock_conditions(session: Session, user_id: int, target: str) -> bool
         return False
     
     # Evaluar cada condición
-    results = [evaluate_condition(session, user_id, cond) for cond in conditions]
+    results = [evaluate_condition(session, user_id, cond, context) for cond in conditions]
     
     # Aplicar lógica AND/OR
     if unlock_rule.require_all:
@@ -259,6 +437,37 @@ def unlock_lesson(session: Session, user_id: int, lesson_number: int) -> bool:
         return True
 
 
+def _add_unlocked_vocabulary(session: Session, user_id: int, word_ids: Iterable[int]) -> int:
+    """
+    Crea el progreso (mastery 0.0, sin ver) de las palabras desbloqueadas y
+    las suma al resumen incremental, igual que las cuenta la reconciliación.
+    No hace commit.
+    
+    Retorna: número de entradas creadas
+    """
+    from utils.progress_tracker import _summary_for_delta, _apply_vocab_delta
+    
+    word_ids = list(dict.fromkeys(word_ids))
+    if not word_ids:
+        return 0
+    
+    for word_id in word_ids:
+        session.add(UserVocabularyProgress(
+            user_id=user_id,
+            word_id=word_id,
+            mastery_level=0.0,
+            times_seen=0
+        ))
+    
+    # Si el resumen se reconcilia aquí, el autoflush ya incluye las filas nuevas
+    summary = _summary_for_delta(session, user_id)
+    if summary is not None:
+        for _ in word_ids:
+            _apply_vocab_delta(summary, None, 0.0)
+    
+    return len(word_ids)
+
+
 def unlock_vocabulary_for_lesson(session: Session, user_id: int, lesson_number: int) -> int:
     """
     Desbloquea el vocabulario de una lección.
@@ -274,7 +483,7 @@ def unlock_vocabulary_for_lesson(session: Session, user_id: int, lesson_number:
     )
     lesson_words = session.exec(statement).all()
     
-    new_unlocks = 0
+    new_word_ids = []
     
     for lesson_word in lesson_words:
         # Verificar si ya tiene progreso
@@ -285,15 +494,10 @@ def unlock_vocabulary_for_lesson(session: Session, user_id: int, lesson_number:
         existing = session.exec(statement).first()
         
         if not existing:
-            # Crear entrada de progreso (con mastery 0.0)
-            new_progress = UserVocabularyProgress(
-                user_id=user_id,
-                word_id=lesson_word.word_id,
-                mastery_level=0.0,
-                times_seen=0
-            )
-            session.add(new_progress)
-            new_unlocks += 1
+            new_word_ids.append(lesson_word.word_id)
+    
+    # Crear entradas de progreso (con mastery 0.0)
+    new_unlocks = _add_unlocked_vocabulary(session, user_id, new_word_ids)
     
     if new_unlocks > 0:
         session.commit()
@@ -306,6 +510,10 @@ def auto_unlock_check(session: Session, user_id: int) -> Dict[str, List[str]]:
     Verifica todas las posibles condiciones de desbloqueo y desbloquea automáticamente
     lo que el usuario ya puede acceder.
     
+    Las condiciones se evalúan en memoria sobre un UnlockContext precargado y
+    todos los desbloqueos se escriben en una sola transacción, de modo que el
+    número de consultas no crece con lecciones × condiciones.
+    
     Retorna un diccionario con los recursos desbloqueados:
     {
         'lessons': [4, 5],
@@ -314,6 +522,8 @@ def auto_unlock_check(session: Session, user_id: int) -> Dict[str, List[str]]:
         'challenges': ['challenge_l3']
     }
     """
+    from database import LessonVocabulary
+    
     unlocked = {
         'lessons': [],
         'vocabulary': [],
@@ -324,23 +534,65 @@ def auto_unlock_check(session: Session, user_id: int) -> Dict[str, List[str]]:
     summary = get_user_summary(session, user_id)
     current = summary.current_lesson
     
-    # Verificar lecciones (hasta 3 lecciones adelante)
-    for lesson_num in range(1, min(current + 4, 41)):
-        target = f'lesson_{lesson_num}'
-        if check_unlock_conditions(session, user_id, target):
-            if unlock_lesson(session, user_id, lesson_num):
-                unlocked['lessons'].append(lesson_num)
-    
-    # Verificar vocabulario de lecciones desbloqueadas
-    for lesson_num in range(1, current + 2):
-        target = f'vocab_l{lesson_num}'
-        if check_unlock_conditions(session, user_id, target):
-            count = unlock_vocabulary_for_lesson(session, user_id, lesson_num)
-            if count > 0:
+    # Verificar lecciones (hasta 3 lecciones adelante) y vocabulario de lecciones desbloqueadas
+    lesson_numbers = range(1, min(current + 4, 41))
+    vocab_lessons = range(1, current + 2)
+    targets = [f'lesson_{n}' for n in lesson_numbers] + [f'vocab_l{n}' for n in vocab_lessons]
+    context = UnlockContext(session, user_id, targets)
+    now = datetime.utcnow()
+    
+    for lesson_num in lesson_numbers:
+        if not check_unlock_conditions(session, user_id, f'lesson_{lesson_num}', context):
+            continue
+        lesson_prog = context.lessons.get(lesson_num)
+        if lesson_prog is None:
+            lesson_prog = LessonProgress(
+                user_id=user_id,
+                lesson_number=lesson_num,
+                status='unlocked',
+                unlocked_at=now
+            )
+            session.add(lesson_prog)
+            context.lessons[lesson_num] = lesson_prog
+            unlocked['lessons'].append(lesson_num)
+        elif lesson_prog.status == 'locked':
+            lesson_prog.status = 'unlocked'
+            lesson_prog.unlocked_at = now
+            unlocked['lessons'].append(lesson_num)
+    
+    vocab_targets = [
+        lesson_num for lesson_num in vocab_lessons
+        if check_unlock_conditions(session, user_id, f'vocab_l{lesson_num}', context)
+    ]
+    if vocab_targets:
+        # Palabras de las lecciones y palabras que el usuario ya tiene, en dos consultas
+        lesson_words = session.exec(
+            select(LessonVocabulary.lesson_number, LessonVocabulary.word_id)
+            .where(LessonVocabulary.lesson_number.in_(vocab_targets))
+            .order_by(LessonVocabulary.lesson_number, LessonVocabulary.id)
+        ).all()
+        known_words = set(session.exec(
+            select(UserVocabularyProgress.word_id).where(UserVocabularyProgress.user_id == user_id)
+        ).all())
+        
+        new_word_ids = []
+        for lesson_num, word_id in lesson_words:
+            if word_id in known_words:
+                continue
+            new_word_ids.append(word_id)
+            known_words.add(word_id)
+            target = f'vocab_l{lesson_num}'
+            if target not in unlocked['vocabulary']:
                 unlocked['vocabulary'].append(target)
+        
+        # Crear entradas de progreso (con mastery 0.0)
+        _add_unlocked_vocabulary(session, user_id, new_word_ids)
     
     # TODO: Agregar lógica para readings y challenges cuando estén implementados
     
+    if unlocked['lessons'] or unlocked['vocabulary']:
+        session.commit()
+    
     return unlocked
 
 